@@ -1,8 +1,14 @@
 #!/usr/bin/env python
 import argparse
+import json
 import os
+import sys
+import time
 from datetime import datetime
+from functools import partial
 
+from flask_backend.env_config import SCRAPER_MAX_CONCURRENCY_PER_HOST
+from scrapers.base import run_all
 from scrapers.capitolio import Capitolio
 from scrapers.cine_cinco import CineCinco
 from scrapers.cinebancarios import CineBancarios
@@ -10,19 +16,104 @@ from scrapers.paulo_amorim import CinematecaPauloAmorim
 from scrapers.sala_redencao import SalaRedencao
 from utils import dump_utf8_json
 
+# slug -> (url, cinema, scraper class), in the order the cinemas appear in
+# the JSON output
+ROOMS = {
+    "capitolio": ("http://www.capitolio.org.br", "Cinemateca Capitólio", Capitolio),
+    "sala-redencao": (
+        "https://www.ufrgs.br/difusaocultural/salaredencao/",
+        "Sala Redenção",
+        SalaRedencao,
+    ),
+    "cinebancarios": (
+        "https://cinebancarios.blogspot.com",
+        "CineBancários",
+        CineBancarios,
+    ),
+    "paulo-amorim": (
+        "https://www.cinematecapauloamorim.com.br",
+        "Cinemateca Paulo Amorim",
+        CinematecaPauloAmorim,
+    ),
+    "cine-cinco": (
+        "https://www.pucrs.br/cultura/projetos/cine-cinco/",
+        "Cine Cinco",
+        CineCinco,
+    ),
+}
+
+
+def _room_feature(slug, features):
+    """`features` is None for a cinema whose pages didn't change since an
+    earlier scrape of the day: it goes out as "unchanged", which import-json
+    skips."""
+    url, cinema, _scraper_class = ROOMS[slug]
+    if features is None:
+        return {
+            "url": url,
+            "cinema": cinema,
+            "slug": slug,
+            "features": [],
+            "unchanged": True,
+        }
+    return {"url": url, "cinema": cinema, "slug": slug, "features": features}
+
+
+def daily_snapshot(features, json_filename):
+    """What the day's archive at `json_filename` should hold for
+    `features`: an unchanged cinema keeps the entry an earlier run of the
+    day wrote. None - leave the file as it is - when there is no such
+    entry to keep."""
+    previous = {}
+    if os.path.exists(json_filename):
+        with open(json_filename) as json_file:
+            previous = {entry["slug"]: entry for entry in json.load(json_file)}
+
+    snapshot = []
+    for feature in features:
+        if feature.get("unchanged"):
+            feature = previous.get(feature["slug"])
+            if feature is None:
+                return None
+        snapshot.append(feature)
+    return snapshot
+
+
+def run_rooms(rooms, parallel=False):
+    """Scrapes `rooms` and returns their features in ROOMS order. In
+    parallel mode every cinema is scraped on the same event loop (see
+    scrapers/base.py), paginated pages are requested
+    SCRAPER_MAX_CONCURRENCY_PER_HOST at a time, and each cinema's
+    wall-clock time is reported to stderr."""
+    slugs = [slug for slug in ROOMS if slug in rooms]
+    if not parallel:
+        return [
+            _room_feature(slug, run_all(ROOMS[slug][2]().scrape_if_changed)[0])
+            for slug in slugs
+        ]
+
+    async def timed_scrape(slug):
+        scraper = ROOMS[slug][2]()
+        scraper.pages_ahead = SCRAPER_MAX_CONCURRENCY_PER_HOST
+        started = time.perf_counter()
+        try:
+            return _room_feature(slug, await scraper.scrape_if_changed())
+        finally:
+            print(f"{slug}: {time.perf_counter() - started:.2f}s", file=sys.stderr)
+
+    started = time.perf_counter()
+    features = run_all(*(partial(timed_scrape, slug) for slug in slugs))
+    print(f"total: {time.perf_counter() - started:.2f}s", file=sys.stderr)
+    return features
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(
         prog="cinemaempoa",
         description="Extrai os horários das salas de cinema de Porto Alegre em formato JSON utilizando webscrapping.",
     )
 
-    allowed_rooms = [
-        "capitolio",
-        "sala-redencao",
-        "cinebancarios",
-        "paulo-amorim",
-        "cine-cinco",
-    ]
+    allowed_rooms = list(ROOMS)
 
     parser.add_argument(
         "-r",
@@ -31,6 +122,12 @@ if __name__ == "__main__":
         help=f"Define as salas de cinemas para extração dos horários de exibição. Opções: {', '.join(allowed_rooms)}",
         required=True,
     )
+    parser.add_argument(
+        "-p",
+        "--parallel",
+        action="store_true",
+        help="Extrai as salas ao mesmo tempo, buscando as páginas de cada site em paralelo, e mostra o tempo de cada sala na saída de erro.",
+    )
 
     args = parser.parse_args()
 
@@ -40,60 +137,22 @@ if __name__ == "__main__":
     if not all(room in allowed_rooms for room in args.rooms):
         parser.error(f"Sala de cinema inválida. Opções: {', '.join(allowed_rooms)}")
 
-    features = []
-    if "capitolio" in args.rooms:
-        feature = {
-            "url": "http://www.capitolio.org.br",
-            "cinema": "Cinemateca Capitólio",
-            "slug": "capitolio",
-        }
-        cap = Capitolio()
-        feature["features"] = cap.get_daily_features_json()
-        features.append(feature)
-    if "sala-redencao" in args.rooms:
-        feature = {
-            "url": "https://www.ufrgs.br/difusaocultural/salaredencao/",
-            "cinema": "Sala Redenção",
-            "slug": "sala-redencao",
-        }
-        redencao = SalaRedencao()
-        feature["features"] = redencao.get_daily_features_json()
-        features.append(feature)
-    if "cinebancarios" in args.rooms:
-        cineBancarios = CineBancarios()
-        feature = {
-            "url": "https://cinebancarios.blogspot.com",
-            "cinema": "CineBancários",
-            "slug": "cinebancarios",
-        }
-        feature["features"] = cineBancarios.get_daily_features_json()
-        features.append(feature)
-    if "paulo-amorim" in args.rooms:
-        feature = {
-            "url": "https://www.cinematecapauloamorim.com.br",
-            "cinema": "Cinemateca Paulo Amorim",
-            "slug": "paulo-amorim",
-        }
-        pauloAmorim = CinematecaPauloAmorim()
-        feature["features"] = pauloAmorim.get_daily_features_json()
-        features.append(feature)
+    features = run_rooms(args.rooms, args.parallel)
 
+    if "paulo-amorim" in args.rooms:
+        # snapshot of the cinemas scraped up to Paulo Amorim
+        paulo_amorim_index = [feature["slug"] for feature in features].index(
+            "paulo-amorim"
+        )
         json_filename = os.path.join(
             "json", f"{datetime.now().strftime('%Y-%m-%d')}.json"
         )
         os.makedirs("json", exist_ok=True)
+        snapshot = daily_snapshot(features[: paulo_amorim_index + 1], json_filename)
 
-        with open(json_filename, "w") as json_file:
-            json_file.write(dump_utf8_json(features))
-    if "cine-cinco" in args.rooms:
-        feature = {
-            "url": "https://www.pucrs.br/cultura/projetos/cine-cinco/",
-            "cinema": "Cine Cinco",
-            "slug": "cine-cinco",
-        }
-        cineCinco = CineCinco()
-        feature["features"] = cineCinco.get_daily_features_json()
-        features.append(feature)
+        if snapshot is not None:
+            with open(json_filename, "w") as json_file:
+                json_file.write(dump_utf8_json(snapshot))
 
     json_string = dump_utf8_json(features)
 
@@ -43,6 +43,7 @@ def register_commands(app):
     app.cli.add_command(sync_graph_command)
     app.cli.add_command(graph_query_command)
     app.cli.add_command(detect_motifs_command)
+    app.cli.add_command(rebuild_upcoming_schedule_command)
 
 
 def _run_import_json(run, json_path):
@@ -78,22 +79,44 @@ def _run_import_json(run, json_path):
             click.echo(message, err=True)
             return
 
+    # cinemas the scraper found unchanged, or whose features are the ones the
+    # last successful import already brought in, have nothing new to import
+    last_fingerprints = pipeline_runs.get_last_cinema_fingerprints(slugs)
+    fingerprints = {
+        c.slug: c.fingerprint()
+        for c in runner.scrapped_results.cinemas
+        if not c.unchanged
+    }
+    unchanged = [
+        c.slug
+        for c in runner.scrapped_results.cinemas
+        if c.unchanged or fingerprints[c.slug] == last_fingerprints.get(c.slug)
+    ]
+    runner.scrapped_results.cinemas = [
+        c for c in runner.scrapped_results.cinemas if c.slug not in unchanged
+    ]
+    if unchanged:
+        click.echo(f"Salas sem mudanças, ignoradas: {', '.join(unchanged)}")
+
     # all validations passed, import screenings :)
     features_processed = sum(
         len(cinema.features) for cinema in runner.scrapped_results.cinemas
     )
     summary = runner.import_scrapped_results(current_app, pipeline_run_id=run.id)
-    status = "warning" if features_processed == 0 else "success"
+    status = "warning" if features_processed == 0 and not unchanged else "success"
+    run_summary = {
+        "movies_created": summary.movies_created,
+        "screenings_created": summary.screenings_created,
+        "dates_registered": summary.dates_registered,
+    }
+    if unchanged:
+        run_summary["cinemas_unchanged"] = unchanged
     pipeline_runs.finish(
         run.id,
         status=status,
-        summary=json.dumps(
-            {
-                "movies_created": summary.movies_created,
-                "screenings_created": summary.screenings_created,
-                "dates_registered": summary.dates_registered,
-            }
-        ),
+        summary=json.dumps(run_summary),
+        # skipped cinemas keep the fingerprint of what was last imported
+        cinema_fingerprints={**last_fingerprints, **fingerprints},
     )
     click.echo(
         f"«{summary.movies_created}» filmes, «{summary.screenings_created}» sessões "
@@ -120,16 +143,31 @@ def dupe_check():
 
 
 @click.command("sync-graph")
-def sync_graph_command():
-    """Reconstrói o grafo de conhecimento (movies, cinemas, sessões, gêneros,
-    diretores, países) a partir do SQLite.
-
-    Apaga e recria o grafo inteiro a cada execução - comando manual, não
-    faz parte de nenhum pipeline automatizado.
+@click.option(
+    "--incremental",
+    is_flag=True,
+    help="Grava só o que mudou desde a última sincronização.",
+)
+def sync_graph_command(incremental):
+    """Sincroniza o grafo de conhecimento (movies, cinemas, sessões, gêneros,
+    diretores, países) com o SQLite.
+
+    Por padrão apaga e recria o grafo inteiro. Com --incremental compara o
+    grafo com o SQLite e grava só os nós e arestas criados, alterados ou
+    removidos, numa única transação - rápido o bastante para rodar depois de
+    cada import-json.
     """
     from flask_backend.service.graph_sync import sync_graph
 
-    result = sync_graph()
+    result = sync_graph(incremental=incremental)
+    if incremental:
+        click.echo(
+            f"Grafo atualizado: {result.nodes_created} nós criados, "
+            f"{result.nodes_updated} alterados, {result.nodes_deleted} removidos; "
+            f"{result.edges_created} arestas criadas, "
+            f"{result.edges_deleted} removidas."
+        )
+        return
     click.echo(
         f"Grafo sincronizado: {result.nodes_created} nós, "
         f"{result.edges_created} arestas."
@@ -230,10 +268,17 @@ def generate_sitemap():
     default=False,
     help="Apenas lista o que seria feito, sem fazer requisições.",
 )
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Sessões buscadas em paralelo (cada fonte respeita seu limite de requisições).",
+)
 @click.option(
     "--verbose", "-v", is_flag=True, default=False, help="Mostra logs detalhados."
 )
-def fetch_posters(limit, dry_run, verbose):
+def fetch_posters(limit, dry_run, workers, verbose):
     """Busca posters para sessões sem imagem.
 
     Tenta fontes na ordem: TMDB, IMDB.
@@ -251,7 +296,11 @@ def fetch_posters(limit, dry_run, verbose):
     run = pipeline_runs.start("fetch-posters")
     try:
         result = run_pipeline(
-            current_app, limit=limit, dry_run=dry_run, pipeline_run_id=run.id
+            current_app,
+            limit=limit,
+            dry_run=dry_run,
+            pipeline_run_id=run.id,
+            workers=workers,
         )
     except Exception as exc:
         pipeline_runs.finish(run.id, status="error", error_message=str(exc)[:500])
@@ -385,10 +434,17 @@ def poster_review():
     default=False,
     help="Apenas lista o que seria feito, sem fazer requisições.",
 )
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Filmes buscados no TMDB em paralelo (respeitando TMDB_REQUESTS_PER_SECOND).",
+)
 @click.option(
     "--verbose", "-v", is_flag=True, default=False, help="Mostra logs detalhados."
 )
-def fetch_movie_metadata(limit, dry_run, verbose):
+def fetch_movie_metadata(limit, dry_run, workers, verbose):
     """Busca diretor(es) e gêneros no TMDB para filmes ainda não vinculados.
 
     Registra cada tentativa para evitar repetição.
@@ -404,7 +460,9 @@ def fetch_movie_metadata(limit, dry_run, verbose):
 
     run = pipeline_runs.start("fetch-movie-metadata")
     try:
-        result = run_pipeline(limit=limit, dry_run=dry_run, pipeline_run_id=run.id)
+        result = run_pipeline(
+            limit=limit, dry_run=dry_run, pipeline_run_id=run.id, workers=workers
+        )
     except Exception as exc:
         pipeline_runs.finish(run.id, status="error", error_message=str(exc)[:500])
         raise
@@ -586,6 +644,20 @@ def delete_movie_command(identifier, yes):
     run_delete_movie(identifier, skip_confirmation=yes)
 
 
+@click.command("rebuild-upcoming-schedule")
+def rebuild_upcoming_schedule_command():
+    """Reconstrói a tabela upcoming_schedule (programação desnormalizada
+    lida pelas páginas públicas) a partir das sessões cadastradas.
+
+    A tabela é mantida atualizada automaticamente a cada escrita; rode este
+    comando após a migração que a cria, ou se suspeitar que ela divergiu.
+    """
+    from flask_backend.repository import upcoming_schedule
+
+    written = upcoming_schedule.rebuild()
+    click.echo(f"Programação reconstruída: {written} horários.")
+
+
 @click.command("detect-motifs")
 @click.option(
     "--limit", type=int, default=10, help="Número máximo de observações a exibir."
@@ -596,7 +668,12 @@ def delete_movie_command(identifier, yes):
     is_flag=True,
     help="Imprime as observações completas (com evidências) em JSON.",
 )
-def detect_motifs_command(limit, as_json):
+@click.option(
+    "--timings",
+    is_flag=True,
+    help="Imprime na saída de erro o tempo de leitura do grafo e de cada motivo.",
+)
+def detect_motifs_command(limit, as_json, timings):
     """Executa o motor de detecção de motivos editoriais sobre o grafo de
     conhecimento e imprime as observações de maior pontuação.
     """
@@ -616,7 +693,11 @@ def detect_motifs_command(limit, as_json):
             "Rode `flask --app flask_backend sync-graph` primeiro."
         )
 
-    observations = motif_ranking.run_motifs()[:limit]
+    motif_timings = {}
+    observations = motif_ranking.run_motifs(timings=motif_timings)[:limit]
+    if timings:
+        for name, seconds in motif_timings.items():
+            click.echo(f"{name}: {seconds * 1000:.1f} ms", err=True)
 
     if as_json:
         click.echo(
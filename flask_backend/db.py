@@ -1,20 +1,88 @@
 import os
 
 import click
+from flask import request, session
 from flask.cli import with_appcontext
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import declarative_base, scoped_session, sessionmaker
+from sqlalchemy.pool import QueuePool
+
+from flask_backend.env_config import (
+    ADMIN_PROD_PWD,
+    ADMIN_PROD_USERNAME,
+    DATABASE_URL,
+    SQLITE_BUSY_TIMEOUT_MS,
+    SQLITE_CACHE_SIZE_MB,
+    SQLITE_MMAP_SIZE_MB,
+    SQLITE_TUNING,
+)
+
+# Blueprints whose anonymous GET/HEAD requests only ever read; their
+# connection is switched to PRAGMA query_only for the request.
+PUBLIC_BLUEPRINTS = ("screening", "movie", "cinema", "blog", "page")
+
+
+def _is_file_sqlite(url) -> bool:
+    url = make_url(url)
+    return url.get_backend_name() == "sqlite" and url.database not in (
+        None,
+        "",
+        ":memory:",
+    )
+
+
+def _configure_sqlite_connection(dbapi_connection, _connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    # WAL lets readers run alongside the single writer; NORMAL is durable
+    # across application crashes under WAL, only an OS crash can lose the
+    # last commits
+    cursor.execute("PRAGMA journal_mode = WAL")
+    cursor.execute("PRAGMA synchronous = NORMAL")
+    cursor.execute(f"PRAGMA cache_size = -{SQLITE_CACHE_SIZE_MB * 1024}")
+    cursor.execute(f"PRAGMA mmap_size = {SQLITE_MMAP_SIZE_MB * 1024 * 1024}")
+    cursor.execute("PRAGMA temp_store = MEMORY")
+    cursor.execute(f"PRAGMA busy_timeout = {SQLITE_BUSY_TIMEOUT_MS}")
+    cursor.close()
+
+
+def _reset_query_only(dbapi_connection, _connection_record) -> None:
+    # the connection goes back to the pool: whatever request borrows it
+    # next may need to write
+    if dbapi_connection is not None:
+        dbapi_connection.execute("PRAGMA query_only = OFF")
+
+
+def _create_engine(url):
+    if not (SQLITE_TUNING and _is_file_sqlite(url)):
+        new_engine = create_engine(url)
+    else:
+        # four gunicorn workers plus the CLI pipelines share the file: keep
+        # a small pool of long-lived connections per process (so the
+        # per-connection page cache and mmap survive between requests) and
+        # wait for a writer's lock instead of failing with "database is
+        # locked"
+        new_engine = create_engine(
+            url,
+            poolclass=QueuePool,
+            pool_size=5,
+            max_overflow=10,
+            connect_args={"timeout": SQLITE_BUSY_TIMEOUT_MS / 1000},
+        )
+        event.listen(new_engine, "connect", _configure_sqlite_connection)
+    if new_engine.dialect.name == "sqlite":
+        event.listen(new_engine, "checkin", _reset_query_only)
+    return new_engine
 
-from flask_backend.env_config import ADMIN_PROD_PWD, ADMIN_PROD_USERNAME, DATABASE_URL
 
 # TODO: This is a hack to get the database to work with pytest
 # see https://github.com/pytest-dev/pytest/issues/9502#issuecomment-2063572916
 # we should be able to change this in conftest.py app fixture
 if os.environ.get("PYTEST_VERSION"):
-    engine = create_engine("sqlite:///:memory:")
+    engine = _create_engine("sqlite:///:memory:")
 else:
-    engine = create_engine(DATABASE_URL)
+    engine = _create_engine(DATABASE_URL)
 
 db_session = scoped_session(
     sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -88,7 +156,31 @@ def seed_db():
         print("Users already registered. Skipping...")
 
 
+def use_read_only_connection():
+    """Switches the current request's connection to PRAGMA query_only for
+    anonymous reads on the public blueprints, so an accidental write
+    there fails loudly instead of taking the database's write lock. The
+    pragma is reset when the connection returns to the pool."""
+    if (
+        engine.dialect.name == "sqlite"
+        and request.blueprint in PUBLIC_BLUEPRINTS
+        and request.method in ("GET", "HEAD")
+        and session.get("user_id") is None
+    ):
+        db_session.connection().exec_driver_sql("PRAGMA query_only = ON")
+
+
 def init_app(app):
+    # registers the flush listeners that keep the upcoming_schedule read
+    # model and the response cache's schedule_generation counter in step
+    # with every content write
+    from flask_backend.repository import (  # noqa: F401
+        schedule_generation,
+        upcoming_schedule,
+    )
+
+    app.before_request(use_read_only_connection)
+
     app.cli.add_command(init_db_command)
     app.cli.add_command(seed_db_command)
     app.cli.add_command(init_db_prod_command)
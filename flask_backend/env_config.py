@@ -3,6 +3,12 @@ from decouple import config
 from flask_backend.utils.enums.environment import EnvironmentEnum
 
 DATABASE_URL = config("DATABASE_URL", default="sqlite:///./development.sqlite")
+# per-connection SQLite tuning, see flask_backend/db.py; SQLITE_TUNING=False
+# restores the stock pysqlite settings (used by the concurrency benchmark)
+SQLITE_TUNING = config("SQLITE_TUNING", default=True, cast=bool)
+SQLITE_BUSY_TIMEOUT_MS = config("SQLITE_BUSY_TIMEOUT_MS", default=10000, cast=int)
+SQLITE_CACHE_SIZE_MB = config("SQLITE_CACHE_SIZE_MB", default=16, cast=int)
+SQLITE_MMAP_SIZE_MB = config("SQLITE_MMAP_SIZE_MB", default=256, cast=int)
 SESSION_KEY = config("SESSION_KEY", default="dev")
 SESSION_LIFETIME_DAYS = config("SESSION_LIFETIME_DAYS", default=365, cast=int)
 APP_ENVIRONMENT = EnvironmentEnum(
@@ -11,11 +17,66 @@ APP_ENVIRONMENT = EnvironmentEnum(
 ADMIN_PROD_USERNAME = config("ADMIN_PROD_USERNAME", default="cinemaempoa")
 ADMIN_PROD_PWD = config("ADMIN_PROD_PWD", default="secret-pwd")
 UPLOAD_DIR = config("UPLOAD_DIR", None)
+# conditional GET + in-process cache of public pages, see utils/response_cache.py;
+# the TTL is how long a page may lag the clock (list a started showtime)
+RESPONSE_CACHE_TTL_SECONDS = config("RESPONSE_CACHE_TTL_SECONDS", default=60, cast=int)
+RESPONSE_CACHE_MAX_ENTRIES = config("RESPONSE_CACHE_MAX_ENTRIES", default=512, cast=int)
+# shared outbound HTTP client, see utils/http_client.py; HTTP/2 also needs
+# the optional h2 package
+HTTP_CLIENT_TIMEOUT_SECONDS = config(
+    "HTTP_CLIENT_TIMEOUT_SECONDS", default=20.0, cast=float
+)
+HTTP_CLIENT_RETRIES = config("HTTP_CLIENT_RETRIES", default=3, cast=int)
+HTTP_CLIENT_BACKOFF_SECONDS = config(
+    "HTTP_CLIENT_BACKOFF_SECONDS", default=0.5, cast=float
+)
+HTTP_CLIENT_MAX_RETRY_AFTER_SECONDS = config(
+    "HTTP_CLIENT_MAX_RETRY_AFTER_SECONDS", default=30.0, cast=float
+)
+HTTP_CLIENT_MAX_CONNECTIONS_PER_HOST = config(
+    "HTTP_CLIENT_MAX_CONNECTIONS_PER_HOST", default=10, cast=int
+)
+HTTP_CLIENT_HTTP2 = config("HTTP_CLIENT_HTTP2", default=False, cast=bool)
+# requests the scrapers (scrapers/base.py) send at once to one site
+SCRAPER_MAX_CONCURRENCY_PER_HOST = config(
+    "SCRAPER_MAX_CONCURRENCY_PER_HOST", default=4, cast=int
+)
+# in production, pages the scrapers read are revalidated with ETag /
+# Last-Modified and kept in this SQLite file, see scrapers/http_cache.py
+SCRAPER_PAGE_CACHE_ENABLED = config(
+    "SCRAPER_PAGE_CACHE_ENABLED", default=True, cast=bool
+)
+SCRAPER_PAGE_CACHE_PATH = config(
+    "SCRAPER_PAGE_CACHE_PATH", default="./scraper_pages.sqlite"
+)
 GRAPH_DB_PATH = config("GRAPH_DB_PATH", default="./flask_backend_graph.sqlite")
+# rows read from SQLite and written to the graph per batch by sync-graph
+GRAPH_SYNC_CHUNK_SIZE = config("GRAPH_SYNC_CHUNK_SIZE", default=5000, cast=int)
+# graph query results kept in memory per process, see service/graph_cache.py
+GRAPH_QUERY_CACHE_MAX_ENTRIES = config(
+    "GRAPH_QUERY_CACHE_MAX_ENTRIES", default=256, cast=int
+)
 IMGBB_API_KEY = config(
     "IMGBB_API_KEY", default="invalid-key"
 )  # api-key from https://api.imgbb.com/
 GEMINI_API_KEY = config("GEMINI_API_KEY", None)
+# gemini_quota keeps each model's recent attempts in memory: it picks up the
+# attempts other processes recorded at most every GEMINI_QUOTA_SYNC_SECONDS,
+# and writes its own from a background thread unless the write-behind is off
+GEMINI_QUOTA_SYNC_SECONDS = config("GEMINI_QUOTA_SYNC_SECONDS", default=5, cast=float)
+GEMINI_QUOTA_WRITE_BEHIND = config("GEMINI_QUOTA_WRITE_BEHIND", default=True, cast=bool)
 TMDB_API_TOKEN = config(
     "TMDB_API_TOKEN", default=None
 )  # Read Access Token from https://www.themoviedb.org/settings/api
+# API calls per second across all threads of a process; TMDB allows ~50
+TMDB_REQUESTS_PER_SECOND = config("TMDB_REQUESTS_PER_SECOND", default=40, cast=int)
+# persistent cache of TMDB answers, see service/tmdb_cache.py; empty answers
+# (title not on TMDB) expire sooner, as TMDB may add the movie later
+TMDB_CACHE_ENABLED = config("TMDB_CACHE_ENABLED", default=True, cast=bool)
+TMDB_CACHE_PATH = config("TMDB_CACHE_PATH", default="./tmdb_cache.sqlite")
+TMDB_CACHE_TTL_SECONDS = config(
+    "TMDB_CACHE_TTL_SECONDS", default=7 * 24 * 3600, cast=int
+)
+TMDB_CACHE_NEGATIVE_TTL_SECONDS = config(
+    "TMDB_CACHE_NEGATIVE_TTL_SECONDS", default=24 * 3600, cast=int
+)
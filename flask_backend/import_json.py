@@ -1,4 +1,6 @@
-from dataclasses import dataclass
+import hashlib
+import json
+from dataclasses import asdict, dataclass
 from typing import List, Optional
 
 from flask_backend.service.shared import parse_to_datetime_string
@@ -45,6 +47,19 @@ class ScrappedCinema:
     cinema: str
     slug: str
     features: List[ScrappedFeature]
+    # the scraper found the cinema's pages as they were at its last scrape
+    unchanged: bool = False
+
+    def fingerprint(self) -> str:
+        """Hash of the normalized feature list: the same features, in any
+        order and with showtimes in any order, give the same fingerprint."""
+        normalized = []
+        for feature in self.features:
+            feature_dict = asdict(feature)
+            if isinstance(feature.time, list):
+                feature_dict["time"] = sorted(feature.time)
+            normalized.append(json.dumps(feature_dict, sort_keys=True))
+        return hashlib.sha256("\n".join(sorted(normalized)).encode()).hexdigest()
 
     @classmethod
     def from_jsonable(cls, cinema_json: str):
@@ -56,6 +71,7 @@ class ScrappedCinema:
                 ScrappedFeature.from_jsonable(features_json)
                 for features_json in cinema_json["features"]
             ],
+            unchanged=cinema_json.get("unchanged", False),
         )
 
 
@@ -1,3 +1,4 @@
+import json
 from datetime import datetime
 from typing import List, Optional
 
@@ -7,6 +8,7 @@ from sqlalchemy import (
     Date,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
     Table,
@@ -195,6 +197,14 @@ class Screening(Base):
         Integer, ForeignKey("pipeline_runs.id"), nullable=True, index=True
     )
 
+    # cinema_id/draft backs the per-cinema public listings (homepage,
+    # /cinemas/<slug>); movie_id/cinema_id backs the import's
+    # "does this movie already screen here" lookup.
+    __table_args__ = (
+        Index("ix_screenings_cinema_id_draft", "cinema_id", "draft"),
+        Index("ix_screenings_movie_id_cinema_id", "movie_id", "cinema_id"),
+    )
+
     movie: Mapped["Movie"] = relationship(back_populates="screenings")
     cinema: Mapped["Cinema"] = relationship()
     dates: Mapped[List["ScreeningDate"]] = relationship(back_populates="screening")
@@ -208,9 +218,74 @@ class ScreeningDate(Base):
     date = Column(Date, nullable=False)
     time = Column(String, nullable=True)
 
+    # Every schedule query filters on a raw `date` range (never
+    # func.date(date), which would defeat these) - see
+    # repository/screenings.py.
+    __table_args__ = (
+        Index("ix_screening_dates_date_time", "date", "time"),
+        Index("ix_screening_dates_screening_id_date", "screening_id", "date"),
+    )
+
     screening: Mapped["Screening"] = relationship(back_populates="dates")
 
 
+class UpcomingShowtime(Base):
+    """Denormalized read model of the public schedule: one row per
+    ScreeningDate from the first day of the current month onwards, carrying
+    everything the public listings render (movie title/slug/directors,
+    cinema short name/color, poster, draft flag) so they read one narrow
+    table instead of joining screenings/screening_dates/movies/cinemas.
+
+    Never written directly - repository/upcoming_schedule.py keeps it in
+    step with the normalized tables on every session flush. `id` is the
+    source ScreeningDate's id."""
+
+    __tablename__ = "upcoming_schedule"
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    screening_id = Column(Integer, nullable=False, index=True)
+    movie_id = Column(Integer, nullable=False, index=True)
+    cinema_id = Column(Integer, nullable=False, index=True)
+    date = Column(Date, nullable=False)
+    time = Column(String, nullable=True)
+    movie_title = Column(String, nullable=False)
+    movie_slug = Column(String, nullable=True)
+    release_year = Column(Integer, nullable=True)
+    # JSON-encoded list of the movie's director names
+    directors = Column(Text, nullable=False, default="[]")
+    cinema_slug = Column(String, nullable=False)
+    cinema_short_name = Column(String, nullable=False)
+    cinema_color = Column(String, nullable=False)
+    description = Column(String, nullable=False)
+    screening_url = Column(String, nullable=True)
+    image = Column(String, nullable=True)
+    image_alt = Column(String, nullable=True)
+    image_width = Column(Integer, nullable=True)
+    image_height = Column(Integer, nullable=True)
+    draft = Column(Boolean, nullable=False, default=False)
+
+    __table_args__ = (Index("ix_upcoming_schedule_date_time", "date", "time"),)
+
+    @property
+    def director_names(self) -> List[str]:
+        return json.loads(self.directors or "[]")
+
+
+class ScheduleGeneration(Base):
+    """Single-row, monotonically increasing counter of content writes
+    (screenings, dates, movies, cinemas, blog posts...). Bumped inside the
+    writing transaction by repository/schedule_generation.py, so every
+    process sharing the database - each gunicorn worker, the CLI
+    pipelines - agrees on whether a cached public page is still current.
+    changed_at is the time of the latest bump."""
+
+    __tablename__ = "schedule_generation"
+
+    id = Column(Integer, primary_key=True)
+    generation = Column(Integer, nullable=False, default=0)
+    changed_at = Column(DateTime, nullable=True)
+
+
 class WantToWatch(Base):
     """One row per (movie, anonymous visitor) mark on the reels homepage's
     want-to-watch star. visitor_id is an opaque UUID from a dedicated
@@ -251,11 +326,20 @@ class PipelineRun(Base):
     # parsed (the cinema slugs aren't known yet at that point).
     source = Column(String, nullable=True)
     started_at = Column(DateTime, nullable=False)
-    finished_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True, index=True)
     status = Column(String, nullable=False)  # see PIPELINE_RUN_STATUSES
     # JSON-encoded result counts (e.g. {"processed": 5, "errors": 1}).
     summary = Column(Text, nullable=True)
     error_message = Column(String, nullable=True)
+    # JSON-encoded per-host outbound HTTP counters for the run
+    # ({"image.tmdb.org": {"requests": 12, "errors": 0, "avg_ms": ...}}),
+    # see flask_backend/utils/http_client.py. NULL when it made no requests.
+    http_stats = Column(Text, nullable=True)
+    # For successful "import-json" runs only: JSON-encoded {slug: fingerprint}
+    # of the feature list each cinema of the run had imported (see
+    # ScrappedCinema.fingerprint()). A cinema whose next JSON has the same
+    # fingerprint is skipped by import-json.
+    cinema_fingerprints = Column(Text, nullable=True)
 
 
 class PosterFetchAttempt(Base):
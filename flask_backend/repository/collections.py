@@ -1,3 +1,7 @@
+from typing import Dict
+
+from sqlalchemy import insert
+
 from flask_backend.db import db_session
 from flask_backend.models import Collection
 
@@ -12,3 +16,26 @@ def get_or_create_by_tmdb_id(tmdb_id: int, name: str) -> Collection:
         db_session.commit()
         db_session.refresh(collection)
     return collection
+
+
+def get_or_create_many_by_tmdb_id(names: Dict[int, str]) -> Dict[int, Collection]:
+    """Collection rows for the given {tmdb_id: name}, keyed by tmdb_id: the
+    existing ones in one query, the rest created with one bulk insert. Does
+    not commit."""
+    if not names:
+        return {}
+
+    def by_key() -> Dict[int, Collection]:
+        rows = db_session.query(Collection).filter(Collection.tmdb_id.in_(names)).all()
+        return {row.tmdb_id: row for row in rows}
+
+    collections = by_key()
+    missing = [
+        {"tmdb_id": key, "name": name}
+        for key, name in names.items()
+        if key not in collections
+    ]
+    if missing:
+        db_session.execute(insert(Collection), missing)
+        collections = by_key()
+    return collections
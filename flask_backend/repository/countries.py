@@ -1,6 +1,6 @@
-from typing import List
+from typing import Dict, List
 
-from sqlalchemy import asc
+from sqlalchemy import asc, insert
 
 from flask_backend.db import db_session
 from flask_backend.models import Country
@@ -18,3 +18,26 @@ def get_or_create_by_iso_code(iso_3166_1: str, name: str) -> Country:
         db_session.commit()
         db_session.refresh(country)
     return country
+
+
+def get_or_create_many_by_iso_code(names: Dict[str, str]) -> Dict[str, Country]:
+    """Country rows for the given {iso_3166_1: name}, keyed by ISO code: the
+    existing ones in one query, the rest created with one bulk insert. Does
+    not commit."""
+    if not names:
+        return {}
+
+    def by_key() -> Dict[str, Country]:
+        rows = db_session.query(Country).filter(Country.iso_3166_1.in_(names)).all()
+        return {row.iso_3166_1: row for row in rows}
+
+    countries = by_key()
+    missing = [
+        {"iso_3166_1": key, "name": name}
+        for key, name in names.items()
+        if key not in countries
+    ]
+    if missing:
+        db_session.execute(insert(Country), missing)
+        countries = by_key()
+    return countries
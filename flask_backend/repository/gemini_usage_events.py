@@ -3,7 +3,9 @@ gemini_models.call_with_fallback, used by flask_backend/service/gemini_quota.py
 to decide whether a model is currently available."""
 
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
+
+from sqlalchemy import insert
 
 from flask_backend.db import db_session
 from flask_backend.models import GeminiUsageEvent
@@ -29,6 +31,29 @@ def create(
     return event
 
 
+def create_many(events: List[dict]) -> None:
+    """Inserts every event (dicts with GeminiUsageEvent's columns) in one
+    executemany and commits."""
+    if not events:
+        return
+    db_session.execute(insert(GeminiUsageEvent), events)
+    db_session.commit()
+
+
+def get_since(since: datetime, after_id: int = 0) -> List[GeminiUsageEvent]:
+    """Events of every model that occurred at or after `since` and were
+    written after the event `after_id`, oldest first."""
+    return (
+        db_session.query(GeminiUsageEvent)
+        .filter(
+            GeminiUsageEvent.occurred_at >= since,
+            GeminiUsageEvent.id > after_id,
+        )
+        .order_by(GeminiUsageEvent.id)
+        .all()
+    )
+
+
 def count_since(model_id: str, since: datetime) -> int:
     return (
         db_session.query(GeminiUsageEvent)
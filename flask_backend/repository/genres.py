@@ -1,6 +1,6 @@
-from typing import List
+from typing import Dict, List
 
-from sqlalchemy import asc
+from sqlalchemy import asc, insert
 
 from flask_backend.db import db_session
 from flask_backend.models import Genre
@@ -18,3 +18,26 @@ def get_or_create_by_tmdb_id(tmdb_id: int, name: str) -> Genre:
         db_session.commit()
         db_session.refresh(genre)
     return genre
+
+
+def get_or_create_many_by_tmdb_id(names: Dict[int, str]) -> Dict[int, Genre]:
+    """Genre rows for the given {tmdb_id: name}, keyed by tmdb_id: the
+    existing ones in one query, the rest created with one bulk insert. Does
+    not commit."""
+    if not names:
+        return {}
+
+    def by_key() -> Dict[int, Genre]:
+        rows = db_session.query(Genre).filter(Genre.tmdb_id.in_(names)).all()
+        return {row.tmdb_id: row for row in rows}
+
+    genres = by_key()
+    missing = [
+        {"tmdb_id": key, "name": name}
+        for key, name in names.items()
+        if key not in genres
+    ]
+    if missing:
+        db_session.execute(insert(Genre), missing)
+        genres = by_key()
+    return genres
@@ -1,5 +1,7 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Set
+
+from sqlalchemy import func, insert
 
 from flask_backend.db import db_session
 from flask_backend.models import Movie, MovieMetadataFetchAttempt
@@ -26,24 +28,59 @@ def create(
     return attempt
 
 
-def has_attempt(movie_id: int) -> bool:
-    """Return whether a TMDB fetch has already been attempted for this movie."""
-    return (
-        db_session.query(MovieMetadataFetchAttempt.id)
-        .filter(MovieMetadataFetchAttempt.movie_id == movie_id)
-        .first()
-        is not None
+def create_many(attempts: List[dict]) -> None:
+    """Inserts many attempts with a single executemany. Each dict takes the
+    keyword arguments of create(); attempted_at defaults to now. Does not
+    commit - the caller commits the batch with its other writes."""
+    if not attempts:
+        return
+    now = datetime.now()
+    rows = [
+        {
+            "error_message": None,
+            "pipeline_run_id": None,
+            "attempted_at": now,
+            **attempt,
+        }
+        for attempt in attempts
+    ]
+    db_session.execute(insert(MovieMetadataFetchAttempt), rows)
+
+
+def get_attempted_movie_ids(movie_ids: Iterable[int]) -> Set[int]:
+    """The subset of `movie_ids` with at least one TMDB fetch attempt, in
+    one query."""
+    movie_ids = set(movie_ids)
+    if not movie_ids:
+        return set()
+    rows = (
+        db_session.query(MovieMetadataFetchAttempt.movie_id)
+        .filter(MovieMetadataFetchAttempt.movie_id.in_(movie_ids))
+        .distinct()
+        .all()
     )
+    return {row[0] for row in rows}
 
 
-def get_latest_attempt(movie_id: int) -> Optional[MovieMetadataFetchAttempt]:
-    """Return the most recent fetch attempt for a movie, if any."""
-    return (
+def get_latest_attempts(
+    movie_ids: Iterable[int],
+) -> Dict[int, MovieMetadataFetchAttempt]:
+    """The most recent fetch attempt of each of the given movies, keyed by
+    movie id, in one query. Movies never attempted are absent."""
+    movie_ids = set(movie_ids)
+    if not movie_ids:
+        return {}
+    latest_ids = (
+        db_session.query(func.max(MovieMetadataFetchAttempt.id))
+        .filter(MovieMetadataFetchAttempt.movie_id.in_(movie_ids))
+        .group_by(MovieMetadataFetchAttempt.movie_id)
+    )
+    attempts = (
         db_session.query(MovieMetadataFetchAttempt)
-        .filter(MovieMetadataFetchAttempt.movie_id == movie_id)
-        .order_by(MovieMetadataFetchAttempt.id.desc())
-        .first()
+        .filter(MovieMetadataFetchAttempt.id.in_(latest_ids.scalar_subquery()))
+        .all()
     )
+    return {attempt.movie_id: attempt for attempt in attempts}
 
 
 def get_movies_needing_enrichment() -> List[Movie]:
@@ -59,7 +96,9 @@ def get_movies_needing_enrichment() -> List[Movie]:
 def get_movies_needing_manual_review() -> List[Movie]:
     """Return movies that need manual TMDB review: not linked, not excluded,
     and already attempted (so the pipeline won't retry them automatically)."""
-    return [movie for movie in get_movies_needing_enrichment() if has_attempt(movie.id)]
+    movies = get_movies_needing_enrichment()
+    attempted = get_attempted_movie_ids(movie.id for movie in movies)
+    return [movie for movie in movies if movie.id in attempted]
 
 
 def get_by_pipeline_run_id(pipeline_run_id: int) -> List[MovieMetadataFetchAttempt]:
@@ -1,9 +1,10 @@
 from datetime import datetime
 from math import ceil
-from typing import List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from slugify import slugify
 from sqlalchemy import func
+from sqlalchemy.orm import selectinload
 
 from flask_backend.db import db_session
 from flask_backend.models import (
@@ -100,6 +101,35 @@ def get_by_slug(slug: str) -> Optional[Movie]:
     return db_session.query(Movie).filter(Movie.slug == slug).first()
 
 
+def get_by_slugs(slugs: Iterable[str]) -> Dict[str, Movie]:
+    """Movies for the given slugs, keyed by slug, in one IN query. Slugs
+    with no movie are absent."""
+    slugs = set(slugs)
+    if not slugs:
+        return {}
+    movies = db_session.query(Movie).filter(Movie.slug.in_(slugs)).all()
+    return {movie.slug: movie for movie in movies}
+
+
+def get_by_ids_with_tmdb_relations(movie_ids: Iterable[int]) -> Dict[int, Movie]:
+    """Movies for the given ids, keyed by id, with the directors, genres and
+    countries that TMDB enrichment replaces already loaded."""
+    movie_ids = set(movie_ids)
+    if not movie_ids:
+        return {}
+    movies = (
+        db_session.query(Movie)
+        .options(
+            selectinload(Movie.directors),
+            selectinload(Movie.genres),
+            selectinload(Movie.countries),
+        )
+        .filter(Movie.id.in_(movie_ids))
+        .all()
+    )
+    return {movie.id: movie for movie in movies}
+
+
 def get_by_title_or_create(
     title: str, pipeline_run_id: Optional[int] = None
 ) -> Tuple[Movie, bool]:
@@ -1,11 +1,14 @@
+import json
 from datetime import datetime, timedelta
 from math import ceil
-from typing import Optional, Tuple
+from typing import Dict, Iterable, Optional, Tuple
 
 from sqlalchemy import func
 
 from flask_backend.db import db_session
 from flask_backend.models import PipelineRun
+from flask_backend.service import tmdb_cache
+from flask_backend.utils import http_client
 
 # A "running" run older than this is considered dead (its process was
 # killed before it could write finished_at) rather than genuinely in
@@ -14,6 +17,10 @@ INTERRUPTED_THRESHOLD = timedelta(hours=1)
 
 
 def start(pipeline_name: str, source: Optional[str] = None) -> PipelineRun:
+    # a CLI process runs one pipeline, so the outbound HTTP counters from
+    # and TMDB cache counters from here to finish() are this run's
+    http_client.reset_host_stats()
+    tmdb_cache.reset_stats()
     run = PipelineRun(
         pipeline_name=pipeline_name,
         source=source,
@@ -38,17 +45,61 @@ def finish(
     status: str,
     summary: Optional[str] = None,
     error_message: Optional[str] = None,
+    cinema_fingerprints: Optional[Dict[str, str]] = None,
 ) -> PipelineRun:
     run = db_session.query(PipelineRun).filter(PipelineRun.id == run_id).one()
     run.status = status
     run.finished_at = datetime.now()
-    run.summary = summary
+    run.summary = _with_tmdb_cache_stats(summary)
     run.error_message = error_message
+    if cinema_fingerprints:
+        run.cinema_fingerprints = json.dumps(cinema_fingerprints, sort_keys=True)
+    http_stats = http_client.get_host_stats()
+    run.http_stats = json.dumps(http_stats) if http_stats else None
     db_session.commit()
     db_session.refresh(run)
     return run
 
 
+def _with_tmdb_cache_stats(summary: Optional[str]) -> Optional[str]:
+    """Adds the run's TMDB cache hits/misses to its JSON summary, when the
+    run looked anything up on TMDB."""
+    stats = tmdb_cache.get_stats()
+    if not any(stats.values()):
+        return summary
+    summary_obj = json.loads(summary) if summary else {}
+    if not isinstance(summary_obj, dict):
+        return summary
+    summary_obj["tmdb_cache"] = stats
+    return json.dumps(summary_obj)
+
+
+def get_last_cinema_fingerprints(slugs: Iterable[str]) -> Dict[str, str]:
+    """{slug: fingerprint} of the feature lists the last successful
+    import-json of each of `slugs` imported. Slugs never imported with a
+    fingerprint are left out."""
+    fingerprints = {}
+    for slug in slugs:
+        # source is the run's comma-joined slugs; the LIKE only narrows it
+        # down, the JSON lookup below is the exact match
+        runs = (
+            db_session.query(PipelineRun.cinema_fingerprints)
+            .filter(
+                PipelineRun.pipeline_name == "import-json",
+                PipelineRun.status == "success",
+                PipelineRun.cinema_fingerprints.isnot(None),
+                PipelineRun.source.like(f"%{slug}%"),
+            )
+            .order_by(PipelineRun.finished_at.desc())
+        )
+        for (run_fingerprints,) in runs.yield_per(20):
+            fingerprint = json.loads(run_fingerprints).get(slug)
+            if fingerprint is not None:
+                fingerprints[slug] = fingerprint
+                break
+    return fingerprints
+
+
 def get_by_id(run_id: int) -> Optional[PipelineRun]:
     return db_session.query(PipelineRun).filter(PipelineRun.id == run_id).first()
 
@@ -1,5 +1,8 @@
 from datetime import datetime
-from typing import List, Optional, Set
+from typing import Dict, Iterable, List, Optional, Set
+
+from sqlalchemy import insert
+from sqlalchemy.orm import joinedload
 
 from flask_backend.db import db_session
 from flask_backend.models import POSTER_SOURCES, PosterFetchAttempt, Screening
@@ -26,29 +29,68 @@ def create(
     return attempt
 
 
-def get_attempted_sources(screening_id: int) -> Set[str]:
-    """Return the set of source names already attempted for a given screening."""
+def create_many(attempts: List[dict]) -> None:
+    """Inserts many attempts with a single executemany. Each dict takes the
+    keyword arguments of create(); attempted_at defaults to now. Does not
+    commit - the caller commits the batch with its other writes."""
+    if not attempts:
+        return
+    now = datetime.now()
+    rows = [
+        {
+            "error_message": None,
+            "pipeline_run_id": None,
+            "attempted_at": now,
+            **attempt,
+        }
+        for attempt in attempts
+    ]
+    db_session.execute(insert(PosterFetchAttempt), rows)
+
+
+def get_attempted_sources_by_screening(
+    screening_ids: Iterable[int],
+) -> Dict[int, Set[str]]:
+    """Sources already attempted for each of the given screenings, in one
+    grouped query. Every requested id is present; screenings never
+    attempted map to an empty set."""
+    attempted = {screening_id: set() for screening_id in screening_ids}
+    if not attempted:
+        return attempted
     rows = (
-        db_session.query(PosterFetchAttempt.source)
-        .filter(PosterFetchAttempt.screening_id == screening_id)
+        db_session.query(PosterFetchAttempt.screening_id, PosterFetchAttempt.source)
+        .filter(PosterFetchAttempt.screening_id.in_(attempted))
+        .group_by(PosterFetchAttempt.screening_id, PosterFetchAttempt.source)
         .all()
     )
-    return {row[0] for row in rows}
+    for screening_id, source in rows:
+        attempted[screening_id].add(source)
+    return attempted
 
 
-def get_next_source(screening_id: int) -> Optional[str]:
-    """Return the next source to try for a screening, or None if all were tried."""
-    attempted = get_attempted_sources(screening_id)
+def _next_source(attempted: Set[str]) -> Optional[str]:
     for source in POSTER_SOURCES:
         if source not in attempted:
             return source
     return None
 
 
+def get_next_sources(screening_ids: Iterable[int]) -> Dict[int, Optional[str]]:
+    """The next source to try for each of the given screenings, following
+    POSTER_SOURCES order, or None once every source was tried. One query."""
+    return {
+        screening_id: _next_source(attempted)
+        for screening_id, attempted in get_attempted_sources_by_screening(
+            screening_ids
+        ).items()
+    }
+
+
 def get_screenings_without_poster() -> List[Screening]:
-    """Return screenings that have no image set."""
+    """Return screenings that have no image set, with their movies loaded."""
     return (
         db_session.query(Screening)
+        .options(joinedload(Screening.movie))
         .filter(
             (Screening.image == None) | (Screening.image == "")  # noqa: E711
         )
@@ -65,12 +107,8 @@ def get_screenings_needing_manual_review() -> List[Screening]:
     - None of them resulted in 'success'
     """
     screenings_without_poster = get_screenings_without_poster()
-    result = []
-    for screening in screenings_without_poster:
-        attempted = get_attempted_sources(screening.id)
-        if all(source in attempted for source in POSTER_SOURCES):
-            result.append(screening)
-    return result
+    next_sources = get_next_sources(s.id for s in screenings_without_poster)
+    return [s for s in screenings_without_poster if next_sources[s.id] is None]
 
 
 def get_by_pipeline_run_id(pipeline_run_id: int) -> List[PosterFetchAttempt]:
@@ -0,0 +1,90 @@
+"""Data access for the schedule_generation counter (ScheduleGeneration) -
+the shared version number the public page response cache
+(flask_backend/utils/response_cache.py) keys its entries on.
+
+Like repository/upcoming_schedule.py, nothing calls bump() by hand: an
+after_flush listener on db_session bumps the counter inside any transaction
+that writes to a table the public pages render from, so a cached page is
+invalidated for every gunicorn worker the moment that write commits.
+"""
+
+from datetime import datetime
+from itertools import chain
+from typing import Optional, Tuple
+
+from sqlalchemy import event, func, select, update
+
+from flask_backend.db import db_session
+from flask_backend.models import (
+    BlogPost,
+    Cinema,
+    Collection,
+    Country,
+    Director,
+    Genre,
+    Movie,
+    PipelineRun,
+    ScheduleGeneration,
+    Screening,
+    ScreeningDate,
+)
+
+GENERATION_ROW_ID = 1
+
+# Models the public pages render from. Bookkeeping rows (pipeline runs,
+# fetch attempts, Gemini usage, want-to-watch marks) deliberately don't
+# bump the counter - they'd invalidate every cached page for nothing.
+CONTENT_MODELS = (
+    BlogPost,
+    Cinema,
+    Collection,
+    Country,
+    Director,
+    Genre,
+    Movie,
+    Screening,
+    ScreeningDate,
+)
+
+_TABLE = ScheduleGeneration.__table__
+
+
+def current() -> Tuple[int, Optional[datetime]]:
+    """(generation, last_modified) as committed by any process, in a single
+    statement. last_modified is the later of the newest content write and
+    the newest finished pipeline run. A database missing the counter row
+    reads as generation 0."""
+    latest_run = select(func.max(PipelineRun.finished_at)).scalar_subquery()
+    row = db_session.execute(
+        select(
+            _TABLE.c.generation, _TABLE.c.changed_at, latest_run.label("latest_run")
+        ).where(_TABLE.c.id == GENERATION_ROW_ID)
+    ).first()
+    if row is None:
+        return 0, None
+    stamps = [stamp for stamp in (row.changed_at, row.latest_run) if stamp]
+    return row.generation, max(stamps, default=None)
+
+
+def _bump(connection) -> None:
+    connection.execute(
+        update(_TABLE)
+        .where(_TABLE.c.id == GENERATION_ROW_ID)
+        .values(generation=_TABLE.c.generation + 1, changed_at=datetime.now())
+    )
+
+
+def bump() -> None:
+    """Bumps the counter within the current transaction, for writes that
+    bypass flush events. Does not commit."""
+    _bump(db_session.connection())
+
+
+@event.listens_for(db_session, "after_flush")
+def _bump_after_flush(session, _flush_context) -> None:
+    dirty = (obj for obj in session.dirty if session.is_modified(obj))
+    if any(
+        isinstance(obj, CONTENT_MODELS)
+        for obj in chain(session.new, dirty, session.deleted)
+    ):
+        _bump(session.connection())
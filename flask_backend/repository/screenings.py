@@ -1,122 +1,92 @@
-from datetime import date, datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from datetime import date, datetime
+from typing import Dict, Iterable, List, Optional, Tuple
 
-from sqlalchemy import func
+from sqlalchemy import Select, func, select
+from sqlalchemy.orm import joinedload, selectinload
 
 from flask_backend.db import db_session
-from flask_backend.models import Cinema, Movie, Screening, ScreeningDate
+from flask_backend.models import Movie, Screening, ScreeningDate
 from flask_backend.repository import alert_actions
 from flask_backend.service.shared import get_weekend_dates
 
+# Loader profile: a named bundle of eager-load options matching the object
+# graph one consumer walks, so it comes back in a fixed number of round
+# trips instead of one lazy SELECT per row. REELS_CARD_PROFILE covers
+# everything service/screening.build_favorites_feed reads off a stale
+# pick's fallback Screening (movie, movie.directors, cinema, dates).
+REELS_CARD_PROFILE = (
+    joinedload(Screening.movie).selectinload(Movie.directors),
+    joinedload(Screening.cinema),
+    selectinload(Screening.dates),
+)
+
+
+def _screening_ids_with_dates_between(
+    start_date: date, end_date: Optional[date] = None
+) -> Select:
+    """Semi-join subquery of screening IDs with at least one ScreeningDate in
+    [start_date, end_date] (open-ended when end_date is None). Filtering
+    Screening.id IN (...) lets SQLite drive from the screening_dates date
+    index instead of scanning screenings and deduplicating a join."""
+    query = select(ScreeningDate.screening_id).where(ScreeningDate.date >= start_date)
+    if end_date is not None:
+        query = query.where(ScreeningDate.date <= end_date)
+    return query
+
 
 def get_screening_by_id(screening_id: int) -> Optional[Screening]:
     return db_session.query(Screening).filter(Screening.id == screening_id).first()
 
 
-def get_days_screenings_by_cinema_id(cinema_id: int, day: date) -> List[Screening]:
-    screening_dates = (
+def get_by_movie_id_and_cinema_id(movie_id: int, cinema_id: int) -> Optional[Screening]:
+    screening = (
         db_session.query(Screening)
-        .join(ScreeningDate)
+        .filter(Screening.movie_id == movie_id)
         .filter(Screening.cinema_id == cinema_id)
-        .filter(func.date(ScreeningDate.date) == day)
-        .order_by(func.time(ScreeningDate.time))
-        .all()
-    )
-
-    return screening_dates
-
-
-def get_month_screening_dates(
-    cinema_slugs: Optional[List[str]] = None,
-) -> List[ScreeningDate]:
-    month = date.today().replace(day=1)
-    if month.month in [4, 6, 9, 11]:
-        last_day = month + timedelta(days=30)
-    else:
-        last_day = month + timedelta(days=31)
-    screening_dates = (
-        db_session.query(ScreeningDate)
-        .join(Screening)
-        .join(Cinema)
-        .filter(func.date(ScreeningDate.date).between(month, last_day))
-    )
-
-    if cinema_slugs:
-        screening_dates = screening_dates.filter(Cinema.slug.in_(cinema_slugs))
-
-    screening_dates = (
-        screening_dates.order_by(func.date(ScreeningDate.date))
-        .order_by(func.time(ScreeningDate.time))
-        .all()
-    )
-
-    return screening_dates
-
-
-def get_screenings_in_date_range(start_date: date, end_date: date) -> List[Screening]:
-    """Screenings (draft included) with at least one ScreeningDate between
-    start_date and end_date, inclusive. Powers the mobile reels feed - the
-    caller decides whether to keep drafts based on login state."""
-    return (
-        db_session.query(Screening)
-        .join(ScreeningDate)
-        .filter(func.date(ScreeningDate.date).between(start_date, end_date))
-        .distinct()
-        .all()
+        .first()
     )
+    return screening
 
 
-def get_screenings_for_movies_with_dates_in_range(
-    movie_ids: List[int], start_date: date, end_date: date
-) -> List[Screening]:
-    """Screenings (draft included) for the given movie IDs with at least
-    one ScreeningDate between start_date and end_date, inclusive. Powers
-    the /favoritos feed - the caller decides whether to keep drafts based
-    on login state, same as get_screenings_in_date_range."""
-    if not movie_ids:
-        return []
-    return (
+def get_by_movie_and_cinema_ids(
+    movie_ids: Iterable[int], cinema_ids: Iterable[int]
+) -> Dict[Tuple[int, int], Screening]:
+    """Screenings of any of the movies at any of the cinemas, keyed by
+    (movie_id, cinema_id), with their dates loaded - the bulk counterpart of
+    get_by_movie_id_and_cinema_id for the JSON import. Like that function,
+    a pair with several screenings resolves to the first one (lowest id)."""
+    movie_ids, cinema_ids = set(movie_ids), set(cinema_ids)
+    if not movie_ids or not cinema_ids:
+        return {}
+    screenings = (
         db_session.query(Screening)
-        .join(ScreeningDate)
+        .options(selectinload(Screening.dates))
         .filter(Screening.movie_id.in_(movie_ids))
-        .filter(func.date(ScreeningDate.date).between(start_date, end_date))
-        .distinct()
+        .filter(Screening.cinema_id.in_(cinema_ids))
+        .order_by(Screening.id)
         .all()
     )
-
-
-def get_screening_dates_for_movies(
-    movie_ids: List[int],
-    start_date: date,
-    end_date: date,
-    include_drafts: bool = False,
-) -> List[ScreeningDate]:
-    """Every ScreeningDate between start_date and end_date (inclusive) for
-    the given movie IDs, across all cinemas. Drafts are excluded unless
-    include_drafts is True - callers must pass True only for logged-in
-    requests, otherwise a movie with an unpublished screening at one cinema
-    would leak that draft's dates via another cinema's published card."""
-    if not movie_ids:
-        return []
-    query = (
-        db_session.query(ScreeningDate)
-        .join(Screening)
-        .filter(Screening.movie_id.in_(movie_ids))
-        .filter(func.date(ScreeningDate.date).between(start_date, end_date))
-    )
-    if not include_drafts:
-        query = query.filter(Screening.draft == False)  # noqa: E712
-    return query.all()
-
-
-def get_by_movie_id_and_cinema_id(movie_id: int, cinema_id: int) -> Optional[Screening]:
-    screening = (
-        db_session.query(Screening)
-        .filter(Screening.movie_id == movie_id)
-        .filter(Screening.cinema_id == cinema_id)
-        .first()
+    by_pair: Dict[Tuple[int, int], Screening] = {}
+    for screening in screenings:
+        by_pair.setdefault((screening.movie_id, screening.cinema_id), screening)
+    return by_pair
+
+
+def get_ids_by_movie_and_cinema_ids(
+    movie_ids: Iterable[int], cinema_ids: Iterable[int]
+) -> Dict[Tuple[int, int], int]:
+    """get_by_movie_and_cinema_ids without loading the rows - just the
+    first screening id per (movie_id, cinema_id)."""
+    rows = db_session.execute(
+        select(Screening.id, Screening.movie_id, Screening.cinema_id)
+        .where(Screening.movie_id.in_(set(movie_ids)))
+        .where(Screening.cinema_id.in_(set(cinema_ids)))
+        .order_by(Screening.id)
     )
-    return screening
+    ids: Dict[Tuple[int, int], int] = {}
+    for screening_id, movie_id, cinema_id in rows:
+        ids.setdefault((movie_id, cinema_id), screening_id)
+    return ids
 
 
 def get_next_screening_date_for_movie(
@@ -130,9 +100,8 @@ def get_next_screening_date_for_movie(
         .join(Screening)
         .filter(Screening.movie_id == movie_id)
         .filter(Screening.draft == False)  # noqa: E712
-        .filter(func.date(ScreeningDate.date) >= on_or_after)
-        .order_by(func.date(ScreeningDate.date))
-        .order_by(func.time(ScreeningDate.time))
+        .filter(ScreeningDate.date >= on_or_after)
+        .order_by(ScreeningDate.date, ScreeningDate.time)
         .first()
     )
 
@@ -183,22 +152,6 @@ def merge_title_cleaning_rules(
     return ",".join(sorted(existing | incoming)) or None
 
 
-def update_title_cleaning_info(
-    screening: Screening, raw_title: str, matched_rule_names: List[str]
-) -> Screening:
-    """Refreshes raw_title to the latest scrape and unions matched_rule_names
-    into the screening's existing title_cleaning_rules, never dropping a
-    previously-detected annotation."""
-    screening.raw_title = raw_title
-    screening.title_cleaning_rules = merge_title_cleaning_rules(
-        screening.title_cleaning_rules, ",".join(matched_rule_names)
-    )
-    db_session.add(screening)
-    db_session.commit()
-    db_session.refresh(screening)
-    return screening
-
-
 def get_screenings_with_upcoming_dates(
     cinema_id: Optional[int] = None,
 ) -> List[Screening]:
@@ -208,13 +161,12 @@ def get_screenings_with_upcoming_dates(
     today = date.today()
     query = (
         db_session.query(Screening)
-        .join(ScreeningDate)
         .filter(Screening.draft == False)  # noqa: E712
-        .filter(func.date(ScreeningDate.date) >= today)
+        .filter(Screening.id.in_(_screening_ids_with_dates_between(today)))
     )
     if cinema_id is not None:
         query = query.filter(Screening.cinema_id == cinema_id)
-    return query.distinct().all()
+    return query.all()
 
 
 def get_latest_screening_for_movie(
@@ -232,6 +184,27 @@ def get_latest_screening_for_movie(
     return query.order_by(Screening.created_at.desc()).first()
 
 
+def get_latest_screenings_for_movies(
+    movie_ids: List[int], include_drafts: bool = False
+) -> Dict[int, Screening]:
+    """Bulk get_latest_screening_for_movie: the most recently created
+    Screening per movie ID, loaded with REELS_CARD_PROFILE. Movies with no
+    (non-draft, unless include_drafts) Screening are left out."""
+    if not movie_ids:
+        return {}
+    query = (
+        db_session.query(Screening)
+        .options(*REELS_CARD_PROFILE)
+        .filter(Screening.movie_id.in_(movie_ids))
+    )
+    if not include_drafts:
+        query = query.filter(Screening.draft == False)  # noqa: E712
+    latest: Dict[int, Screening] = {}
+    for screening in query.order_by(Screening.created_at.desc()):
+        latest.setdefault(screening.movie_id, screening)
+    return latest
+
+
 def update_screening_dates(
     screening: Screening, screening_dates: List[ScreeningDate]
 ) -> Screening:
@@ -293,9 +266,8 @@ def get_weekend_screening_dates() -> Tuple[List[ScreeningDate], date, date, date
         db_session.query(ScreeningDate)
         .join(Screening)
         .filter(Screening.draft == False)  # noqa: E712
-        .filter(func.date(ScreeningDate.date).between(friday_date, sunday_date))
-        .order_by(func.date(ScreeningDate.date))
-        .order_by(func.time(ScreeningDate.time))
+        .filter(ScreeningDate.date.between(friday_date, sunday_date))
+        .order_by(ScreeningDate.date, ScreeningDate.time)
         .all(),
         friday_date,
         saturday_date,
@@ -328,7 +300,7 @@ def get_past_movies_for_cinema(
             .join(ScreeningDate)
             .filter(Screening.cinema_id == cinema_id)
             .filter(Screening.draft == False)  # noqa: E712
-            .filter(func.date(ScreeningDate.date) >= today)
+            .filter(ScreeningDate.date >= today)
             .distinct()
         )
     }
@@ -0,0 +1,351 @@
+"""Data access for the upcoming_schedule read model (UpcomingShowtime) -
+the denormalized table every public schedule listing (/, /program,
+/weekend, /favoritos, /cinemas/<slug>) reads instead of joining
+screenings/screening_dates/movies/cinemas per request.
+
+The table is never written by callers. An after_flush listener on
+db_session works out which screening dates, screenings, movies and cinemas
+a flush touched and re-derives just their rows inside the same
+transaction, so the import, the admin screening routes, movie_merge and
+any other ORM write keep it current without knowing it exists. Bulk
+Query.delete()/update() calls skip flush events - none of them touch the
+source tables today; if one ever does, follow it with refresh() or run
+`flask rebuild-upcoming-schedule`.
+"""
+
+import json
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from itertools import chain
+from typing import Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import delete, event, insert, inspect, or_, select
+
+from flask_backend.constants import (
+    CINEMA_COLORS,
+    CINEMA_SHORT_NAMES,
+    DEFAULT_CINEMA_COLOR,
+)
+from flask_backend.db import db_session
+from flask_backend.models import (
+    Cinema,
+    Director,
+    Movie,
+    Screening,
+    ScreeningDate,
+    UpcomingShowtime,
+    movie_directors,
+)
+from flask_backend.service.shared import get_weekend_dates
+
+_TABLE = UpcomingShowtime.__table__
+
+
+def schedule_horizon(today: Optional[date] = None) -> date:
+    """Oldest date kept in the read model: the first of the current month
+    (/program lists the whole month) or a week back, whichever is earlier
+    (/weekend starts from last Friday when today is Saturday or Sunday)."""
+    today = today or date.today()
+    return min(today.replace(day=1), today - timedelta(days=7))
+
+
+@dataclass
+class RefreshScope:
+    """Which rows a refresh re-derives: any ScreeningDate whose own id,
+    screening, movie or cinema is listed."""
+
+    screening_date_ids: Set[int] = field(default_factory=set)
+    screening_ids: Set[int] = field(default_factory=set)
+    movie_ids: Set[int] = field(default_factory=set)
+    cinema_ids: Set[int] = field(default_factory=set)
+
+    def __bool__(self) -> bool:
+        return bool(
+            self.screening_date_ids
+            or self.screening_ids
+            or self.movie_ids
+            or self.cinema_ids
+        )
+
+    def matches(self, screening_date_id, screening_id, movie_id, cinema_id):
+        return or_(
+            screening_date_id.in_(self.screening_date_ids),
+            screening_id.in_(self.screening_ids),
+            movie_id.in_(self.movie_ids),
+            cinema_id.in_(self.cinema_ids),
+        )
+
+
+def _loaded_id(obj, attribute: str) -> Optional[int]:
+    # read straight from the instance dict: a deleted or expired instance
+    # must not trigger a lazy load from inside a flush
+    return inspect(obj).dict.get(attribute)
+
+
+def _scope_from_session(session) -> RefreshScope:
+    scope = RefreshScope()
+    dirty = (obj for obj in session.dirty if session.is_modified(obj))
+    for obj in chain(session.new, dirty, session.deleted):
+        if isinstance(obj, ScreeningDate):
+            scope.screening_date_ids.add(_loaded_id(obj, "id"))
+            scope.screening_ids.add(_loaded_id(obj, "screening_id"))
+        elif isinstance(obj, Screening):
+            scope.screening_ids.add(_loaded_id(obj, "id"))
+        elif isinstance(obj, Movie):
+            scope.movie_ids.add(_loaded_id(obj, "id"))
+        elif isinstance(obj, Cinema):
+            scope.cinema_ids.add(_loaded_id(obj, "id"))
+    for ids in (
+        scope.screening_date_ids,
+        scope.screening_ids,
+        scope.movie_ids,
+        scope.cinema_ids,
+    ):
+        ids.discard(None)
+    return scope
+
+
+def _directors_by_movie(connection, movie_ids: Set[int]) -> Dict[int, List[str]]:
+    directors: Dict[int, List[str]] = defaultdict(list)
+    if not movie_ids:
+        return directors
+    rows = connection.execute(
+        select(movie_directors.c.movie_id, Director.name)
+        .join(Director, Director.id == movie_directors.c.director_id)
+        .where(movie_directors.c.movie_id.in_(movie_ids))
+    )
+    for movie_id, name in rows:
+        directors[movie_id].append(name)
+    return directors
+
+
+def _refresh(connection, scope: Optional[RefreshScope]) -> int:
+    """Re-derives the rows in `scope` (every row when None) from the
+    normalized tables and prunes rows older than schedule_horizon().
+    Returns how many rows were written."""
+    horizon = schedule_horizon()
+    connection.execute(delete(_TABLE).where(_TABLE.c.date < horizon))
+
+    source = (
+        select(
+            ScreeningDate.id,
+            ScreeningDate.screening_id,
+            ScreeningDate.date,
+            ScreeningDate.time,
+            Screening.movie_id,
+            Screening.cinema_id,
+            Screening.description,
+            Screening.url,
+            Screening.image,
+            Screening.image_alt,
+            Screening.image_width,
+            Screening.image_height,
+            Screening.draft,
+            Movie.title,
+            Movie.slug.label("movie_slug"),
+            Movie.release_year,
+            Cinema.slug.label("cinema_slug"),
+            Cinema.name.label("cinema_name"),
+        )
+        .join(Screening, Screening.id == ScreeningDate.screening_id)
+        .join(Movie, Movie.id == Screening.movie_id)
+        .join(Cinema, Cinema.id == Screening.cinema_id)
+        .where(ScreeningDate.date >= horizon)
+    )
+    if scope is None:
+        connection.execute(delete(_TABLE))
+    else:
+        connection.execute(
+            delete(_TABLE).where(
+                scope.matches(
+                    _TABLE.c.id,
+                    _TABLE.c.screening_id,
+                    _TABLE.c.movie_id,
+                    _TABLE.c.cinema_id,
+                )
+            )
+        )
+        source = source.where(
+            scope.matches(
+                ScreeningDate.id,
+                Screening.id,
+                Screening.movie_id,
+                Screening.cinema_id,
+            )
+        )
+
+    rows = connection.execute(source).all()
+    if not rows:
+        return 0
+
+    directors = _directors_by_movie(connection, {row.movie_id for row in rows})
+    connection.execute(
+        insert(_TABLE),
+        [
+            {
+                "id": row.id,
+                "screening_id": row.screening_id,
+                "movie_id": row.movie_id,
+                "cinema_id": row.cinema_id,
+                "date": row.date,
+                "time": row.time,
+                "movie_title": row.title,
+                "movie_slug": row.movie_slug,
+                "release_year": row.release_year,
+                "directors": json.dumps(directors.get(row.movie_id, [])),
+                "cinema_slug": row.cinema_slug,
+                # same lookups as the Cinema.short_name/.color properties
+                "cinema_short_name": CINEMA_SHORT_NAMES.get(
+                    row.cinema_slug, row.cinema_name
+                ),
+                "cinema_color": CINEMA_COLORS.get(
+                    row.cinema_slug, DEFAULT_CINEMA_COLOR
+                ),
+                "description": row.description,
+                "screening_url": row.url,
+                "image": row.image,
+                "image_alt": row.image_alt,
+                "image_width": row.image_width,
+                "image_height": row.image_height,
+                "draft": bool(row.draft),
+            }
+            for row in rows
+        ],
+    )
+    return len(rows)
+
+
+@event.listens_for(db_session, "after_flush")
+def _refresh_after_flush(session, _flush_context) -> None:
+    scope = _scope_from_session(session)
+    if scope:
+        _refresh(session.connection(), scope)
+
+
+def refresh(scope: RefreshScope) -> int:
+    """Re-derives the rows in `scope` within the current transaction, for
+    writes that bypass flush events. Does not commit."""
+    if not scope:
+        return 0
+    return _refresh(db_session.connection(), scope)
+
+
+def rebuild() -> int:
+    """Rebuilds the whole table from the normalized tables and commits.
+    Returns how many rows it now holds."""
+    written = _refresh(db_session.connection(), None)
+    db_session.commit()
+    return written
+
+
+def get_days_schedule_by_cinema(
+    day: date,
+) -> Dict[int, List[Tuple[UpcomingShowtime, List[Optional[str]]]]]:
+    """The whole multi-cinema schedule for `day`, keyed by cinema_id. Each
+    bucket holds (showtime, times on `day`) pairs ordered by the
+    screening's earliest time that day, where showtime is that earliest
+    row; a screening with several times that day appears once. Drafts
+    included - the caller decides whether to keep them based on login
+    state. Cinemas with nothing scheduled are absent."""
+    showtimes = (
+        db_session.query(UpcomingShowtime)
+        .filter(UpcomingShowtime.date == day)
+        .order_by(UpcomingShowtime.time)
+        .all()
+    )
+
+    schedule: Dict[int, Dict[int, Tuple[UpcomingShowtime, List[Optional[str]]]]] = (
+        defaultdict(dict)
+    )
+    for showtime in showtimes:
+        _showtime, times = schedule[showtime.cinema_id].setdefault(
+            showtime.screening_id, (showtime, [])
+        )
+        times.append(showtime.time)
+
+    return {
+        cinema_id: list(by_screening.values())
+        for cinema_id, by_screening in schedule.items()
+    }
+
+
+def get_schedule_in_range(
+    start_date: date, end_date: date, include_drafts: bool = False
+) -> List[UpcomingShowtime]:
+    """Every showtime between start_date and end_date (inclusive), ordered
+    by date and time. Drafts are excluded unless include_drafts is True -
+    pass True only for logged-in requests."""
+    query = db_session.query(UpcomingShowtime).filter(
+        UpcomingShowtime.date.between(start_date, end_date)
+    )
+    if not include_drafts:
+        query = query.filter(UpcomingShowtime.draft == False)  # noqa: E712
+    return query.order_by(UpcomingShowtime.date, UpcomingShowtime.time).all()
+
+
+def get_schedule_for_movies(
+    movie_ids: List[int],
+    start_date: date,
+    end_date: date,
+    include_drafts: bool = False,
+) -> List[UpcomingShowtime]:
+    """get_schedule_in_range narrowed to the given movie IDs, across all
+    cinemas."""
+    if not movie_ids:
+        return []
+    query = (
+        db_session.query(UpcomingShowtime)
+        .filter(UpcomingShowtime.movie_id.in_(movie_ids))
+        .filter(UpcomingShowtime.date.between(start_date, end_date))
+    )
+    if not include_drafts:
+        query = query.filter(UpcomingShowtime.draft == False)  # noqa: E712
+    return query.order_by(UpcomingShowtime.date, UpcomingShowtime.time).all()
+
+
+def get_month_schedule(
+    cinema_slugs: Optional[List[str]] = None,
+) -> List[UpcomingShowtime]:
+    """The current month's showtimes (drafts included), optionally limited
+    to the given cinemas, ordered by date and time."""
+    month = date.today().replace(day=1)
+    if month.month in [4, 6, 9, 11]:
+        last_day = month + timedelta(days=30)
+    else:
+        last_day = month + timedelta(days=31)
+    query = db_session.query(UpcomingShowtime).filter(
+        UpcomingShowtime.date.between(month, last_day)
+    )
+    if cinema_slugs:
+        query = query.filter(UpcomingShowtime.cinema_slug.in_(cinema_slugs))
+    return query.order_by(UpcomingShowtime.date, UpcomingShowtime.time).all()
+
+
+def get_weekend_schedule() -> Tuple[List[UpcomingShowtime], date, date, date]:
+    """Non-draft showtimes for this (or the coming) weekend, plus its
+    Friday, Saturday and Sunday dates."""
+    friday_date, saturday_date, sunday_date = get_weekend_dates(date.today())
+    return (
+        get_schedule_in_range(friday_date, sunday_date),
+        friday_date,
+        saturday_date,
+        sunday_date,
+    )
+
+
+def get_upcoming_for_cinema(cinema_id: int) -> List[UpcomingShowtime]:
+    """One row per non-draft screening at this cinema with a showtime today
+    or later - its soonest one - ordered by that showtime."""
+    showtimes = (
+        db_session.query(UpcomingShowtime)
+        .filter(UpcomingShowtime.cinema_id == cinema_id)
+        .filter(UpcomingShowtime.draft == False)  # noqa: E712
+        .filter(UpcomingShowtime.date >= date.today())
+        .order_by(UpcomingShowtime.date, UpcomingShowtime.time)
+        .all()
+    )
+    soonest: Dict[int, UpcomingShowtime] = {}
+    for showtime in showtimes:
+        soonest.setdefault(showtime.screening_id, showtime)
+    return list(soonest.values())
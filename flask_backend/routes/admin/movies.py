@@ -1,4 +1,4 @@
-import requests
+import httpx
 from flask import Blueprint, abort, jsonify, render_template, request
 
 from flask_backend.db import db_session
@@ -48,9 +48,11 @@ def tmdb_search(movie_id):
     if not query:
         return jsonify([])
 
+    # an admin searching by hand wants TMDB's current answer, not a cached
+    # one (fetching refreshes the cache for the pipelines too)
     try:
-        results = TMDBClient().search_movies(query)
-    except requests.RequestException as exc:
+        results = TMDBClient(use_cache=False).search_movies(query)
+    except httpx.HTTPError as exc:
         return jsonify({"error": str(exc)}), 502
 
     candidates = []
@@ -95,8 +97,8 @@ def tmdb_link(movie_id):
         return jsonify({"error": "tmdb_id é obrigatório."}), 400
 
     try:
-        details = TMDBClient().get_movie_details(tmdb_id)
-    except requests.RequestException as exc:
+        details = TMDBClient(use_cache=False).get_movie_details(tmdb_id)
+    except httpx.HTTPError as exc:
         return jsonify({"error": str(exc)}), 502
 
     apply_tmdb_details(movie, tmdb_id, details)
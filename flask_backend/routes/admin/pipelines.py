@@ -173,6 +173,7 @@ def detail(pipeline_name, run_id):
         run=run,
         label=_group_label(run.pipeline_name, run.source),
         display_status=pipeline_runs.display_status(run),
+        http_stats=json.loads(run.http_stats) if run.http_stats else None,
         screenings=screenings,
         metadata_attempts=metadata_attempts,
         poster_attempts=poster_attempts,
@@ -8,11 +8,13 @@ from flask import (
 from werkzeug.exceptions import abort
 
 from flask_backend.repository import blog_posts
+from flask_backend.utils.response_cache import cached_page
 
 bp = Blueprint("blog", __name__)
 
 
 @bp.route("/blog")
+@cached_page()
 def index():
     """Public blog listing page"""
     user_logged_in = g.user is not None
@@ -4,8 +4,9 @@ from flask_backend.repository.cinemas import get_all, get_by_slug
 from flask_backend.repository.screenings import (
     get_latest_screening_images_for_movies,
     get_past_movies_for_cinema,
-    get_screenings_with_upcoming_dates,
 )
+from flask_backend.repository.upcoming_schedule import get_upcoming_for_cinema
+from flask_backend.utils.response_cache import cached_page
 
 bp = Blueprint("cinema", __name__)
 
@@ -17,12 +18,13 @@ def index():
 
 
 @bp.route("/cinemas/<slug>")
+@cached_page()
 def show(slug):
     cinema = get_by_slug(slug)
     if cinema is None:
         abort(404)
 
-    upcoming_screenings = get_screenings_with_upcoming_dates(cinema_id=cinema.id)
+    upcoming_screenings = get_upcoming_for_cinema(cinema.id)
     past_movies = get_past_movies_for_cinema(cinema.id)
     past_movie_screenings = get_latest_screening_images_for_movies(
         cinema.id, [movie.id for movie, _exclusive in past_movies]
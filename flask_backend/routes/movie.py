@@ -11,11 +11,13 @@ from flask_backend.repository.movies import (
 )
 from flask_backend.routes.auth import login_required
 from flask_backend.routes.screening import CANONICAL_BASE_URL
+from flask_backend.utils.response_cache import cached_page
 
 bp = Blueprint("movie", __name__)
 
 
 @bp.route("/movies")
+@cached_page()
 def index():
     user_logged_in = g.user is not None
     try:
@@ -1,6 +1,6 @@
 import math
 from datetime import date, datetime, timedelta
-from typing import List, Optional
+from typing import Optional
 
 from flask import (
     Blueprint,
@@ -31,16 +31,17 @@ from flask_backend.repository.movies import (
 from flask_backend.repository.screenings import (
     create as create_screening,
     delete as delete_screening,
-    get_days_screenings_by_cinema_id,
-    get_month_screening_dates,
     get_screening_by_id,
-    get_screening_dates_for_movies,
-    get_screenings_in_date_range,
-    get_weekend_screening_dates,
     reattach_movie,
     update as update_screening,
     update_screening_dates,
 )
+from flask_backend.repository.upcoming_schedule import (
+    get_days_schedule_by_cinema,
+    get_month_schedule,
+    get_schedule_in_range,
+    get_weekend_schedule,
+)
 from flask_backend.repository.want_to_watch import (
     get_movie_ids_for_visitor,
     toggle as toggle_want_to_watch,
@@ -56,6 +57,7 @@ from flask_backend.service.screening import (
     validate_image,
 )
 from flask_backend.utils.mobile import is_mobile_user_agent
+from flask_backend.utils.response_cache import cached_page
 from flask_backend.utils.visitor import (
     VISITOR_COOKIE_NAME,
     get_visitor_id,
@@ -82,16 +84,11 @@ def _mobile_index(shared_screening: Optional[Screening] = None):
     window_end = today + timedelta(days=6)
     user_logged_in = g.user is not None
 
-    screenings = get_screenings_in_date_range(today, window_end)
-    movie_ids = list({screening.movie_id for screening in screenings})
-    movie_dates = get_screening_dates_for_movies(
-        movie_ids, today, window_end, include_drafts=user_logged_in
-    )
+    showtimes = get_schedule_in_range(today, window_end, include_drafts=user_logged_in)
     visitor_id = get_visitor_id(request)
     wanted_movie_ids = get_movie_ids_for_visitor(visitor_id) if visitor_id else set()
     cards = build_reels_feed(
-        screenings,
-        movie_dates,
+        showtimes,
         today,
         window_end,
         user_logged_in,
@@ -117,6 +114,7 @@ def _mobile_index(shared_screening: Optional[Screening] = None):
 
 
 @bp.route("/")
+@cached_page(varies_on_visitor=True, varies_on_clock=True)
 def index():
     screening_id = request.args.get("screening", type=int)
     shared_screening = get_screening_by_id(screening_id) if screening_id else None
@@ -141,6 +139,8 @@ def index():
 
     user_logged_in = g.user is not None
 
+    todays_schedule = get_days_schedule_by_cinema(today)
+
     for cinema in cinemas:
         quicklinks.append((cinema.slug, cinema.name))
 
@@ -152,33 +152,27 @@ def index():
             "url": cinema.url,
             "screening_dates": [],
         }
-        screenings: List[Screening] = get_days_screenings_by_cinema_id(cinema.id, today)
-        for screening in screenings:
-            if screening.draft is True and not user_logged_in:
+        for showtime, screening_times in todays_schedule.get(cinema.id, []):
+            if showtime.draft is True and not user_logged_in:
                 continue
             # used to set <li> styling
             minHeight = None
-            if screening.image is not None:
+            if showtime.image is not None:
                 minHeight = math.ceil(
-                    imgDisplayWidth / screening.image_width * screening.image_height
+                    imgDisplayWidth / showtime.image_width * showtime.image_height
                 )
-            screening_times = [
-                screening_date.time
-                for screening_date in screening.dates
-                if screening_date.date == today
-            ]
             cinema_obj["screening_dates"].append(
                 {
                     "times": screening_times,
-                    "image": screening.image,
-                    "image_alt": screening.image_alt,
+                    "image": showtime.image,
+                    "image_alt": showtime.image_alt,
                     "min_height": minHeight,
                     "image_display_width": imgDisplayWidth,
-                    "title": screening.movie.title,
-                    "description": screening.description,
-                    "screening_url": screening.url,
-                    "screening_id": screening.id,
-                    "draft": screening.draft,
+                    "title": showtime.movie_title,
+                    "description": showtime.description,
+                    "screening_url": showtime.screening_url,
+                    "screening_id": showtime.screening_id,
+                    "draft": showtime.draft,
                 }
             )
         cinemas_with_screenings.append(cinema_obj)
@@ -203,10 +197,9 @@ def index():
 
 
 @bp.route("/weekend")
+@cached_page()
 def weekend():
-    screening_dates, friday_date, saturday_date, sunday_date = (
-        get_weekend_screening_dates()
-    )
+    screening_dates, friday_date, saturday_date, sunday_date = get_weekend_schedule()
     return render_template(
         "screening/weekend.html",
         screening_dates=screening_dates,
@@ -217,6 +210,7 @@ def weekend():
 
 
 @bp.route("/program")
+@cached_page()
 def programacao():
     all_cinemas = get_all_cinemas()
 
@@ -228,7 +222,7 @@ def programacao():
         else [cinema.slug for cinema in all_cinemas]
     )
 
-    screening_dates = get_month_screening_dates(checked_cinemas)
+    screening_dates = get_month_schedule(checked_cinemas)
     # group by date
     screening_dates_grouped = {}
     for screening_date in screening_dates:
@@ -543,6 +537,7 @@ def want_to_watch(movie_id):
 
 
 @bp.route("/favoritos")
+@cached_page(varies_on_visitor=True, varies_on_clock=True)
 def favoritos():
     visitor_id = get_visitor_id(request)
     movie_ids = list(get_movie_ids_for_visitor(visitor_id)) if visitor_id else []
@@ -0,0 +1,247 @@
+"""Benchmark do `sync-graph`: cadastra um histórico sintético (100.000
+horários de sessão por padrão, cinco por sessão, com gêneros, diretores e
+países) e mede, cada um em um processo próprio, a reconstrução do grafo do
+zero e uma sincronização incremental depois de alterar 1% das sessões -
+tempo, linhas do grafo (nós + arestas) por segundo, linhas gravadas e
+pico de memória (RSS) do processo.
+
+Roda em um banco temporário novo, criado com `init-db`, e em um grafo
+temporário. Não toca no banco configurado em DATABASE_URL nem em
+GRAPH_DB_PATH.
+
+    uv run python -m flask_backend.scripts.graph_sync_benchmark --dates 100000
+"""
+
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+import click
+
+from flask_backend.scripts.sqlite_concurrency_benchmark import (
+    CINEMA_SLUGS,
+    register_cinemas,
+)
+
+DATES_PER_SCREENING = 5
+SCREENINGS_PER_MOVIE = 4
+
+
+def populate_history(dates: int, first_day: date = date(2020, 1, 1)) -> None:
+    """Registers a synthetic screening history of `dates` screening dates,
+    spread over 2000 days from first_day, in the app's database."""
+    from sqlalchemy import insert, select
+
+    from flask_backend.db import db_session
+    from flask_backend.models import (
+        Cinema,
+        Country,
+        Director,
+        Genre,
+        Movie,
+        Screening,
+        ScreeningDate,
+        movie_countries,
+        movie_directors,
+        movie_genres,
+    )
+
+    screenings = dates // DATES_PER_SCREENING
+    movies = max(1, screenings // SCREENINGS_PER_MOVIE)
+    cinema_ids = [
+        cinema_id
+        for (cinema_id,) in db_session.execute(
+            select(Cinema.id).where(Cinema.slug.in_(CINEMA_SLUGS))
+        )
+    ]
+
+    db_session.execute(
+        insert(Genre), [{"tmdb_id": i, "name": f"Gênero {i}"} for i in range(1, 20)]
+    )
+    db_session.execute(
+        insert(Director),
+        [{"tmdb_id": i, "name": f"Diretora {i}"} for i in range(1, 301)],
+    )
+    db_session.execute(
+        insert(Country),
+        [{"iso_3166_1": f"C{i}", "name": f"País {i}"} for i in range(1, 13)],
+    )
+    db_session.execute(
+        insert(Movie),
+        [
+            {
+                "title": f"Filme sintético {i}",
+                "slug": f"filme-sintetico-{i}",
+                "release_year": 1950 + i % 75,
+            }
+            for i in range(1, movies + 1)
+        ],
+    )
+    db_session.execute(
+        insert(movie_genres),
+        [
+            {"movie_id": i, "genre_id": genre_id}
+            for i in range(1, movies + 1)
+            for genre_id in {1 + i % 19, 1 + (i + 1) % 19}
+        ],
+    )
+    db_session.execute(
+        insert(movie_directors),
+        [{"movie_id": i, "director_id": 1 + i % 300} for i in range(1, movies + 1)],
+    )
+    db_session.execute(
+        insert(movie_countries),
+        [{"movie_id": i, "country_id": 1 + i % 12} for i in range(1, movies + 1)],
+    )
+    db_session.execute(
+        insert(Screening),
+        [
+            {
+                "movie_id": 1 + i % movies,
+                "cinema_id": cinema_ids[i % len(cinema_ids)],
+                "description": "Sessão gerada pelo benchmark do grafo.",
+                "draft": False,
+            }
+            for i in range(screenings)
+        ],
+    )
+    db_session.execute(
+        insert(ScreeningDate),
+        [
+            {
+                "screening_id": 1 + i // DATES_PER_SCREENING,
+                "date": first_day + timedelta(days=i % 2000),
+                "time": f"{14 + i % DATES_PER_SCREENING * 2}:00",
+            }
+            for i in range(screenings * DATES_PER_SCREENING)
+        ],
+    )
+    db_session.commit()
+
+
+def _touch_one_percent() -> None:
+    """Changes 1% of the screenings and adds a date to each of them."""
+    from sqlalchemy import func, insert, select, update
+
+    from flask_backend.db import db_session
+    from flask_backend.models import Screening, ScreeningDate
+
+    screenings = db_session.execute(select(func.count(Screening.id))).scalar()
+    touched = list(range(1, screenings + 1, 100))
+    db_session.execute(
+        update(Screening).where(Screening.id.in_(touched)).values(draft=True)
+    )
+    db_session.execute(
+        insert(ScreeningDate),
+        [
+            {"screening_id": screening_id, "date": date(2030, 1, 1), "time": "21:00"}
+            for screening_id in touched
+        ],
+    )
+    db_session.commit()
+
+
+def _timed_sync(mode: str) -> None:
+    """Runs in a child process of its own, so ru_maxrss is this sync's
+    peak."""
+    from flask_backend import create_app
+    from flask_backend.service.graph_sync import sync_graph
+
+    app = create_app()
+    with app.app_context():
+        if mode == "incremental":
+            _touch_one_percent()
+        started = time.perf_counter()
+        result = sync_graph(incremental=mode == "incremental")
+        elapsed = time.perf_counter() - started
+    peak_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    written = (
+        result.nodes_created
+        + result.nodes_updated
+        + result.nodes_deleted
+        + result.edges_created
+        + result.edges_deleted
+    )
+    rows = _graph_rows()
+    click.echo(
+        f"{mode:<14}{elapsed:>10.2f}{rows:>10}{rows / elapsed:>12.0f}"
+        f"{written:>10}{peak_rss_mb:>10.1f}"
+    )
+
+
+def _graph_rows() -> int:
+    """Nodes + edges of the synced graph - what each sync goes through."""
+    import sqlite3
+
+    from flask_backend.env_config import GRAPH_DB_PATH
+
+    with sqlite3.connect(GRAPH_DB_PATH) as conn:
+        return conn.execute(
+            "SELECT (SELECT COUNT(*) FROM nodes) + (SELECT COUNT(*) FROM edges)"
+        ).fetchone()[0]
+
+
+def _flask(env: dict, *args: str) -> None:
+    result = subprocess.run(
+        [sys.executable, "-m", "flask", "--app", "flask_backend", *args],
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise click.ClickException(result.stderr)
+
+
+def _child(env: dict, *args: str) -> None:
+    subprocess.run([sys.executable, "-m", __spec__.name, *args], env=env, check=True)
+
+
+@click.command()
+@click.option(
+    "--dates",
+    default=100_000,
+    show_default=True,
+    help="Horários de sessão sintéticos.",
+)
+@click.option(
+    "--child",
+    type=click.Choice(["populate", "rebuild", "incremental"]),
+    hidden=True,
+)
+def main(dates, child):
+    if child == "populate":
+        from flask_backend import create_app
+
+        with create_app().app_context():
+            populate_history(dates)
+        return
+    if child:
+        _timed_sync(child)
+        return
+
+    with tempfile.TemporaryDirectory() as workdir:
+        env = {
+            key: value for key, value in os.environ.items() if key != "PYTEST_VERSION"
+        }
+        database_path = Path(workdir) / "benchmark.sqlite"
+        env["DATABASE_URL"] = f"sqlite:///{database_path}"
+        env["GRAPH_DB_PATH"] = str(Path(workdir) / "graph.sqlite")
+        _flask(env, "init-db")
+        register_cinemas(database_path)
+        _child(env, "--dates", str(dates), "--child", "populate")
+
+        click.echo(
+            f"{'sincronização':<14}{'segundos':>10}{'linhas':>10}"
+            f"{'linhas/s':>12}{'gravadas':>10}{'RSS MB':>10}"
+        )
+        _child(env, "--child", "rebuild")
+        _child(env, "--child", "incremental")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""Benchmark do `import_scrapped_results`: gera um JSON sintético no formato
+dos scrapers (5.000 filmes por padrão, distribuídos entre os quatro
+cinemas) e mede o tempo e o número de comandos SQL de duas importações
+seguidas - a primeira cria todos os filmes e sessões, a segunda reimporta
+os mesmos filmes com parte dos horários trocados.
+
+Roda em um banco temporário novo, criado com `init-db` + `seed-db`. Não toca
+no banco configurado em DATABASE_URL.
+
+    uv run python -m flask_backend.scripts.import_benchmark --features 5000
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+import click
+
+from flask_backend.scripts.sqlite_concurrency_benchmark import (
+    CINEMA_SLUGS,
+    register_cinemas,
+)
+
+
+def _synthetic_results(features: int, round_number: int) -> list:
+    """`features` movies spread over the four cinemas, three showtimes each.
+    Every other round moves the last showtime of each movie a day later, so
+    the re-import both keeps and adds dates."""
+    today = date.today()
+    cinemas = {slug: [] for slug in CINEMA_SLUGS}
+    for index in range(features):
+        slug = CINEMA_SLUGS[index % len(CINEMA_SLUGS)]
+        times = []
+        for showtime in range(3):
+            shift = round_number if showtime == 2 else 0
+            day = today + timedelta(days=(index + showtime + shift) % 14)
+            times.append(f"{day.isoformat()}T{14 + showtime * 2:02d}:{index % 60:02d}")
+        cinemas[slug].append(
+            {
+                "title": f"Filme sintético {index}",
+                "original_title": f"Synthetic Movie {index}",
+                "price": "R$ 10,00",
+                "director": "Direção de benchmark",
+                "classification": "Livre",
+                "general_info": "Brasil, 2025, 90 min",
+                "excerpt": "Sessão gerada pelo benchmark de importação.",
+                "read_more": "",
+                "time": times,
+                "poster": "",
+            }
+        )
+    return [
+        {"url": "", "cinema": slug, "slug": slug, "features": features}
+        for slug, features in cinemas.items()
+    ]
+
+
+def _flask(env: dict, *args: str) -> None:
+    result = subprocess.run(
+        [sys.executable, "-m", "flask", "--app", "flask_backend", *args],
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise click.ClickException(result.stderr)
+
+
+def _timed_import(app, features: int, round_number: int) -> dict:
+    from sqlalchemy import event
+
+    from flask_backend.db import db_session
+    from flask_backend.import_json import ScrappedResult
+    from flask_backend.service.screening import import_scrapped_results
+
+    results = ScrappedResult.from_jsonable(_synthetic_results(features, round_number))
+    statements = []
+
+    def count(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        with app.app_context():
+            started = time.perf_counter()
+            summary = import_scrapped_results(results, app)
+            elapsed = time.perf_counter() - started
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+    return {"seconds": elapsed, "statements": len(statements), "summary": summary}
+
+
+def _run_imports(features: int) -> None:
+    """Runs in the child process, whose DATABASE_URL points at the
+    temporary database."""
+    from flask_backend import create_app
+
+    app = create_app()
+    click.echo(f"{'importação':<14}{'segundos':>10}{'comandos':>10}  resumo")
+    for label, round_number in (("primeira", 0), ("reimportação", 1)):
+        stats = _timed_import(app, features, round_number)
+        summary = stats["summary"]
+        click.echo(
+            f"{label:<14}{stats['seconds']:>10.2f}{stats['statements']:>10}  "
+            f"filmes={summary.movies_created} "
+            f"sessões={summary.screenings_created} "
+            f"datas={summary.dates_registered}"
+        )
+
+
+@click.command()
+@click.option(
+    "--features",
+    default=5000,
+    show_default=True,
+    help="Filmes no JSON sintético.",
+)
+@click.option("--child", is_flag=True, hidden=True)
+def main(features, child):
+    if child:
+        _run_imports(features)
+        return
+
+    with tempfile.TemporaryDirectory() as workdir:
+        env = {
+            key: value for key, value in os.environ.items() if key != "PYTEST_VERSION"
+        }
+        database_path = Path(workdir) / "benchmark.sqlite"
+        env["DATABASE_URL"] = f"sqlite:///{database_path}"
+        _flask(env, "init-db")
+        _flask(env, "seed-db")
+        register_cinemas(database_path)
+        subprocess.run(
+            [
+                *(sys.executable, "-m", __spec__.name, "--child"),
+                *("--features", str(features)),
+            ],
+            env=env,
+            check=True,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""Benchmark do `detect-motifs`: cadastra um histórico sintético (100.000
+horários de sessão por padrão - cerca de 10 vezes o volume atual - com
+gêneros, diretores e países, os últimos 100 dias no futuro), sincroniza o
+grafo e mede a leitura dos fatos das sessões e a avaliação de cada motivo,
+em milissegundos, sem o cache de consultas do grafo. Depois altera algumas
+sessões (10 por padrão), sincroniza o grafo de forma incremental e compara
+a detecção incremental (`detect_incremental`, que reavalia só o que a
+sincronização tocou) com a completa.
+
+Roda em um banco temporário novo, criado com `init-db`, e em um grafo
+temporário. Não toca no banco configurado em DATABASE_URL nem em
+GRAPH_DB_PATH.
+
+    uv run python -m flask_backend.scripts.motif_benchmark --dates 100000 --changed 10
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+import click
+
+from flask_backend.scripts.graph_sync_benchmark import populate_history
+from flask_backend.scripts.sqlite_concurrency_benchmark import register_cinemas
+
+HISTORY_DAYS = 2000
+FUTURE_DAYS = 100
+
+
+def _touch_screenings(count: int) -> None:
+    """Toggles the draft flag of `count` screenings spread over the history
+    and gives each of them a new date tomorrow."""
+    from sqlalchemy import func, insert, select, update
+
+    from flask_backend.db import db_session
+    from flask_backend.models import Screening, ScreeningDate
+
+    screenings = db_session.execute(select(func.count(Screening.id))).scalar()
+    touched = list(range(1, screenings + 1, max(1, screenings // count)))[:count]
+    db_session.execute(
+        update(Screening)
+        .where(Screening.id.in_(touched))
+        .values(draft=~Screening.draft)
+    )
+    db_session.execute(
+        insert(ScreeningDate),
+        [
+            {
+                "screening_id": screening_id,
+                "date": date.today() + timedelta(days=1),
+                "time": "21:00",
+            }
+            for screening_id in touched
+        ],
+    )
+    db_session.commit()
+
+
+def _timed_motifs(dates: int, rounds: int, changed: int) -> None:
+    """Runs in the child process, whose environment points at the
+    temporary database and graph."""
+    from flask_backend import create_app
+    from flask_backend.env_config import GRAPH_DB_PATH
+    from flask_backend.service.graph_cache import get_graph
+    from flask_backend.service.graph_sync import sync_graph
+    from flask_backend.service.motif_snapshot import detect_incremental
+    from flask_backend.service.motifs import detect_all
+
+    app = create_app()
+    with app.app_context():
+        populate_history(
+            dates, date.today() - timedelta(days=HISTORY_DAYS - FUTURE_DAYS)
+        )
+        sync_graph()
+
+    graph = get_graph(GRAPH_DB_PATH)
+    best: dict[str, float] = {}
+    started = time.perf_counter()
+    for _round in range(rounds):
+        observations, timings = detect_all(graph)
+        for name, seconds in timings.items():
+            best[name] = min(seconds, best.get(name, seconds))
+    elapsed = (time.perf_counter() - started) / rounds
+
+    click.echo(f"{'etapa':<20}{'ms':>10}")
+    for name, seconds in best.items():
+        click.echo(f"{name:<20}{seconds * 1000:>10.1f}")
+    click.echo(f"{'total (média)':<20}{elapsed * 1000:>10.1f}")
+    click.echo(f"observações: {len(observations)}")
+
+    detect_incremental(graph)
+    with app.app_context():
+        _touch_screenings(changed)
+        sync_graph(incremental=True)
+    started = time.perf_counter()
+    detect_incremental(graph)
+    incremental = time.perf_counter() - started
+    started = time.perf_counter()
+    detect_all(graph)
+    full = time.perf_counter() - started
+    click.echo(
+        f"{changed} sessões alteradas: incremental {incremental * 1000:.1f} ms, "
+        f"completa {full * 1000:.1f} ms"
+    )
+
+
+def _flask(env: dict, *args: str) -> None:
+    result = subprocess.run(
+        [sys.executable, "-m", "flask", "--app", "flask_backend", *args],
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise click.ClickException(result.stderr)
+
+
+@click.command()
+@click.option(
+    "--dates",
+    default=100_000,
+    show_default=True,
+    help="Horários de sessão sintéticos.",
+)
+@click.option(
+    "--rounds",
+    default=3,
+    show_default=True,
+    help="Rodadas de detecção; vale o menor tempo de cada etapa.",
+)
+@click.option(
+    "--changed",
+    default=10,
+    show_default=True,
+    help="Sessões alteradas antes da detecção incremental.",
+)
+@click.option("--child", is_flag=True, hidden=True)
+def main(dates, rounds, changed, child):
+    if child:
+        _timed_motifs(dates, rounds, changed)
+        return
+
+    with tempfile.TemporaryDirectory() as workdir:
+        env = {
+            key: value for key, value in os.environ.items() if key != "PYTEST_VERSION"
+        }
+        database_path = Path(workdir) / "benchmark.sqlite"
+        env["DATABASE_URL"] = f"sqlite:///{database_path}"
+        env["GRAPH_DB_PATH"] = str(Path(workdir) / "graph.sqlite")
+        _flask(env, "init-db")
+        register_cinemas(database_path)
+        subprocess.run(
+            [
+                *(sys.executable, "-m", __spec__.name, "--child"),
+                *("--dates", str(dates), "--rounds", str(rounds)),
+                *("--changed", str(changed)),
+            ],
+            env=env,
+            check=True,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+"""Benchmark de concorrência do SQLite: N threads leitoras requisitando `/`
+enquanto `flask import-json` grava no mesmo arquivo em loop, com e sem a
+configuração de conexão de flask_backend/db.py (SQLITE_TUNING). Reporta a
+latência p50/p99 das leituras e quantos erros "database is locked" leitores
+e importações sofreram.
+
+Cada modo roda em um banco temporário novo (o journal_mode=WAL fica gravado
+no arquivo), criado com `init-db` + `seed-db`. Não toca no banco configurado
+em DATABASE_URL.
+
+    uv run python -m flask_backend.scripts.sqlite_concurrency_benchmark \\
+        --readers 8 --seconds 20
+"""
+
+import json
+import os
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+import click
+
+DESKTOP_UA = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36"
+)
+CINEMA_SLUGS = ("capitolio", "sala-redencao", "cinebancarios", "paulo-amorim")
+
+
+def _import_features(features_per_cinema: int, round_number: int) -> list:
+    """A scraper-shaped payload whose showtimes shift every round, so each
+    import writes new screening dates instead of finding them all known."""
+    today = date.today()
+    cinemas = []
+    for slug in CINEMA_SLUGS:
+        features = []
+        for index in range(features_per_cinema):
+            day = today + timedelta(days=(index + round_number) % 14)
+            minute = (round_number * 7 + index) % 60
+            features.append(
+                {
+                    "title": f"Filme de benchmark {slug} {index}",
+                    "excerpt": "Sessão gerada pelo benchmark de concorrência.",
+                    "time": [f"{day.isoformat()}T{14 + index % 8:02d}:{minute:02d}"],
+                    "poster": "",
+                }
+            )
+        cinemas.append({"url": "", "cinema": slug, "slug": slug, "features": features})
+    return cinemas
+
+
+def register_cinemas(database_path: Path) -> None:
+    """The migrations already insert cine-cinco, which makes `seed-db` skip
+    the other cinemas; the benchmark payloads need all of CINEMA_SLUGS."""
+    with sqlite3.connect(database_path) as connection:
+        connection.executemany(
+            "INSERT OR IGNORE INTO cinemas (name, slug, url) VALUES (?, ?, '')",
+            [(slug, slug) for slug in CINEMA_SLUGS],
+        )
+
+
+def _percentile(latencies: list, fraction: float) -> float:
+    if not latencies:
+        return 0.0
+    ordered = sorted(latencies)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def _hammer(readers: int, seconds: float) -> dict:
+    """Runs in the reader child process: `readers` threads requesting `/`
+    through the Flask test client until the deadline. Each request has a
+    unique query string so the response cache can't answer it."""
+    from sqlalchemy.exc import OperationalError
+
+    from flask_backend import create_app
+
+    app = create_app()
+    app.config["PROPAGATE_EXCEPTIONS"] = True
+    deadline = time.monotonic() + seconds
+    latencies = []
+    counters = {"locked": 0, "errors": 0}
+    lock = threading.Lock()
+
+    def read(reader: int) -> None:
+        client = app.test_client()
+        request_number = 0
+        while time.monotonic() < deadline:
+            request_number += 1
+            started = time.perf_counter()
+            try:
+                response = client.get(
+                    f"/?bench={reader}-{request_number}",
+                    headers={"User-Agent": DESKTOP_UA},
+                )
+                failed = "errors" if response.status_code != 200 else None
+            except OperationalError as exc:
+                failed = "locked" if "database is locked" in str(exc) else "errors"
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            with lock:
+                latencies.append(elapsed_ms)
+                if failed:
+                    counters[failed] += 1
+
+    threads = [threading.Thread(target=read, args=(n,)) for n in range(readers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    return {
+        "requests": len(latencies),
+        "p50_ms": statistics.median(latencies) if latencies else 0.0,
+        "p99_ms": _percentile(latencies, 0.99),
+        "locked": counters["locked"],
+        "errors": counters["errors"],
+    }
+
+
+def _flask(env: dict, *args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "-m", "flask", "--app", "flask_backend", *args],
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+
+
+def _run_mode(tuned: bool, readers: int, seconds: float, features: int) -> dict:
+    with tempfile.TemporaryDirectory() as workdir:
+        env = {
+            key: value for key, value in os.environ.items() if key != "PYTEST_VERSION"
+        }
+        database_path = Path(workdir) / "benchmark.sqlite"
+        env["DATABASE_URL"] = f"sqlite:///{database_path}"
+        env["SQLITE_TUNING"] = "True" if tuned else "False"
+        for command in (("init-db",), ("seed-db",)):
+            result = _flask(env, *command)
+            if result.returncode != 0:
+                raise click.ClickException(result.stderr)
+        register_cinemas(database_path)
+
+        payloads = []
+        for round_number in range(2):
+            payload = Path(workdir) / f"import-{round_number}.json"
+            payload.write_text(json.dumps(_import_features(features, round_number)))
+            payloads.append(payload)
+        result = _flask(env, "import-json", str(payloads[0]))
+        if result.returncode != 0 or result.stderr:
+            raise click.ClickException(result.stderr)
+
+        reader = subprocess.Popen(
+            [
+                *(sys.executable, "-m", __spec__.name, "--reader"),
+                *("--readers", str(readers), "--seconds", str(seconds)),
+            ],
+            env=env,
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        imports = import_locked = 0
+        while reader.poll() is None:
+            result = _flask(env, "import-json", str(payloads[imports % 2]))
+            imports += 1
+            if "database is locked" in result.stderr:
+                import_locked += 1
+        stats = json.loads(reader.stdout.read())
+
+    stats["imports"] = imports
+    stats["import_locked"] = import_locked
+    return stats
+
+
+@click.command()
+@click.option("--readers", default=8, show_default=True, help="Threads leitoras.")
+@click.option("--seconds", default=20.0, show_default=True, help="Duração por modo.")
+@click.option(
+    "--features",
+    default=50,
+    show_default=True,
+    help="Filmes por cinema em cada import-json.",
+)
+@click.option("--reader", is_flag=True, hidden=True)
+def main(readers, seconds, features, reader):
+    if reader:
+        click.echo(json.dumps(_hammer(readers, seconds)))
+        return
+
+    header = (
+        f"{'modo':<10}{'reqs':>8}{'p50 ms':>10}{'p99 ms':>10}"
+        f"{'locked':>8}{'erros':>8}{'imports':>9}{'imp. locked':>13}"
+    )
+    click.echo(header)
+    for label, tuned in (("antes", False), ("depois", True)):
+        stats = _run_mode(tuned, readers, seconds, features)
+        click.echo(
+            f"{label:<10}{stats['requests']:>8}{stats['p50_ms']:>10.1f}"
+            f"{stats['p99_ms']:>10.1f}{stats['locked']:>8}{stats['errors']:>8}"
+            f"{stats['imports']:>9}{stats['import_locked']:>13}"
+        )
+
+
+if __name__ == "__main__":
+    main()
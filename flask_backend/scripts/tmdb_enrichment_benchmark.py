@@ -0,0 +1,207 @@
+"""Benchmark do `fetch-movie-metadata` contra um servidor TMDB falso local:
+cadastra N filmes sem metadados e roda o pipeline com 1 worker e com
+`--workers` workers, medindo o tempo e o número de comandos SQL de cada
+rodada.
+
+O servidor falso responde /search/movie e /movie/{id} depois de
+`--latency-ms` milissegundos, com diretores, gêneros, países e coleções
+sorteados de conjuntos pequenos (como no catálogo real, muitos filmes
+compartilham os mesmos). O cache do TMDB fica desligado e o limite de
+requisições por segundo bem alto, para medir só o pipeline.
+
+Roda em um banco temporário novo, criado com `init-db`. Não toca no banco
+configurado em DATABASE_URL.
+
+    uv run python -m flask_backend.scripts.tmdb_enrichment_benchmark --movies 500
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+import click
+
+
+def _details(tmdb_id: int) -> dict:
+    return {
+        "id": tmdb_id,
+        "original_title": f"Synthetic Movie {tmdb_id}",
+        "release_date": f"{1950 + tmdb_id % 75}-01-01",
+        "original_language": "pt",
+        "genres": [
+            {"id": genre_id, "name": f"Gênero {genre_id}"}
+            for genre_id in (100 + tmdb_id % 19, 100 + (tmdb_id + 1) % 19)
+        ],
+        "production_countries": [
+            {"iso_3166_1": f"C{tmdb_id % 12}", "name": f"País {tmdb_id % 12}"}
+        ],
+        "belongs_to_collection": (
+            {"id": 9000 + tmdb_id % 40, "name": f"Coleção {tmdb_id % 40}"}
+            if tmdb_id % 5 == 0
+            else None
+        ),
+        "credits": {
+            "crew": [
+                {
+                    "id": 5000 + tmdb_id % 300,
+                    "name": f"Diretora {tmdb_id % 300}",
+                    "job": "Director",
+                }
+            ]
+        },
+    }
+
+
+def _fake_tmdb_server(latency_seconds: float) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            time.sleep(latency_seconds)
+            url = urlparse(self.path)
+            if url.path == "/3/search/movie":
+                title = parse_qs(url.query)["query"][0]
+                body = {"results": [{"id": int(title.rsplit(" ", 1)[-1])}]}
+            else:
+                body = _details(int(url.path.rsplit("/", 1)[-1]))
+            payload = json.dumps(body).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *_args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _insert_movies(first_id: int, movies: int) -> None:
+    from sqlalchemy import insert
+
+    from flask_backend.db import db_session
+    from flask_backend.models import Movie
+
+    db_session.execute(
+        insert(Movie),
+        [
+            {"title": f"Filme sintético {index}", "slug": f"filme-sintetico-{index}"}
+            for index in range(first_id, first_id + movies)
+        ],
+    )
+    db_session.commit()
+
+
+def _timed_run(app, workers: int) -> dict:
+    from sqlalchemy import event
+
+    from flask_backend.db import db_session
+    from flask_backend.service.movie_metadata_pipeline import run_pipeline
+
+    statements = []
+
+    def count(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        with app.app_context():
+            started = time.perf_counter()
+            result = run_pipeline(workers=workers)
+            elapsed = time.perf_counter() - started
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+    return {"seconds": elapsed, "statements": len(statements), "result": result}
+
+
+def _run_rounds(movies: int, workers: int, latency_ms: int) -> None:
+    """Runs in the child process, whose environment points at the
+    temporary database and the benchmark TMDB settings."""
+    from flask_backend import create_app
+    from flask_backend.service import tmdb
+
+    server = _fake_tmdb_server(latency_ms / 1000)
+    tmdb.TMDB_API_BASE_URL = f"http://127.0.0.1:{server.server_port}/3"
+    app = create_app()
+
+    click.echo(f"{'workers':<10}{'segundos':>10}{'comandos':>10}  resultado")
+    for round_number, round_workers in enumerate((1, workers)):
+        with app.app_context():
+            _insert_movies(1 + round_number * movies, movies)
+        stats = _timed_run(app, round_workers)
+        result = stats["result"]
+        click.echo(
+            f"{round_workers:<10}{stats['seconds']:>10.2f}{stats['statements']:>10}  "
+            f"encontrados={result.metadata_found} erros={result.errors}"
+        )
+    server.shutdown()
+
+
+def _flask(env: dict, *args: str) -> None:
+    result = subprocess.run(
+        [sys.executable, "-m", "flask", "--app", "flask_backend", *args],
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise click.ClickException(result.stderr)
+
+
+@click.command()
+@click.option(
+    "--movies",
+    default=500,
+    show_default=True,
+    help="Filmes sem metadados em cada rodada.",
+)
+@click.option(
+    "--workers",
+    default=8,
+    show_default=True,
+    help="Workers da segunda rodada (a primeira usa 1).",
+)
+@click.option(
+    "--latency-ms",
+    default=30,
+    show_default=True,
+    help="Latência de cada resposta do TMDB falso.",
+)
+@click.option("--child", is_flag=True, hidden=True)
+def main(movies, workers, latency_ms, child):
+    if child:
+        _run_rounds(movies, workers, latency_ms)
+        return
+
+    with tempfile.TemporaryDirectory() as workdir:
+        env = {
+            key: value for key, value in os.environ.items() if key != "PYTEST_VERSION"
+        }
+        env["DATABASE_URL"] = f"sqlite:///{Path(workdir) / 'benchmark.sqlite'}"
+        env["TMDB_API_TOKEN"] = "benchmark"
+        env["TMDB_CACHE_ENABLED"] = "False"
+        env["TMDB_REQUESTS_PER_SECOND"] = "100000"
+        _flask(env, "init-db")
+        subprocess.run(
+            [
+                *(sys.executable, "-m", __spec__.name, "--child"),
+                *("--movies", str(movies)),
+                *("--workers", str(workers)),
+                *("--latency-ms", str(latency_ms)),
+            ],
+            env=env,
+            check=True,
+        )
+
+
+if __name__ == "__main__":
+    main()
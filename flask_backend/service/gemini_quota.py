@@ -3,16 +3,29 @@ skip models it already knows are exhausted, instead of discovering that on
 every single call. Classifies 429 responses by which quota was hit (per-minute
 vs per-day), and records each attempt's outcome so future availability checks
 can proactively count recent usage or react to an explicit cooldown.
+
+The counting happens in memory (see QuotaTracker): the table is read once per
+process and then only for the rows other processes added since.
 """
 
+import atexit
 import logging
+import queue
+import threading
+import time
+from collections import Counter, deque
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Callable, Dict, Optional
 
 from google.genai.errors import ClientError
 from zoneinfo import ZoneInfo
 
+from flask_backend.db import db_session
+from flask_backend.env_config import (
+    GEMINI_QUOTA_SYNC_SECONDS,
+    GEMINI_QUOTA_WRITE_BEHIND,
+)
 from flask_backend.repository import gemini_usage_events
 
 logger = logging.getLogger(__name__)
@@ -115,38 +128,219 @@ def _next_pacific_midnight_utc(now_utc_naive: datetime) -> datetime:
     return next_midnight_pacific.astimezone(timezone.utc).replace(tzinfo=None)
 
 
-def is_available(model_id: str) -> bool:
-    try:
-        now = _utcnow_naive()
+RPM_WINDOW = timedelta(seconds=60)
 
-        last_event = gemini_usage_events.most_recent(model_id)
-        if (
-            last_event is not None
-            and last_event.outcome == "rate_limited"
-            and last_event.unavailable_until is not None
-            and last_event.unavailable_until > now
-        ):
-            return False
-
-        limits = GEMINI_MODEL_LIMITS.get(model_id, {})
-
-        rpm_limit = limits.get("rpm")
-        if rpm_limit is not None:
-            rpm_count = gemini_usage_events.count_since(
-                model_id, now - timedelta(seconds=60)
-            )
-            if rpm_count >= rpm_limit:
+
+@dataclass
+class _ModelState:
+    """One model's recent attempts, kept in memory. `attempts` is a ring
+    buffer of their occurred_at, just big enough to tell whether the
+    model's largest limit was reached; the latest attempt alone decides the
+    reactive cooldown."""
+
+    attempts: deque
+    last_occurred_at: Optional[datetime] = None
+    last_outcome: Optional[str] = None
+    last_unavailable_until: Optional[datetime] = None
+
+    def add(
+        self,
+        occurred_at: datetime,
+        outcome: str,
+        unavailable_until: Optional[datetime],
+    ) -> None:
+        self.attempts.append(occurred_at)
+        if self.last_occurred_at is None or occurred_at >= self.last_occurred_at:
+            self.last_occurred_at = occurred_at
+            self.last_outcome = outcome
+            self.last_unavailable_until = unavailable_until
+
+    def count_since(self, since: datetime) -> int:
+        return sum(1 for occurred_at in self.attempts if occurred_at >= since)
+
+    def cooldown_until(self) -> Optional[datetime]:
+        if self.last_outcome != "rate_limited":
+            return None
+        return self.last_unavailable_until
+
+
+class QuotaTracker:
+    """Sliding-window view of gemini_usage_events held in process memory, so
+    availability checks don't query the table for every model of every
+    call.
+
+    The first check loads the attempts of the current Pacific day (and of
+    the trailing RPM window); later checks fetch only the rows written since
+    the last one seen, at most every `sync_interval_seconds` - that's how
+    the attempts of other processes (gunicorn workers, cron pipelines) are
+    shared. record_attempt() updates the memory right away and writes the
+    row from a background thread when `write_behind` is set, inline
+    otherwise; the rows this process wrote are recognized when the sync
+    reads them back, so they're only counted once."""
+
+    def __init__(
+        self,
+        sync_interval_seconds: float = GEMINI_QUOTA_SYNC_SECONDS,
+        write_behind: bool = GEMINI_QUOTA_WRITE_BEHIND,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.sync_interval_seconds = sync_interval_seconds
+        self.write_behind = write_behind
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+        self._models: Dict[str, _ModelState] = {}
+        self._last_event_id = 0
+        self._synced_at: Optional[float] = None
+        # (model_id, occurred_at) of the attempts recorded here whose row the
+        # sync hasn't read back yet
+        self._unconfirmed: Counter = Counter()
+        self._queue: Optional[queue.Queue] = None
+
+    def _state(self, model_id: str) -> _ModelState:
+        state = self._models.get(model_id)
+        if state is None:
+            limits = GEMINI_MODEL_LIMITS.get(model_id, {})
+            size = max(limits.get("rpm", 0), limits.get("rpd", 0))
+            state = self._models[model_id] = _ModelState(attempts=deque(maxlen=size))
+        return state
+
+    def sync(self, now: datetime) -> None:
+        """Reads the rows written since the last sync, unless the last one
+        was less than `sync_interval_seconds` ago."""
+        with self._sync_lock:
+            if (
+                self._synced_at is not None
+                and self._clock() - self._synced_at < self.sync_interval_seconds
+            ):
+                return
+            # anything older has no say: it's outside both windows, and its
+            # cooldown (at most until the following Pacific midnight) is over
+            since = min(_pacific_day_start_utc(now), now - RPM_WINDOW)
+            events = gemini_usage_events.get_since(since, self._last_event_id)
+            with self._lock:
+                for event in events:
+                    self._last_event_id = max(self._last_event_id, event.id)
+                    key = (event.model_id, event.occurred_at)
+                    if self._unconfirmed[key]:
+                        self._unconfirmed[key] -= 1
+                        continue
+                    self._state(event.model_id).add(
+                        event.occurred_at, event.outcome, event.unavailable_until
+                    )
+                self._unconfirmed += Counter()  # drops the zeroed keys
+            self._synced_at = self._clock()
+
+    def is_available(self, model_id: str, now: datetime) -> bool:
+        self.sync(now)
+        with self._lock:
+            state = self._models.get(model_id)
+            if state is None:
+                return True
+
+            cooldown_until = state.cooldown_until()
+            if cooldown_until is not None and cooldown_until > now:
                 return False
 
-        rpd_limit = limits.get("rpd")
-        if rpd_limit is not None:
-            rpd_count = gemini_usage_events.count_since(
-                model_id, _pacific_day_start_utc(now)
-            )
-            if rpd_count >= rpd_limit:
+            limits = GEMINI_MODEL_LIMITS.get(model_id, {})
+
+            rpm_limit = limits.get("rpm")
+            if (
+                rpm_limit is not None
+                and state.count_since(now - RPM_WINDOW) >= rpm_limit
+            ):
                 return False
 
-        return True
+            rpd_limit = limits.get("rpd")
+            if (
+                rpd_limit is not None
+                and state.count_since(_pacific_day_start_utc(now)) >= rpd_limit
+            ):
+                return False
+
+            return True
+
+    def cooldowns(self, models: list[str], now: datetime) -> list[datetime]:
+        """unavailable_until of each of `models` whose latest attempt was
+        rate limited."""
+        self.sync(now)
+        with self._lock:
+            return [
+                cooldown_until
+                for cooldown_until in (
+                    self._models[model_id].cooldown_until()
+                    for model_id in models
+                    if model_id in self._models
+                )
+                if cooldown_until is not None
+            ]
+
+    def record(self, event: dict) -> None:
+        with self._lock:
+            self._state(event["model_id"]).add(
+                event["occurred_at"], event["outcome"], event["unavailable_until"]
+            )
+            self._unconfirmed[(event["model_id"], event["occurred_at"])] += 1
+        if not self.write_behind:
+            self._write([event])
+            return
+        with self._lock:
+            if self._queue is None:
+                self._queue = queue.Queue()
+                threading.Thread(
+                    target=self._write_loop, name="gemini-quota-writer", daemon=True
+                ).start()
+        self._queue.put(event)
+
+    def flush(self) -> None:
+        """Blocks until every attempt recorded so far is in the table."""
+        if self._queue is not None:
+            self._queue.join()
+
+    def _write_loop(self) -> None:
+        while True:
+            events = [self._queue.get()]
+            while True:
+                try:
+                    events.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            self._write(events)
+            for _ in events:
+                self._queue.task_done()
+
+    def _write(self, events: list[dict]) -> None:
+        try:
+            gemini_usage_events.create_many(events)
+        except Exception:
+            logger.exception(
+                "gemini_quota could not write %d usage event(s) for model_id=%s; "
+                "usage events not recorded",
+                len(events),
+                ",".join(sorted({event["model_id"] for event in events})),
+            )
+            db_session.rollback()
+            with self._lock:
+                self._unconfirmed -= Counter(
+                    (event["model_id"], event["occurred_at"]) for event in events
+                )
+
+
+_tracker = QuotaTracker()
+
+
+def flush() -> None:
+    """Writes out the attempts still queued for the write-behind thread;
+    runs at interpreter exit, so a CLI run doesn't lose its last ones."""
+    _tracker.flush()
+
+
+atexit.register(flush)
+
+
+def is_available(model_id: str) -> bool:
+    try:
+        return _tracker.is_available(model_id, _utcnow_naive())
     except Exception:
         logger.exception(
             "gemini_quota.is_available failed for model_id=%s; treating as available",
@@ -164,13 +358,7 @@ def seconds_until_available(models: list[str]) -> Optional[float]:
     check rather than an explicit reactive-cooldown row, so there's no
     specific recovery time to report."""
     now = _utcnow_naive()
-    recoveries = [
-        event.unavailable_until
-        for event in (gemini_usage_events.most_recent(model_id) for model_id in models)
-        if event is not None
-        and event.outcome == "rate_limited"
-        and event.unavailable_until is not None
-    ]
+    recoveries = _tracker.cooldowns(models, now)
     if not recoveries:
         return None
     return (min(recoveries) - now).total_seconds()
@@ -194,12 +382,14 @@ def record_attempt(
             else:  # "requests_per_day" or "unknown" - treated the same, conservatively
                 unavailable_until = _next_pacific_midnight_utc(now)
 
-        gemini_usage_events.create(
-            model_id,
-            now,
-            outcome,
-            quota_metric=quota_metric,
-            unavailable_until=unavailable_until,
+        _tracker.record(
+            {
+                "model_id": model_id,
+                "occurred_at": now,
+                "outcome": outcome,
+                "quota_metric": quota_metric,
+                "unavailable_until": unavailable_until,
+            }
         )
     except Exception:
         logger.exception(
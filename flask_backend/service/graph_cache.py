@@ -0,0 +1,162 @@
+"""Process-wide GraphQLite handles and an in-memory cache of graph query
+results, shared by graph_queries.py and motif_ranking.py.
+
+Opening a Graph loads the GraphQLite extension into a fresh SQLite
+connection, so get_graph() keeps one open handle per file (and per thread -
+SQLite connections can't cross threads) instead of opening one per query.
+
+The graph only changes when sync_graph() runs, and every sync that writes
+something stamps the file with a new generation (stamp_generation(), inside
+the sync's transaction). cached_query() keys results on (file, generation,
+query name, params), so the same query between two syncs is answered from
+memory by any caller in the process, and the first one after a sync - from
+this process or any other - runs again. A graph no sync has stamped (built
+before the generation existed, or by hand) is never cached.
+"""
+
+import copy
+import os
+import sqlite3
+import threading
+import uuid
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from graphqlite import Graph
+
+from flask_backend.env_config import GRAPH_QUERY_CACHE_MAX_ENTRIES
+
+GENERATION_SCHEMA = """
+CREATE TABLE IF NOT EXISTS graph_generation (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    generation TEXT NOT NULL
+)
+"""
+
+_CacheKey = Tuple[str, str, str, Hashable]
+
+
+def stamp_generation(conn: sqlite3.Connection) -> None:
+    """Gives the graph a new generation. Meant to run inside the
+    transaction that changed it, so readers see both or neither."""
+    conn.execute(GENERATION_SCHEMA)
+    conn.execute(
+        "INSERT OR REPLACE INTO graph_generation (id, generation) VALUES (1, ?)",
+        (uuid.uuid4().hex,),
+    )
+
+
+def current_generation(graph: Graph) -> Optional[str]:
+    """The generation the last sync stamped, or None for an unstamped
+    graph."""
+    try:
+        row = graph.connection.sqlite_connection.execute(
+            "SELECT generation FROM graph_generation WHERE id = 1"
+        ).fetchone()
+    except sqlite3.OperationalError:
+        return None
+    return row[0] if row else None
+
+
+class GraphPool:
+    """Open Graph handles by file path, one set per thread. A file replaced
+    on disk (a new inode) gets a new handle."""
+
+    def __init__(self):
+        self._local = threading.local()
+
+    def _handles(self) -> Dict[str, Tuple[Graph, Optional[int]]]:
+        handles = getattr(self._local, "handles", None)
+        if handles is None:
+            handles = self._local.handles = {}
+        return handles
+
+    def get(self, path: str) -> Graph:
+        path = os.path.abspath(path)
+        handles = self._handles()
+        inode = _inode(path)
+        handle = handles.get(path)
+        if handle is not None and handle[1] == inode:
+            return handle[0]
+        if handle is not None:
+            handle[0].close()
+        graph = Graph(path)
+        handles[path] = (graph, _inode(path))
+        return graph
+
+    def close(self) -> None:
+        """Closes this thread's handles."""
+        handles = self._handles()
+        for graph, _inode_number in handles.values():
+            graph.close()
+        handles.clear()
+
+
+def _inode(path: str) -> Optional[int]:
+    try:
+        return os.stat(path).st_ino
+    except FileNotFoundError:
+        return None
+
+
+class QueryCache:
+    """Thread-safe LRU of query results. Entries never go stale - a sync
+    changes the generation in their key - so old ones simply age out."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[_CacheKey, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: _CacheKey) -> Tuple[bool, Any]:
+        """(True, value) for a cached result, (False, None) otherwise."""
+        with self._lock:
+            if key not in self._entries:
+                return False, None
+            self._entries.move_to_end(key)
+            return True, self._entries[key]
+
+    def set(self, key: _CacheKey, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_pool = GraphPool()
+_results = QueryCache(GRAPH_QUERY_CACHE_MAX_ENTRIES)
+
+
+def get_graph(path: str) -> Graph:
+    """This thread's open handle to the graph file at `path`."""
+    return _pool.get(path)
+
+
+def cached_query(
+    path: str, name: str, params: Dict[str, Hashable], run: Callable[[Graph], Any]
+) -> Any:
+    """run(graph) on the graph at `path`, or its result from the last call
+    with the same name and params since the graph's last sync. `params` must
+    hold everything run() depends on besides the graph - today's date
+    included. Callers get a copy of the cached result, free to mutate."""
+    graph = get_graph(path)
+    generation = current_generation(graph)
+    if generation is None:
+        return run(graph)
+
+    key = (
+        os.path.abspath(path),
+        generation,
+        name,
+        tuple(sorted(params.items())),
+    )
+    hit, result = _results.get(key)
+    if not hit:
+        result = run(graph)
+        _results.set(key, result)
+    return copy.deepcopy(result)
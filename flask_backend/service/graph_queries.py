@@ -1,37 +1,49 @@
+"""Predefined Cypher queries over the knowledge graph, behind the
+`graph-query` CLI command. Results are cached per graph generation (see
+graph_cache.py), so asking again before the next sync costs nothing."""
+
 import calendar
 from datetime import date
 
-from graphqlite import Graph
-
 from flask_backend.env_config import GRAPH_DB_PATH
+from flask_backend.service.graph_cache import cached_query
 
 
-def _open(db_path: str | None = None) -> Graph:
-    return Graph(db_path or GRAPH_DB_PATH)
+def _query(
+    name: str, cypher: str, params: dict, db_path: str | None = None
+) -> list[dict]:
+    return cached_query(
+        db_path or GRAPH_DB_PATH,
+        name,
+        params,
+        lambda graph: graph.query(cypher, params),
+    )
 
 
 def movies_by_director(name: str, db_path: str | None = None) -> list[dict]:
     """Movies directed by the given director name."""
-    graph = _open(db_path)
-    return graph.query(
+    return _query(
+        "movies_by_director",
         "MATCH (m:Movie)-[:DIRECTED_BY]->(d:Director) "
         "WHERE d.name = $name "
         "RETURN m.title AS title, m.slug AS slug "
         "ORDER BY m.title",
         {"name": name},
+        db_path,
     )
 
 
 def directors_currently_showing(db_path: str | None = None) -> list[dict]:
     """Directors with at least one non-draft movie screening today or later."""
-    graph = _open(db_path)
-    return graph.query(
+    return _query(
+        "directors_currently_showing",
         "MATCH (d:Director)<-[:DIRECTED_BY]-(:Movie)"
         "-[:HAS_SCREENING]->(s:Screening)-[:HAS_DATE]->(sd:ScreeningDate) "
         "WHERE sd.date >= $today AND s.draft = false "
         "RETURN DISTINCT d.name AS name "
         "ORDER BY d.name",
         {"today": date.today().isoformat()},
+        db_path,
     )
 
 
@@ -43,14 +55,15 @@ def countries_this_month(db_path: str | None = None) -> list[dict]:
     start = today.replace(day=1).isoformat()
     end = today.replace(day=last_day).isoformat()
 
-    graph = _open(db_path)
-    return graph.query(
+    return _query(
+        "countries_this_month",
         "MATCH (c:Country)<-[:PRODUCED_IN]-(m:Movie)-[:HAS_SCREENING]->"
         "(s:Screening)-[:HAS_DATE]->(sd:ScreeningDate) "
         "WHERE sd.date >= $start AND sd.date <= $end AND s.draft = false "
         "RETURN DISTINCT c.name AS name "
         "ORDER BY c.name",
         {"start": start, "end": end},
+        db_path,
     )
 
 
@@ -62,8 +75,8 @@ def genres_at_cinema(
     start = f"{year}-01-01"
     end = f"{year}-12-31"
 
-    graph = _open(db_path)
-    return graph.query(
+    return _query(
+        "genres_at_cinema",
         "MATCH (ci:Cinema)<-[:AT_CINEMA]-(s:Screening)-[:HAS_DATE]->(sd:ScreeningDate), "
         "(s)<-[:HAS_SCREENING]-(m:Movie)-[:HAS_GENRE]->(g:Genre) "
         "WHERE ci.slug = $cinema_slug AND sd.date >= $start AND sd.date <= $end "
@@ -71,6 +84,7 @@ def genres_at_cinema(
         "RETURN DISTINCT g.name AS name "
         "ORDER BY g.name",
         {"cinema_slug": cinema_slug, "start": start, "end": end},
+        db_path,
     )
 
 
@@ -79,12 +93,13 @@ def screenings_since_release(movie_slug: str, db_path: str | None = None) -> lis
     ordered chronologically. ("Since its release" simplifies to "all
     screening dates on record" - Phase 1's Movie node has no exact release
     date, only release_year.)"""
-    graph = _open(db_path)
-    return graph.query(
+    return _query(
+        "screenings_since_release",
         "MATCH (m:Movie)-[:HAS_SCREENING]->(s:Screening)-[:HAS_DATE]->(sd:ScreeningDate), "
         "(s)-[:AT_CINEMA]->(ci:Cinema) "
         "WHERE m.slug = $movie_slug "
         "RETURN sd.date AS date, sd.time AS time, ci.name AS cinema_name "
         "ORDER BY sd.date, sd.time",
         {"movie_slug": movie_slug},
+        db_path,
     )
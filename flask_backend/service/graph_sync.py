@@ -5,26 +5,86 @@ PRODUCED_IN, HAS_SCREENING, AT_CINEMA, HAS_DATE). `sync_graph()` is the
 entry point used by the `sync-graph` CLI command; `build_graph_data()` is
 split out separately so tests can inspect the raw node/edge tuples without
 touching a graph file.
+
+Rows are streamed: iter_graph_nodes()/iter_graph_edges() read plain columns
+(no ORM objects) GRAPH_SYNC_CHUNK_SIZE rows at a time, and a sync writes
+them chunk by chunk, in one transaction. Only the external id -> rowid map
+of the nodes grows with the screening history.
+
+Besides GraphQLite's own tables, the graph file holds graph_sync_nodes: the
+internal rowid and a digest of the label and props of every node a sync
+wrote. An incremental sync diffs the fresh node/edge set against it (and
+against the edges table) and writes only what changed. Every sync that
+writes something also stamps the file with a new generation, which is what
+graph_cache.py keys cached query results on, and logs it in graph_sync_log:
+a rebuild as such, an incremental sync with the external ids of the nodes
+it wrote or deleted and of both ends of the edges it wrote or deleted
+(graph_sync_touched). touched_since() reads that log back for incremental
+motif detection (motif_snapshot.py).
 """
 
+import hashlib
+import json
+import sqlite3
 from dataclasses import dataclass
-from typing import List, Tuple
+from itertools import batched
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
 
 from graphqlite import Graph
+from sqlalchemy import select
 
 from flask_backend.db import db_session
-from flask_backend.env_config import GRAPH_DB_PATH
-from flask_backend.models import Country, Director, Genre, Movie, Screening
-from flask_backend.repository import (
-    cinemas as cinemas_repo,
-    countries as countries_repo,
-    directors as directors_repo,
-    genres as genres_repo,
+from flask_backend.env_config import GRAPH_DB_PATH, GRAPH_SYNC_CHUNK_SIZE
+from flask_backend.models import (
+    Cinema,
+    Country,
+    Director,
+    Genre,
+    Movie,
+    Screening,
+    ScreeningDate,
+    movie_countries,
+    movie_directors,
+    movie_genres,
 )
+from flask_backend.service.graph_cache import stamp_generation
 
 NodeTuple = Tuple[str, dict, str]
 EdgeTuple = Tuple[str, str, dict, str]
 
+_SYNC_STATE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS graph_sync_nodes (
+    external_id TEXT PRIMARY KEY,
+    node_id INTEGER NOT NULL,
+    digest TEXT NOT NULL
+)
+"""
+
+_SYNC_LOG_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS graph_sync_log (
+        seq INTEGER PRIMARY KEY AUTOINCREMENT,
+        rebuilt INTEGER NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS graph_sync_touched (
+        seq INTEGER NOT NULL,
+        external_id TEXT NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_graph_sync_touched_seq ON graph_sync_touched (seq)",
+)
+
+# incremental syncs whose touched nodes are kept - a reader further behind
+# than that starts over
+GRAPH_SYNC_LOG_KEEP = 200
+
+# GraphQLite's typed property tables, in the order its bulk loader checks
+# a value's type (bool before int: True is an int too)
+_PROP_TABLES = ((bool, "bool"), (int, "int"), (float, "real"))
+_PROP_TABLE_SUFFIXES = ("bool", "int", "real", "text", "json")
+
 
 def _props(**kwargs) -> dict:
     """Drops None-valued keys before a node's props dict reaches GraphQLite.
@@ -37,7 +97,7 @@ def _props(**kwargs) -> dict:
     return {k: v for k, v in kwargs.items() if v is not None}
 
 
-def _movie_node(movie: Movie) -> NodeTuple:
+def _movie_node(movie) -> NodeTuple:
     return (
         f"movie:{movie.id}",
         _props(
@@ -61,7 +121,7 @@ def _cinema_node(cinema) -> NodeTuple:
     )
 
 
-def _screening_node(screening: Screening) -> NodeTuple:
+def _screening_node(screening) -> NodeTuple:
     return (
         f"screening:{screening.id}",
         _props(sqlite_id=screening.id, url=screening.url, draft=screening.draft),
@@ -81,7 +141,7 @@ def _screening_date_node(screening_date) -> NodeTuple:
     )
 
 
-def _genre_node(genre: Genre) -> NodeTuple:
+def _genre_node(genre) -> NodeTuple:
     return (
         f"genre:{genre.id}",
         _props(sqlite_id=genre.id, tmdb_id=genre.tmdb_id, name=genre.name),
@@ -89,7 +149,7 @@ def _genre_node(genre: Genre) -> NodeTuple:
     )
 
 
-def _director_node(director: Director) -> NodeTuple:
+def _director_node(director) -> NodeTuple:
     return (
         f"director:{director.id}",
         _props(sqlite_id=director.id, tmdb_id=director.tmdb_id, name=director.name),
@@ -97,7 +157,7 @@ def _director_node(director: Director) -> NodeTuple:
     )
 
 
-def _country_node(country: Country) -> NodeTuple:
+def _country_node(country) -> NodeTuple:
     return (
         f"country:{country.id}",
         _props(
@@ -109,115 +169,497 @@ def _country_node(country: Country) -> NodeTuple:
     )
 
 
-def build_graph_data() -> Tuple[List[NodeTuple], List[EdgeTuple]]:
-    """Reads every row Phase 1's knowledge graph cares about from SQLite and
-    returns the full set of graph nodes/edges for a from-scratch rebuild.
+def _rows(statement) -> Iterator:
+    """The statement's rows, fetched GRAPH_SYNC_CHUNK_SIZE at a time."""
+    return db_session.execute(
+        statement.execution_options(yield_per=GRAPH_SYNC_CHUNK_SIZE)
+    )
+
+
+def iter_graph_nodes() -> Iterator[NodeTuple]:
+    """Every node of the graph, read straight from the table columns.
 
     Unfiltered by design: the graph is meant to be a faithful mirror of
-    SQLite's explicit facts, not a business-logic view. Movie and Screening
-    are queried directly with `db_session.query(...).all()` instead of
-    through the repository layer's `get_all()` functions, which apply
-    publish-state filtering (e.g. hiding draft screenings) - that filtering
-    is a presentation concern for visitor-facing pages, and belongs in the
-    query layer (`graph_queries.py`) on a per-query basis, not baked into
-    what gets mirrored into the graph itself.
+    SQLite's explicit facts, not a business-logic view. Publish-state
+    filtering (e.g. hiding draft screenings) is a presentation concern for
+    visitor-facing pages, and belongs in the query layer
+    (`graph_queries.py`) on a per-query basis, not baked into what gets
+    mirrored into the graph itself.
     """
-    nodes: List[NodeTuple] = []
-    edges: List[EdgeTuple] = []
-
-    movies = db_session.query(Movie).all()
-    for movie in movies:
-        nodes.append(_movie_node(movie))
-        for genre in movie.genres:
-            edges.append((f"movie:{movie.id}", f"genre:{genre.id}", {}, "HAS_GENRE"))
-        for director in movie.directors:
-            edges.append(
-                (f"movie:{movie.id}", f"director:{director.id}", {}, "DIRECTED_BY")
-            )
-        for country in movie.countries:
-            edges.append(
-                (f"movie:{movie.id}", f"country:{country.id}", {}, "PRODUCED_IN")
-            )
-
-    for cinema in cinemas_repo.get_all():
-        nodes.append(_cinema_node(cinema))
+    for movie in _rows(
+        select(
+            Movie.id,
+            Movie.title,
+            Movie.slug,
+            Movie.original_title,
+            Movie.release_year,
+            Movie.original_language,
+            Movie.tmdb_id,
+        ).order_by(Movie.id)
+    ):
+        yield _movie_node(movie)
+    for cinema in _rows(
+        select(Cinema.id, Cinema.slug, Cinema.name).order_by(Cinema.id)
+    ):
+        yield _cinema_node(cinema)
+    for genre in _rows(select(Genre.id, Genre.tmdb_id, Genre.name).order_by(Genre.id)):
+        yield _genre_node(genre)
+    for director in _rows(
+        select(Director.id, Director.tmdb_id, Director.name).order_by(Director.id)
+    ):
+        yield _director_node(director)
+    for country in _rows(
+        select(Country.id, Country.iso_3166_1, Country.name).order_by(Country.id)
+    ):
+        yield _country_node(country)
+    for screening in _rows(
+        select(Screening.id, Screening.url, Screening.draft).order_by(Screening.id)
+    ):
+        yield _screening_node(screening)
+    for screening_date in _rows(
+        select(ScreeningDate.id, ScreeningDate.date, ScreeningDate.time).order_by(
+            ScreeningDate.id
+        )
+    ):
+        yield _screening_date_node(screening_date)
+
+
+def iter_graph_edges() -> Iterator[EdgeTuple]:
+    """Every edge of the graph, read straight from the table columns."""
+    for table, prefix, column, rel_type in (
+        (movie_genres, "genre", "genre_id", "HAS_GENRE"),
+        (movie_directors, "director", "director_id", "DIRECTED_BY"),
+        (movie_countries, "country", "country_id", "PRODUCED_IN"),
+    ):
+        for movie_id, target_id in _rows(
+            select(table.c.movie_id, table.c[column]).order_by(table.c.movie_id)
+        ):
+            yield (f"movie:{movie_id}", f"{prefix}:{target_id}", {}, rel_type)
+
+    for screening_id, movie_id, cinema_id in _rows(
+        select(Screening.id, Screening.movie_id, Screening.cinema_id).order_by(
+            Screening.id
+        )
+    ):
+        yield (f"movie:{movie_id}", f"screening:{screening_id}", {}, "HAS_SCREENING")
+        yield (f"screening:{screening_id}", f"cinema:{cinema_id}", {}, "AT_CINEMA")
+
+    for screening_date_id, screening_id in _rows(
+        select(ScreeningDate.id, ScreeningDate.screening_id).order_by(ScreeningDate.id)
+    ):
+        yield (
+            f"screening:{screening_id}",
+            f"screeningdate:{screening_date_id}",
+            {},
+            "HAS_DATE",
+        )
 
-    for genre in genres_repo.get_all():
-        nodes.append(_genre_node(genre))
 
-    for director in directors_repo.get_all():
-        nodes.append(_director_node(director))
+def build_graph_data() -> Tuple[List[NodeTuple], List[EdgeTuple]]:
+    """The full set of graph nodes/edges for a from-scratch rebuild, as
+    lists - iter_graph_nodes()/iter_graph_edges() without the streaming."""
+    return list(iter_graph_nodes()), list(iter_graph_edges())
 
-    for country in countries_repo.get_all():
-        nodes.append(_country_node(country))
 
-    screenings = db_session.query(Screening).all()
-    for screening in screenings:
-        nodes.append(_screening_node(screening))
-        edges.append(
-            (
-                f"movie:{screening.movie_id}",
-                f"screening:{screening.id}",
-                {},
-                "HAS_SCREENING",
+@dataclass
+class SyncResult:
+    nodes_created: int
+    edges_created: int
+    nodes_updated: int = 0
+    nodes_deleted: int = 0
+    edges_deleted: int = 0
+
+
+def _digest(label: str, props: dict) -> str:
+    return hashlib.sha256(
+        json.dumps([label, props], sort_keys=True).encode()
+    ).hexdigest()
+
+
+class _GraphWriter:
+    """Writes nodes and edges straight into GraphQLite's tables, the way its
+    insert_*_bulk() methods do, but a chunk per executemany() and inside
+    the caller's transaction. Rowids are handed out here, so a whole chunk
+    goes in without a round trip per row."""
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+        self._keys: Dict[str, int] = {}
+        self._last_ids: Dict[str, int] = {}
+
+    def _key(self, key: str) -> int:
+        key_id = self._keys.get(key)
+        if key_id is None:
+            row = self.conn.execute(
+                "SELECT id FROM property_keys WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                key_id = self.conn.execute(
+                    "INSERT INTO property_keys (key) VALUES (?)", (key,)
+                ).lastrowid
+            else:
+                key_id = row[0]
+            self._keys[key] = key_id
+        return key_id
+
+    def _new_ids(self, table: str, count: int) -> range:
+        """`count` fresh rowids of `table` (nodes or edges), past any rowid
+        AUTOINCREMENT has handed out."""
+        last_id = self._last_ids.get(table)
+        if last_id is None:
+            last_id = self.conn.execute(
+                "SELECT MAX("
+                "COALESCE((SELECT seq FROM sqlite_sequence WHERE name = ?), 0),"
+                f" COALESCE((SELECT MAX(id) FROM {table}), 0))",
+                (table,),
+            ).fetchone()[0]
+        self._last_ids[table] = last_id + count
+        return range(last_id + 1, last_id + count + 1)
+
+    def _insert_props(self, entity: str, owners: Iterable[Tuple[int, dict]]) -> None:
+        rows: Dict[str, list] = {}
+        for entity_id, props in owners:
+            for key, value in props.items():
+                suffix = next(
+                    (
+                        suffix
+                        for kind, suffix in _PROP_TABLES
+                        if isinstance(value, kind)
+                    ),
+                    "text",
+                )
+                if suffix == "text":
+                    value = str(value)
+                rows.setdefault(suffix, []).append((entity_id, self._key(key), value))
+        for suffix, suffix_rows in rows.items():
+            self.conn.executemany(
+                f"INSERT OR REPLACE INTO {entity}_props_{suffix}"
+                f" ({entity}_id, key_id, value) VALUES (?, ?, ?)",
+                suffix_rows,
             )
+
+    def clear(self) -> None:
+        """Deletes every node and edge (property keys stay)."""
+        for suffix in _PROP_TABLE_SUFFIXES:
+            self.conn.execute(f"DELETE FROM edge_props_{suffix}")
+        self.conn.execute("DELETE FROM edges")
+        for suffix in _PROP_TABLE_SUFFIXES:
+            self.conn.execute(f"DELETE FROM node_props_{suffix}")
+        self.conn.execute("DELETE FROM node_labels")
+        self.conn.execute("DELETE FROM nodes")
+
+    def insert_nodes(self, nodes: Sequence[NodeTuple]) -> Dict[str, int]:
+        """Inserts the nodes and returns their external id -> rowid map."""
+        node_ids = self._new_ids("nodes", len(nodes))
+        self.conn.executemany(
+            "INSERT INTO nodes (id) VALUES (?)", ((node_id,) for node_id in node_ids)
+        )
+        self.conn.executemany(
+            "INSERT INTO node_labels (node_id, label) VALUES (?, ?)",
+            ((node_id, label) for node_id, (_, _, label) in zip(node_ids, nodes)),
         )
-        edges.append(
+        self._insert_props(
+            "node",
             (
-                f"screening:{screening.id}",
-                f"cinema:{screening.cinema_id}",
-                {},
-                "AT_CINEMA",
+                (node_id, {"id": external_id, **props})
+                for node_id, (external_id, props, _) in zip(node_ids, nodes)
+            ),
+        )
+        return {
+            external_id: node_id
+            for node_id, (external_id, _, _) in zip(node_ids, nodes)
+        }
+
+    def replace_node_props(self, node_id: int, external_id: str, props: dict) -> None:
+        for suffix in _PROP_TABLE_SUFFIXES:
+            self.conn.execute(
+                f"DELETE FROM node_props_{suffix} WHERE node_id = ?", (node_id,)
             )
+        self._insert_props("node", [(node_id, {"id": external_id, **props})])
+
+    def insert_edges(self, edges: Sequence[Tuple[int, int, dict, str]]) -> None:
+        """Inserts (source rowid, target rowid, props, type) edges."""
+        edge_ids = self._new_ids("edges", len(edges))
+        self.conn.executemany(
+            "INSERT INTO edges (id, source_id, target_id, type) VALUES (?, ?, ?, ?)",
+            (
+                (edge_id, source_id, target_id, rel_type)
+                for edge_id, (source_id, target_id, _, rel_type) in zip(edge_ids, edges)
+            ),
         )
-        for screening_date in screening.dates:
-            nodes.append(_screening_date_node(screening_date))
-            edges.append(
-                (
-                    f"screening:{screening.id}",
-                    f"screeningdate:{screening_date.id}",
-                    {},
-                    "HAS_DATE",
-                )
+        self._insert_props(
+            "edge",
+            ((edge_id, props) for edge_id, (_, _, props, _) in zip(edge_ids, edges)),
+        )
+
+    def delete_edges(self, edge_ids: Iterable[int]) -> None:
+        rows = [(edge_id,) for edge_id in edge_ids]
+        for suffix in _PROP_TABLE_SUFFIXES:
+            self.conn.executemany(
+                f"DELETE FROM edge_props_{suffix} WHERE edge_id = ?", rows
+            )
+        self.conn.executemany("DELETE FROM edges WHERE id = ?", rows)
+
+    def delete_nodes(self, node_ids: Iterable[int]) -> None:
+        """Deletes the nodes - their edges must be gone already."""
+        rows = [(node_id,) for node_id in node_ids]
+        for suffix in _PROP_TABLE_SUFFIXES:
+            self.conn.executemany(
+                f"DELETE FROM node_props_{suffix} WHERE node_id = ?", rows
             )
+        self.conn.executemany("DELETE FROM node_labels WHERE node_id = ?", rows)
+        self.conn.executemany("DELETE FROM nodes WHERE id = ?", rows)
+
+
+def _record_nodes(
+    conn: sqlite3.Connection, nodes: Iterable[NodeTuple], node_ids: Dict[str, int]
+) -> None:
+    conn.executemany(
+        "INSERT OR REPLACE INTO graph_sync_nodes (external_id, node_id, digest)"
+        " VALUES (?, ?, ?)",
+        (
+            (external_id, node_ids[external_id], _digest(label, props))
+            for external_id, props, label in nodes
+        ),
+    )
 
-    return nodes, edges
 
+def _log_sync(conn: sqlite3.Connection, touched: Optional[Set[str]]) -> None:
+    """Logs a sync that wrote something: a rebuild (touched is None), which
+    makes the earlier entries moot, or an incremental sync and the external
+    ids it touched."""
+    if touched is None:
+        conn.execute("DELETE FROM graph_sync_touched")
+        conn.execute("DELETE FROM graph_sync_log")
+    seq = conn.execute(
+        "INSERT INTO graph_sync_log (rebuilt) VALUES (?)", (touched is None,)
+    ).lastrowid
+    if touched is None:
+        return
+    conn.executemany(
+        "INSERT INTO graph_sync_touched (seq, external_id) VALUES (?, ?)",
+        ((seq, external_id) for external_id in touched),
+    )
+    oldest_kept = seq - GRAPH_SYNC_LOG_KEEP
+    conn.execute("DELETE FROM graph_sync_touched WHERE seq <= ?", (oldest_kept,))
+    conn.execute("DELETE FROM graph_sync_log WHERE seq <= ?", (oldest_kept,))
 
-@dataclass
-class SyncResult:
-    nodes_created: int
-    edges_created: int
 
+def last_sync_seq(conn: sqlite3.Connection) -> Optional[int]:
+    """Position of the last logged sync, or None for a graph no sync has
+    logged."""
+    try:
+        return conn.execute("SELECT MAX(seq) FROM graph_sync_log").fetchone()[0]
+    except sqlite3.OperationalError:
+        return None
+
+
+def touched_since(conn: sqlite3.Connection, seq: int) -> Optional[Set[str]]:
+    """External ids the syncs logged after position `seq` touched, or None
+    when that can't be told: the graph was rebuilt since, or the log no
+    longer goes back that far."""
+    rows = conn.execute(
+        "SELECT seq, rebuilt FROM graph_sync_log WHERE seq >= ? ORDER BY seq",
+        (seq,),
+    ).fetchall()
+    if not rows or rows[0][0] != seq or any(rebuilt for _seq, rebuilt in rows[1:]):
+        return None
+    return {
+        external_id
+        for (external_id,) in conn.execute(
+            "SELECT DISTINCT external_id FROM graph_sync_touched WHERE seq > ?",
+            (seq,),
+        )
+    }
+
+
+def _external_ids(conn: sqlite3.Connection, node_ids: Iterable[int]) -> List[str]:
+    return [
+        external_id
+        for (external_id,) in conn.execute(
+            "SELECT p.value FROM node_props_text p"
+            " JOIN property_keys k ON k.id = p.key_id AND k.key = 'id'"
+            " WHERE p.node_id IN (SELECT value FROM json_each(?))",
+            (json.dumps(list(node_ids)),),
+        )
+    ]
 
-def sync_graph(db_path: str | None = None) -> SyncResult:
-    """Rebuilds the knowledge graph from scratch: wipes every node/edge in
-    the GraphQLite file at db_path (or GRAPH_DB_PATH) and re-inserts a
-    fresh graph from the current SQLite state. Idempotent - safe to run
-    repeatedly, always converges to the same graph for the same SQLite
-    state."""
-    path = db_path or GRAPH_DB_PATH
-    graph = Graph(path)
-    conn = graph.connection.sqlite_connection
 
-    # `cypher()` runs as a `SELECT`, so sqlite3's implicit-transaction
-    # detection (which only triggers on literal INSERT/UPDATE/DELETE/REPLACE
-    # statement text) never opens one here. Without an explicit transaction,
-    # DETACH DELETE removes each node/edge as its own autocommit write - a
-    # separate fsync'd journal file per row - which takes minutes once the
-    # graph has thousands of nodes instead of the sub-second it takes wrapped
-    # in a single transaction.
+def _rebuild(conn: sqlite3.Connection) -> SyncResult:
+    """Wipes the graph and writes every node and edge again, chunk by
+    chunk, in one transaction - readers see the old graph until it
+    commits."""
+    result = SyncResult(nodes_created=0, edges_created=0)
+    writer = _GraphWriter(conn)
+    node_ids: Dict[str, int] = {}
+
     conn.execute("BEGIN IMMEDIATE")
     try:
-        graph.query("MATCH (n) DETACH DELETE n")
+        writer.clear()
+        conn.execute("DELETE FROM graph_sync_nodes")
+        for chunk in batched(iter_graph_nodes(), GRAPH_SYNC_CHUNK_SIZE):
+            chunk_ids = writer.insert_nodes(chunk)
+            _record_nodes(conn, chunk, chunk_ids)
+            node_ids.update(chunk_ids)
+            result.nodes_created += len(chunk)
+        for chunk in batched(iter_graph_edges(), GRAPH_SYNC_CHUNK_SIZE):
+            writer.insert_edges(
+                [
+                    (node_ids[source], node_ids[target], props, rel_type)
+                    for source, target, props, rel_type in chunk
+                ]
+            )
+            result.edges_created += len(chunk)
+        stamp_generation(conn)
+        _log_sync(conn, None)
         conn.execute("COMMIT")
     except Exception:
         conn.execute("ROLLBACK")
         raise
 
-    nodes, edges = build_graph_data()
-    result = graph.insert_graph_bulk(nodes, edges)
-
-    return SyncResult(
-        nodes_created=result.nodes_inserted, edges_created=result.edges_inserted
+    return result
+
+
+def _diff_nodes(
+    conn: sqlite3.Connection,
+    writer: _GraphWriter,
+    result: SyncResult,
+    touched: Set[str],
+) -> Tuple[Dict[str, int], Dict[str, int]]:
+    """Inserts the new nodes and rewrites the ones whose label/props digest
+    changed. Returns the node ids of every external id known to the graph,
+    and those of the nodes that are no longer current."""
+    known = {
+        external_id: (node_id, digest)
+        for external_id, node_id, digest in conn.execute(
+            "SELECT external_id, node_id, digest FROM graph_sync_nodes"
+        )
+    }
+    node_ids = {external_id: node_id for external_id, (node_id, _) in known.items()}
+    stale_nodes = dict(node_ids)
+    for chunk in batched(iter_graph_nodes(), GRAPH_SYNC_CHUNK_SIZE):
+        new_nodes = []
+        changed_nodes = []
+        for node in chunk:
+            external_id, props, label = node
+            stale_nodes.pop(external_id, None)
+            if external_id not in known:
+                new_nodes.append(node)
+            elif known[external_id][1] != _digest(label, props):
+                writer.replace_node_props(node_ids[external_id], external_id, props)
+                changed_nodes.append(node)
+        if new_nodes:
+            node_ids.update(writer.insert_nodes(new_nodes))
+        _record_nodes(conn, new_nodes + changed_nodes, node_ids)
+        touched.update(external_id for external_id, _, _ in new_nodes + changed_nodes)
+        result.nodes_created += len(new_nodes)
+        result.nodes_updated += len(changed_nodes)
+    return node_ids, stale_nodes
+
+
+def _diff_edges(
+    conn: sqlite3.Connection,
+    writer: _GraphWriter,
+    node_ids: Dict[str, int],
+    result: SyncResult,
+    touched: Set[str],
+) -> Dict[Tuple[int, int, str], int]:
+    """Inserts the edges the graph doesn't have yet. Returns the ids of the
+    ones that are no longer current, by (source, target, type)."""
+    stale_edges = {
+        (source_id, target_id, rel_type): edge_id
+        for edge_id, source_id, target_id, rel_type in conn.execute(
+            "SELECT id, source_id, target_id, type FROM edges"
+        )
+    }
+    for chunk in batched(iter_graph_edges(), GRAPH_SYNC_CHUNK_SIZE):
+        new_edges = []
+        for source, target, props, rel_type in chunk:
+            edge = (node_ids[source], node_ids[target], rel_type)
+            if stale_edges.pop(edge, None) is None:
+                new_edges.append((edge[0], edge[1], props, rel_type))
+                touched.update((source, target))
+        if new_edges:
+            writer.insert_edges(new_edges)
+        result.edges_created += len(new_edges)
+    return stale_edges
+
+
+def _delete_stale(
+    conn: sqlite3.Connection,
+    writer: _GraphWriter,
+    stale_nodes: Dict[str, int],
+    stale_edges: Dict[Tuple[int, int, str], int],
+    result: SyncResult,
+    touched: Set[str],
+) -> None:
+    """Deletes the edges and nodes that are no longer current; their
+    endpoints and the deleted nodes count as touched."""
+    touched.update(
+        _external_ids(
+            conn,
+            {
+                node_id
+                for source, target, _ in stale_edges
+                for node_id in (source, target)
+            },
+        )
+    )
+    touched.update(stale_nodes)
+    writer.delete_edges(stale_edges.values())
+    result.edges_deleted = len(stale_edges)
+    writer.delete_nodes(stale_nodes.values())
+    conn.executemany(
+        "DELETE FROM graph_sync_nodes WHERE external_id = ?",
+        ((external_id,) for external_id in stale_nodes),
     )
+    result.nodes_deleted = len(stale_nodes)
+
+
+def _apply_diff(conn: sqlite3.Connection) -> SyncResult:
+    """Brings the graph to exactly the current nodes/edges in one
+    transaction, touching only the nodes whose label/props digest changed
+    and the edges that appeared or disappeared. Edges are told apart by
+    (source, target, type) - none of them carries props."""
+    result = SyncResult(nodes_created=0, edges_created=0)
+    writer = _GraphWriter(conn)
+    touched: Set[str] = set()
+
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        node_ids, stale_nodes = _diff_nodes(conn, writer, result, touched)
+        stale_edges = _diff_edges(conn, writer, node_ids, result, touched)
+        _delete_stale(conn, writer, stale_nodes, stale_edges, result, touched)
+        if result != SyncResult(nodes_created=0, edges_created=0):
+            stamp_generation(conn)
+            _log_sync(conn, touched)
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+
+    return result
+
+
+def sync_graph(db_path: str | None = None, incremental: bool = False) -> SyncResult:
+    """Brings the knowledge graph in the GraphQLite file at db_path (or
+    GRAPH_DB_PATH) in line with the current SQLite state. Idempotent - safe
+    to run repeatedly, always converges to the same graph for the same
+    SQLite state.
+
+    By default every node/edge is wiped and a fresh graph is re-inserted.
+    With `incremental`, only the differences since the last sync are written
+    (see _apply_diff()) - cheap enough to run after every import. An
+    incremental sync of a graph no sync has recorded (an empty file, or one
+    built before graph_sync_nodes existed) falls back to a rebuild."""
+    path = db_path or GRAPH_DB_PATH
+    graph = Graph(path)
+    conn = graph.connection.sqlite_connection
+    conn.execute(_SYNC_STATE_SCHEMA)
+    for statement in _SYNC_LOG_SCHEMA:
+        conn.execute(statement)
+
+    synced_before = conn.execute("SELECT 1 FROM graph_sync_nodes LIMIT 1").fetchone()
+    if incremental and synced_before:
+        return _apply_diff(conn)
+    return _rebuild(conn)
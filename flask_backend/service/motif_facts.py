@@ -0,0 +1,214 @@
+"""The "non-draft screening facts" every motif in motifs.py evaluates
+against, read from the knowledge graph once per motif run instead of once
+per motif.
+
+ScreeningFacts is columnar: movies, directors, countries and genres are
+numbered by position, every non-draft screening date is a (movie, date
+ordinal) pair of parallel arrays, and every DIRECTED_BY / PRODUCED_IN /
+HAS_GENRE edge a (movie, entity) pair. One pass over the dates then gives
+each movie its earliest current and latest past screening, which is all
+the motifs need from the date history.
+
+The facts are read with plain SQL over GraphQLite's storage tables (see
+graph_sync.py for their layout), which - unlike the Cypher equivalents -
+go through its edge and property indexes: reading the facts of a handful
+of movies (motif_snapshot.py) costs as much as those movies' rows.
+"""
+
+import json
+from array import array
+from dataclasses import dataclass
+from datetime import date
+from typing import Iterable
+
+
+def key_id(key: str) -> str:
+    """SQL for the id GraphQLite gave the property `key`."""
+    return f"(SELECT id FROM property_keys WHERE key = '{key}')"
+
+
+_MOVIES_SQL = f"""
+SELECT l.node_id, i.value, t.value, r.value
+FROM node_labels l
+JOIN node_props_text i ON i.node_id = l.node_id AND i.key_id = {key_id("id")}
+LEFT JOIN node_props_text t
+    ON t.node_id = l.node_id AND t.key_id = {key_id("title")}
+LEFT JOIN node_props_int r
+    ON r.node_id = l.node_id AND r.key_id = {key_id("release_year")}
+WHERE l.label = 'Movie'{{movies}}
+ORDER BY l.node_id
+"""
+
+_SCREENING_FACTS_SQL = f"""
+SELECT hs.source_id, d.value
+FROM edges hs
+JOIN node_props_bool dr ON dr.node_id = hs.target_id
+    AND dr.key_id = {key_id("draft")} AND dr.value = 0
+JOIN edges hd ON hd.source_id = hs.target_id AND hd.type = 'HAS_DATE'
+JOIN node_props_text d ON d.node_id = hd.target_id AND d.key_id = {key_id("date")}
+WHERE hs.type = 'HAS_SCREENING'{{movies}}
+"""
+
+_LINKS_SQL = f"""
+SELECT e.source_id, e.target_id, i.value, n.value
+FROM edges e
+JOIN node_props_text i ON i.node_id = e.target_id AND i.key_id = {key_id("id")}
+LEFT JOIN node_props_text n
+    ON n.node_id = e.target_id AND n.key_id = {key_id("name")}
+WHERE e.type = :rel_type{{movies}}
+"""
+
+_MOVIES_FILTER = " AND {} IN (SELECT value FROM json_each(:movies))"
+
+# first_current/last_past value of a movie without such a screening -
+# below every real date ordinal
+NO_DATE = 0
+
+
+@dataclass
+class EntityLinks:
+    """Movies linked to one kind of entity: the entities' node ids and
+    names by position, and one (movie, entity) position pair per edge."""
+
+    ids: list[str]
+    names: list[str]
+    movie: array
+    entity: array
+
+    def movies_by_entity(self) -> dict[int, list[int]]:
+        """Movie positions linked to each entity position, in movie
+        order."""
+        by_entity: dict[int, list[int]] = {}
+        for movie, entity in sorted(zip(self.movie, self.entity)):
+            by_entity.setdefault(entity, []).append(movie)
+        return by_entity
+
+
+@dataclass
+class ScreeningFacts:
+    """What the motifs know about the graph, as of `today` (a date
+    ordinal). first_current and last_past hold, per movie position, the
+    ordinal of its earliest non-draft screening date today or later and of
+    its latest one before today - NO_DATE when there is none."""
+
+    today: int
+    movie_ids: list[str]
+    titles: list[str]
+    release_years: list[int | None]
+    date_movie: array
+    date_ordinal: array
+    first_current: array
+    last_past: array
+    directors: EntityLinks
+    countries: EntityLinks
+    genres: EntityLinks
+
+    def is_current(self, movie: int) -> bool:
+        return self.first_current[movie] != NO_DATE
+
+
+def _links(
+    conn, rel_type: str, movie_positions: dict[int, int], movies_filter: str, params
+) -> EntityLinks:
+    positions: dict[int, int] = {}
+    links = EntityLinks(ids=[], names=[], movie=array("l"), entity=array("l"))
+    rows = conn.execute(
+        _LINKS_SQL.format(movies=movies_filter.format("e.source_id")),
+        {**params, "rel_type": rel_type},
+    )
+    for movie_node, entity_node, entity_id, name in rows:
+        position = positions.get(entity_node)
+        if position is None:
+            position = positions[entity_node] = len(links.ids)
+            links.ids.append(entity_id)
+            links.names.append(name)
+        links.movie.append(movie_positions[movie_node])
+        links.entity.append(position)
+    return links
+
+
+def load_screening_facts(
+    graph,
+    today: date | None = None,
+    movies: Iterable[int] | None = None,
+    known: dict[str, tuple[int, int]] | None = None,
+) -> ScreeningFacts:
+    """Reads the screening facts off `graph`, as of `today` (default: the
+    real today) - of every movie, or only of the `movies` (node rowids).
+    `known` holds the (first_current, last_past) of movies (by movie id)
+    already worked out as of `today`: their dates aren't read, nor part of
+    date_movie/date_ordinal."""
+    conn = graph.connection.sqlite_connection
+    today_ordinal = (today or date.today()).toordinal()
+    movies_filter = "" if movies is None else _MOVIES_FILTER
+    params = {"movies": None if movies is None else json.dumps(list(movies))}
+    known = known or {}
+
+    movie_ids: list[str] = []
+    titles: list[str] = []
+    release_years: list[int | None] = []
+    movie_positions: dict[int, int] = {}
+    rows = conn.execute(
+        _MOVIES_SQL.format(movies=movies_filter.format("l.node_id")), params
+    )
+    for node_id, movie_id, title, release_year in rows:
+        movie_positions[node_id] = len(movie_ids)
+        movie_ids.append(movie_id)
+        titles.append(title)
+        release_years.append(release_year)
+
+    date_movie = array("l")
+    date_ordinal = array("l")
+    first_current = array("l", [NO_DATE]) * len(movie_ids)
+    last_past = array("l", [NO_DATE]) * len(movie_ids)
+    dates_filter, dates_params = movies_filter, params
+    if known:
+        for movie, movie_id in enumerate(movie_ids):
+            if movie_id in known:
+                first_current[movie], last_past[movie] = known[movie_id]
+        dates_filter = _MOVIES_FILTER
+        dates_params = {
+            "movies": json.dumps(
+                [
+                    node_id
+                    for node_id, movie in movie_positions.items()
+                    if movie_ids[movie] not in known
+                ]
+            )
+        }
+    # a few thousand distinct days against up to millions of dates
+    ordinals: dict[str, int] = {}
+    rows = conn.execute(
+        _SCREENING_FACTS_SQL.format(movies=dates_filter.format("hs.source_id")),
+        dates_params,
+    )
+    for movie_node, day in rows:
+        movie = movie_positions[movie_node]
+        ordinal = ordinals.get(day)
+        if ordinal is None:
+            ordinal = ordinals[day] = date.fromisoformat(day).toordinal()
+        date_movie.append(movie)
+        date_ordinal.append(ordinal)
+        if ordinal >= today_ordinal:
+            if first_current[movie] == NO_DATE or ordinal < first_current[movie]:
+                first_current[movie] = ordinal
+        elif ordinal > last_past[movie]:
+            last_past[movie] = ordinal
+
+    return ScreeningFacts(
+        today=today_ordinal,
+        movie_ids=movie_ids,
+        titles=titles,
+        release_years=release_years,
+        date_movie=date_movie,
+        date_ordinal=date_ordinal,
+        first_current=first_current,
+        last_past=last_past,
+        directors=_links(conn, "DIRECTED_BY", movie_positions, movies_filter, params),
+        countries=_links(conn, "PRODUCED_IN", movie_positions, movies_filter, params),
+        genres=_links(conn, "HAS_GENRE", movie_positions, movies_filter, params),
+    )
+
+
+def iso(ordinal: int) -> str:
+    return date.fromordinal(ordinal).isoformat()
@@ -2,14 +2,19 @@
 in MOTIF_REGISTRY. See flask_backend/service/motifs.py for the motifs
 themselves and docs/superpowers/specs/2026-08-03-motif-detection-design.md
 for the ranking formula's rationale (the PRD's historical_significance
-signal is dropped - no honest data to back it with yet)."""
+signal is dropped - no honest data to back it with yet).
 
-from datetime import date
+Detections are cached per graph generation and day (see graph_cache.py)
+and, across syncs, only re-evaluated for what the syncs touched (see
+motif_snapshot.py); scoring, which depends on the day too, always reruns."""
 
-from graphqlite import Graph
+from collections import Counter
+from datetime import date
 
 from flask_backend.env_config import GRAPH_DB_PATH
-from flask_backend.service.motifs import MOTIF_REGISTRY, Observation
+from flask_backend.service.graph_cache import cached_query
+from flask_backend.service.motif_snapshot import detect_incremental
+from flask_backend.service.motifs import Observation
 
 RARITY_WEIGHT = 0.45
 TIMELINESS_WEIGHT = 0.30
@@ -22,97 +27,136 @@ GRAPH_COMPLEXITY_NODE_CAP = 10
 DEDUP_JACCARD_THRESHOLD = 0.5
 
 
-def _open(db_path: str | None = None) -> Graph:
-    return Graph(db_path or GRAPH_DB_PATH)
-
-
-def _timeliness(observation: Observation) -> float:
-    next_date_str = observation.metadata.get("next_screening_date")
-    if not next_date_str:
-        return 0.0
-
-    days_until = (date.fromisoformat(next_date_str) - date.today()).days
-    if days_until <= TIMELINESS_FULL_SCORE_DAYS:
-        return 1.0
-    if days_until >= TIMELINESS_ZERO_SCORE_DAYS:
-        return 0.0
-
+def _timeliness_by_date(next_dates: list[str | None]) -> dict[str | None, float]:
+    """Timeliness of each distinct next_screening_date - observations of a
+    run share a few dozen days at most."""
+    today = date.today()
     span = TIMELINESS_ZERO_SCORE_DAYS - TIMELINESS_FULL_SCORE_DAYS
-    return 1.0 - (days_until - TIMELINESS_FULL_SCORE_DAYS) / span
-
-
-def _score(observation: Observation, motif_count: int) -> float:
-    rarity = 1 / motif_count
-    timeliness = _timeliness(observation)
-    graph_complexity = min(
-        len(observation.evidence.nodes) / GRAPH_COMPLEXITY_NODE_CAP, 1.0
-    )
-    return (
-        RARITY_WEIGHT * rarity
-        + TIMELINESS_WEIGHT * timeliness
-        + GRAPH_COMPLEXITY_WEIGHT * graph_complexity
-    )
-
-
-def _overlaps(a_nodes: set[str], b_nodes: set[str]) -> bool:
-    """Two observations are considered the same underlying story only when
-    a majority of their combined evidence overlaps (Jaccard similarity) - a
-    bare intersection is too coarse: a CountryFocus observation can carry
-    a dozen+ movie nodes, so it would otherwise "absorb" every unrelated
-    observation that happens to mention any one of those movies."""
-    if not a_nodes or not b_nodes:
-        return False
-    intersection = a_nodes & b_nodes
-    if not intersection:
-        return False
-    union = a_nodes | b_nodes
-    return len(intersection) / len(union) >= DEDUP_JACCARD_THRESHOLD
+    timeliness: dict[str | None, float] = {}
+    for next_date_str in set(next_dates):
+        if not next_date_str:
+            timeliness[next_date_str] = 0.0
+            continue
+        days_until = (date.fromisoformat(next_date_str) - today).days
+        if days_until <= TIMELINESS_FULL_SCORE_DAYS:
+            timeliness[next_date_str] = 1.0
+        elif days_until >= TIMELINESS_ZERO_SCORE_DAYS:
+            timeliness[next_date_str] = 0.0
+        else:
+            timeliness[next_date_str] = (
+                1.0 - (days_until - TIMELINESS_FULL_SCORE_DAYS) / span
+            )
+    return timeliness
+
+
+def _scores(observations: list[Observation]) -> list[float]:
+    """Every observation's score, a column at a time."""
+    motif_names = [obs.motif_name for obs in observations]
+    motif_counts = Counter(motif_names)
+    rarity = [1 / motif_counts[name] for name in motif_names]
+
+    next_dates = [obs.metadata.get("next_screening_date") for obs in observations]
+    timeliness_by_date = _timeliness_by_date(next_dates)
+    timeliness = [timeliness_by_date[next_date] for next_date in next_dates]
+
+    graph_complexity = [
+        min(len(obs.evidence.nodes) / GRAPH_COMPLEXITY_NODE_CAP, 1.0)
+        for obs in observations
+    ]
+    return [
+        RARITY_WEIGHT * r + TIMELINESS_WEIGHT * t + GRAPH_COMPLEXITY_WEIGHT * c
+        for r, t, c in zip(rarity, timeliness, graph_complexity)
+    ]
+
+
+def _node_bitsets(observations: list[Observation]) -> list[int]:
+    """Each observation's evidence nodes as a bitset (an int) over the
+    nodes of all of them."""
+    positions: dict[str, int] = {}
+    bitsets = []
+    for obs in observations:
+        bits = 0
+        for node in obs.evidence.nodes:
+            bits |= 1 << positions.setdefault(node, len(positions))
+        bitsets.append(bits)
+    return bitsets
 
 
 def _deduplicate(observations: list[Observation]) -> list[Observation]:
-    """Merges observations whose evidence overlaps enough (see _overlaps)
-    to represent the same underlying story. Processes observations
-    highest-score-first so a later, lower-scored observation always merges
-    INTO an already-kept entry rather than replacing it - this keeps merge
-    provenance (metadata['merged_from']) from being discarded and makes the
-    result independent of input order."""
+    """Merges observations whose evidence overlaps enough to represent the
+    same underlying story: a majority of their combined evidence nodes
+    (Jaccard similarity of at least DEDUP_JACCARD_THRESHOLD). A bare
+    intersection is too coarse: a CountryFocus observation can carry a
+    dozen+ movie nodes, so it would otherwise "absorb" every unrelated
+    observation that happens to mention any one of those movies.
+
+    Processes observations highest-score-first so a later, lower-scored
+    observation always merges INTO the earliest kept entry it overlaps
+    rather than replacing it - this keeps merge provenance
+    (metadata['merged_from']) from being discarded and makes the result
+    independent of input order.
+
+    Evidence nodes are compared as bitsets, and only against the kept
+    entries that share at least one node with them (found through a
+    node -> kept entries index) - any other pair has a similarity of 0."""
     ordered = sorted(observations, key=lambda o: o.score, reverse=True)
+    bitsets = _node_bitsets(ordered)
     kept: list[Observation] = []
-    for obs in ordered:
-        obs_nodes = set(obs.evidence.nodes)
-        match = next(
-            (
-                existing
-                for existing in kept
-                if _overlaps(obs_nodes, set(existing.evidence.nodes))
-            ),
-            None,
-        )
+    kept_bitsets: list[int] = []
+    kept_by_node: dict[str, list[int]] = {}
+    for obs, bits in zip(ordered, bitsets):
+        match = None
+        if bits:
+            size = bits.bit_count()
+            candidates = sorted(
+                {
+                    position
+                    for node in obs.evidence.nodes
+                    for position in kept_by_node.get(node, ())
+                }
+            )
+            for position in candidates:
+                other = kept_bitsets[position]
+                intersection = (bits & other).bit_count()
+                union = size + other.bit_count() - intersection
+                if intersection / union >= DEDUP_JACCARD_THRESHOLD:
+                    match = kept[position]
+                    break
         if match is None:
+            for node in obs.evidence.nodes:
+                kept_by_node.setdefault(node, []).append(len(kept))
             kept.append(obs)
+            kept_bitsets.append(bits)
             continue
         match.metadata.setdefault("merged_from", []).append(obs.motif_name)
     return kept
 
 
 def rank_observations(observations: list[Observation]) -> list[Observation]:
+    """Scores the observations, merges the ones telling the same story and
+    returns the rest, highest score first."""
     if not observations:
         return []
 
-    motif_counts: dict[str, int] = {}
-    for obs in observations:
-        motif_counts[obs.motif_name] = motif_counts.get(obs.motif_name, 0) + 1
-
-    for obs in observations:
-        obs.score = _score(obs, motif_counts[obs.motif_name])
-
-    deduped = _deduplicate(observations)
-    return sorted(deduped, key=lambda o: o.score, reverse=True)
-
-
-def run_motifs(db_path: str | None = None) -> list[Observation]:
-    graph = _open(db_path)
-    observations: list[Observation] = []
-    for motif in MOTIF_REGISTRY:
-        observations.extend(motif.detect(graph))
+    for obs, score in zip(observations, _scores(observations)):
+        obs.score = score
+    # kept highest-score-first already
+    return _deduplicate(observations)
+
+
+def run_motifs(
+    db_path: str | None = None, timings: dict[str, float] | None = None
+) -> list[Observation]:
+    """Ranked observations of every motif. When given, `timings` is filled
+    with the seconds detect_incremental() spent on the snapshot, reading
+    the screening facts and evaluating each motif - on a cache hit, those
+    of the run that filled the cache."""
+    observations, detect_timings = cached_query(
+        db_path or GRAPH_DB_PATH,
+        "motifs",
+        {"today": date.today().isoformat()},
+        detect_incremental,
+    )
+    if timings is not None:
+        timings.update(detect_timings)
     return rank_observations(observations)
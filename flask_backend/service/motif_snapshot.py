@@ -0,0 +1,336 @@
+"""Incremental motif detection: keeps the last run's observations in the
+graph file and, on the next run, re-evaluates only the subjects (see
+motifs.py) whose facts may have changed since.
+
+What may have changed comes from the sync log (graph_sync.touched_since()):
+the touched movies are those of every touched screening, screening date or
+movie, plus those with a screening date the day rolled past since the last
+run; the touched entities, the directors, countries and genres of those
+movies and any touched directly. Observations about a touched subject are
+re-evaluated on the screening facts of its movies, the others kept as
+they were.
+
+A genre easily spans a tenth of the catalog, so the snapshot also keeps
+every movie's first_current/last_past (motif_facts.py): only the dates of
+the touched movies are read again, which is what makes a run cost about as
+much as the changes since the last one.
+
+detect_incremental() falls back to a full run - and saves its result as
+the new snapshot - when there is no usable snapshot: none yet, taken by
+other motif versions or in another year (anniversaries), or older than
+what the sync log remembers, or the graph was rebuilt since.
+"""
+
+import json
+import sqlite3
+import time
+from dataclasses import asdict
+from datetime import date
+
+from flask_backend.service.graph_sync import last_sync_seq, touched_since
+from flask_backend.service.motif_facts import (
+    ScreeningFacts,
+    key_id,
+    load_screening_facts,
+)
+from flask_backend.service.motifs import (
+    FACTS_TIMING,
+    MOTIF_REGISTRY,
+    GraphEvidence,
+    Observation,
+    detect_all,
+    evaluate_all,
+)
+
+_SNAPSHOT_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS motif_snapshot_state (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        seq INTEGER NOT NULL,
+        day TEXT NOT NULL,
+        versions TEXT NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS motif_snapshot (
+        motif TEXT NOT NULL,
+        subject TEXT NOT NULL,
+        observation TEXT NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_motif_snapshot_subject ON motif_snapshot (subject)",
+    """
+    CREATE TABLE IF NOT EXISTS motif_snapshot_movies (
+        movie TEXT PRIMARY KEY,
+        first_current INTEGER NOT NULL,
+        last_past INTEGER NOT NULL
+    )
+    """,
+)
+
+# detect_incremental()'s timing key for finding the touched subjects and
+# reading/writing the snapshot, next to detect_all()'s
+SNAPSHOT_TIMING = "motif_snapshot"
+
+_ENTITY_LINKS = "('DIRECTED_BY', 'PRODUCED_IN', 'HAS_GENRE')"
+
+_NODES_SQL = f"""
+SELECT node_id FROM node_props_text
+WHERE key_id = {key_id("id")} AND value IN (SELECT value FROM json_each(?))
+"""
+
+_ROLLED_OVER_DATES_SQL = f"""
+SELECT node_id FROM node_props_text
+WHERE key_id = {key_id("date")} AND value >= ? AND value < ?
+"""
+
+_MOVIES_OF_NODES_SQL = """
+SELECT node_id FROM node_labels
+WHERE label = 'Movie' AND node_id IN (SELECT value FROM json_each(?1))
+UNION
+SELECT source_id FROM edges
+WHERE type = 'HAS_SCREENING' AND target_id IN (SELECT value FROM json_each(?1))
+UNION
+SELECT hs.source_id FROM edges hd
+JOIN edges hs ON hs.target_id = hd.source_id AND hs.type = 'HAS_SCREENING'
+WHERE hd.type = 'HAS_DATE' AND hd.target_id IN (SELECT value FROM json_each(?1))
+"""
+
+_ENTITIES_SQL = f"""
+SELECT target_id FROM edges
+WHERE type IN {_ENTITY_LINKS} AND source_id IN (SELECT value FROM json_each(?1))
+UNION
+SELECT node_id FROM node_labels
+WHERE label IN ('Director', 'Country', 'Genre')
+    AND node_id IN (SELECT value FROM json_each(?2))
+"""
+
+_ENTITY_MOVIES_SQL = f"""
+SELECT source_id FROM edges
+WHERE type IN {_ENTITY_LINKS} AND target_id IN (SELECT value FROM json_each(?))
+"""
+
+_EXTERNAL_IDS_SQL = f"""
+SELECT value FROM node_props_text
+WHERE key_id = {key_id("id")} AND node_id IN (SELECT value FROM json_each(?))
+"""
+
+
+def _column(conn: sqlite3.Connection, sql: str, *params) -> set:
+    return {
+        value
+        for (value,) in conn.execute(
+            sql, [json.dumps(sorted(param)) for param in params]
+        )
+    }
+
+
+def _versions() -> str:
+    return json.dumps({motif.name: motif.version for motif in MOTIF_REGISTRY})
+
+
+def _load_state(conn: sqlite3.Connection) -> tuple[int, str, str] | None:
+    return conn.execute(
+        "SELECT seq, day, versions FROM motif_snapshot_state WHERE id = 1"
+    ).fetchone()
+
+
+def _to_row(observation: Observation) -> tuple[str, str, str]:
+    return (
+        observation.motif_name,
+        observation.evidence.nodes[0],
+        json.dumps(asdict(observation)),
+    )
+
+
+def _from_row(observation: str) -> Observation:
+    fields = json.loads(observation)
+    evidence = fields.pop("evidence")
+    return Observation(
+        **fields,
+        evidence=GraphEvidence(
+            nodes=evidence["nodes"],
+            edges=[tuple(edge) for edge in evidence["edges"]],
+            query=evidence["query"],
+        ),
+    )
+
+
+def _touched(
+    conn: sqlite3.Connection, touched_ids: set[str], since: str, today: date
+) -> tuple[set[int], set[int], set[str]]:
+    """Node ids of the touched movies and of every movie of a touched
+    entity, and the external ids of every subject whose observations may
+    have changed."""
+    nodes = _column(conn, _NODES_SQL, touched_ids)
+    nodes |= {
+        node_id
+        for (node_id,) in conn.execute(
+            _ROLLED_OVER_DATES_SQL, (since, today.isoformat())
+        )
+    }
+    movies = _column(conn, _MOVIES_OF_NODES_SQL, nodes)
+    entities = _column(conn, _ENTITIES_SQL, movies, nodes)
+    entity_movies = _column(conn, _ENTITY_MOVIES_SQL, entities) - movies
+    subjects = touched_ids | _column(conn, _EXTERNAL_IDS_SQL, movies | entities)
+    return movies, entity_movies, subjects
+
+
+def _known_dates(
+    conn: sqlite3.Connection, movies: set[int]
+) -> dict[str, tuple[int, int]]:
+    """The snapshot's first_current/last_past of the `movies` (node ids)."""
+    return {
+        movie: (first_current, last_past)
+        for movie, first_current, last_past in conn.execute(
+            "SELECT movie, first_current, last_past FROM motif_snapshot_movies"
+            " WHERE movie IN (SELECT value FROM json_each(?))",
+            (json.dumps(sorted(_column(conn, _EXTERNAL_IDS_SQL, movies))),),
+        )
+    }
+
+
+def _save(
+    conn: sqlite3.Connection,
+    seq: int,
+    today: date,
+    observations: list[Observation],
+    facts: ScreeningFacts,
+    known: dict[str, tuple[int, int]],
+    replaced_subjects: set[str] | None,
+) -> None:
+    """Stores `observations` in place of the snapshot's observations about
+    `replaced_subjects` - of all of them, when None - and the movie dates
+    `facts` worked out besides the `known` ones."""
+    if replaced_subjects is None:
+        conn.execute("DELETE FROM motif_snapshot")
+        conn.execute("DELETE FROM motif_snapshot_movies")
+    else:
+        replaced = json.dumps(sorted(replaced_subjects))
+        conn.execute(
+            "DELETE FROM motif_snapshot"
+            " WHERE subject IN (SELECT value FROM json_each(?))",
+            (replaced,),
+        )
+        conn.execute(
+            "DELETE FROM motif_snapshot_movies"
+            " WHERE movie IN (SELECT value FROM json_each(?))",
+            (replaced,),
+        )
+    conn.executemany(
+        "INSERT INTO motif_snapshot (motif, subject, observation) VALUES (?, ?, ?)",
+        (_to_row(observation) for observation in observations),
+    )
+    conn.executemany(
+        "INSERT OR REPLACE INTO motif_snapshot_movies (movie, first_current, last_past)"
+        " VALUES (?, ?, ?)",
+        (
+            (movie_id, facts.first_current[movie], facts.last_past[movie])
+            for movie, movie_id in enumerate(facts.movie_ids)
+            if movie_id not in known
+        ),
+    )
+    conn.execute(
+        "INSERT OR REPLACE INTO motif_snapshot_state (id, seq, day, versions)"
+        " VALUES (1, ?, ?, ?)",
+        (seq, today.isoformat(), _versions()),
+    )
+
+
+def _usable_state(
+    conn: sqlite3.Connection, today: date
+) -> tuple[int, str, set[str]] | None:
+    """(seq, day, external ids touched since) of a snapshot detect_incremental()
+    can build on, or None."""
+    state = _load_state(conn)
+    if state is None:
+        return None
+    seq, day, versions = state
+    snapshot_date = date.fromisoformat(day)
+    if (
+        versions != _versions()
+        or snapshot_date > today
+        or snapshot_date.year != today.year
+    ):
+        return None
+    touched_ids = touched_since(conn, seq)
+    if touched_ids is None:
+        return None
+    return seq, day, touched_ids
+
+
+def detect_incremental(
+    graph, today: date | None = None
+) -> tuple[list[Observation], dict[str, float]]:
+    """detect_all()'s observations (in the same order) and timings,
+    re-evaluating only the subjects touched since the last call's snapshot
+    (see module docstring). A graph whose syncs aren't logged gets a plain
+    detect_all(), and no snapshot."""
+    today = today or date.today()
+    conn = graph.connection.sqlite_connection
+    seq = last_sync_seq(conn)
+    if seq is None:
+        return detect_all(graph, today)
+
+    started = time.perf_counter()
+    # the write lock up front: the snapshot saved is of the graph it read
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        for statement in _SNAPSHOT_SCHEMA:
+            conn.execute(statement)
+        usable = _usable_state(conn, today)
+        if usable is None:
+            facts = load_screening_facts(graph, today)
+            timings = {FACTS_TIMING: time.perf_counter() - started}
+            observations, motif_timings = evaluate_all(facts)
+            timings.update(motif_timings)
+            _save(conn, seq, today, observations, facts, {}, None)
+            conn.execute("COMMIT")
+            return observations, timings
+
+        snapshot_seq, snapshot_day, touched_ids = usable
+        movies, entity_movies, subjects = _touched(
+            conn, touched_ids, snapshot_day, today
+        )
+        known = _known_dates(conn, entity_movies)
+        kept = [
+            _from_row(observation)
+            for (observation,) in conn.execute(
+                "SELECT observation FROM motif_snapshot"
+                " WHERE subject NOT IN (SELECT value FROM json_each(?))",
+                (json.dumps(sorted(subjects)),),
+            )
+        ]
+        timings = {SNAPSHOT_TIMING: time.perf_counter() - started}
+
+        started = time.perf_counter()
+        facts = load_screening_facts(graph, today, movies | entity_movies, known)
+        timings[FACTS_TIMING] = time.perf_counter() - started
+
+        fresh, motif_timings = evaluate_all(facts)
+        fresh = [
+            observation
+            for observation in fresh
+            if observation.evidence.nodes[0] in subjects
+        ]
+        timings.update(motif_timings)
+
+        started = time.perf_counter()
+        if subjects or snapshot_seq != seq or snapshot_day != today.isoformat():
+            _save(conn, seq, today, fresh, facts, known, subjects)
+        conn.execute("COMMIT")
+        timings[SNAPSHOT_TIMING] += time.perf_counter() - started
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+
+    position = {motif.name: index for index, motif in enumerate(MOTIF_REGISTRY)}
+    motifs = {motif.name: motif for motif in MOTIF_REGISTRY}
+    observations = sorted(
+        kept + fresh,
+        key=lambda observation: (
+            position[observation.motif_name],
+            motifs[observation.motif_name].order_key(observation),
+        ),
+    )
+    return observations, timings
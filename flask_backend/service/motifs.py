@@ -4,12 +4,30 @@ objects for predefined editorial patterns. See
 docs/superpowers/specs/2026-08-03-motif-detection-design.md for the full
 design rationale, including the GraphQLite quirks this module works around
 (min()/max() on date strings, collect(DISTINCT ...) not deduplicating).
+
+The motifs don't query the graph themselves: detect_all() reads the shared
+non-draft screening facts once (motif_facts.py) and evaluates every motif
+of MOTIF_REGISTRY against them in memory.
+
+Every observation is about one subject - a director, country, genre or
+movie, the first of its evidence nodes - and depends only on the facts of
+that subject's movies; motif_snapshot.py relies on that to re-evaluate
+only the subjects a sync touched.
 """
 
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import date
 
+from flask_backend.service.motif_facts import (
+    NO_DATE,
+    EntityLinks,
+    ScreeningFacts,
+    iso,
+    load_screening_facts,
+)
+
 
 @dataclass
 class GraphEvidence:
@@ -33,9 +51,26 @@ class Motif(ABC):
     name: str
     description: str
     version: str
+    # metadata key holding the name of the observation's subject, which
+    # observations are ordered by (see order_key())
+    subject_key: str
+    # the Cypher pattern the motif stands for, recorded as the query of its
+    # observations' evidence: graph.query() runs it with $today (an ISO
+    # date) and $threshold. evaluate() itself works on ScreeningFacts.
+    evidence_query: str | None = None
 
     @abstractmethod
-    def detect(self, graph) -> list[Observation]: ...
+    def evaluate(self, facts: ScreeningFacts) -> list[Observation]: ...
+
+    def detect(self, graph) -> list[Observation]:
+        """evaluate() on facts read off `graph` for this motif alone - see
+        detect_all() for running several."""
+        return self.evaluate(load_screening_facts(graph))
+
+    def order_key(self, observation: Observation) -> tuple[str, str]:
+        """evaluate() returns observations sorted by this key: subject name,
+        then subject node id."""
+        return observation.metadata[self.subject_key], observation.evidence.nodes[0]
 
 
 def _dedupe_preserve_order(items: list) -> list:
@@ -45,6 +80,25 @@ def _dedupe_preserve_order(items: list) -> list:
     return list(dict.fromkeys(items))
 
 
+def _current_movies_by_entity(
+    facts: ScreeningFacts, links: EntityLinks, threshold: int
+) -> list[tuple[int, list[int]]]:
+    """(entity, current movies) for every entity with `threshold`+ movies
+    currently screening, ordered by entity name."""
+    groups = [
+        (entity, [movie for movie in movies if facts.is_current(movie)])
+        for entity, movies in links.movies_by_entity().items()
+    ]
+    return sorted(
+        ((entity, movies) for entity, movies in groups if len(movies) >= threshold),
+        key=lambda group: (links.names[group[0]], links.ids[group[0]]),
+    )
+
+
+def _next_screening_date(facts: ScreeningFacts, movies: list[int]) -> str:
+    return iso(min(facts.first_current[movie] for movie in movies))
+
+
 DIRECTOR_FOCUS_THRESHOLD = 2
 COUNTRY_FOCUS_THRESHOLD = 2
 GENRE_FOCUS_THRESHOLD = 2
@@ -53,51 +107,46 @@ GENRE_FOCUS_THRESHOLD = 2
 class DirectorFocusMotif(Motif):
     name = "director_focus"
     description = "Detects directors with 2+ movies currently screening."
-    version = "1.0"
-
-    def detect(self, graph) -> list[Observation]:
-        today = date.today().isoformat()
-        query = (
-            "MATCH (d:Director)<-[:DIRECTED_BY]-(m:Movie)-[:HAS_SCREENING]->"
-            "(s:Screening)-[:HAS_DATE]->(sd:ScreeningDate) "
-            "WHERE sd.date >= $today AND s.draft = false "
-            "WITH d, count(DISTINCT m) AS movie_count, collect(m.id) AS movie_ids, "
-            "collect(m.title) AS titles, collect(sd.date) AS dates "
-            "WHERE movie_count >= $threshold "
-            "RETURN d.id AS director_id, d.name AS director_name, movie_count, "
-            "movie_ids, titles, dates "
-            "ORDER BY director_name"
-        )
-        rows = graph.query(
-            query, {"today": today, "threshold": DIRECTOR_FOCUS_THRESHOLD}
-        )
+    version = "1.1"
+    subject_key = "director"
+    evidence_query = (
+        "MATCH (d:Director)<-[:DIRECTED_BY]-(m:Movie)-[:HAS_SCREENING]->"
+        "(s:Screening)-[:HAS_DATE]->(sd:ScreeningDate) "
+        "WHERE sd.date >= $today AND s.draft = false "
+        "WITH d, count(DISTINCT m) AS movie_count "
+        "WHERE movie_count >= $threshold "
+        "RETURN d.id AS director_id, d.name AS director_name, movie_count "
+        "ORDER BY director_name"
+    )
 
+    def evaluate(self, facts: ScreeningFacts) -> list[Observation]:
+        links = facts.directors
         observations = []
-        for row in rows:
-            movie_ids = _dedupe_preserve_order(row["movie_ids"])
-            titles = _dedupe_preserve_order(row["titles"])
+        for director, movies in _current_movies_by_entity(
+            facts, links, DIRECTOR_FOCUS_THRESHOLD
+        ):
+            director_id, director_name = links.ids[director], links.names[director]
+            movie_ids = [facts.movie_ids[movie] for movie in movies]
+            titles = _dedupe_preserve_order([facts.titles[movie] for movie in movies])
             observations.append(
                 Observation(
                     motif_name=self.name,
                     confidence=1.0,
                     score=0.0,
-                    headline=f"Múltiplos filmes de {row['director_name']} em cartaz",
+                    headline=f"Múltiplos filmes de {director_name} em cartaz",
                     summary=(
                         f"{len(movie_ids)} filmes dirigidos por "
-                        f"{row['director_name']} estão em cartaz atualmente."
+                        f"{director_name} estão em cartaz atualmente."
                     ),
                     evidence=GraphEvidence(
-                        nodes=[row["director_id"], *movie_ids],
-                        edges=[
-                            (mid, row["director_id"], "DIRECTED_BY")
-                            for mid in movie_ids
-                        ],
-                        query=query,
+                        nodes=[director_id, *movie_ids],
+                        edges=[(mid, director_id, "DIRECTED_BY") for mid in movie_ids],
+                        query=self.evidence_query,
                     ),
                     metadata={
-                        "director": row["director_name"],
+                        "director": director_name,
                         "movies": titles,
-                        "next_screening_date": min(row["dates"]),
+                        "next_screening_date": _next_screening_date(facts, movies),
                     },
                 )
             )
@@ -110,50 +159,46 @@ class CountryFocusMotif(Motif):
         f"Detects production countries with {COUNTRY_FOCUS_THRESHOLD}+ "
         "movies currently screening."
     )
-    version = "1.0"
-
-    def detect(self, graph) -> list[Observation]:
-        today = date.today().isoformat()
-        query = (
-            "MATCH (m:Movie)-[:PRODUCED_IN]->(c:Country), "
-            "(m)-[:HAS_SCREENING]->(s:Screening)-[:HAS_DATE]->(sd:ScreeningDate) "
-            "WHERE sd.date >= $today AND s.draft = false "
-            "WITH c, count(DISTINCT m) AS movie_count, collect(m.id) AS movie_ids, "
-            "collect(m.title) AS titles, collect(sd.date) AS dates "
-            "WHERE movie_count >= $threshold "
-            "RETURN c.id AS country_id, c.name AS country_name, movie_count, "
-            "movie_ids, titles, dates "
-            "ORDER BY country_name"
-        )
-        rows = graph.query(
-            query, {"today": today, "threshold": COUNTRY_FOCUS_THRESHOLD}
-        )
+    version = "1.1"
+    subject_key = "country"
+    evidence_query = (
+        "MATCH (m:Movie)-[:PRODUCED_IN]->(c:Country), "
+        "(m)-[:HAS_SCREENING]->(s:Screening)-[:HAS_DATE]->(sd:ScreeningDate) "
+        "WHERE sd.date >= $today AND s.draft = false "
+        "WITH c, count(DISTINCT m) AS movie_count "
+        "WHERE movie_count >= $threshold "
+        "RETURN c.id AS country_id, c.name AS country_name, movie_count "
+        "ORDER BY country_name"
+    )
 
+    def evaluate(self, facts: ScreeningFacts) -> list[Observation]:
+        links = facts.countries
         observations = []
-        for row in rows:
-            movie_ids = _dedupe_preserve_order(row["movie_ids"])
-            titles = _dedupe_preserve_order(row["titles"])
+        for country, movies in _current_movies_by_entity(
+            facts, links, COUNTRY_FOCUS_THRESHOLD
+        ):
+            country_id, country_name = links.ids[country], links.names[country]
+            movie_ids = [facts.movie_ids[movie] for movie in movies]
+            titles = _dedupe_preserve_order([facts.titles[movie] for movie in movies])
             observations.append(
                 Observation(
                     motif_name=self.name,
                     confidence=1.0,
                     score=0.0,
-                    headline=f"Cinema de {row['country_name']} em destaque",
+                    headline=f"Cinema de {country_name} em destaque",
                     summary=(
-                        f"{len(movie_ids)} filmes de {row['country_name']} "
+                        f"{len(movie_ids)} filmes de {country_name} "
                         "estão em cartaz atualmente."
                     ),
                     evidence=GraphEvidence(
-                        nodes=[row["country_id"], *movie_ids],
-                        edges=[
-                            (mid, row["country_id"], "PRODUCED_IN") for mid in movie_ids
-                        ],
-                        query=query,
+                        nodes=[country_id, *movie_ids],
+                        edges=[(mid, country_id, "PRODUCED_IN") for mid in movie_ids],
+                        query=self.evidence_query,
                     ),
                     metadata={
-                        "country": row["country_name"],
+                        "country": country_name,
                         "movies": titles,
-                        "next_screening_date": min(row["dates"]),
+                        "next_screening_date": _next_screening_date(facts, movies),
                     },
                 )
             )
@@ -166,48 +211,46 @@ class GenreFocusMotif(Motif):
         f"Detects genres with {GENRE_FOCUS_THRESHOLD}+ movies currently "
         "screening, across all cinemas."
     )
-    version = "2.0"
-
-    def detect(self, graph) -> list[Observation]:
-        today = date.today().isoformat()
-        query = (
-            "MATCH (m:Movie)-[:HAS_GENRE]->(g:Genre), "
-            "(m)-[:HAS_SCREENING]->(s:Screening)-[:HAS_DATE]->(sd:ScreeningDate) "
-            "WHERE sd.date >= $today AND s.draft = false "
-            "WITH g, count(DISTINCT m) AS movie_count, collect(m.id) AS movie_ids, "
-            "collect(m.title) AS titles, collect(sd.date) AS dates "
-            "WHERE movie_count >= $threshold "
-            "RETURN g.id AS genre_id, g.name AS genre_name, movie_count, "
-            "movie_ids, titles, dates "
-            "ORDER BY genre_name"
-        )
-        rows = graph.query(query, {"today": today, "threshold": GENRE_FOCUS_THRESHOLD})
+    version = "2.1"
+    subject_key = "genre"
+    evidence_query = (
+        "MATCH (m:Movie)-[:HAS_GENRE]->(g:Genre), "
+        "(m)-[:HAS_SCREENING]->(s:Screening)-[:HAS_DATE]->(sd:ScreeningDate) "
+        "WHERE sd.date >= $today AND s.draft = false "
+        "WITH g, count(DISTINCT m) AS movie_count "
+        "WHERE movie_count >= $threshold "
+        "RETURN g.id AS genre_id, g.name AS genre_name, movie_count "
+        "ORDER BY genre_name"
+    )
 
+    def evaluate(self, facts: ScreeningFacts) -> list[Observation]:
+        links = facts.genres
         observations = []
-        for row in rows:
-            movie_ids = _dedupe_preserve_order(row["movie_ids"])
-            titles = _dedupe_preserve_order(row["titles"])
+        for genre, movies in _current_movies_by_entity(
+            facts, links, GENRE_FOCUS_THRESHOLD
+        ):
+            genre_id, genre_name = links.ids[genre], links.names[genre]
+            movie_ids = [facts.movie_ids[movie] for movie in movies]
+            titles = _dedupe_preserve_order([facts.titles[movie] for movie in movies])
             observations.append(
                 Observation(
                     motif_name=self.name,
                     confidence=1.0,
                     score=0.0,
-                    headline=f"{row['genre_name']} em destaque nos cinemas",
+                    headline=f"{genre_name} em destaque nos cinemas",
                     summary=(
-                        f"{len(movie_ids)} filmes de {row['genre_name']} "
+                        f"{len(movie_ids)} filmes de {genre_name} "
                         "estão em cartaz atualmente."
                     ),
                     evidence=GraphEvidence(
-                        nodes=[row["genre_id"], *movie_ids],
-                        edges=[
-                            (mid, row["genre_id"], "HAS_GENRE") for mid in movie_ids
-                        ],
-                        query=query,
+                        nodes=[genre_id, *movie_ids],
+                        edges=[(mid, genre_id, "HAS_GENRE") for mid in movie_ids],
+                        query=self.evidence_query,
                     ),
                     metadata={
-                        "genre": row["genre_name"],
+                        "genre": genre_name,
                         "movies": titles,
-                        "next_screening_date": min(row["dates"]),
+                        "next_screening_date": _next_screening_date(facts, movies),
                     },
                 )
             )
@@ -226,57 +269,48 @@ class DirectorReturnMotif(Motif):
         "screening history back to Jan 2025, so this cannot yet detect a "
         "true multi-year gap."
     )
-    version = "1.0"
-
-    def detect(self, graph) -> list[Observation]:
-        query = (
-            "MATCH (d:Director)<-[:DIRECTED_BY]-(m:Movie)-[:HAS_SCREENING]->"
-            "(s:Screening)-[:HAS_DATE]->(sd:ScreeningDate) "
-            "WHERE s.draft = false "
-            "RETURN d.id AS director_id, d.name AS director_name, "
-            "m.id AS movie_id, m.title AS title, sd.date AS date "
-            "ORDER BY director_name"
-        )
-        rows = graph.query(query)
-
-        today_iso = date.today().isoformat()
-        by_director: dict[str, dict] = {}
-        for row in rows:
-            entry = by_director.setdefault(
-                row["director_id"],
-                {"name": row["director_name"], "past": [], "current": []},
-            )
-            bucket = "current" if row["date"] >= today_iso else "past"
-            entry[bucket].append((row["movie_id"], row["title"], row["date"]))
+    version = "1.1"
+    subject_key = "director"
+    evidence_query = (
+        "MATCH (d:Director)<-[:DIRECTED_BY]-(m:Movie)-[:HAS_SCREENING]->"
+        "(s:Screening)-[:HAS_DATE]->(sd:ScreeningDate) "
+        "WHERE s.draft = false "
+        "RETURN d.id AS director_id, d.name AS director_name, "
+        "m.id AS movie_id, m.title AS title, sd.date AS date "
+        "ORDER BY director_name"
+    )
 
-        observations = []
-        for director_id, entry in by_director.items():
-            if not entry["past"] or not entry["current"]:
+    def evaluate(self, facts: ScreeningFacts) -> list[Observation]:
+        links = facts.directors
+        returns = []
+        for director, movies in links.movies_by_entity().items():
+            current = [movie for movie in movies if facts.is_current(movie)]
+            last_past_date = max(facts.last_past[movie] for movie in movies)
+            if not current or last_past_date == NO_DATE:
                 continue
 
-            last_past_date = max(d for _, _, d in entry["past"])
-            first_current_date = min(d for _, _, d in entry["current"])
-            gap_days = (
-                date.fromisoformat(first_current_date)
-                - date.fromisoformat(last_past_date)
-            ).days
+            first_current_date = min(facts.first_current[movie] for movie in current)
+            gap_days = first_current_date - last_past_date
             if gap_days <= DIRECTOR_RETURN_GAP_DAYS:
                 continue
+            returns.append((director, current, gap_days, first_current_date))
+        returns.sort(key=lambda found: (links.names[found[0]], links.ids[found[0]]))
 
-            current_movie_ids = _dedupe_preserve_order(
-                [mid for mid, _, _ in entry["current"]]
-            )
+        observations = []
+        for director, current, gap_days, first_current_date in returns:
+            director_id, director_name = links.ids[director], links.names[director]
+            current_movie_ids = [facts.movie_ids[movie] for movie in current]
             current_titles = _dedupe_preserve_order(
-                [title for _, title, _ in entry["current"]]
+                [facts.titles[movie] for movie in current]
             )
             observations.append(
                 Observation(
                     motif_name=self.name,
                     confidence=0.7,
                     score=0.0,
-                    headline=f"{entry['name']} retorna após {gap_days} dias",
+                    headline=f"{director_name} retorna após {gap_days} dias",
                     summary=(
-                        f"Um filme de {entry['name']} volta a ser exibido "
+                        f"Um filme de {director_name} volta a ser exibido "
                         f"após {gap_days} dias sem sessões registradas."
                     ),
                     evidence=GraphEvidence(
@@ -285,13 +319,13 @@ class DirectorReturnMotif(Motif):
                             (mid, director_id, "DIRECTED_BY")
                             for mid in current_movie_ids
                         ],
-                        query=query,
+                        query=self.evidence_query,
                     ),
                     metadata={
-                        "director": entry["name"],
+                        "director": director_name,
                         "movies": current_titles,
                         "gap_days": gap_days,
-                        "next_screening_date": first_current_date,
+                        "next_screening_date": iso(first_current_date),
                     },
                 )
             )
@@ -307,56 +341,52 @@ class AnniversaryMotif(Motif):
         "Detects currently-screening movies whose age since release "
         f"matches a recognized anniversary year: {sorted(ANNIVERSARY_YEARS)}."
     )
-    version = "1.0"
+    version = "1.1"
+    subject_key = "movie"
+    evidence_query = (
+        "MATCH (m:Movie)-[:HAS_SCREENING]->(s:Screening)-[:HAS_DATE]->"
+        "(sd:ScreeningDate) "
+        "WHERE sd.date >= $today AND s.draft = false "
+        "RETURN m.id AS movie_id, m.title AS title, m.release_year AS "
+        "release_year, sd.date AS date "
+        "ORDER BY m.title, sd.date"
+    )
 
-    def detect(self, graph) -> list[Observation]:
-        today = date.today().isoformat()
-        query = (
-            "MATCH (m:Movie)-[:HAS_SCREENING]->(s:Screening)-[:HAS_DATE]->"
-            "(sd:ScreeningDate) "
-            "WHERE sd.date >= $today AND s.draft = false "
-            "RETURN m.id AS movie_id, m.title AS title, m.release_year AS "
-            "release_year, sd.date AS date "
-            "ORDER BY m.title, sd.date"
+    def evaluate(self, facts: ScreeningFacts) -> list[Observation]:
+        current_year = date.fromordinal(facts.today).year
+        anniversaries = [
+            (movie, current_year - release_year)
+            for movie, release_year in enumerate(facts.release_years)
+            if release_year is not None
+            and facts.is_current(movie)
+            and current_year - release_year in ANNIVERSARY_YEARS
+        ]
+        anniversaries.sort(
+            key=lambda found: (facts.titles[found[0]], facts.movie_ids[found[0]])
         )
-        rows = graph.query(query, {"today": today})
-
-        by_movie: dict[str, dict] = {}
-        for row in rows:
-            entry = by_movie.setdefault(
-                row["movie_id"],
-                {
-                    "title": row["title"],
-                    "release_year": row["release_year"],
-                    "dates": [],
-                },
-            )
-            entry["dates"].append(row["date"])
 
-        current_year = date.today().year
         observations = []
-        for movie_id, entry in by_movie.items():
-            if entry["release_year"] is None:
-                continue
-            years = current_year - entry["release_year"]
-            if years not in ANNIVERSARY_YEARS:
-                continue
-
+        for movie, years in anniversaries:
+            title = facts.titles[movie]
             observations.append(
                 Observation(
                     motif_name=self.name,
                     confidence=1.0,
                     score=0.0,
-                    headline=f"{entry['title']} completa {years} anos em cartaz",
+                    headline=f"{title} completa {years} anos em cartaz",
                     summary=(
-                        f"{entry['title']}, lançado há {years} anos, está "
+                        f"{title}, lançado há {years} anos, está "
                         "de volta aos cinemas."
                     ),
-                    evidence=GraphEvidence(nodes=[movie_id], edges=[], query=query),
+                    evidence=GraphEvidence(
+                        nodes=[facts.movie_ids[movie]],
+                        edges=[],
+                        query=self.evidence_query,
+                    ),
                     metadata={
-                        "movie": entry["title"],
+                        "movie": title,
                         "years": years,
-                        "next_screening_date": min(entry["dates"]),
+                        "next_screening_date": iso(facts.first_current[movie]),
                     },
                 )
             )
@@ -370,3 +400,33 @@ MOTIF_REGISTRY: list[Motif] = [
     DirectorReturnMotif(),
     AnniversaryMotif(),
 ]
+
+# detect_all()'s timing key for reading the facts, next to the motif names
+FACTS_TIMING = "screening_facts"
+
+
+def evaluate_all(facts: ScreeningFacts) -> tuple[list[Observation], dict[str, float]]:
+    """Every motif's observations on `facts`, along with the seconds spent
+    evaluating each motif (by name)."""
+    observations: list[Observation] = []
+    timings: dict[str, float] = {}
+    for motif in MOTIF_REGISTRY:
+        started = time.perf_counter()
+        observations.extend(motif.evaluate(facts))
+        timings[motif.name] = time.perf_counter() - started
+    return observations, timings
+
+
+def detect_all(
+    graph, today: date | None = None
+) -> tuple[list[Observation], dict[str, float]]:
+    """Every motif's observations, from a single read of the screening
+    facts (as of `today`, default the real today), along with the seconds
+    spent reading the facts (FACTS_TIMING) and evaluating each motif (by
+    name)."""
+    started = time.perf_counter()
+    facts = load_screening_facts(graph, today)
+    timings = {FACTS_TIMING: time.perf_counter() - started}
+    observations, motif_timings = evaluate_all(facts)
+    timings.update(motif_timings)
+    return observations, timings
@@ -11,8 +11,8 @@ import time
 from dataclasses import dataclass
 from typing import List, Literal, Optional
 
+import httpx
 import instructor
-import requests
 from atomic_agents import AgentConfig, AtomicAgent, BaseIOSchema
 from atomic_agents.context import ChatHistory, SystemPromptGenerator
 from bs4 import BeautifulSoup
@@ -37,6 +37,7 @@ from flask_backend.service.movie_metadata_pipeline import (
     clear_tmdb_metadata,
 )
 from flask_backend.service.tmdb import TMDBClient
+from flask_backend.utils import http_client
 
 logger = logging.getLogger(__name__)
 
@@ -81,7 +82,7 @@ def _run_search_tmdb_candidates(title: str) -> tuple[str, list[int]]:
     loop can record which ids the agent actually saw (see `inspect_movie`)."""
     try:
         results = TMDBClient().search_movies(title)
-    except requests.RequestException as exc:
+    except httpx.HTTPError as exc:
         return f"Erro ao buscar '{title}' no TMDB: {exc}", []
     if not results:
         return f"Nenhum resultado no TMDB para '{title}'.", []
@@ -98,7 +99,7 @@ def _run_search_tmdb_candidates(title: str) -> tuple[str, list[int]]:
 def _run_get_tmdb_details(tmdb_id: int) -> tuple[str, list[int]]:
     try:
         details = TMDBClient().get_movie_details(tmdb_id)
-    except requests.RequestException as exc:
+    except httpx.HTTPError as exc:
         return f"Erro ao buscar detalhes do TMDB id={tmdb_id}: {exc}", []
     directors = ", ".join(d["name"] for d in details["directors"]) or "desconhecido"
     countries = ", ".join(c["name"] for c in details["countries"]) or "desconhecido"
@@ -117,9 +118,9 @@ def _run_fetch_screening_source(screening_id: int) -> str:
     if not screening.url:
         return f"Sessão #{screening_id} não tem URL de origem cadastrada."
     try:
-        response = requests.get(screening.url, timeout=10)
+        response = http_client.get(screening.url, timeout=10)
         response.raise_for_status()
-    except requests.RequestException as exc:
+    except httpx.HTTPError as exc:
         return f"Erro ao buscar {screening.url}: {exc}"
     text = BeautifulSoup(response.text, "html.parser").get_text(" ", strip=True)
     return f"Conteúdo de {screening.url}:\n{text[:4000]}"
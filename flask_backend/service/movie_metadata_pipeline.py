@@ -5,35 +5,30 @@ Usage (via CLI):
     flask fetch-movie-metadata          # process all movies missing metadata
     flask fetch-movie-metadata --limit 10   # process at most 10
     flask fetch-movie-metadata --dry-run    # only list what would be processed
+    flask fetch-movie-metadata --workers 8  # query TMDB for 8 movies at a time
 """
 
 import logging
-from dataclasses import dataclass
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional
 
 from flask_backend.db import db_session
-from flask_backend.models import Movie
-from flask_backend.repository.collections import (
-    get_or_create_by_tmdb_id as get_or_create_collection,
-)
-from flask_backend.repository.countries import (
-    get_or_create_by_iso_code as get_or_create_country,
-)
-from flask_backend.repository.directors import (
-    get_or_create_by_tmdb_id as get_or_create_director,
-)
-from flask_backend.repository.genres import (
-    get_or_create_by_tmdb_id as get_or_create_genre,
-)
+from flask_backend.models import Collection, Country, Director, Genre, Movie
+from flask_backend.repository import collections, countries, directors, genres
 from flask_backend.repository.movie_metadata_fetch_attempts import (
-    create as create_attempt,
+    create_many as create_attempts,
+    get_attempted_movie_ids,
     get_movies_needing_enrichment,
-    has_attempt,
 )
+from flask_backend.repository.movies import get_by_ids_with_tmdb_relations
 from flask_backend.service.tmdb import TMDBClient
 
 logger = logging.getLogger(__name__)
 
+# Outcomes buffered by the writer before each commit.
+METADATA_BATCH_SIZE = 50
+
 
 @dataclass
 class PipelineResult:
@@ -76,7 +71,66 @@ def clear_tmdb_metadata(movie: Movie) -> None:
     movie.original_language = None
 
 
-def apply_tmdb_details(movie: Movie, tmdb_id: int, details: dict) -> None:
+def _has_collection(details: dict) -> bool:
+    collection_data = details.get("collection")
+    return bool(
+        collection_data
+        and collection_data.get("id") is not None
+        and collection_data.get("name")
+    )
+
+
+@dataclass
+class TmdbEntities:
+    """Director, Genre, Country and Collection rows keyed by TMDB id (ISO
+    code for countries), so applying details needs no query per credit.
+
+    ensure() loads every row a set of details refers to with one query per
+    type and bulk-creates the missing ones. Batch callers call it once per
+    batch rather than preloading the tables once: each batch commit expires
+    the loaded rows, and reloading them with one IN query beats the
+    per-row refresh SQLAlchemy would otherwise run on first use.
+    """
+
+    directors: Dict[int, Director] = field(default_factory=dict)
+    genres: Dict[int, Genre] = field(default_factory=dict)
+    countries: Dict[str, Country] = field(default_factory=dict)
+    collections: Dict[int, Collection] = field(default_factory=dict)
+
+    def ensure(self, details_list: Iterable[dict]) -> None:
+        wanted_directors: Dict[int, str] = {}
+        wanted_genres: Dict[int, str] = {}
+        wanted_countries: Dict[str, str] = {}
+        wanted_collections: Dict[int, str] = {}
+        for details in details_list:
+            for d in details.get("directors", []):
+                wanted_directors.setdefault(d["id"], d["name"])
+            for g in details.get("genres", []):
+                wanted_genres.setdefault(g["id"], g["name"])
+            for c in details.get("countries", []):
+                wanted_countries.setdefault(c["iso_3166_1"], c["name"])
+            if _has_collection(details):
+                collection_data = details["collection"]
+                wanted_collections.setdefault(
+                    collection_data["id"], collection_data["name"]
+                )
+
+        self.directors.update(directors.get_or_create_many_by_tmdb_id(wanted_directors))
+        self.genres.update(genres.get_or_create_many_by_tmdb_id(wanted_genres))
+        self.countries.update(
+            countries.get_or_create_many_by_iso_code(wanted_countries)
+        )
+        self.collections.update(
+            collections.get_or_create_many_by_tmdb_id(wanted_collections)
+        )
+
+
+def apply_tmdb_details(
+    movie: Movie,
+    tmdb_id: int,
+    details: dict,
+    entities: Optional[TmdbEntities] = None,
+) -> None:
     """Replaces a movie's TMDB-derived metadata in-memory with `details`:
     upserts directors, genres, countries and collection, sets
     original_title/release_year/original_language, records the tmdb_id
@@ -86,36 +140,35 @@ def apply_tmdb_details(movie: Movie, tmdb_id: int, details: dict) -> None:
     call whether the movie was previously unlinked or linked to a different
     TMDB entry.
 
+    Batch callers pass `entities` on which ensure() already ran for these
+    details; otherwise the rows are looked up (and created) here.
+
     Does not commit - caller is responsible for db_session.add(movie) +
     db_session.commit().
     """
+    if entities is None:
+        entities = TmdbEntities()
+        entities.ensure([details])
+
     clear_tmdb_metadata(movie)
 
     for d in details.get("directors", []):
-        director = get_or_create_director(d["id"], d["name"])
+        director = entities.directors[d["id"]]
         if director not in movie.directors:
             movie.directors.append(director)
 
     for g in details.get("genres", []):
-        genre = get_or_create_genre(g["id"], g["name"])
+        genre = entities.genres[g["id"]]
         if genre not in movie.genres:
             movie.genres.append(genre)
 
     for c in details.get("countries", []):
-        country = get_or_create_country(c["iso_3166_1"], c["name"])
+        country = entities.countries[c["iso_3166_1"]]
         if country not in movie.countries:
             movie.countries.append(country)
 
-    collection_data = details.get("collection")
-    if (
-        collection_data
-        and collection_data.get("id") is not None
-        and collection_data.get("name")
-    ):
-        collection = get_or_create_collection(
-            collection_data["id"], collection_data["name"]
-        )
-        movie.collection_id = collection.id
+    if _has_collection(details):
+        movie.collection_id = entities.collections[details["collection"]["id"]].id
 
     movie.original_title = details.get("original_title")
     movie.release_year = details.get("release_year")
@@ -124,10 +177,112 @@ def apply_tmdb_details(movie: Movie, tmdb_id: int, details: dict) -> None:
     movie.tmdb_excluded = False
 
 
+@dataclass
+class _MetadataJob:
+    movie_id: int
+    title: str
+
+
+@dataclass
+class _MetadataOutcome:
+    job: _MetadataJob
+    status: str
+    error_message: Optional[str] = None
+    tmdb_id: Optional[int] = None
+    details: Optional[dict] = None
+
+
+def _fetch_metadata(job: _MetadataJob) -> _MetadataOutcome:
+    """Network side of one movie: TMDB search and details. Runs on the
+    worker threads and never touches the database."""
+    try:
+        outcome = _try_tmdb(job.title)
+    except Exception as exc:
+        logger.warning(
+            "Filme %d ('%s') – erro ao consultar TMDB: %s",
+            job.movie_id,
+            job.title,
+            exc,
+        )
+        return _MetadataOutcome(job, "error", error_message=str(exc)[:500])
+
+    if outcome is None:
+        logger.info(
+            "Filme %d ('%s') – não encontrado no TMDB",
+            job.movie_id,
+            job.title,
+        )
+        return _MetadataOutcome(job, "not_found")
+
+    tmdb_id, details = outcome
+    return _MetadataOutcome(job, "success", tmdb_id=tmdb_id, details=details)
+
+
+class _OutcomeWriter:
+    """The only code that writes to the database during a run. Outcomes are
+    buffered and committed every METADATA_BATCH_SIZE: the batch's
+    directors/genres/countries/collections loaded (and the new ones bulk
+    inserted) with a few queries per type, its movies loaded in one query
+    and updated in memory, its attempts inserted in one executemany."""
+
+    def __init__(self, result: PipelineResult, pipeline_run_id: Optional[int]):
+        self.result = result
+        self.pipeline_run_id = pipeline_run_id
+        self.entities = TmdbEntities()
+        self.pending: List[_MetadataOutcome] = []
+
+    def write(self, outcome: _MetadataOutcome) -> None:
+        self.pending.append(outcome)
+        if len(self.pending) >= METADATA_BATCH_SIZE:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self.pending:
+            return
+        found = [outcome for outcome in self.pending if outcome.status == "success"]
+        self.entities.ensure(outcome.details for outcome in found)
+        movies = get_by_ids_with_tmdb_relations(
+            outcome.job.movie_id for outcome in found
+        )
+        for outcome in found:
+            movie = movies[outcome.job.movie_id]
+            apply_tmdb_details(movie, outcome.tmdb_id, outcome.details, self.entities)
+            logger.info(
+                "Filme %d ('%s') – metadados salvos via TMDB",
+                movie.id,
+                movie.title,
+            )
+
+        create_attempts(
+            [
+                {
+                    "movie_id": outcome.job.movie_id,
+                    "source": "tmdb",
+                    "status": outcome.status,
+                    "error_message": outcome.error_message,
+                    "pipeline_run_id": self.pipeline_run_id,
+                }
+                for outcome in self.pending
+            ]
+        )
+        db_session.commit()
+
+        for outcome in self.pending:
+            if outcome.status == "success":
+                self.result.metadata_found += 1
+            elif outcome.status == "not_found":
+                self.result.metadata_not_found += 1
+            else:
+                self.result.errors += 1
+            self.result.processed += 1
+        self.pending = []
+
+
 def run_pipeline(
     limit: Optional[int] = None,
     dry_run: bool = False,
     pipeline_run_id: Optional[int] = None,
+    workers: int = 1,
 ) -> PipelineResult:
     """Main entry point for the movie metadata pipeline.
 
@@ -138,10 +293,15 @@ def run_pipeline(
     3. Record the attempt (success / not_found / error).
     4. If successful, upsert and attach genres/directors to the movie.
 
+    Step 2 runs on `workers` threads (TMDBClient keeps them under TMDB's
+    rate limit); the main thread applies steps 3 and 4 in batches (see
+    _OutcomeWriter).
+
     Args:
         limit: Maximum number of movies to process. None = all.
         dry_run: If True, only report what would be done without making requests.
         pipeline_run_id: If provided, tag created attempts with this run id.
+        workers: Movies looked up concurrently. 1 = one at a time.
 
     Returns:
         A PipelineResult summarising the run.
@@ -152,8 +312,10 @@ def run_pipeline(
     if limit is not None:
         movies = movies[:limit]
 
+    attempted = get_attempted_movie_ids(movie.id for movie in movies)
+    jobs: List[_MetadataJob] = []
     for movie in movies:
-        if has_attempt(movie.id):
+        if movie.id in attempted:
             result.skipped_all_sources_tried += 1
             logger.debug(
                 "Filme %d ('%s'): TMDB já tentado sem sucesso – requer revisão manual",
@@ -171,60 +333,23 @@ def run_pipeline(
             result.processed += 1
             continue
 
-        try:
-            outcome = _try_tmdb(movie.title)
-        except Exception as exc:
-            logger.warning(
-                "Filme %d ('%s') – erro ao consultar TMDB: %s",
-                movie.id,
-                movie.title,
-                exc,
-            )
-            create_attempt(
-                movie_id=movie.id,
-                source="tmdb",
-                status="error",
-                error_message=str(exc)[:500],
-                pipeline_run_id=pipeline_run_id,
-            )
-            result.errors += 1
-            result.processed += 1
-            continue
-
-        if outcome is None:
-            logger.info(
-                "Filme %d ('%s') – não encontrado no TMDB",
-                movie.id,
-                movie.title,
-            )
-            create_attempt(
-                movie_id=movie.id,
-                source="tmdb",
-                status="not_found",
-                pipeline_run_id=pipeline_run_id,
-            )
-            result.metadata_not_found += 1
-            result.processed += 1
-            continue
+        jobs.append(_MetadataJob(movie_id=movie.id, title=movie.title))
 
-        resolved_tmdb_id, details = outcome
-        apply_tmdb_details(movie, resolved_tmdb_id, details)
-        db_session.add(movie)
-        db_session.commit()
+    if not jobs:
+        return result
 
-        logger.info(
-            "Filme %d ('%s') – metadados salvos via TMDB",
-            movie.id,
-            movie.title,
-        )
-        create_attempt(
-            movie_id=movie.id,
-            source="tmdb",
-            status="success",
-            pipeline_run_id=pipeline_run_id,
-        )
-        result.metadata_found += 1
-        result.processed += 1
+    writer = _OutcomeWriter(result, pipeline_run_id)
+    try:
+        if workers <= 1:
+            for job in jobs:
+                writer.write(_fetch_metadata(job))
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(_fetch_metadata, job) for job in jobs]
+                for future in as_completed(futures):
+                    writer.write(future.result())
+    finally:
+        writer.flush()
 
     return result
 
@@ -236,14 +361,15 @@ def get_manual_review_summary() -> list[dict]:
     TMDB fetch attempt (status, error_message).
     """
     from flask_backend.repository.movie_metadata_fetch_attempts import (
-        get_latest_attempt,
+        get_latest_attempts,
         get_movies_needing_manual_review,
     )
 
     movies = get_movies_needing_manual_review()
+    latest = get_latest_attempts(movie.id for movie in movies)
     summary = []
     for movie in movies:
-        attempt = get_latest_attempt(movie.id)
+        attempt = latest.get(movie.id)
         summary.append(
             {
                 "movie_id": movie.id,
@@ -4,26 +4,44 @@ Usage (via CLI):
     flask fetch-posters          # process all screenings missing images
     flask fetch-posters --limit 10   # process at most 10
     flask fetch-posters --dry-run    # only list what would be processed
+    flask fetch-posters --workers 8  # look up 8 screenings at a time
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
+
+import httpx
 
 from flask_backend.db import db_session
 from flask_backend.import_json import ScrappedFeature
-from flask_backend.models import POSTER_SOURCES
+from flask_backend.models import POSTER_SOURCES, Screening
 from flask_backend.repository.poster_fetch_attempts import (
-    create as create_attempt,
-    get_next_source,
+    create_many as create_attempts,
+    get_next_sources,
     get_screenings_without_poster,
 )
-from flask_backend.service.screening import download_image_from_url, save_image
+from flask_backend.service.screening import (
+    download_image_from_url,
+    save_image,
+    unwrap_app,
+)
 from flask_backend.service.tmdb import TMDBClient
+from flask_backend.utils.rate_limit import TokenBucket
 from scrapers.imdb import IMDBScrapper
 
 logger = logging.getLogger(__name__)
 
+# Lookups per second and burst allowed for each source, shared by all the
+# workers of a run. IMDB is scraped, so it gets a polite pace; TMDB needs no
+# entry, as TMDBClient throttles every API call itself.
+SOURCE_RATE_LIMITS = {
+    "imdb": (1.0, 2),
+}
+# Outcomes buffered by the writer before each commit.
+ATTEMPT_BATCH_SIZE = 50
+
 
 @dataclass
 class PipelineResult:
@@ -93,11 +111,158 @@ def _extract_director_from_description(description: str) -> Optional[str]:
     return None
 
 
+@dataclass
+class _PosterJob:
+    """What a worker needs to look up one screening's poster; read from the
+    ORM objects in the main thread, since the session is not shared with
+    the workers."""
+
+    screening_id: int
+    movie_title: str
+    source: str
+    director: Optional[str]
+
+
+@dataclass
+class _PosterOutcome:
+    job: _PosterJob
+    status: str
+    error_message: Optional[str] = None
+    image: Optional[Tuple[str, int, int]] = None
+
+
+def _build_rate_limits() -> Dict[str, TokenBucket]:
+    return {
+        source: TokenBucket(rate, burst)
+        for source, (rate, burst) in SOURCE_RATE_LIMITS.items()
+    }
+
+
+def _fetch_poster(
+    job: _PosterJob, current_app, rate_limits: Dict[str, TokenBucket]
+) -> _PosterOutcome:
+    """Network side of one screening: asks the source for a poster, then
+    downloads and saves it. Runs on the worker threads and never touches
+    the database."""
+    limiter = rate_limits.get(job.source)
+    if limiter is not None:
+        limiter.acquire()
+
+    try:
+        image_url = _SOURCE_HANDLERS[job.source](job.movie_title, director=job.director)
+    except Exception as exc:
+        logger.warning(
+            "Screening %d ('%s') – erro na fonte '%s': %s",
+            job.screening_id,
+            job.movie_title,
+            job.source,
+            exc,
+        )
+        return _PosterOutcome(job, "error", error_message=str(exc)[:500])
+
+    if image_url is None:
+        logger.info(
+            "Screening %d ('%s') – fonte '%s': poster não encontrado",
+            job.screening_id,
+            job.movie_title,
+            job.source,
+        )
+        return _PosterOutcome(job, "not_found")
+
+    try:
+        img_bytes, filename = download_image_from_url(image_url)
+    except httpx.HTTPError:
+        img_bytes = None
+    if img_bytes is None:
+        logger.warning(
+            "Screening %d ('%s') – poster encontrado em '%s' mas download falhou: %s",
+            job.screening_id,
+            job.movie_title,
+            job.source,
+            image_url,
+        )
+        return _PosterOutcome(
+            job, "error", error_message=f"Download falhou: {image_url}"
+        )
+
+    try:
+        image = save_image(img_bytes, current_app, filename)
+    except Exception as exc:
+        logger.warning(
+            "Screening %d ('%s') – poster de '%s' não pôde ser salvo: %s",
+            job.screening_id,
+            job.movie_title,
+            job.source,
+            exc,
+        )
+        return _PosterOutcome(job, "error", error_message=str(exc)[:500])
+    logger.info(
+        "Screening %d ('%s') – poster salvo via '%s': %s",
+        job.screening_id,
+        job.movie_title,
+        job.source,
+        image[0],
+    )
+    return _PosterOutcome(job, "success", image=image)
+
+
+class _OutcomeWriter:
+    """The only code that writes to the database during a run. Outcomes are
+    buffered and committed every ATTEMPT_BATCH_SIZE: the attempts in one
+    executemany, the new posters as updates to the screenings loaded by
+    the main thread."""
+
+    def __init__(
+        self,
+        screenings: Dict[int, Screening],
+        result: PipelineResult,
+        pipeline_run_id: Optional[int],
+    ):
+        self.screenings = screenings
+        self.result = result
+        self.pipeline_run_id = pipeline_run_id
+        self.pending: List[dict] = []
+
+    def write(self, outcome: _PosterOutcome) -> None:
+        job = outcome.job
+        if outcome.status == "success":
+            screening = self.screenings[job.screening_id]
+            screening.image, screening.image_width, screening.image_height = (
+                outcome.image
+            )
+            self.result.posters_found += 1
+        elif outcome.status == "not_found":
+            self.result.posters_not_found += 1
+        else:
+            self.result.errors += 1
+        self.result.processed += 1
+
+        self.pending.append(
+            {
+                "screening_id": job.screening_id,
+                "source": job.source,
+                "status": outcome.status,
+                "error_message": outcome.error_message,
+                "pipeline_run_id": self.pipeline_run_id,
+            }
+        )
+        if len(self.pending) >= ATTEMPT_BATCH_SIZE:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self.pending:
+            return
+        create_attempts(self.pending)
+        db_session.commit()
+        self.pending = []
+
+
 def run_pipeline(
     current_app,
     limit: Optional[int] = None,
     dry_run: bool = False,
     pipeline_run_id: Optional[int] = None,
+    workers: int = 1,
 ) -> PipelineResult:
     """Main entry point for the poster pipeline.
 
@@ -107,10 +272,15 @@ def run_pipeline(
     3. Record the attempt (success / not_found / error).
     4. If successful, download and save the image, updating the screening.
 
+    Steps 2 and 4 (the network) run on `workers` threads, each source
+    throttled by its SOURCE_RATE_LIMITS token bucket; the main thread
+    records the outcomes in batches (see _OutcomeWriter).
+
     Args:
         current_app: The Flask application (needed by save_image).
         limit: Maximum number of screenings to process. None = all.
         dry_run: If True, only report what would be done without making requests.
+        workers: Screenings looked up concurrently. 1 = one at a time.
 
     Returns:
         A PipelineResult summarising the run.
@@ -121,9 +291,11 @@ def run_pipeline(
     if limit is not None:
         screenings = screenings[:limit]
 
+    next_sources = get_next_sources(screening.id for screening in screenings)
+    jobs: List[_PosterJob] = []
     for screening in screenings:
         movie_title = screening.movie.title
-        next_source = get_next_source(screening.id)
+        next_source = next_sources[screening.id]
 
         if next_source is None:
             result.skipped_all_sources_tried += 1
@@ -144,99 +316,39 @@ def run_pipeline(
             result.processed += 1
             continue
 
-        handler = _SOURCE_HANDLERS.get(next_source)
-        if handler is None:
+        if next_source not in _SOURCE_HANDLERS:
             logger.error("Fonte '%s' não possui handler implementado", next_source)
             result.errors += 1
             continue
 
-        director = _extract_director_from_description(screening.description)
-        image_url: Optional[str] = None
-
-        try:
-            image_url = handler(movie_title, director=director)
-        except Exception as exc:
-            logger.warning(
-                "Screening %d ('%s') – erro na fonte '%s': %s",
-                screening.id,
-                movie_title,
-                next_source,
-                exc,
-            )
-            create_attempt(
-                screening_id=screening.id,
-                source=next_source,
-                status="error",
-                error_message=str(exc)[:500],
-                pipeline_run_id=pipeline_run_id,
-            )
-            result.errors += 1
-            result.processed += 1
-            continue
-
-        if image_url is None:
-            logger.info(
-                "Screening %d ('%s') – fonte '%s': poster não encontrado",
-                screening.id,
-                movie_title,
-                next_source,
-            )
-            create_attempt(
+        jobs.append(
+            _PosterJob(
                 screening_id=screening.id,
+                movie_title=movie_title,
                 source=next_source,
-                status="not_found",
-                pipeline_run_id=pipeline_run_id,
+                director=_extract_director_from_description(screening.description),
             )
-            result.posters_not_found += 1
-            result.processed += 1
-            continue
-
-        # Download and save the image
-        img_bytes, filename = download_image_from_url(image_url)
-        if img_bytes is None:
-            logger.warning(
-                "Screening %d ('%s') – poster encontrado em '%s' mas download falhou: %s",
-                screening.id,
-                movie_title,
-                next_source,
-                image_url,
-            )
-            create_attempt(
-                screening_id=screening.id,
-                source=next_source,
-                status="error",
-                error_message=f"Download falhou: {image_url}",
-                pipeline_run_id=pipeline_run_id,
-            )
-            result.errors += 1
-            result.processed += 1
-            continue
-
-        image_filename, image_width, image_height = save_image(
-            img_bytes, current_app, filename
         )
 
-        screening.image = image_filename
-        screening.image_width = image_width
-        screening.image_height = image_height
-        db_session.add(screening)
-        db_session.commit()
-
-        logger.info(
-            "Screening %d ('%s') – poster salvo via '%s': %s",
-            screening.id,
-            movie_title,
-            next_source,
-            image_filename,
-        )
-        create_attempt(
-            screening_id=screening.id,
-            source=next_source,
-            status="success",
-            pipeline_run_id=pipeline_run_id,
-        )
-        result.posters_found += 1
-        result.processed += 1
+    writer = _OutcomeWriter(
+        {screening.id: screening for screening in screenings}, result, pipeline_run_id
+    )
+    rate_limits = _build_rate_limits()
+    app = unwrap_app(current_app)
+    try:
+        if workers <= 1:
+            for job in jobs:
+                writer.write(_fetch_poster(job, app, rate_limits))
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(_fetch_poster, job, app, rate_limits)
+                    for job in jobs
+                ]
+                for future in as_completed(futures):
+                    writer.write(future.result())
+    finally:
+        writer.flush()
 
     return result
 
@@ -248,20 +360,18 @@ def get_manual_review_summary() -> list[dict]:
     sources already attempted.
     """
     from flask_backend.repository.poster_fetch_attempts import (
-        get_attempted_sources,
+        get_attempted_sources_by_screening,
         get_screenings_needing_manual_review,
     )
 
     screenings = get_screenings_needing_manual_review()
-    summary = []
-    for s in screenings:
-        attempted = get_attempted_sources(s.id)
-        summary.append(
-            {
-                "screening_id": s.id,
-                "movie_title": s.movie.title,
-                "sources_attempted": sorted(attempted),
-                "total_sources": len(POSTER_SOURCES),
-            }
-        )
-    return summary
+    attempted = get_attempted_sources_by_screening(s.id for s in screenings)
+    return [
+        {
+            "screening_id": s.id,
+            "movie_title": s.movie.title,
+            "sources_attempted": sorted(attempted[s.id]),
+            "total_sources": len(POSTER_SOURCES),
+        }
+        for s in screenings
+    ]
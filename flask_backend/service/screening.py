@@ -2,44 +2,59 @@ import hashlib
 import logging
 import os
 from collections import OrderedDict, defaultdict
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from datetime import date, datetime, time, timedelta
 from io import BytesIO
 from typing import Dict, List, Optional, Set, Tuple
 
 import filetype
-import requests
+import httpx
 from PIL import Image, UnidentifiedImageError
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+from slugify import slugify
+from sqlalchemy import delete, insert, update
 from werkzeug.utils import secure_filename
 
+from flask_backend.db import db_session
 from flask_backend.env_config import APP_ENVIRONMENT
 from flask_backend.import_json import ScrappedCinema, ScrappedFeature, ScrappedResult
-from flask_backend.models import Screening, ScreeningDate
-from flask_backend.repository.cinemas import get_by_slug as get_cinema_by_slug
-from flask_backend.repository.movies import (
-    get_by_title_or_create as get_movie_by_title_or_create,
+from flask_backend.models import (
+    Cinema,
+    Movie,
+    Screening,
+    ScreeningDate,
+    UpcomingShowtime,
 )
+from flask_backend.repository import schedule_generation, upcoming_schedule
+from flask_backend.repository.cinemas import get_all as get_all_cinemas
+from flask_backend.repository.movies import get_by_slugs as get_movies_by_slugs
 from flask_backend.repository.screenings import (
-    create as create_screening,
-    get_by_movie_id_and_cinema_id as get_screening_by_movie_id_and_cinema_id,
-    get_latest_screening_for_movie,
-    get_screening_dates_for_movies,
-    get_screenings_for_movies_with_dates_in_range,
-    update_screening_dates,
-    update_title_cleaning_info,
+    get_by_movie_and_cinema_ids as get_screenings_by_movie_and_cinema_ids,
+    get_ids_by_movie_and_cinema_ids as get_screening_ids_by_movie_and_cinema_ids,
+    get_latest_screenings_for_movies,
+    merge_title_cleaning_rules,
+)
+from flask_backend.repository.upcoming_schedule import (
+    RefreshScope,
+    get_schedule_for_movies,
 )
 from flask_backend.service.image_processing import resize_for_display
 from flask_backend.service.shared import is_screening_date_upcoming
-from flask_backend.service.title_cleaning import clean_title
+from flask_backend.service.title_cleaning import CleanTitleResult, clean_title
 from flask_backend.service.upload import upload_image_to_api, upload_image_to_local_disk
+from flask_backend.utils import http_client
 from flask_backend.utils.enums.environment import EnvironmentEnum
 
 logger = logging.getLogger(__name__)
 
 ALLOWED_EXTENSIONS = {"png", "jpg", "jpeg", "webp"}
 
+# posters of newly imported screenings are fetched after the import commits,
+# this many at a time; the timeout keeps one slow cinema CDN from holding
+# a worker indefinitely
+POSTER_DOWNLOAD_POOL_SIZE = 8
+POSTER_DOWNLOAD_TIMEOUT_SECONDS = 20
+
 _WEEKDAY_NAMES_PT = [
     "Segunda-feira",
     "Terça-feira",
@@ -103,7 +118,7 @@ def save_image(file, app, filename: Optional[str] = None) -> Tuple[str, int, int
     try:
         return upload_image_to_api(app, resized_file)
     # on failure, save locally
-    except requests.exceptions.HTTPError:
+    except httpx.HTTPStatusError:
         resized_file.seek(0)
         return upload_image_to_local_disk(resized_file, app, webp_filename)
 
@@ -161,8 +176,7 @@ def get_soonest_date_in_range(
 
 
 def build_reels_feed(
-    screenings: List[Screening],
-    movie_dates: List[ScreeningDate],
+    showtimes: List[UpcomingShowtime],
     today: date,
     window_end: date,
     user_logged_in: bool,
@@ -171,64 +185,60 @@ def build_reels_feed(
 ) -> List[dict]:
     """Builds the mobile reels feed: one card per non-draft screening (all
     screenings if user_logged_in), sorted by each screening's soonest
-    future ScreeningDate within [today, window_end]. `movie_dates` is the
-    flat, cross-cinema list of ScreeningDate rows for every movie present in
-    `screenings` within the same window - grouped here per movie for each
-    card's "next dates" list. `wanted_movie_ids` marks cards for the
-    current anonymous visitor's want-to-watch picks."""
+    future showtime within [today, window_end]. `showtimes` is the flat,
+    cross-cinema list of upcoming_schedule rows for the window - grouped
+    here per screening for each card and per movie for each card's "next
+    dates" list. `wanted_movie_ids` marks cards for the current anonymous
+    visitor's want-to-watch picks."""
     if earliest_datetime is None:
         earliest_datetime = datetime.combine(today, time.min)
     if wanted_movie_ids is None:
         wanted_movie_ids = set()
 
-    dates_by_movie: Dict[int, List[ScreeningDate]] = defaultdict(list)
-    for screening_date in movie_dates:
-        if is_screening_date_upcoming(screening_date, earliest_datetime):
-            dates_by_movie[screening_date.screening.movie_id].append(screening_date)
-
-    cards = []
-    for screening in screenings:
-        if screening.draft and not user_logged_in:
+    by_screening: Dict[int, List[UpcomingShowtime]] = defaultdict(list)
+    by_movie: Dict[int, List[UpcomingShowtime]] = defaultdict(list)
+    for showtime in showtimes:
+        if showtime.draft and not user_logged_in:
             continue
-        future_dates = [
-            d
-            for d in screening.dates
-            if today <= d.date <= window_end
-            and is_screening_date_upcoming(d, earliest_datetime)
-        ]
-        if not future_dates:
+        if not today <= showtime.date <= window_end:
             continue
-        soonest = min(future_dates, key=lambda d: (d.date, d.time or ""))
+        if not is_screening_date_upcoming(showtime, earliest_datetime):
+            continue
+        by_screening[showtime.screening_id].append(showtime)
+        by_movie[showtime.movie_id].append(showtime)
+
+    cards = []
+    for screening_showtimes in by_screening.values():
+        soonest = min(screening_showtimes, key=lambda s: (s.date, s.time or ""))
         next_dates = sorted(
-            dates_by_movie.get(screening.movie_id, []),
-            key=lambda d: (d.date, d.time or ""),
+            by_movie[soonest.movie_id], key=lambda s: (s.date, s.time or "")
         )
         cards.append(
             {
-                "screening_id": screening.id,
-                "movie_id": screening.movie_id,
-                "movie_title": screening.movie.title,
-                "directors": [director.name for director in screening.movie.directors],
-                "release_year": screening.movie.release_year,
-                "description": screening.description,
-                "image": screening.image,
-                "image_alt": screening.image_alt,
-                "cinema_name": screening.cinema.short_name,
-                "cinema_color": screening.cinema.color,
-                "cinema_slug": screening.cinema.slug,
+                "screening_id": soonest.screening_id,
+                "movie_id": soonest.movie_id,
+                "movie_title": soonest.movie_title,
+                "directors": soonest.director_names,
+                "release_year": soonest.release_year,
+                "description": soonest.description,
+                "image": soonest.image,
+                "image_alt": soonest.image_alt,
+                "cinema_name": soonest.cinema_short_name,
+                "cinema_color": soonest.cinema_color,
+                "cinema_slug": soonest.cinema_slug,
                 "soonest_date": soonest.date,
                 "soonest_time": soonest.time,
                 "next_dates": [
                     {
-                        "date": screening_date.date,
-                        "time": screening_date.time,
-                        "cinema_name": screening_date.screening.cinema.short_name,
+                        "date": showtime.date,
+                        "time": showtime.time,
+                        "cinema_name": showtime.cinema_short_name,
                     }
-                    for screening_date in next_dates
+                    for showtime in next_dates
                 ],
-                "draft": screening.draft,
-                "screening_url": screening.url,
-                "wanted": screening.movie_id in wanted_movie_ids,
+                "draft": soonest.draft,
+                "screening_url": soonest.screening_url,
+                "wanted": soonest.movie_id in wanted_movie_ids,
             }
         )
 
@@ -266,15 +276,11 @@ def build_favorites_feed(
     if now is None:
         now = datetime.now()
 
-    screenings = get_screenings_for_movies_with_dates_in_range(
-        movie_ids, today, _FAR_FUTURE_DATE
-    )
-    movie_dates = get_screening_dates_for_movies(
+    showtimes = get_schedule_for_movies(
         movie_ids, today, _FAR_FUTURE_DATE, include_drafts=user_logged_in
     )
     cards = build_reels_feed(
-        screenings,
-        movie_dates,
+        showtimes,
         today,
         _FAR_FUTURE_DATE,
         user_logged_in,
@@ -285,15 +291,17 @@ def build_favorites_feed(
         card["no_sessions"] = False
 
     covered_movie_ids = {card["movie_id"] for card in cards}
-    for movie_id in movie_ids:
-        if movie_id in covered_movie_ids:
-            continue
-        stale_screening = get_latest_screening_for_movie(
-            movie_id, include_drafts=user_logged_in
-        )
+    stale_movie_ids = [
+        movie_id for movie_id in movie_ids if movie_id not in covered_movie_ids
+    ]
+    stale_screenings = get_latest_screenings_for_movies(
+        stale_movie_ids, include_drafts=user_logged_in
+    )
+    for movie_id in stale_movie_ids:
+        stale_screening = stale_screenings.get(movie_id)
         if stale_screening is None:
             continue
-        # defensive: get_latest_screening_for_movie already excludes drafts
+        # defensive: get_latest_screenings_for_movies already excludes drafts
         # when include_drafts is False, so this should be unreachable here.
         if stale_screening.draft and not user_logged_in:
             continue
@@ -334,14 +342,8 @@ def download_image_from_url(image_url) -> Tuple[Optional[BytesIO], Optional[str]
         hashlib.md5(image_url.encode("utf-8")).hexdigest() + "." + file_extension
     )
 
-    session = requests.Session()
-    retry = Retry(connect=3, backoff_factor=0.5)
-    adapter = HTTPAdapter(max_retries=retry)
-    session.mount("http://", adapter)
-    session.mount("https://", adapter)
-
-    r = session.get(image_url)
-    if r.ok is False:
+    r = http_client.get(image_url, timeout=POSTER_DOWNLOAD_TIMEOUT_SECONDS)
+    if not r.is_success:
         return None, None
 
     image_bytes = BytesIO(r.content)
@@ -384,15 +386,43 @@ class ImportSummary:
     dates_registered: int
 
 
-def import_scrapped_results(
-    scrapped_results: ScrappedResult, current_app, pipeline_run_id: Optional[int] = None
-) -> ImportSummary:
-    movies_created = 0
-    screenings_created = 0
-    screenings_with_new_dates: Set[int] = set()
+@dataclass
+class _ImportedFeature:
+    """One scraped feature, parsed and cleaned ahead of the database work."""
+
+    cinema: Cinema
+    feature: ScrappedFeature
+    title_cleaning: CleanTitleResult
+    slug: str
+    description: str
+    dates: List[ScreeningDate]
+    had_scraped_time: bool
+
+
+def _build_description(scrapped_feature: ScrappedFeature) -> str:
+    description: str = ""
+    if scrapped_feature.original_title:
+        description += f"\n{scrapped_feature.original_title.strip()}"
+    if scrapped_feature.price:
+        description += f"\n{scrapped_feature.price}"
+    if scrapped_feature.director:
+        description += f"\n{scrapped_feature.director}"
+    if scrapped_feature.classification:
+        description += f"\n{scrapped_feature.classification}"
+    if scrapped_feature.general_info:
+        description += f"\n{scrapped_feature.general_info}"
+    if scrapped_feature.excerpt:
+        description += f"\n{scrapped_feature.excerpt}"
+    return description.strip()
+
+
+def _parse_features(
+    scrapped_results: ScrappedResult, cinemas_by_slug: Dict[str, Cinema]
+) -> List[_ImportedFeature]:
+    parsed = []
     scrapped_cinema: ScrappedCinema
     for scrapped_cinema in scrapped_results.cinemas:
-        cinema = get_cinema_by_slug(scrapped_cinema.slug)
+        cinema = cinemas_by_slug[scrapped_cinema.slug]
         scrapped_feature: ScrappedFeature
         for scrapped_feature in scrapped_cinema.features:
             title_cleaning_result = clean_title(scrapped_feature.title)
@@ -403,137 +433,367 @@ def import_scrapped_results(
                     title_cleaning_result.cleaned_title,
                     ", ".join(title_cleaning_result.matched_rules),
                 )
-            movie, movie_created = get_movie_by_title_or_create(
-                title_cleaning_result.cleaned_title, pipeline_run_id=pipeline_run_id
-            )
-            if movie_created:
-                movies_created += 1
-
-            description: str = ""
             had_scraped_time = bool(scrapped_feature.time)
-            screenings_dates = None
-            if scrapped_feature.time:
+            if had_scraped_time:
                 screenings_dates = build_dates(scrapped_feature.time)
-            if scrapped_feature.original_title:
-                description += f"\n{scrapped_feature.original_title.strip()}"
-            if scrapped_feature.price:
-                description += f"\n{scrapped_feature.price}"
-            if scrapped_feature.director:
-                description += f"\n{scrapped_feature.director}"
-            if scrapped_feature.classification:
-                description += f"\n{scrapped_feature.classification}"
-            if scrapped_feature.general_info:
-                description += f"\n{scrapped_feature.general_info}"
-            if scrapped_feature.excerpt:
-                description += f"\n{scrapped_feature.excerpt}"
-
-            description = description.strip()
-
-            if screenings_dates is None:
+            else:
                 screenings_dates = build_dates(
                     [datetime.now().strftime("%Y-%m-%dT%H:%M")]
                 )
-            screening = get_screening_by_movie_id_and_cinema_id(movie.id, cinema.id)
-
-            if not screening:
-                # only attempt to download the poster if the screening doesn't previously exists
-                img, image_filename, image_width, image_height = None, None, None, None
-                if scrapped_feature.poster:
-                    img, filename = download_image_from_url(scrapped_feature.poster)
-
-                if img is not None:
-                    # if we fail to download or validate the image, just ignore it for now
-                    image_filename, image_width, image_height = save_image(
-                        img, current_app, filename
-                    )
-
-                create_screening(
-                    movie_id=movie.id,
-                    description=description,
-                    cinema_id=cinema.id,
-                    screening_dates=screenings_dates,
-                    image=image_filename,
-                    image_width=image_width,
-                    image_height=image_height,
-                    is_draft=False,
-                    image_alt=None,
-                    url_origin=scrapped_feature.read_more,
-                    raw_title=title_cleaning_result.raw_title,
-                    title_cleaning_rules=",".join(title_cleaning_result.matched_rules)
-                    or None,
-                    pipeline_run_id=pipeline_run_id,
+            parsed.append(
+                _ImportedFeature(
+                    cinema=cinema,
+                    feature=scrapped_feature,
+                    title_cleaning=title_cleaning_result,
+                    slug=slugify(title_cleaning_result.cleaned_title),
+                    description=_build_description(scrapped_feature),
+                    dates=screenings_dates,
+                    had_scraped_time=had_scraped_time,
                 )
-                screenings_created += 1
-            else:
-                update_title_cleaning_info(
-                    screening,
-                    title_cleaning_result.raw_title,
-                    title_cleaning_result.matched_rules,
+            )
+    return parsed
+
+
+# A screening's date as the import tracks it: (date, time, row), where row
+# is the persisted ScreeningDate or None for one this run will insert.
+_DateEntry = Tuple[date, str, Optional[ScreeningDate]]
+
+
+@dataclass
+class _ImportedScreening:
+    """A screening the import touches: an existing one (`screening` set) or
+    one it will insert (`values` set), and its dates as of this run."""
+
+    dates: List[_DateEntry]
+    screening: Optional[Screening] = None
+    values: Optional[dict] = None
+    removed_dates: List[ScreeningDate] = field(default_factory=list)
+    # scraped poster of a screening this run creates, fetched after commit
+    poster_url: Optional[str] = None
+
+
+def _merge_screening_dates(
+    target: _ImportedScreening,
+    received: List[ScreeningDate],
+    replace_received_days: bool,
+) -> None:
+    """Diffs the received dates against the screening's current ones in
+    memory: adds the (date, time) pairs it doesn't have yet and, when
+    replace_received_days is set, drops its dates on the received days that
+    this run no longer lists. Persisted rows that stay keep their ids.
+
+    capitolio may occasionally change screening times for a given movie, so
+    records for any day included in the current run could become obsolete -
+    for that cinema we trust the new times for every received day (see
+    issue #163)."""
+    received_pairs = {(sd.date, sd.time) for sd in received}
+    received_days = {sd.date for sd in received}
+    kept_pairs: Set[Tuple[date, str]] = set()
+    kept: List[_DateEntry] = []
+    for entry in target.dates:
+        day, time_, row = entry
+        pair = (day, time_)
+        obsolete = replace_received_days and day in received_days
+        if obsolete and (pair not in received_pairs or pair in kept_pairs):
+            if row is not None:
+                target.removed_dates.append(row)
+            continue
+        kept.append(entry)
+        kept_pairs.add(pair)
+    for new_date in received:
+        pair = (new_date.date, new_date.time)
+        if pair not in kept_pairs:
+            kept.append((new_date.date, new_date.time, None))
+            kept_pairs.add(pair)
+    target.dates = kept
+
+
+def unwrap_app(app):
+    """The app object behind a `current_app` proxy (an app is returned as
+    is). Worker threads have no app context to resolve the proxy in, so
+    code handing the app to a pool hands them this."""
+    return getattr(app, "_get_current_object", lambda: app)()
+
+
+def _download_poster(
+    poster_url: str, current_app
+) -> Tuple[Optional[str], Optional[int], Optional[int]]:
+    img, filename = download_image_from_url(poster_url)
+    if img is None:
+        # if we fail to download or validate the image, just ignore it for now
+        return None, None, None
+    return save_image(img, current_app, filename)
+
+
+def _attach_posters(posters: Dict[int, str], current_app) -> None:
+    """Downloads the scraped posters of newly imported screenings (screening
+    id -> poster URL), POSTER_DOWNLOAD_POOL_SIZE at a time, and stores the
+    ones that succeed in a single write. Runs after the import has
+    committed, so slow or failing image hosts never hold the import's
+    transaction open or fail it - a screening left without a poster is
+    picked up later by `flask fetch-posters`.
+
+    Screenings sharing a poster URL download it once."""
+    screening_ids_by_url: Dict[str, List[int]] = defaultdict(list)
+    for screening_id, poster_url in posters.items():
+        screening_ids_by_url[poster_url].append(screening_id)
+    if not screening_ids_by_url:
+        return
+
+    app = unwrap_app(current_app)
+    values = []
+    pool_size = min(POSTER_DOWNLOAD_POOL_SIZE, len(screening_ids_by_url))
+    with ThreadPoolExecutor(max_workers=pool_size) as executor:
+        futures = {
+            executor.submit(_download_poster, poster_url, app): poster_url
+            for poster_url in screening_ids_by_url
+        }
+        for future in as_completed(futures):
+            poster_url = futures[future]
+            try:
+                image, image_width, image_height = future.result()
+            except Exception as exc:
+                logger.warning(
+                    "Falha ao baixar o poster %s na importação: %s", poster_url, exc
                 )
-                # captured before any of the filtering below mutates what
-                # "existing" means, so it reflects what was truly on file
-                # before this run - see issue #249
-                original_date_time_pairs = {
-                    (sd.date, sd.time) for sd in screening.dates
+                continue
+            if image is None:
+                continue
+            values.extend(
+                {
+                    "id": screening_id,
+                    "image": image,
+                    "image_width": image_width,
+                    "image_height": image_height,
                 }
-                if cinema.slug == "capitolio":
-                    # capitolio may occasionally change
-                    # screening times for a given movie
-                    # so records for any given day could become obsolete
-                    # our strategy is, for every day included in the current run,
-                    # we delete existing records and trust the new ones
-                    # see issue #163
-
-                    # ex. existing_dates_for_screening = [ 12/12/2025, 13/12/2025, 14/12/2025 ]
-                    existing_dates_for_screening = list(screening.dates)
-
-                    # ex. [13/12/2025, 14/12/2025]
-                    received_dates_for_screening = [sd.date for sd in screenings_dates]
-
-                    # we skip screening_dates for dates in the
-                    # `received_dates_for_screening` list, so they can be recreated
-                    # ex. existing_dates = [ 12/12/2025 ]
-                    existing_dates = build_dates(
-                        [
-                            f"{sd.date}T{sd.time}"
-                            for sd in existing_dates_for_screening
-                            if sd.date not in received_dates_for_screening
-                        ]
-                    )
-                else:
-                    # create new ScreeningDate objects from existing ones
-                    # to prevent reference errors
-                    existing_dates = build_dates(
-                        [f"{sd.date}T{sd.time}" for sd in screening.dates]
-                    )
-                # append new dates to the list by checking if there is no
-                # other date with an equal date and time fields
-                for new_date in screenings_dates:
-                    already_registered = False
-                    for existing_date in existing_dates:
-                        same_date = existing_date.date == new_date.date
-                        same_time = existing_date.time == new_date.time
-                        if same_date and same_time:
-                            already_registered = True
-                            break
-                    if not already_registered:
-                        existing_dates.append(new_date)
-
-                # computed before update_screening_dates()'s commit expires
-                # these ORM objects, to avoid a reload query per attribute
-                # access below. had_scraped_time guards against the
-                # datetime.now() fallback (used when nothing was scraped)
-                # always counting as "new" on every run.
-                got_new_date = had_scraped_time and any(
-                    (nd.date, nd.time) not in original_date_time_pairs
-                    for nd in screenings_dates
-                )
-                if got_new_date:
-                    screenings_with_new_dates.add(screening.id)
+                for screening_id in screening_ids_by_url[poster_url]
+            )
+
+    if not values:
+        return
+    # same bulk path as the import itself: no flush listeners, so the read
+    # model and the cache generation are updated by hand
+    db_session.execute(update(Screening), values)
+    schedule_generation.bump()
+    upcoming_schedule.refresh(
+        RefreshScope(screening_ids={value["id"] for value in values})
+    )
+    db_session.commit()
+
+
+def _insert_new_movies(
+    features: List[_ImportedFeature], pipeline_run_id: Optional[int]
+) -> Tuple[Dict[str, Movie], int]:
+    """The movies of the features by slug, inserting the missing ones, and
+    how many were inserted."""
+    movies_by_slug = get_movies_by_slugs(feature.slug for feature in features)
+    new_movies: Dict[str, dict] = {}
+    for feature in features:
+        if feature.slug not in movies_by_slug and feature.slug not in new_movies:
+            new_movies[feature.slug] = {
+                "title": feature.title_cleaning.cleaned_title,
+                "slug": feature.slug,
+                "created_at": datetime.now(),
+                "pipeline_run_id": pipeline_run_id,
+            }
+    if new_movies:
+        db_session.execute(insert(Movie), list(new_movies.values()))
+        movies_by_slug.update(get_movies_by_slugs(new_movies))
+    return movies_by_slug, len(new_movies)
+
+
+def _existing_screening(existing: Screening) -> _ImportedScreening:
+    return _ImportedScreening(
+        dates=[(sd.date, sd.time, sd) for sd in existing.dates],
+        screening=existing,
+        values={
+            "id": existing.id,
+            "raw_title": existing.raw_title,
+            "title_cleaning_rules": existing.title_cleaning_rules,
+        },
+    )
+
 
-                update_screening_dates(screening, existing_dates)
+def _new_screening(
+    pair: Tuple[int, int], feature: _ImportedFeature, pipeline_run_id: Optional[int]
+) -> _ImportedScreening:
+    matched_rules = ",".join(feature.title_cleaning.matched_rules)
+    return _ImportedScreening(
+        # kept as received, duplicates included, like a screening created by
+        # hand
+        dates=[(sd.date, sd.time, None) for sd in feature.dates],
+        values={
+            "movie_id": pair[0],
+            "cinema_id": pair[1],
+            "image": None,
+            "image_alt": None,
+            "image_width": None,
+            "image_height": None,
+            "description": feature.description,
+            "draft": False,
+            "url": feature.feature.read_more,
+            "raw_title": feature.title_cleaning.raw_title,
+            "title_cleaning_rules": matched_rules or None,
+            "pipeline_run_id": pipeline_run_id,
+            "created_at": datetime.now(),
+        },
+        # only attempt to download the poster if the screening doesn't
+        # previously exist
+        poster_url=feature.feature.poster or None,
+    )
+
+
+def _merge_feature(target: _ImportedScreening, feature: _ImportedFeature) -> bool:
+    """Merges another feature into a screening the import already holds;
+    True when it brings a scraped (date, time) the screening didn't have."""
+    target.values["raw_title"] = feature.title_cleaning.raw_title
+    target.values["title_cleaning_rules"] = merge_title_cleaning_rules(
+        target.values["title_cleaning_rules"],
+        ",".join(feature.title_cleaning.matched_rules),
+    )
+    # captured before the merge below, so it reflects what was on file
+    # before this feature - see issue #249. had_scraped_time guards against
+    # the datetime.now() fallback (used when nothing was scraped) always
+    # counting as "new" on every run.
+    original_date_time_pairs = {(day, time_) for day, time_, _row in target.dates}
+    has_new_dates = feature.had_scraped_time and any(
+        (nd.date, nd.time) not in original_date_time_pairs for nd in feature.dates
+    )
+    _merge_screening_dates(
+        target,
+        feature.dates,
+        replace_received_days=feature.cinema.slug == "capitolio",
+    )
+    return has_new_dates
+
+
+def _resolve_screenings(
+    features: List[_ImportedFeature],
+    movies_by_slug: Dict[str, Movie],
+    pipeline_run_id: Optional[int],
+) -> Tuple[Dict[Tuple[int, int], _ImportedScreening], Set[Tuple[int, int]]]:
+    """The screenings the features touch by (movie id, cinema id), with
+    their dates merged in memory, and the pairs that got new dates."""
+    screenings_by_pair = get_screenings_by_movie_and_cinema_ids(
+        (movie.id for movie in movies_by_slug.values()),
+        (feature.cinema.id for feature in features),
+    )
+    imported: Dict[Tuple[int, int], _ImportedScreening] = {}
+    screenings_with_new_dates: Set[Tuple[int, int]] = set()
+    for feature in features:
+        pair = (movies_by_slug[feature.slug].id, feature.cinema.id)
+        target = imported.get(pair)
+        if target is None and pair not in screenings_by_pair:
+            imported[pair] = _new_screening(pair, feature, pipeline_run_id)
+            continue
+        if target is None:
+            target = imported[pair] = _existing_screening(screenings_by_pair[pair])
+        if _merge_feature(target, feature):
+            screenings_with_new_dates.add(pair)
+    return imported, screenings_with_new_dates
+
+
+def import_scrapped_results(
+    scrapped_results: ScrappedResult, current_app, pipeline_run_id: Optional[int] = None
+) -> ImportSummary:
+    """Imports a scraper JSON in one transaction. Cinemas, movies (by slug)
+    and the affected screenings with their dates are loaded in a handful of
+    IN queries, dates are diffed in memory, and the writes go out as one
+    executemany per table. Those bulk statements skip the session's flush
+    listeners, so upcoming_schedule and schedule_generation are brought up
+    to date explicitly before the single commit. Posters of the screenings
+    it creates are downloaded afterwards, in parallel (see
+    _attach_posters)."""
+    cinemas_by_slug = {cinema.slug: cinema for cinema in get_all_cinemas()}
+    features = _parse_features(scrapped_results, cinemas_by_slug)
+    movies_by_slug, movies_created = _insert_new_movies(features, pipeline_run_id)
+    imported, screenings_with_new_dates = _resolve_screenings(
+        features, movies_by_slug, pipeline_run_id
+    )
+
+    _write_imported_screenings(imported)
+    db_session.commit()
+    _attach_posters(
+        {
+            target.values["id"]: target.poster_url
+            for target in imported.values()
+            if target.poster_url
+        },
+        current_app,
+    )
     return ImportSummary(
         movies_created=movies_created,
-        screenings_created=screenings_created,
+        screenings_created=sum(
+            1 for target in imported.values() if target.screening is None
+        ),
         dates_registered=len(screenings_with_new_dates),
     )
+
+
+def _update_existing_screenings(existing: List[_ImportedScreening]) -> None:
+    if existing:
+        # ORM bulk UPDATE by primary key - one executemany
+        db_session.execute(update(Screening), [target.values for target in existing])
+    removed_ids = [row.id for target in existing for row in target.removed_dates]
+    if removed_ids:
+        db_session.execute(
+            delete(ScreeningDate).where(ScreeningDate.id.in_(removed_ids))
+        )
+
+
+def _insert_created_screenings(created: List[_ImportedScreening]) -> None:
+    """Inserts the new screenings and sets their ids on `created`."""
+    if not created:
+        return
+    db_session.execute(insert(Screening), [target.values for target in created])
+    created_ids = get_screening_ids_by_movie_and_cinema_ids(
+        {target.values["movie_id"] for target in created},
+        {target.values["cinema_id"] for target in created},
+    )
+    for target in created:
+        target.values["id"] = created_ids[
+            (target.values["movie_id"], target.values["cinema_id"])
+        ]
+
+
+def _insert_new_dates(imported: List[_ImportedScreening]) -> None:
+    new_dates = [
+        {"screening_id": target.values["id"], "date": day, "time": time_}
+        for target in imported
+        for day, time_, row in target.dates
+        if row is None
+    ]
+    if new_dates:
+        db_session.execute(insert(ScreeningDate), new_dates)
+
+
+def _is_touched(target: _ImportedScreening) -> bool:
+    return (
+        target.screening is None
+        or bool(target.removed_dates)
+        or any(row is None for _day, _time, row in target.dates)
+    )
+
+
+def _write_imported_screenings(
+    imported: Dict[Tuple[int, int], _ImportedScreening],
+) -> None:
+    _update_existing_screenings(
+        [target for target in imported.values() if target.screening]
+    )
+    _insert_created_screenings(
+        [target for target in imported.values() if not target.screening]
+    )
+    _insert_new_dates(list(imported.values()))
+
+    if imported:
+        schedule_generation.bump()
+        upcoming_schedule.refresh(
+            RefreshScope(
+                screening_ids={
+                    target.values["id"]
+                    for target in imported.values()
+                    if _is_touched(target)
+                }
+            )
+        )
@@ -1,5 +1,11 @@
 """Client for The Movie Database (TMDB) API.
 
+Every API call of a process waits on one token bucket, so concurrent
+callers together stay under TMDB_REQUESTS_PER_SECOND. Searches and movie
+details are served from the persistent cache in
+tmdb_cache.py when a live entry exists; TMDBClient(use_cache=False)
+skips the lookup (and refreshes the entry with the fresh answer).
+
 Docs:
     - https://developer.themoviedb.org/reference/search-movie
     - https://developer.themoviedb.org/reference/movie-details
@@ -9,9 +15,12 @@ Docs:
 import logging
 from typing import Optional
 
-import requests
+import httpx
 
-from flask_backend.env_config import TMDB_API_TOKEN
+from flask_backend.env_config import TMDB_API_TOKEN, TMDB_REQUESTS_PER_SECOND
+from flask_backend.service import tmdb_cache
+from flask_backend.utils import http_client
+from flask_backend.utils.rate_limit import TokenBucket
 
 logger = logging.getLogger(__name__)
 
@@ -21,11 +30,13 @@ TMDB_API_BASE_URL = "https://api.themoviedb.org/3"
 # Available poster sizes: w92, w154, w185, w342, w500, w780, original
 DEFAULT_POSTER_SIZE = "w500"
 
+_request_bucket = TokenBucket(TMDB_REQUESTS_PER_SECOND, TMDB_REQUESTS_PER_SECOND)
+
 
 class TMDBClient:
     """Searches TMDB for movie posters using the public API."""
 
-    def __init__(self, api_token: Optional[str] = None):
+    def __init__(self, api_token: Optional[str] = None, use_cache: bool = True):
         token = api_token or TMDB_API_TOKEN
         if token is None:
             raise ValueError(
@@ -36,30 +47,52 @@ class TMDBClient:
             "Authorization": f"Bearer {token}",
             "accept": "application/json",
         }
-
-    def search_movie(self, title: str, language: str = "pt-BR") -> Optional[dict]:
-        """Search TMDB for a movie by title and return the best match.
-
-        Tries pt-BR first; if no results are found, retries with en-US.
-
-        Returns the first result dict or None if nothing is found.
-        """
-        for lang in [language, "en-US"]:
+        self.use_cache = use_cache
+
+    def _cached(self, endpoint: str, query: str, language: str, fetch):
+        """Returns the cached answer for (endpoint, query, language), or calls
+        fetch() and caches what it returns."""
+        cache = tmdb_cache.get_cache()
+        if cache is None:
+            return fetch()
+        if self.use_cache:
+            hit, value = cache.get(endpoint, query, language)
+            if hit:
+                return value
+        value = fetch()
+        cache.set(endpoint, query, language, value)
+        return value
+
+    def _search(self, title: str, language: str) -> list[dict]:
+        """Raw results of one /search/movie call."""
+
+        def fetch():
             url = f"{TMDB_API_BASE_URL}/search/movie"
-            params = {"query": title, "language": lang}
+            params = {"query": title, "language": language}
+            _request_bucket.acquire()
             try:
-                response = requests.get(
+                response = http_client.get(
                     url, headers=self.headers, params=params, timeout=10
                 )
                 response.raise_for_status()
-            except requests.RequestException as exc:
+            except httpx.HTTPError as exc:
                 logger.warning(
-                    "TMDB search failed for '%s' (lang=%s): %s", title, lang, exc
+                    "TMDB search failed for '%s' (lang=%s): %s", title, language, exc
                 )
                 raise
+            return response.json().get("results", [])
+
+        return self._cached("search/movie", title, language, fetch)
+
+    def search_movie(self, title: str, language: str = "pt-BR") -> Optional[dict]:
+        """Search TMDB for a movie by title and return the best match.
 
-            data = response.json()
-            results = data.get("results", [])
+        Tries pt-BR first; if no results are found, retries with en-US.
+
+        Returns the first result dict or None if nothing is found.
+        """
+        for lang in [language, "en-US"]:
+            results = self._search(title, lang)
             if results:
                 return results[0]
 
@@ -74,20 +107,7 @@ class TMDBClient:
         result list instead of just the first match.
         """
         for lang in [language, "en-US"]:
-            url = f"{TMDB_API_BASE_URL}/search/movie"
-            params = {"query": title, "language": lang}
-            try:
-                response = requests.get(
-                    url, headers=self.headers, params=params, timeout=10
-                )
-                response.raise_for_status()
-            except requests.RequestException as exc:
-                logger.warning(
-                    "TMDB search failed for '%s' (lang=%s): %s", title, lang, exc
-                )
-                raise
-
-            results = response.json().get("results", [])
+            results = self._search(title, lang)
             if results:
                 return results[:limit]
 
@@ -135,16 +155,25 @@ class TMDBClient:
               grouping, already included in the base response with no
               extra append_to_response needed
 
-        Raises requests.RequestException on network / API errors.
+        Raises httpx.HTTPError on network / API errors.
         """
+        return self._cached(
+            "movie",
+            str(tmdb_id),
+            language,
+            lambda: self._fetch_movie_details(tmdb_id, language),
+        )
+
+    def _fetch_movie_details(self, tmdb_id: int, language: str) -> dict:
         url = f"{TMDB_API_BASE_URL}/movie/{tmdb_id}"
         params = {"language": language, "append_to_response": "credits"}
+        _request_bucket.acquire()
         try:
-            response = requests.get(
+            response = http_client.get(
                 url, headers=self.headers, params=params, timeout=10
             )
             response.raise_for_status()
-        except requests.RequestException as exc:
+        except httpx.HTTPError as exc:
             logger.warning("TMDB details failed for id=%s: %s", tmdb_id, exc)
             raise
 
@@ -0,0 +1,132 @@
+"""Persistent cache of TMDB API answers, shared by every TMDBClient.
+
+The same titles are searched over and over - by fetch-posters, by
+fetch-movie-metadata, by the TMDB id backfill and by the movie inspector's
+tools - so answers are kept in a SQLite file of their own (TMDB_CACHE_PATH)
+and reused across cron runs. It lives apart from the main database: the
+poster pipeline's worker threads read and write it without contending with
+the pipeline's single database writer.
+
+Entries are keyed on (endpoint, query, language) and hold the JSON the
+client kept from the answer. Answers expire after TMDB_CACHE_TTL_SECONDS;
+empty ones (a title TMDB doesn't know) are cached too, for the shorter
+TMDB_CACHE_NEGATIVE_TTL_SECONDS, since TMDB may add the movie later.
+
+Hits and misses are counted per process (see get_stats()):
+pipeline_runs.start() resets the counters and pipeline_runs.finish() adds
+them to the run's summary.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Optional, Tuple
+
+from flask_backend.env_config import (
+    TMDB_CACHE_ENABLED,
+    TMDB_CACHE_NEGATIVE_TTL_SECONDS,
+    TMDB_CACHE_PATH,
+    TMDB_CACHE_TTL_SECONDS,
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tmdb_cache (
+    endpoint TEXT NOT NULL,
+    query TEXT NOT NULL,
+    language TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    expires_at REAL NOT NULL,
+    PRIMARY KEY (endpoint, query, language)
+)
+"""
+
+
+class TMDBCache:
+    """TMDB answers stored in the SQLite file at `path`, which is created on
+    first use. Each thread gets its own connection."""
+
+    def __init__(
+        self,
+        path: str,
+        ttl_seconds: int,
+        negative_ttl_seconds: int,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self._clock = clock
+        self._local = threading.local()
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(_SCHEMA)
+            connection.execute(
+                "DELETE FROM tmdb_cache WHERE expires_at < ?", (self._clock(),)
+            )
+            self._local.connection = connection
+        return connection
+
+    def get(self, endpoint: str, query: str, language: str) -> Tuple[bool, Any]:
+        """(True, value) for a live entry, (False, None) otherwise."""
+        row = (
+            self._connection()
+            .execute(
+                "SELECT payload FROM tmdb_cache"
+                " WHERE endpoint = ? AND query = ? AND language = ? AND expires_at >= ?",
+                (endpoint, query, language, self._clock()),
+            )
+            .fetchone()
+        )
+        _count("hits" if row else "misses")
+        if row is None:
+            return False, None
+        return True, json.loads(row[0])
+
+    def set(self, endpoint: str, query: str, language: str, value: Any) -> None:
+        ttl = self.ttl_seconds if value else self.negative_ttl_seconds
+        self._connection().execute(
+            "INSERT OR REPLACE INTO tmdb_cache"
+            " (endpoint, query, language, payload, expires_at)"
+            " VALUES (?, ?, ?, ?, ?)",
+            (endpoint, query, language, json.dumps(value), self._clock() + ttl),
+        )
+
+
+_cache: Optional[TMDBCache] = None
+_cache_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0}
+_stats_lock = threading.Lock()
+
+
+def get_cache() -> Optional[TMDBCache]:
+    """The process-wide cache, or None when TMDB_CACHE_ENABLED is off."""
+    global _cache
+    if not TMDB_CACHE_ENABLED:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = TMDBCache(
+                TMDB_CACHE_PATH, TMDB_CACHE_TTL_SECONDS, TMDB_CACHE_NEGATIVE_TTL_SECONDS
+            )
+        return _cache
+
+
+def _count(outcome: str) -> None:
+    with _stats_lock:
+        _stats[outcome] += 1
+
+
+def get_stats() -> dict:
+    """{"hits", "misses"} since the last reset_stats()."""
+    with _stats_lock:
+        return dict(_stats)
+
+
+def reset_stats() -> None:
+    with _stats_lock:
+        _stats.update(hits=0, misses=0)
@@ -2,11 +2,11 @@ import base64
 import os
 from typing import Optional, Tuple
 
-import requests
 from PIL import Image
 from werkzeug.utils import secure_filename
 
 from flask_backend.env_config import IMGBB_API_KEY
+from flask_backend.utils import http_client
 
 
 # `app` is unused here but kept so this shares a call signature with
@@ -17,7 +17,7 @@ def upload_image_to_api(app, image) -> Tuple[str, int, int]:  # noqa: ARG001
         "key": IMGBB_API_KEY,
         "image": base64.b64encode(image.read()),
     }
-    res = requests.post(url, payload)
+    res = http_client.post(url, data=payload)
     res.raise_for_status()
     image_url = res.json()["data"]["url"]
     width = res.json()["data"]["width"]
@@ -13,11 +13,12 @@ from io import BytesIO
 from math import ceil
 from typing import List, Optional
 
-import requests
+import httpx
 from PIL import Image, ImageDraw, ImageFilter, ImageFont
 
 from flask_backend.models import ScreeningDate
 from flask_backend.service.screening import group_screening_dates_by_day
+from flask_backend.utils import http_client
 
 logger = logging.getLogger(__name__)
 
@@ -345,10 +346,10 @@ def _load_poster_bytes(image_path: str, upload_folder: str) -> Optional[bytes]:
             file_path = os.path.join(upload_folder, filename)
             with open(file_path, "rb") as f:
                 return f.read()
-        response = requests.get(image_path, timeout=POSTER_LOAD_TIMEOUT_SECONDS)
+        response = http_client.get(image_path, timeout=POSTER_LOAD_TIMEOUT_SECONDS)
         response.raise_for_status()
         return response.content
-    except (OSError, requests.RequestException) as exc:
+    except (OSError, httpx.HTTPError) as exc:
         logger.warning(
             "Falha ao carregar poster '%s' para a capa do fim de semana: %s",
             image_path,
@@ -1,12 +1,15 @@
+from contextlib import contextmanager
 from datetime import datetime
 
 import pytest
+from sqlalchemy import event
 
 from flask_backend import create_app
-from flask_backend.db import db_session
+from flask_backend.db import db_session, engine
 from flask_backend.env_config import APP_ENVIRONMENT
 from flask_backend.models import BlogPost, User
 from flask_backend.seeds.cinema_seeds import create_cinemas
+from flask_backend.service import gemini_quota, graph_cache, tmdb_cache
 from flask_backend.utils.enums.environment import EnvironmentEnum
 
 
@@ -48,6 +51,7 @@ def clean_db(app):
             PosterFetchAttempt,
             Screening,
             ScreeningDate,
+            UpcomingShowtime,
             User,
             WantToWatch,
             movie_countries,
@@ -69,6 +73,7 @@ def clean_db(app):
         db_session.query(Genre).delete()
         db_session.query(Director).delete()
         db_session.query(Country).delete()
+        db_session.query(UpcomingShowtime).delete()
         db_session.query(ScreeningDate).delete()
         db_session.query(Screening).delete()
         db_session.query(WantToWatch).delete()
@@ -78,6 +83,65 @@ def clean_db(app):
         db_session.commit()
 
 
+@pytest.fixture(autouse=True)
+def fresh_tmdb_cache(tmp_path, monkeypatch):
+    """Gives each test an empty TMDB cache of its own and zeroed counters,
+    so cached answers never leak between tests."""
+    cache = tmdb_cache.TMDBCache(
+        str(tmp_path / "tmdb_cache.sqlite"),
+        tmdb_cache.TMDB_CACHE_TTL_SECONDS,
+        tmdb_cache.TMDB_CACHE_NEGATIVE_TTL_SECONDS,
+    )
+    monkeypatch.setattr(tmdb_cache, "_cache", cache)
+    tmdb_cache.reset_stats()
+    return cache
+
+
+@pytest.fixture(autouse=True)
+def fresh_gemini_quota(monkeypatch):
+    """Gives each test an empty Gemini quota tracker that writes its usage
+    events inline: the in-memory test database is per thread, so a
+    write-behind thread would write to a database of its own."""
+    tracker = gemini_quota.QuotaTracker(write_behind=False)
+    monkeypatch.setattr(gemini_quota, "_tracker", tracker)
+    return tracker
+
+
+@pytest.fixture(autouse=True)
+def fresh_graph_cache(monkeypatch):
+    """Gives each test an empty graph query cache and handle pool, and
+    closes the graph handles the test opened."""
+    pool = graph_cache.GraphPool()
+    results = graph_cache.QueryCache(graph_cache.GRAPH_QUERY_CACHE_MAX_ENTRIES)
+    monkeypatch.setattr(graph_cache, "_pool", pool)
+    monkeypatch.setattr(graph_cache, "_results", results)
+    yield results
+    pool.close()
+
+
+@pytest.fixture()
+def captured_statements():
+    """Returns a context manager that records every (statement, parameters)
+    pair sent to the engine while its block runs - for query-count and
+    EXPLAIN QUERY PLAN assertions."""
+
+    @contextmanager
+    def _capture():
+        statements = []
+
+        def _record(*args):
+            _conn, _cursor, statement, parameters, _context, _executemany = args
+            statements.append((statement, parameters))
+
+        event.listen(engine, "before_cursor_execute", _record)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, "before_cursor_execute", _record)
+
+    return _capture
+
+
 @pytest.fixture()
 def client(app):
     """A test client for the app."""
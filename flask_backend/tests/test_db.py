@@ -0,0 +1,83 @@
+"""
+Tests the SQLite engine configuration and the read-only connection mode for
+public requests in flask_backend/db.py.
+"""
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from flask_backend.db import (
+    _create_engine,
+    _is_file_sqlite,
+    db_session,
+    use_read_only_connection,
+)
+from flask_backend.env_config import SQLITE_BUSY_TIMEOUT_MS
+from flask_backend.models import Movie
+
+
+class TestCreateEngine:
+    def test_tells_file_databases_from_in_memory_ones(self):
+        assert _is_file_sqlite("sqlite:///./development.sqlite") is True
+        assert _is_file_sqlite("sqlite:///:memory:") is False
+        assert _is_file_sqlite("sqlite://") is False
+
+    def test_file_database_connections_get_the_tuning_pragmas(self, tmp_path):
+        engine = _create_engine(f"sqlite:///{tmp_path / 'tuned.sqlite'}")
+        with engine.connect() as connection:
+
+            def pragma(name):
+                return connection.exec_driver_sql(f"PRAGMA {name}").scalar()
+
+            assert pragma("journal_mode") == "wal"
+            assert pragma("synchronous") == 1  # NORMAL
+            assert pragma("temp_store") == 2  # MEMORY
+            assert pragma("busy_timeout") == SQLITE_BUSY_TIMEOUT_MS
+            assert pragma("cache_size") < 0  # sized in KiB, not pages
+        engine.dispose()
+
+    def test_query_only_is_reset_when_the_connection_returns_to_the_pool(
+        self, tmp_path
+    ):
+        engine = _create_engine(f"sqlite:///{tmp_path / 'tuned.sqlite'}")
+        with engine.connect() as connection:
+            connection.exec_driver_sql("PRAGMA query_only = ON")
+        with engine.connect() as connection:
+            assert connection.exec_driver_sql("PRAGMA query_only").scalar() == 0
+        engine.dispose()
+
+
+def _add_movie():
+    db_session.add(Movie(title="Filme", slug="filme", created_at=datetime.now()))
+    db_session.commit()
+
+
+class TestUseReadOnlyConnection:
+    def test_anonymous_public_get_cannot_write(self, app):
+        with app.test_request_context("/", method="GET"):
+            app.preprocess_request()
+            with pytest.raises(OperationalError, match="readonly"):
+                _add_movie()
+            db_session.rollback()
+
+    def test_connection_can_write_again_after_the_request(self, app):
+        with app.test_request_context("/", method="GET"):
+            app.preprocess_request()
+        db_session.remove()
+
+        with app.app_context():
+            _add_movie()
+            assert db_session.query(Movie).count() == 1
+
+    def test_logged_in_requests_keep_a_writable_connection(self, app, test_user):
+        with app.test_request_context("/", method="GET") as context:
+            context.session["user_id"] = test_user
+            use_read_only_connection()
+            _add_movie()
+
+    def test_public_posts_keep_a_writable_connection(self, app):
+        with app.test_request_context("/", method="POST"):
+            use_read_only_connection()
+            _add_movie()
@@ -2,7 +2,11 @@
 Tests flask_backend/repository/countries.py.
 """
 
-from flask_backend.repository.countries import get_all, get_or_create_by_iso_code
+from flask_backend.repository.countries import (
+    get_all,
+    get_or_create_by_iso_code,
+    get_or_create_many_by_iso_code,
+)
 
 
 class TestGetAll:
@@ -14,3 +18,17 @@ class TestGetAll:
             countries = get_all()
 
             assert [c.name for c in countries] == ["Brazil", "United States of America"]
+
+
+class TestGetOrCreateManyByIsoCode:
+    def test_returns_existing_and_creates_missing(self, app):
+        with app.app_context():
+            brazil = get_or_create_by_iso_code("BR", "Brazil")
+
+            countries = get_or_create_many_by_iso_code(
+                {"BR": "Brasil", "AR": "Argentina"}
+            )
+
+            assert countries["BR"].id == brazil.id
+            assert countries["AR"].name == "Argentina"
+            assert [c.iso_3166_1 for c in get_all()] == ["AR", "BR"]
@@ -2,7 +2,13 @@
 Tests flask_backend/repository/directors.py.
 """
 
-from flask_backend.repository.directors import get_all, get_or_create_by_tmdb_id
+from flask_backend.db import db_session
+from flask_backend.models import Director
+from flask_backend.repository.directors import (
+    get_all,
+    get_or_create_by_tmdb_id,
+    get_or_create_many_by_tmdb_id,
+)
 
 
 class TestGetAll:
@@ -14,3 +20,25 @@ class TestGetAll:
             directors = get_all()
 
             assert [d.name for d in directors] == ["Agnès Varda", "Wim Wenders"]
+
+
+class TestGetOrCreateManyByTmdbId:
+    def test_returns_existing_and_creates_missing(self, app):
+        with app.app_context():
+            existing = get_or_create_by_tmdb_id(1, "Agnès Varda")
+
+            directors = get_or_create_many_by_tmdb_id(
+                {1: "Nome ignorado", 2: "Wim Wenders"}
+            )
+            db_session.commit()
+
+            assert directors[1].id == existing.id
+            assert directors[1].name == "Agnès Varda"
+            assert directors[2].name == "Wim Wenders"
+            assert db_session.query(Director).count() == 2
+
+    def test_empty_input_runs_no_query(self, app, captured_statements):
+        with app.app_context(), captured_statements() as statements:
+            assert get_or_create_many_by_tmdb_id({}) == {}
+
+        assert statements == []
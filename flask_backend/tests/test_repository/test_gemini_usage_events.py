@@ -79,3 +79,48 @@ class TestMostRecent:
     def test_returns_none_when_no_events(self, app):
         with app.app_context():
             assert gemini_usage_events.most_recent("model-a") is None
+
+
+class TestCreateMany:
+    def test_inserts_every_event(self, app):
+        with app.app_context():
+            now = datetime(2026, 8, 5, 12, 0, 0)
+
+            gemini_usage_events.create_many(
+                [
+                    {
+                        "model_id": "model-a",
+                        "occurred_at": now,
+                        "outcome": "success",
+                        "quota_metric": None,
+                        "unavailable_until": None,
+                    },
+                    {
+                        "model_id": "model-b",
+                        "occurred_at": now,
+                        "outcome": "rate_limited",
+                        "quota_metric": "requests_per_minute",
+                        "unavailable_until": now + timedelta(seconds=30),
+                    },
+                ]
+            )
+
+            assert gemini_usage_events.count_since("model-a", now) == 1
+            stored = gemini_usage_events.most_recent("model-b")
+            assert stored.unavailable_until == now + timedelta(seconds=30)
+
+
+class TestGetSince:
+    def test_returns_events_on_or_after_since_and_after_the_given_id(self, app):
+        with app.app_context():
+            base = datetime(2026, 8, 5, 12, 0, 0)
+            gemini_usage_events.create(
+                "model-a", base - timedelta(seconds=1), "success"
+            )
+            seen = gemini_usage_events.create("model-a", base, "success")
+            newer = gemini_usage_events.create(
+                "model-b", base + timedelta(seconds=1), "success"
+            )
+
+            assert gemini_usage_events.get_since(base) == [seen, newer]
+            assert gemini_usage_events.get_since(base, seen.id) == [newer]
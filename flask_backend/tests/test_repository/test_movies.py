@@ -4,6 +4,7 @@ from flask_backend.repository import pipeline_runs
 from flask_backend.repository.movies import (
     create,
     create_distinct,
+    get_by_slugs,
     get_by_title_or_create,
     get_movies_with_similar_titles,
 )
@@ -52,6 +53,24 @@ class TestGetByTitleOrCreate:
             assert second.pipeline_run_id == run_a.id
 
 
+class TestGetBySlugs:
+    def test_returns_movies_keyed_by_slug_and_skips_unknown_slugs(self, app):
+        with app.app_context():
+            first, _ = get_by_title_or_create("Filme Um")
+            second, _ = get_by_title_or_create("Filme Dois")
+
+            movies = get_by_slugs(["filme-um", "filme-dois", "filme-tres"])
+
+            assert movies == {"filme-um": first, "filme-dois": second}
+
+    def test_returns_empty_dict_without_querying_for_no_slugs(
+        self, app, captured_statements
+    ):
+        with app.app_context(), captured_statements() as statements:
+            assert get_by_slugs([]) == {}
+        assert statements == []
+
+
 class TestCreate:
     def test_leaves_pipeline_run_id_null_by_default(self, app):
         with app.app_context():
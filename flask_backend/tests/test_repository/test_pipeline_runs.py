@@ -1,8 +1,12 @@
+import json
 from datetime import datetime, timedelta
+from unittest.mock import patch
 
 from flask_backend.db import db_session
 from flask_backend.models import PipelineRun
 from flask_backend.repository import pipeline_runs
+from flask_backend.service import tmdb_cache
+from flask_backend.utils import http_client
 
 
 class TestStart:
@@ -58,6 +62,54 @@ class TestFinish:
             assert finished.status == "error"
             assert finished.error_message == "boom"
 
+    def test_stores_the_http_counters_collected_since_start(self, app):
+        stats = {"api.themoviedb.org": {"requests": 3, "errors": 0}}
+        with (
+            app.app_context(),
+            patch.object(http_client, "reset_host_stats") as reset,
+            patch.object(http_client, "get_host_stats", return_value=stats),
+        ):
+            run = pipeline_runs.start("fetch-posters")
+            reset.assert_called_once()
+
+            finished = pipeline_runs.finish(run.id, status="success")
+
+            assert json.loads(finished.http_stats) == stats
+
+    def test_leaves_http_stats_empty_when_no_requests_were_made(self, app):
+        with (
+            app.app_context(),
+            patch.object(http_client, "get_host_stats", return_value={}),
+        ):
+            run = pipeline_runs.start("import-json")
+            finished = pipeline_runs.finish(run.id, status="success")
+
+            assert finished.http_stats is None
+
+    def test_adds_tmdb_cache_counters_to_the_summary(self, app):
+        with app.app_context():
+            run = pipeline_runs.start("fetch-movie-metadata")
+            with patch.object(
+                tmdb_cache, "get_stats", return_value={"hits": 4, "misses": 1}
+            ):
+                finished = pipeline_runs.finish(
+                    run.id, status="success", summary=json.dumps({"processed": 5})
+                )
+
+            assert json.loads(finished.summary) == {
+                "processed": 5,
+                "tmdb_cache": {"hits": 4, "misses": 1},
+            }
+
+    def test_leaves_the_summary_alone_without_tmdb_lookups(self, app):
+        with app.app_context():
+            run = pipeline_runs.start("import-json")
+            finished = pipeline_runs.finish(
+                run.id, status="success", summary='{"processed": 2}'
+            )
+
+            assert finished.summary == '{"processed": 2}'
+
 
 class TestGetById:
     def test_returns_none_when_missing(self, app):
@@ -99,6 +151,35 @@ class TestGetLatestByPipeline:
             assert latest.id == run_a.id
 
 
+class TestGetLastCinemaFingerprints:
+    def _finish(self, source, status, fingerprints):
+        run = pipeline_runs.start("import-json", source=source)
+        pipeline_runs.finish(run.id, status=status, cinema_fingerprints=fingerprints)
+
+    def test_takes_each_cinema_from_its_last_successful_run(self, app):
+        with app.app_context():
+            self._finish(
+                "capitolio,cine-cinco", "success", {"capitolio": "a", "cine-cinco": "b"}
+            )
+            self._finish("cine-cinco", "success", {"cine-cinco": "c"})
+            self._finish("capitolio", "error", None)
+
+            fingerprints = pipeline_runs.get_last_cinema_fingerprints(
+                ["capitolio", "cine-cinco", "sala-redencao"]
+            )
+
+            assert fingerprints == {"capitolio": "a", "cine-cinco": "c"}
+
+    def test_ignores_warning_runs(self, app):
+        with app.app_context():
+            self._finish("capitolio", "success", {"capitolio": "a"})
+            self._finish("capitolio", "warning", {"capitolio": "empty"})
+
+            assert pipeline_runs.get_last_cinema_fingerprints(["capitolio"]) == {
+                "capitolio": "a"
+            }
+
+
 class TestGetPaginated:
     def test_paginates_and_orders_newest_first(self, app):
         with app.app_context():
@@ -0,0 +1,81 @@
+from datetime import datetime
+
+from flask_backend.db import db_session
+from flask_backend.models import Movie
+from flask_backend.repository import pipeline_runs, schedule_generation
+
+
+class TestCurrent:
+    def test_migration_seeds_the_counter_row(self, app):
+        with app.app_context():
+            generation, _last_modified = schedule_generation.current()
+            assert generation >= 0
+
+    def test_last_modified_follows_the_newest_finished_pipeline_run(self, app):
+        with app.app_context():
+            run = pipeline_runs.start("fetch-posters")
+            finished = pipeline_runs.finish(run.id, "success")
+
+            _generation, last_modified = schedule_generation.current()
+
+            assert last_modified == finished.finished_at
+
+
+class TestBumpAfterFlush:
+    def test_content_write_bumps_the_generation(self, app):
+        with app.app_context():
+            before, _ = schedule_generation.current()
+
+            db_session.add(
+                Movie(title="Filme", slug="filme", created_at=datetime.now())
+            )
+            db_session.commit()
+
+            after, last_modified = schedule_generation.current()
+            assert after == before + 1
+            assert last_modified is not None
+
+    def test_one_flush_bumps_once(self, app):
+        with app.app_context():
+            before, _ = schedule_generation.current()
+
+            db_session.add_all(
+                [
+                    Movie(title="Um", slug="um", created_at=datetime.now()),
+                    Movie(title="Dois", slug="dois", created_at=datetime.now()),
+                ]
+            )
+            db_session.commit()
+
+            assert schedule_generation.current()[0] == before + 1
+
+    def test_bookkeeping_write_does_not_bump(self, app):
+        with app.app_context():
+            before, _ = schedule_generation.current()
+
+            pipeline_runs.start("fetch-posters")
+
+            assert schedule_generation.current()[0] == before
+
+    def test_rolled_back_write_does_not_bump(self, app):
+        with app.app_context():
+            before, _ = schedule_generation.current()
+
+            db_session.add(
+                Movie(title="Filme", slug="filme", created_at=datetime.now())
+            )
+            db_session.flush()
+            db_session.rollback()
+
+            assert schedule_generation.current()[0] == before
+
+
+class TestBump:
+    def test_bumps_within_the_current_transaction(self, app):
+        with app.app_context():
+            before, _ = schedule_generation.current()
+
+            schedule_generation.bump()
+            db_session.commit()
+
+            assert schedule_generation.current()[0] == before + 1
@@ -1,17 +1,19 @@
 from datetime import date, datetime, timedelta
 
-from flask_backend.db import db_session
+from flask_backend.db import db_session, engine
 from flask_backend.models import Movie, Screening, ScreeningDate
 from flask_backend.repository.cinemas import get_by_slug as get_cinema_by_slug
 from flask_backend.repository.screenings import (
+    get_by_movie_and_cinema_ids,
+    get_ids_by_movie_and_cinema_ids,
     get_latest_screening_for_movie,
     get_latest_screening_images_for_movies,
+    get_latest_screenings_for_movies,
+    get_next_screening_date_for_movie,
     get_past_movies_for_cinema,
-    get_screening_dates_for_movies,
-    get_screenings_for_movies_with_dates_in_range,
-    get_screenings_in_date_range,
     get_screenings_with_image,
     get_screenings_with_upcoming_dates,
+    get_weekend_screening_dates,
     reattach_movie,
 )
 
@@ -44,6 +46,45 @@ def _create_screening(
         return screening.id, movie_id
 
 
+class TestGetByMovieAndCinemaIds:
+    def test_keys_screenings_by_movie_and_cinema_with_dates_loaded(
+        self, app, setup_cinemas
+    ):
+        screening_id, movie_id = _create_screening(
+            app, "Filme A", "filme-a", [date(2025, 12, 25)]
+        )
+        _create_screening(
+            app, "Filme B", "filme-b", [date(2025, 12, 26)], cinema_slug="sala-redencao"
+        )
+        with app.app_context():
+            capitolio = get_cinema_by_slug("capitolio")
+
+            screenings = get_by_movie_and_cinema_ids([movie_id], [capitolio.id])
+
+            assert list(screenings) == [(movie_id, capitolio.id)]
+            screening = screenings[(movie_id, capitolio.id)]
+            assert screening.id == screening_id
+            assert "dates" in screening.__dict__
+            assert [d.date for d in screening.dates] == [date(2025, 12, 25)]
+
+    def test_resolves_a_duplicated_pair_to_the_oldest_screening(
+        self, app, setup_cinemas
+    ):
+        first_id, movie_id = _create_screening(app, "Filme A", "filme-a", [])
+        _create_screening(app, "Filme A", "filme-a", [], movie_id=movie_id)
+        with app.app_context():
+            capitolio = get_cinema_by_slug("capitolio")
+            pair = (movie_id, capitolio.id)
+
+            assert (
+                get_by_movie_and_cinema_ids([movie_id], [capitolio.id])[pair].id
+                == first_id
+            )
+            assert get_ids_by_movie_and_cinema_ids([movie_id], [capitolio.id]) == {
+                pair: first_id
+            }
+
+
 class TestReattachMovie:
     def test_changes_screening_movie_id(self, app, setup_cinemas):
         with app.app_context():
@@ -143,233 +184,6 @@ class TestGetScreeningsWithUpcomingDates:
             assert ids.count(screening_id) == 1
 
 
-class TestGetScreeningsInDateRange:
-    def test_includes_screening_with_a_date_inside_the_range(self, app, setup_cinemas):
-        screening_id, _ = _create_screening(
-            app, "Filme", "filme", [date.today() + timedelta(days=3)]
-        )
-
-        with app.app_context():
-            ids = [
-                s.id
-                for s in get_screenings_in_date_range(
-                    date.today(), date.today() + timedelta(days=6)
-                )
-            ]
-            assert screening_id in ids
-
-    def test_excludes_screening_with_a_date_before_the_range(self, app, setup_cinemas):
-        screening_id, _ = _create_screening(
-            app, "Filme Passado", "filme-passado", [date.today() - timedelta(days=1)]
-        )
-
-        with app.app_context():
-            ids = [
-                s.id
-                for s in get_screenings_in_date_range(
-                    date.today(), date.today() + timedelta(days=6)
-                )
-            ]
-            assert screening_id not in ids
-
-    def test_excludes_screening_with_a_date_after_the_range(self, app, setup_cinemas):
-        screening_id, _ = _create_screening(
-            app, "Filme Futuro", "filme-futuro", [date.today() + timedelta(days=7)]
-        )
-
-        with app.app_context():
-            ids = [
-                s.id
-                for s in get_screenings_in_date_range(
-                    date.today(), date.today() + timedelta(days=6)
-                )
-            ]
-            assert screening_id not in ids
-
-    def test_includes_screening_with_a_date_on_the_last_day_of_the_range(
-        self, app, setup_cinemas
-    ):
-        screening_id, _ = _create_screening(
-            app, "Filme Limite", "filme-limite", [date.today() + timedelta(days=6)]
-        )
-
-        with app.app_context():
-            ids = [
-                s.id
-                for s in get_screenings_in_date_range(
-                    date.today(), date.today() + timedelta(days=6)
-                )
-            ]
-            assert screening_id in ids
-
-    def test_includes_draft_screenings(self, app, setup_cinemas):
-        screening_id, _ = _create_screening(
-            app, "Rascunho", "rascunho", [date.today()], draft=True
-        )
-
-        with app.app_context():
-            ids = [
-                s.id
-                for s in get_screenings_in_date_range(
-                    date.today(), date.today() + timedelta(days=6)
-                )
-            ]
-            assert screening_id in ids
-
-    def test_does_not_duplicate_screenings_with_multiple_dates_in_range(
-        self, app, setup_cinemas
-    ):
-        screening_id, _ = _create_screening(
-            app,
-            "Recorrente",
-            "recorrente",
-            [date.today(), date.today() + timedelta(days=1)],
-        )
-
-        with app.app_context():
-            ids = [
-                s.id
-                for s in get_screenings_in_date_range(
-                    date.today(), date.today() + timedelta(days=6)
-                )
-            ]
-            assert ids.count(screening_id) == 1
-
-
-class TestGetScreeningDatesForMovies:
-    def test_includes_dates_for_the_requested_movie(self, app, setup_cinemas):
-        screening_id, movie_id = _create_screening(
-            app, "Filme", "filme", [date.today() + timedelta(days=2)]
-        )
-
-        with app.app_context():
-            dates = get_screening_dates_for_movies(
-                [movie_id], date.today(), date.today() + timedelta(days=6)
-            )
-            assert len(dates) == 1
-            assert dates[0].screening_id == screening_id
-
-    def test_aggregates_dates_across_cinemas_for_the_same_movie(
-        self, app, setup_cinemas
-    ):
-        _screening_id_a, movie_id = _create_screening(
-            app, "Filme", "filme", [date.today()], cinema_slug="capitolio"
-        )
-        _create_screening(
-            app,
-            "Filme",
-            "filme",
-            [date.today() + timedelta(days=1)],
-            cinema_slug="sala-redencao",
-            movie_id=movie_id,
-        )
-
-        with app.app_context():
-            dates = get_screening_dates_for_movies(
-                [movie_id], date.today(), date.today() + timedelta(days=6)
-            )
-            assert len(dates) == 2
-
-    def test_excludes_dates_for_other_movies(self, app, setup_cinemas):
-        _screening_id, movie_id = _create_screening(
-            app, "Filme A", "filme-a", [date.today()]
-        )
-        _create_screening(app, "Filme B", "filme-b", [date.today()])
-
-        with app.app_context():
-            dates = get_screening_dates_for_movies(
-                [movie_id], date.today(), date.today() + timedelta(days=6)
-            )
-            assert len(dates) == 1
-
-    def test_excludes_dates_outside_the_range(self, app, setup_cinemas):
-        _screening_id, movie_id = _create_screening(
-            app,
-            "Filme",
-            "filme",
-            [date.today(), date.today() + timedelta(days=10)],
-        )
-
-        with app.app_context():
-            dates = get_screening_dates_for_movies(
-                [movie_id], date.today(), date.today() + timedelta(days=6)
-            )
-            assert len(dates) == 1
-
-    def test_excludes_draft_screening_dates_by_default(self, app, setup_cinemas):
-        _screening_id, movie_id = _create_screening(
-            app, "Rascunho", "rascunho", [date.today()], draft=True
-        )
-
-        with app.app_context():
-            dates = get_screening_dates_for_movies(
-                [movie_id], date.today(), date.today() + timedelta(days=6)
-            )
-            assert dates == []
-
-    def test_includes_draft_screening_dates_when_include_drafts_is_true(
-        self, app, setup_cinemas
-    ):
-        _screening_id, movie_id = _create_screening(
-            app, "Rascunho", "rascunho", [date.today()], draft=True
-        )
-
-        with app.app_context():
-            dates = get_screening_dates_for_movies(
-                [movie_id],
-                date.today(),
-                date.today() + timedelta(days=6),
-                include_drafts=True,
-            )
-            assert len(dates) == 1
-
-    def test_returns_empty_list_for_empty_movie_ids(self, app, setup_cinemas):
-        with app.app_context():
-            assert get_screening_dates_for_movies([], date.today(), date.today()) == []
-
-
-class TestGetScreeningsForMoviesWithDatesInRange:
-    def test_includes_screening_for_requested_movie_within_range(
-        self, app, setup_cinemas
-    ):
-        screening_id, movie_id = _create_screening(
-            app, "Filme", "filme", [date.today() + timedelta(days=1)]
-        )
-
-        with app.app_context():
-            ids = [
-                s.id
-                for s in get_screenings_for_movies_with_dates_in_range(
-                    [movie_id], date.today(), date.today() + timedelta(days=6)
-                )
-            ]
-            assert screening_id in ids
-
-    def test_excludes_screening_for_a_different_movie(self, app, setup_cinemas):
-        _, movie_id = _create_screening(
-            app, "Filme", "filme", [date.today() + timedelta(days=1)]
-        )
-        other_screening_id, _ = _create_screening(
-            app, "Outro Filme", "outro-filme", [date.today() + timedelta(days=1)]
-        )
-
-        with app.app_context():
-            ids = [
-                s.id
-                for s in get_screenings_for_movies_with_dates_in_range(
-                    [movie_id], date.today(), date.today() + timedelta(days=6)
-                )
-            ]
-            assert other_screening_id not in ids
-
-    def test_returns_empty_list_for_no_movie_ids(self, app, setup_cinemas):
-        with app.app_context():
-            result = get_screenings_for_movies_with_dates_in_range(
-                [], date.today(), date.today()
-            )
-            assert result == []
-
-
 class TestGetLatestScreeningForMovie:
     def test_returns_the_most_recently_created_screening(self, app, setup_cinemas):
         with app.app_context():
@@ -467,6 +281,57 @@ class TestGetLatestScreeningForMovie:
             assert latest.id == newer_draft.id
 
 
+class TestGetLatestScreeningsForMovies:
+    def test_returns_the_most_recently_created_screening_per_movie(
+        self, app, setup_cinemas
+    ):
+        with app.app_context():
+            cinema = get_cinema_by_slug("capitolio")
+            movie_a = Movie(title="Filme A", slug="filme-a")
+            movie_b = Movie(title="Filme B", slug="filme-b")
+            db_session.add_all([movie_a, movie_b])
+            db_session.commit()
+            older_a = Screening(
+                movie_id=movie_a.id,
+                cinema_id=cinema.id,
+                description="antiga",
+                created_at=datetime.now() - timedelta(days=10),
+            )
+            newer_a = Screening(
+                movie_id=movie_a.id,
+                cinema_id=cinema.id,
+                description="recente",
+                created_at=datetime.now(),
+            )
+            only_b = Screening(
+                movie_id=movie_b.id, cinema_id=cinema.id, description="única"
+            )
+            db_session.add_all([older_a, newer_a, only_b])
+            db_session.commit()
+
+            latest = get_latest_screenings_for_movies([movie_a.id, movie_b.id])
+
+            assert {movie_id: s.id for movie_id, s in latest.items()} == {
+                movie_a.id: newer_a.id,
+                movie_b.id: only_b.id,
+            }
+
+    def test_skips_drafts_unless_include_drafts(self, app, setup_cinemas):
+        _screening_id, movie_id = _create_screening(
+            app, "Rascunho", "rascunho", [date.today()], draft=True
+        )
+
+        with app.app_context():
+            assert get_latest_screenings_for_movies([movie_id]) == {}
+            assert movie_id in get_latest_screenings_for_movies(
+                [movie_id], include_drafts=True
+            )
+
+    def test_returns_empty_dict_for_no_movie_ids(self, app, setup_cinemas):
+        with app.app_context():
+            assert get_latest_screenings_for_movies([]) == {}
+
+
 class TestGetPastMoviesForCinema:
     def test_includes_movie_with_only_a_past_date(self, app, setup_cinemas):
         screening_id, movie_id = _create_screening(
@@ -667,3 +532,57 @@ class TestGetScreeningsWithImage:
             result = get_screenings_with_image()
 
         assert [s.id for s in result] == [second_id, first_id]
+
+
+def _full_table_scans(statements):
+    """Plan details like "SCAN screening_dates" - a full pass over one of
+    the two tables that grow with the whole screening history. Plain
+    "SEARCH ... USING INDEX" rows are what we want instead."""
+    scans = []
+    with engine.connect() as connection:
+        for statement, parameters in statements:
+            rows = connection.exec_driver_sql(
+                f"EXPLAIN QUERY PLAN {statement}", parameters
+            ).fetchall()
+            for row in rows:
+                detail = row[-1]
+                if detail.startswith(("SCAN screening_dates", "SCAN screenings")):
+                    scans.append((detail, statement))
+    return scans
+
+
+class TestScheduleQueriesUseIndexes:
+    """Regression guard: every schedule query must filter
+    screening_dates.date as a raw column (never func.date(date)) so SQLite
+    can SEARCH it through an index instead of scanning the table."""
+
+    def test_no_schedule_query_scans_the_screening_tables(
+        self, app, setup_cinemas, captured_statements
+    ):
+        _screening_id, movie_id = _create_screening(
+            app, "Filme", "filme", [date.today()]
+        )
+
+        with app.app_context():
+            cinema_id = get_cinema_by_slug("capitolio").id
+            queries = {
+                "weekend_screening_dates": get_weekend_screening_dates,
+                "next_screening_date_for_movie": lambda: (
+                    get_next_screening_date_for_movie(movie_id)
+                ),
+                "screenings_with_upcoming_dates": get_screenings_with_upcoming_dates,
+                "screenings_with_upcoming_dates_by_cinema": lambda: (
+                    get_screenings_with_upcoming_dates(cinema_id)
+                ),
+            }
+
+            scans_by_query = {}
+            for name, query in queries.items():
+                with captured_statements() as statements:
+                    query()
+                assert statements, name
+                scans = _full_table_scans(statements)
+                if scans:
+                    scans_by_query[name] = scans
+
+        assert scans_by_query == {}
@@ -0,0 +1,476 @@
+import json
+from datetime import date, datetime, timedelta
+
+from flask_backend.db import db_session, engine
+from flask_backend.models import (
+    Director,
+    Movie,
+    Screening,
+    ScreeningDate,
+    UpcomingShowtime,
+)
+from flask_backend.repository.cinemas import get_by_slug as get_cinema_by_slug
+from flask_backend.repository.screenings import (
+    delete as delete_screening,
+    reattach_movie,
+    update as update_screening,
+    update_screening_dates,
+)
+from flask_backend.repository.upcoming_schedule import (
+    get_days_schedule_by_cinema,
+    get_month_schedule,
+    get_schedule_for_movies,
+    get_schedule_in_range,
+    get_upcoming_for_cinema,
+    get_weekend_schedule,
+    rebuild,
+    schedule_horizon,
+)
+from flask_backend.service.movie_merge import merge_movies
+
+
+def _create_screening(
+    app, title, slug, dates, draft=False, cinema_slug="capitolio", movie_id=None
+):
+    with app.app_context():
+        if movie_id is None:
+            movie = Movie(title=title, slug=slug, created_at=datetime.now())
+            db_session.add(movie)
+            db_session.commit()
+            movie_id = movie.id
+        cinema = get_cinema_by_slug(cinema_slug)
+        screening = Screening(
+            movie_id=movie_id,
+            cinema_id=cinema.id,
+            description="desc",
+            draft=draft,
+        )
+        db_session.add(screening)
+        db_session.commit()
+        for screening_date in dates:
+            db_session.add(
+                ScreeningDate(
+                    screening_id=screening.id, date=screening_date, time="20:00"
+                )
+            )
+        db_session.commit()
+        return screening.id, movie_id
+
+
+def _rows_for_screening(screening_id):
+    return (
+        db_session.query(UpcomingShowtime)
+        .filter(UpcomingShowtime.screening_id == screening_id)
+        .order_by(UpcomingShowtime.date, UpcomingShowtime.time)
+        .all()
+    )
+
+
+class TestFlushRefresh:
+    def test_new_screening_dates_get_a_denormalized_row(self, app, setup_cinemas):
+        screening_id, movie_id = _create_screening(
+            app, "Filme", "filme", [date.today() + timedelta(days=1)]
+        )
+
+        with app.app_context():
+            [row] = _rows_for_screening(screening_id)
+            assert row.movie_id == movie_id
+            assert row.movie_title == "Filme"
+            assert row.movie_slug == "filme"
+            assert row.cinema_slug == "capitolio"
+            assert row.cinema_short_name == "Capitólio"
+            assert row.cinema_color == "#911eb4"
+            assert row.time == "20:00"
+            assert row.draft is False
+
+    def test_dates_before_the_horizon_are_not_kept(self, app, setup_cinemas):
+        screening_id, _ = _create_screening(
+            app, "Filme", "filme", [schedule_horizon() - timedelta(days=1)]
+        )
+
+        with app.app_context():
+            assert _rows_for_screening(screening_id) == []
+
+    def test_replacing_dates_replaces_the_rows(self, app, setup_cinemas):
+        screening_id, _ = _create_screening(app, "Filme", "filme", [date.today()])
+        tomorrow = date.today() + timedelta(days=1)
+
+        with app.app_context():
+            screening = db_session.get(Screening, screening_id)
+            update_screening_dates(
+                screening, [ScreeningDate(date=tomorrow, time="18:00")]
+            )
+
+            assert [
+                (row.date, row.time) for row in _rows_for_screening(screening_id)
+            ] == [(tomorrow, "18:00")]
+
+    def test_publishing_a_draft_updates_its_rows(self, app, setup_cinemas):
+        screening_id, movie_id = _create_screening(
+            app, "Rascunho", "rascunho", [date.today()], draft=True
+        )
+
+        with app.app_context():
+            screening = db_session.get(Screening, screening_id)
+            update_screening(screening, movie_id, "nova", None, None, None, False)
+
+            [row] = _rows_for_screening(screening_id)
+            assert row.draft is False
+            assert row.description == "nova"
+
+    def test_deleting_a_screening_removes_its_rows(self, app, setup_cinemas):
+        screening_id, _ = _create_screening(app, "Filme", "filme", [date.today()])
+
+        with app.app_context():
+            delete_screening(db_session.get(Screening, screening_id))
+
+            assert _rows_for_screening(screening_id) == []
+
+    def test_reattaching_a_screening_follows_the_new_movie(self, app, setup_cinemas):
+        screening_id, _ = _create_screening(app, "Filme", "filme", [date.today()])
+
+        with app.app_context():
+            target = Movie(title="Outro Filme", slug="outro-filme")
+            db_session.add(target)
+            db_session.commit()
+            reattach_movie(db_session.get(Screening, screening_id), target.id)
+
+            [row] = _rows_for_screening(screening_id)
+            assert row.movie_id == target.id
+            assert row.movie_title == "Outro Filme"
+
+    def test_movie_title_and_directors_changes_reach_every_row(
+        self, app, setup_cinemas
+    ):
+        capitolio_id, movie_id = _create_screening(
+            app, "Filme", "filme", [date.today()]
+        )
+        redencao_id, _ = _create_screening(
+            app,
+            "Filme",
+            "filme",
+            [date.today()],
+            cinema_slug="sala-redencao",
+            movie_id=movie_id,
+        )
+
+        with app.app_context():
+            movie = db_session.get(Movie, movie_id)
+            movie.title = "Filme Corrigido"
+            movie.directors.append(Director(name="Diretora"))
+            db_session.commit()
+
+            rows = _rows_for_screening(capitolio_id) + _rows_for_screening(redencao_id)
+            assert [row.movie_title for row in rows] == ["Filme Corrigido"] * 2
+            assert [row.director_names for row in rows] == [["Diretora"]] * 2
+
+    def test_merging_movies_moves_the_duplicates_rows_to_the_survivor(
+        self, app, setup_cinemas
+    ):
+        _survivor_screening_id, survivor_id = _create_screening(
+            app, "Filme", "filme", [date.today()]
+        )
+        duplicate_screening_id, duplicate_id = _create_screening(
+            app,
+            "Filme (legendado)",
+            "filme-legendado",
+            [date.today() + timedelta(days=1)],
+            cinema_slug="sala-redencao",
+        )
+
+        with app.app_context():
+            survivor = db_session.get(Movie, survivor_id)
+            duplicate = db_session.get(Movie, duplicate_id)
+            merge_movies(survivor, [duplicate])
+            db_session.commit()
+
+            [row] = _rows_for_screening(duplicate_screening_id)
+            assert row.movie_id == survivor_id
+            assert row.movie_title == "Filme"
+
+    def test_rebuild_matches_the_incremental_rows(self, app, setup_cinemas):
+        _create_screening(app, "Filme A", "filme-a", [date.today()])
+        _create_screening(
+            app,
+            "Filme B",
+            "filme-b",
+            [date.today(), date.today() + timedelta(days=3)],
+            cinema_slug="sala-redencao",
+        )
+
+        def snapshot():
+            return [
+                {
+                    column.name: getattr(row, column.name)
+                    for column in UpcomingShowtime.__table__.columns
+                }
+                for row in db_session.query(UpcomingShowtime).order_by(
+                    UpcomingShowtime.id
+                )
+            ]
+
+        with app.app_context():
+            incremental = snapshot()
+            db_session.query(UpcomingShowtime).delete()
+            db_session.commit()
+
+            assert rebuild() == 3
+            db_session.expire_all()
+            assert snapshot() == incremental
+            assert json.loads(incremental[0]["directors"]) == []
+
+
+class TestGetDaysScheduleByCinema:
+    def test_buckets_the_days_screenings_by_cinema(self, app, setup_cinemas):
+        capitolio_id, _ = _create_screening(app, "Filme A", "filme-a", [date.today()])
+        redencao_id, _ = _create_screening(
+            app, "Filme B", "filme-b", [date.today()], cinema_slug="sala-redencao"
+        )
+        _create_screening(app, "Filme C", "filme-c", [date.today() + timedelta(days=1)])
+
+        with app.app_context():
+            schedule = get_days_schedule_by_cinema(date.today())
+            capitolio = get_cinema_by_slug("capitolio")
+            redencao = get_cinema_by_slug("sala-redencao")
+
+            assert {
+                cinema_id: [showtime.screening_id for showtime, _times in bucket]
+                for cinema_id, bucket in schedule.items()
+            } == {capitolio.id: [capitolio_id], redencao.id: [redencao_id]}
+
+    def test_orders_each_bucket_by_time_and_lists_a_screening_once(
+        self, app, setup_cinemas
+    ):
+        late_id, _ = _create_screening(app, "Tarde", "tarde", [date.today()])
+        early_id, _ = _create_screening(app, "Cedo", "cedo", [date.today()])
+
+        with app.app_context():
+            early = db_session.get(Screening, early_id)
+            update_screening_dates(
+                early,
+                [
+                    ScreeningDate(date=date.today(), time="14:00"),
+                    ScreeningDate(date=date.today(), time="16:30"),
+                ],
+            )
+
+            bucket = get_days_schedule_by_cinema(date.today())[
+                get_cinema_by_slug("capitolio").id
+            ]
+
+            assert [(showtime.screening_id, times) for showtime, times in bucket] == [
+                (early_id, ["14:00", "16:30"]),
+                (late_id, ["20:00"]),
+            ]
+
+    def test_includes_draft_screenings(self, app, setup_cinemas):
+        screening_id, _ = _create_screening(
+            app, "Rascunho", "rascunho", [date.today()], draft=True
+        )
+
+        with app.app_context():
+            bucket = get_days_schedule_by_cinema(date.today())[
+                get_cinema_by_slug("capitolio").id
+            ]
+            assert [showtime.screening_id for showtime, _times in bucket] == [
+                screening_id
+            ]
+
+
+class TestGetScheduleInRange:
+    def _screening_ids(self, include_drafts=False):
+        return {
+            showtime.screening_id
+            for showtime in get_schedule_in_range(
+                date.today(), date.today() + timedelta(days=6), include_drafts
+            )
+        }
+
+    def test_includes_a_showtime_inside_the_range(self, app, setup_cinemas):
+        screening_id, _ = _create_screening(
+            app, "Filme", "filme", [date.today() + timedelta(days=3)]
+        )
+
+        with app.app_context():
+            assert screening_id in self._screening_ids()
+
+    def test_excludes_showtimes_outside_the_range(self, app, setup_cinemas):
+        before_id, _ = _create_screening(
+            app, "Filme Passado", "filme-passado", [date.today() - timedelta(days=1)]
+        )
+        after_id, _ = _create_screening(
+            app, "Filme Futuro", "filme-futuro", [date.today() + timedelta(days=7)]
+        )
+
+        with app.app_context():
+            assert self._screening_ids().isdisjoint({before_id, after_id})
+
+    def test_includes_a_showtime_on_the_last_day_of_the_range(self, app, setup_cinemas):
+        screening_id, _ = _create_screening(
+            app, "Filme Limite", "filme-limite", [date.today() + timedelta(days=6)]
+        )
+
+        with app.app_context():
+            assert screening_id in self._screening_ids()
+
+    def test_excludes_drafts_unless_include_drafts(self, app, setup_cinemas):
+        screening_id, _ = _create_screening(
+            app, "Rascunho", "rascunho", [date.today()], draft=True
+        )
+
+        with app.app_context():
+            assert screening_id not in self._screening_ids()
+            assert screening_id in self._screening_ids(include_drafts=True)
+
+
+class TestGetScheduleForMovies:
+    def test_aggregates_showtimes_across_cinemas_for_the_same_movie(
+        self, app, setup_cinemas
+    ):
+        _screening_id, movie_id = _create_screening(
+            app, "Filme", "filme", [date.today()], cinema_slug="capitolio"
+        )
+        _create_screening(
+            app,
+            "Filme",
+            "filme",
+            [date.today() + timedelta(days=1)],
+            cinema_slug="sala-redencao",
+            movie_id=movie_id,
+        )
+
+        with app.app_context():
+            showtimes = get_schedule_for_movies(
+                [movie_id], date.today(), date.today() + timedelta(days=6)
+            )
+            assert [showtime.cinema_slug for showtime in showtimes] == [
+                "capitolio",
+                "sala-redencao",
+            ]
+
+    def test_excludes_other_movies_and_dates_outside_the_range(
+        self, app, setup_cinemas
+    ):
+        _screening_id, movie_id = _create_screening(
+            app,
+            "Filme A",
+            "filme-a",
+            [date.today(), date.today() + timedelta(days=10)],
+        )
+        _create_screening(app, "Filme B", "filme-b", [date.today()])
+
+        with app.app_context():
+            showtimes = get_schedule_for_movies(
+                [movie_id], date.today(), date.today() + timedelta(days=6)
+            )
+            assert len(showtimes) == 1
+
+    def test_excludes_drafts_unless_include_drafts(self, app, setup_cinemas):
+        _screening_id, movie_id = _create_screening(
+            app, "Rascunho", "rascunho", [date.today()], draft=True
+        )
+
+        with app.app_context():
+            window_end = date.today() + timedelta(days=6)
+            assert get_schedule_for_movies([movie_id], date.today(), window_end) == []
+            assert (
+                len(
+                    get_schedule_for_movies(
+                        [movie_id], date.today(), window_end, include_drafts=True
+                    )
+                )
+                == 1
+            )
+
+    def test_returns_empty_list_for_empty_movie_ids(self, app, setup_cinemas):
+        with app.app_context():
+            assert get_schedule_for_movies([], date.today(), date.today()) == []
+
+
+class TestGetMonthSchedule:
+    def test_filters_by_cinema_slug_and_keeps_drafts(self, app, setup_cinemas):
+        capitolio_id, _ = _create_screening(
+            app, "Rascunho", "rascunho", [date.today()], draft=True
+        )
+        _create_screening(
+            app, "Filme", "filme", [date.today()], cinema_slug="sala-redencao"
+        )
+
+        with app.app_context():
+            showtimes = get_month_schedule(["capitolio"])
+            assert [showtime.screening_id for showtime in showtimes] == [capitolio_id]
+
+
+class TestGetWeekendSchedule:
+    def test_returns_only_published_weekend_showtimes(self, app, setup_cinemas):
+        with app.app_context():
+            _showtimes, friday, saturday, _sunday = get_weekend_schedule()
+        published_id, _ = _create_screening(app, "Filme", "filme", [saturday])
+        _create_screening(app, "Rascunho", "rascunho", [friday], draft=True)
+
+        with app.app_context():
+            showtimes, *_dates = get_weekend_schedule()
+            assert [showtime.screening_id for showtime in showtimes] == [published_id]
+
+
+class TestGetUpcomingForCinema:
+    def test_lists_each_published_screening_once_by_soonest_showtime(
+        self, app, setup_cinemas
+    ):
+        later_id, _ = _create_screening(
+            app,
+            "Depois",
+            "depois",
+            [date.today() + timedelta(days=3), date.today() + timedelta(days=4)],
+        )
+        sooner_id, _ = _create_screening(
+            app, "Antes", "antes", [date.today() + timedelta(days=1)]
+        )
+        _create_screening(app, "Rascunho", "rascunho", [date.today()], draft=True)
+        _create_screening(app, "Passado", "passado", [date.today() - timedelta(days=1)])
+
+        with app.app_context():
+            showtimes = get_upcoming_for_cinema(get_cinema_by_slug("capitolio").id)
+            assert [showtime.screening_id for showtime in showtimes] == [
+                sooner_id,
+                later_id,
+            ]
+
+
+class TestReadersUseIndexes:
+    def test_no_reader_scans_the_upcoming_schedule_table(
+        self, app, setup_cinemas, captured_statements
+    ):
+        _screening_id, movie_id = _create_screening(
+            app, "Filme", "filme", [date.today()]
+        )
+        today = date.today()
+        window_end = today + timedelta(days=6)
+
+        with app.app_context():
+            cinema_id = get_cinema_by_slug("capitolio").id
+            queries = {
+                "days_schedule_by_cinema": lambda: get_days_schedule_by_cinema(today),
+                "schedule_in_range": lambda: get_schedule_in_range(today, window_end),
+                "schedule_for_movies": lambda: get_schedule_for_movies(
+                    [movie_id], today, window_end
+                ),
+                "month_schedule": get_month_schedule,
+                "month_schedule_by_slug": lambda: get_month_schedule(["capitolio"]),
+                "weekend_schedule": get_weekend_schedule,
+                "upcoming_for_cinema": lambda: get_upcoming_for_cinema(cinema_id),
+            }
+
+            scans = {}
+            for name, query in queries.items():
+                with captured_statements() as statements:
+                    query()
+                with engine.connect() as connection:
+                    for statement, parameters in statements:
+                        for row in connection.exec_driver_sql(
+                            f"EXPLAIN QUERY PLAN {statement}", parameters
+                        ):
+                            if row[-1].startswith("SCAN upcoming_schedule"):
+                                scans[name] = row[-1]
+
+        assert scans == {}
@@ -4,7 +4,7 @@ Tests the basic functionality of /admin/movies/* endpoints.
 
 from unittest.mock import patch
 
-import requests
+import httpx
 
 from flask_backend.db import db_session
 from flask_backend.models import Collection, Country, Director, Genre, Movie
@@ -92,8 +92,8 @@ class TestAdminMoviesTmdbSearch:
             movie_id = _create_movie().id
 
         with patch("flask_backend.routes.admin.movies.TMDBClient") as mock_client_cls:
-            mock_client_cls.return_value.search_movies.side_effect = (
-                requests.RequestException("boom")
+            mock_client_cls.return_value.search_movies.side_effect = httpx.ConnectError(
+                "boom"
             )
             response = auth_headers.get(f"/admin/movies/{movie_id}/tmdb-search?q=x")
 
@@ -296,7 +296,7 @@ class TestAdminMoviesTmdbLink:
 
         with patch("flask_backend.routes.admin.movies.TMDBClient") as mock_client_cls:
             mock_client_cls.return_value.get_movie_details.side_effect = (
-                requests.RequestException("boom")
+                httpx.ConnectError("boom")
             )
             response = auth_headers.post(
                 f"/admin/movies/{movie_id}/tmdb-link", json={"tmdb_id": 555}
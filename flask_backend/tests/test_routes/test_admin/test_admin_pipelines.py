@@ -110,6 +110,22 @@ class TestAdminPipelinesDetail:
         response = auth_headers.get(f"/admin/pipelines/fetch-movie-metadata/{run_id}")
         assert response.status_code == 404
 
+    def test_shows_the_run_http_counters_per_host(self, app, auth_headers):
+        with app.app_context():
+            run = pipeline_runs.start("fetch-posters")
+            run.http_stats = (
+                '{"image.tmdb.org": {"requests": 7, "errors": 2, '
+                '"avg_ms": 120.5, "max_ms": 480.0}}'
+            )
+            db_session.commit()
+            run_id = run.id
+
+        response = auth_headers.get(f"/admin/pipelines/fetch-posters/{run_id}")
+
+        assert response.status_code == 200
+        assert b"image.tmdb.org" in response.data
+        assert b"120.5" in response.data
+
     def test_shows_screenings_created_for_import_json_run(
         self, app, auth_headers, setup_cinemas
     ):
@@ -8,7 +8,14 @@ from flask import url_for
 from google.genai.errors import ClientError, ServerError
 
 from flask_backend.db import db_session
-from flask_backend.models import AlertAction, Cinema, Movie, Screening, ScreeningDate
+from flask_backend.models import (
+    AlertAction,
+    Cinema,
+    Director,
+    Movie,
+    Screening,
+    ScreeningDate,
+)
 
 
 def _get_cinema(slug="capitolio"):
@@ -94,6 +101,52 @@ class TestScreeningIndex:
         response = auth_headers.get("/")
         assert b"Filme Rascunho Logado" in response.data
 
+    def test_statement_count_does_not_grow_with_the_number_of_cinemas(
+        self, client, setup_cinemas, captured_statements
+    ):
+        counts = []
+        for extra_cinemas in (0, 3):
+            with client.application.app_context():
+                for index in range(extra_cinemas):
+                    db_session.add(
+                        Cinema(
+                            slug=f"nova-sala-{index}",
+                            name=f"Nova Sala {index}",
+                            url="https://example.com",
+                        )
+                    )
+                db_session.commit()
+                for cinema in db_session.query(Cinema).all():
+                    _create_screening(
+                        cinema_slug=cinema.slug,
+                        movie_title=f"Filme {cinema.slug} {extra_cinemas}",
+                    )
+            with captured_statements() as statements:
+                response = client.get("/")
+            assert response.status_code == 200
+            counts.append(len(statements))
+
+        assert counts[0] == counts[1]
+
+    def test_lists_a_screening_with_several_times_today_once(
+        self, client, setup_cinemas
+    ):
+        with client.application.app_context():
+            screening_id = _create_screening(
+                movie_title="Filme Duas Sessões", screening_time="15:00"
+            )
+            db_session.add(
+                ScreeningDate(
+                    screening_id=screening_id, date=date.today(), time="19:00"
+                )
+            )
+            db_session.commit()
+        response = client.get("/")
+        html = response.get_data(as_text=True)
+        assert html.count("Filme Duas Sessões") == 1
+        assert "15:00" in html
+        assert "19:00" in html
+
 
 class TestScreeningIndexAltBadge:
     def test_shows_alt_badge_when_image_alt_present(self, client, setup_cinemas):
@@ -784,6 +837,34 @@ MOBILE_UA = (
     "(KHTML, like Gecko) Version/17.4 Mobile/15E148 Safari/604.1"
 )
 
+# Upper bound on SQL statements for one reels-feed request (homepage on
+# mobile, /favoritos), however many cards it renders.
+REELS_STATEMENT_CEILING = 10
+
+
+def _create_reels_movies(title_prefix, count, screening_date=None):
+    """Seeds `count` movies, each with a director and a screening at two
+    cinemas, so every reels card has cross-cinema "next dates". Returns
+    the movie ids."""
+    screening_date = screening_date or date.today() + timedelta(days=1)
+    movie_ids = []
+    for index in range(count):
+        movie = Movie(
+            title=f"{title_prefix} {index}",
+            slug=f"{title_prefix.lower().replace(' ', '-')}-{index}",
+            directors=[Director(name=f"Diretora {title_prefix} {index}")],
+        )
+        db_session.add(movie)
+        db_session.commit()
+        for cinema_slug in ("capitolio", "sala-redencao"):
+            _create_screening(
+                cinema_slug=cinema_slug,
+                screening_date=screening_date,
+                movie_id=movie.id,
+            )
+        movie_ids.append(movie.id)
+    return movie_ids
+
 
 class TestScreeningIndexMobile:
     def test_returns_200_for_mobile_user_agent(self, client, setup_cinemas):
@@ -1036,6 +1117,24 @@ class TestScreeningIndexMobile:
             in html
         )
 
+    def test_statement_count_does_not_grow_with_the_number_of_cards(
+        self, client, setup_cinemas, captured_statements
+    ):
+        # every card reads its movie, directors, cinema and dates, plus the
+        # cinema of each cross-cinema "next date" - all of which must come
+        # from the repository's eager-load profiles, not lazy loads.
+        counts = []
+        for batch in (2, 6):
+            with client.application.app_context():
+                _create_reels_movies(f"Lote {batch}", batch)
+            with captured_statements() as statements:
+                response = client.get("/", headers={"User-Agent": MOBILE_UA})
+            assert response.status_code == 200
+            counts.append(len(statements))
+
+        assert counts[0] == counts[1]
+        assert counts[1] <= REELS_STATEMENT_CEILING
+
 
 class TestScreeningSharedLink:
     def test_mobile_with_screening_in_current_feed_renders_and_highlights_card(
@@ -1457,3 +1556,29 @@ class TestFavoritos:
         html = response.get_data(as_text=True)
 
         assert "poster-tile-badge" not in html
+
+    def test_statement_count_does_not_grow_with_the_number_of_marked_movies(
+        self, client, setup_cinemas, captured_statements
+    ):
+        from flask_backend.repository.want_to_watch import toggle
+
+        client.set_cookie("visitor_id", "visitor-a")
+        counts = []
+        for batch in (2, 6):
+            with client.application.app_context():
+                movie_ids = _create_reels_movies(
+                    f"Em Cartaz {batch}", batch
+                ) + _create_reels_movies(
+                    f"Antigo {batch}",
+                    batch,
+                    screening_date=date.today() - timedelta(days=20),
+                )
+                for movie_id in movie_ids:
+                    toggle(movie_id, "visitor-a")
+            with captured_statements() as statements:
+                response = client.get("/favoritos")
+            assert response.status_code == 200
+            counts.append(len(statements))
+
+        assert counts[0] == counts[1]
+        assert counts[1] <= REELS_STATEMENT_CEILING
@@ -1,7 +1,10 @@
+import io
 import json
 import logging
 from unittest.mock import patch
 
+from PIL import Image
+
 from flask_backend.db import db_session
 from flask_backend.models import PipelineRun, Screening
 from flask_backend.service.image_resize_pipeline import (
@@ -14,6 +17,7 @@ from flask_backend.service.movie_metadata_pipeline import (
     PipelineResult as MetadataPipelineResult,
 )
 from flask_backend.service.poster_pipeline import PipelineResult as PosterPipelineResult
+from flask_backend.service.screening import import_scrapped_results
 
 
 class TestImportJsonCommand:
@@ -74,6 +78,54 @@ class TestImportJsonCommand:
         result = runner.invoke(args=["import-json", str(json_path)])
         assert "novos horários registrados" in result.output
 
+    def test_saves_posters_from_the_download_pool(
+        self, app, runner, tmp_path, setup_cinemas
+    ):
+        """The import-json command hands the pool `current_app`, a proxy
+        pool threads can't resolve - save_image must still reach the app."""
+        payload = [
+            {
+                "url": "",
+                "cinema": "Cinemateca Capitólio",
+                "slug": "capitolio",
+                "features": [
+                    {
+                        "poster": "https://example.com/poster.jpg",
+                        "time": ["2026-08-01T19:00"],
+                        "title": "Filme com poster via CLI",
+                        "original_title": "",
+                        "price": "",
+                        "director": "",
+                        "classification": "",
+                        "general_info": "",
+                        "excerpt": "um filme",
+                        "read_more": "",
+                    }
+                ],
+            }
+        ]
+        json_path = tmp_path / "poster.json"
+        json_path.write_text(json.dumps(payload))
+        app.config["UPLOAD_FOLDER"] = str(tmp_path)
+        png = io.BytesIO()
+        Image.new("RGB", (10, 20), color="blue").save(png, format="PNG")
+        png.seek(0)
+
+        # the app context the flask CLI pushes around every command
+        with (
+            app.app_context(),
+            patch(
+                "flask_backend.service.screening.download_image_from_url",
+                return_value=(png, "poster.png"),
+            ),
+        ):
+            runner.invoke(args=["import-json", str(json_path)])
+
+        with app.app_context():
+            screening = db_session.query(Screening).one()
+            assert screening.image == "/screening/assets/poster.webp"
+            assert (tmp_path / "poster.webp").exists()
+
     def test_success_creates_pipeline_run_with_source_and_summary(
         self, app, runner, tmp_path, setup_cinemas
     ):
@@ -189,6 +241,87 @@ class TestImportJsonCommand:
             assert '"screenings_created": 0' in runs[1].summary
             assert '"dates_registered": 0' in runs[1].summary
 
+    def test_unchanged_cinemas_are_skipped(self, app, runner, tmp_path, setup_cinemas):
+        payload = [
+            {
+                "url": "",
+                "cinema": "Cinemateca Capitólio",
+                "slug": "capitolio",
+                "features": [],
+                "unchanged": True,
+            }
+        ]
+        json_path = tmp_path / "unchanged.json"
+        json_path.write_text(json.dumps(payload))
+
+        result = runner.invoke(args=["import-json", str(json_path)])
+
+        assert "sem mudanças, ignoradas: capitolio" in result.output
+        with app.app_context():
+            run = (
+                db_session.query(PipelineRun)
+                .filter_by(pipeline_name="import-json")
+                .one()
+            )
+            assert run.status == "success"
+            assert json.loads(run.summary)["cinemas_unchanged"] == ["capitolio"]
+            assert db_session.query(Screening).count() == 0
+
+    def test_cinema_with_the_last_imported_features_is_skipped(
+        self, app, runner, tmp_path, setup_cinemas
+    ):
+        feature = {
+            "poster": "",
+            "time": ["2026-08-01T19:00"],
+            "title": "Filme Repetido",
+            "original_title": "",
+            "price": "",
+            "director": "",
+            "classification": "",
+            "general_info": "",
+            "excerpt": "um filme",
+            "read_more": "",
+        }
+        payload = [
+            {
+                "url": "",
+                "cinema": "Cinemateca Capitólio",
+                "slug": "capitolio",
+                "features": [feature],
+            }
+        ]
+        json_path = tmp_path / "repeated.json"
+        json_path.write_text(json.dumps(payload))
+        runner.invoke(args=["import-json", str(json_path)])
+        with patch(
+            "flask_backend.service.runner.import_scrapped_results",
+            wraps=import_scrapped_results,
+        ) as import_results:
+            runner.invoke(args=["import-json", str(json_path)])
+            assert import_results.call_args.args[0].cinemas == []
+
+        payload[0]["features"][0]["time"] = ["2026-08-01T21:00"]
+        json_path.write_text(json.dumps(payload))
+        runner.invoke(args=["import-json", str(json_path)])
+
+        with app.app_context():
+            runs = (
+                db_session.query(PipelineRun)
+                .filter_by(pipeline_name="import-json")
+                .order_by(PipelineRun.id)
+                .all()
+            )
+            assert [
+                json.loads(run.summary).get("cinemas_unchanged") for run in runs
+            ] == [
+                None,
+                ["capitolio"],
+                None,
+            ]
+            assert runs[1].cinema_fingerprints == runs[0].cinema_fingerprints
+            assert runs[2].cinema_fingerprints != runs[0].cinema_fingerprints
+            assert db_session.query(Screening).count() == 1
+
     def test_invalid_json_marks_run_as_error(self, app, runner, tmp_path):
         json_path = tmp_path / "bad.json"
         json_path.write_text("not-valid-json{")
@@ -275,6 +408,14 @@ class TestThinWrapperCommands:
             runner.invoke(args=["delete-movie", "filme-slug", "--yes"])
         mock_fn.assert_called_once_with("filme-slug", skip_confirmation=True)
 
+    def test_rebuild_upcoming_schedule_prints_row_count(self, runner):
+        with patch(
+            "flask_backend.repository.upcoming_schedule.rebuild", return_value=3
+        ) as mock_fn:
+            result = runner.invoke(args=["rebuild-upcoming-schedule"])
+        mock_fn.assert_called_once()
+        assert "Programação reconstruída: 3 horários." in result.output
+
 
 class TestFetchPostersCommand:
     def test_prints_summary(self, runner):
@@ -6,6 +6,7 @@ from google.genai.errors import ClientError
 from flask_backend.repository import gemini_usage_events
 from flask_backend.service.gemini_quota import (
     GEMINI_MODEL_LIMITS,
+    QuotaTracker,
     RateLimitInfo,
     classify_gemini_rate_limit,
     is_available,
@@ -404,3 +405,101 @@ class TestRecordAttempt:
             side_effect=Exception("db exploded"),
         ):
             record_attempt("gemini-2.5-flash", "success", None)  # must not raise
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestQuotaTracker:
+    def test_checks_between_syncs_do_not_query_the_table(
+        self, app, captured_statements
+    ):
+        with app.app_context(), patch(
+            "flask_backend.service.gemini_quota._utcnow_naive", return_value=FROZEN_NOW
+        ):
+            gemini_usage_events.create("gemini-2.5-flash", FROZEN_NOW, "success")
+
+            with captured_statements() as statements:
+                for _ in range(3):
+                    for model_id in GEMINI_MODEL_LIMITS:
+                        is_available(model_id)
+                record_attempt("gemini-2.5-flash", "success", None)
+                seconds_until_available(list(GEMINI_MODEL_LIMITS))
+
+        selects = [sql for sql, _params in statements if sql.startswith("SELECT")]
+        assert len(selects) == 1
+
+    def test_picks_up_other_processes_events_once_the_sync_interval_passes(self, app):
+        clock = _FakeClock()
+        tracker = QuotaTracker(sync_interval_seconds=5, write_behind=False, clock=clock)
+        with app.app_context(), patch(
+            "flask_backend.service.gemini_quota.GEMINI_MODEL_LIMITS",
+            {"test-model": {"rpm": 2}},
+        ):
+            assert tracker.is_available("test-model", FROZEN_NOW) is True
+
+            for _ in range(2):
+                gemini_usage_events.create("test-model", FROZEN_NOW, "success")
+            clock.now = 4
+            assert tracker.is_available("test-model", FROZEN_NOW) is True
+
+            clock.now = 5
+            assert tracker.is_available("test-model", FROZEN_NOW) is False
+
+    def test_counts_its_own_attempts_once_after_reading_them_back(self, app):
+        clock = _FakeClock()
+        tracker = QuotaTracker(sync_interval_seconds=5, write_behind=False, clock=clock)
+        with app.app_context(), patch(
+            "flask_backend.service.gemini_quota.GEMINI_MODEL_LIMITS",
+            {"test-model": {"rpm": 3}},
+        ):
+            for _ in range(2):
+                tracker.record(
+                    {
+                        "model_id": "test-model",
+                        "occurred_at": FROZEN_NOW,
+                        "outcome": "success",
+                        "quota_metric": None,
+                        "unavailable_until": None,
+                    }
+                )
+            clock.now = 10
+
+            assert tracker.is_available("test-model", FROZEN_NOW) is True
+            assert gemini_usage_events.count_since("test-model", FROZEN_NOW) == 2
+
+    def test_write_behind_writes_from_a_background_thread(self, app):
+        tracker = QuotaTracker(write_behind=True)
+        event = {
+            "model_id": "test-model",
+            "occurred_at": FROZEN_NOW,
+            "outcome": "success",
+            "quota_metric": None,
+            "unavailable_until": None,
+        }
+        with patch(
+            "flask_backend.repository.gemini_usage_events.create_many"
+        ) as create_many:
+            tracker.record(event)
+            tracker.flush()
+
+        create_many.assert_called_once_with([event])
+
+    def test_is_available_fails_open_when_the_sync_fails(self, app):
+        with app.app_context(), patch(
+            "flask_backend.repository.gemini_usage_events.get_since",
+            side_effect=Exception("db exploded"),
+        ):
+            assert is_available("gemini-2.5-flash") is True
+
+    def test_record_attempt_swallows_a_failed_write(self, app):
+        with app.app_context(), patch(
+            "flask_backend.repository.gemini_usage_events.create_many",
+            side_effect=Exception("db exploded"),
+        ):
+            record_attempt("gemini-2.5-flash", "success", None)  # must not raise
@@ -0,0 +1,130 @@
+"""
+Tests flask_backend/service/graph_cache.py.
+"""
+
+import os
+
+from graphqlite import Graph
+
+from flask_backend.db import db_session
+from flask_backend.models import Movie
+from flask_backend.service.graph_cache import (
+    cached_query,
+    current_generation,
+    get_graph,
+)
+from flask_backend.service.graph_queries import movies_by_director
+from flask_backend.service.graph_sync import sync_graph
+
+_TITLES = "MATCH (m:Movie) RETURN m.title AS title ORDER BY m.title"
+
+
+def _titles(graph):
+    return graph.query(_TITLES)
+
+
+class TestGetGraph:
+    def test_reuses_the_handle_of_a_file(self, tmp_path):
+        db_path = str(tmp_path / "graph.db")
+
+        assert get_graph(db_path) is get_graph(db_path)
+
+    def test_reopens_a_file_replaced_on_disk(self, tmp_path):
+        db_path = str(tmp_path / "graph.db")
+        first = get_graph(db_path)
+        os.remove(db_path)
+        Graph(db_path).upsert_node("movie:1", {"title": "Nova"}, label="Movie")
+
+        second = get_graph(db_path)
+
+        assert second is not first
+        assert _titles(second) == [{"title": "Nova"}]
+
+
+class TestCachedQuery:
+    def test_reuses_results_until_the_next_sync(self, app, tmp_path):
+        with app.app_context():
+            db_session.add(Movie(title="Ariabescos", slug="ariabescos"))
+            db_session.commit()
+            db_path = str(tmp_path / "graph.db")
+            sync_graph(db_path=db_path)
+            calls = []
+
+            def run(graph):
+                calls.append(graph)
+                return _titles(graph)
+
+            first = cached_query(db_path, "titles", {}, run)
+            db_session.add(Movie(title="Chegou", slug="chegou"))
+            db_session.commit()
+            second = cached_query(db_path, "titles", {}, run)
+            sync_graph(db_path=db_path, incremental=True)
+            third = cached_query(db_path, "titles", {}, run)
+
+            assert first == second == [{"title": "Ariabescos"}]
+            assert third == [{"title": "Ariabescos"}, {"title": "Chegou"}]
+            assert len(calls) == 2
+
+    def test_keys_results_on_the_params(self, app, tmp_path):
+        with app.app_context():
+            db_path = str(tmp_path / "graph.db")
+            sync_graph(db_path=db_path)
+
+            first = cached_query(db_path, "echo", {"value": 1}, lambda _g: 1)
+            second = cached_query(db_path, "echo", {"value": 2}, lambda _g: 2)
+
+            assert (first, second) == (1, 2)
+
+    def test_hands_out_copies_of_the_cached_result(self, app, tmp_path):
+        with app.app_context():
+            db_session.add(Movie(title="Ariabescos", slug="ariabescos"))
+            db_session.commit()
+            db_path = str(tmp_path / "graph.db")
+            sync_graph(db_path=db_path)
+
+            cached_query(db_path, "titles", {}, _titles).append({"title": "x"})
+
+            assert cached_query(db_path, "titles", {}, _titles) == [
+                {"title": "Ariabescos"}
+            ]
+
+    def test_never_caches_a_graph_no_sync_stamped(self, tmp_path):
+        db_path = str(tmp_path / "graph.db")
+        graph = Graph(db_path)
+        graph.upsert_node("movie:1", {"title": "Antes"}, label="Movie")
+        cached_query(db_path, "titles", {}, _titles)
+
+        graph.upsert_node("movie:2", {"title": "Depois"}, label="Movie")
+
+        assert cached_query(db_path, "titles", {}, _titles) == [
+            {"title": "Antes"},
+            {"title": "Depois"},
+        ]
+
+    def test_serves_graph_queries_from_the_cache(self, app, tmp_path):
+        with app.app_context():
+            db_path = str(tmp_path / "graph.db")
+            sync_graph(db_path=db_path)
+            movies_by_director("Wim Wenders", db_path=db_path)
+            Graph(db_path).upsert_node("movie:1", {"title": "Fora"}, label="Movie")
+
+            assert movies_by_director("Wim Wenders", db_path=db_path) == []
+
+
+class TestGeneration:
+    def test_a_sync_that_changes_nothing_keeps_the_generation(self, app, tmp_path):
+        with app.app_context():
+            db_session.add(Movie(title="Ariabescos", slug="ariabescos"))
+            db_session.commit()
+            db_path = str(tmp_path / "graph.db")
+            sync_graph(db_path=db_path)
+            stamped = current_generation(get_graph(db_path))
+
+            sync_graph(db_path=db_path, incremental=True)
+            unchanged = current_generation(get_graph(db_path))
+            sync_graph(db_path=db_path)
+            rebuilt = current_generation(get_graph(db_path))
+
+            assert stamped is not None
+            assert unchanged == stamped
+            assert rebuilt != stamped
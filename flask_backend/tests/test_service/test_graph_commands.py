@@ -31,6 +31,19 @@ class TestSyncGraphCommand:
         assert "nós" in result.output
         assert "arestas" in result.output
 
+    def test_incremental_reports_what_changed(
+        self, app, runner, setup_cinemas, tmp_path, monkeypatch
+    ):
+        monkeypatch.setattr(
+            "flask_backend.service.graph_sync.GRAPH_DB_PATH", str(tmp_path / "graph.db")
+        )
+        runner.invoke(args=["sync-graph"])
+
+        result = runner.invoke(args=["sync-graph", "--incremental"])
+
+        assert result.exit_code == 0
+        assert "0 nós criados, 0 alterados, 0 removidos" in result.output
+
 
 class TestGraphQueryCommand:
     def test_movies_by_director_prints_matching_titles(
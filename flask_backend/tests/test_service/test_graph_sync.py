@@ -4,6 +4,7 @@ Tests flask_backend/service/graph_sync.py.
 
 from datetime import date
 
+import pytest
 from graphqlite import Graph
 
 from flask_backend.db import db_session
@@ -16,7 +17,14 @@ from flask_backend.repository.directors import (
 from flask_backend.repository.genres import (
     get_or_create_by_tmdb_id as get_or_create_genre,
 )
-from flask_backend.service.graph_sync import build_graph_data, sync_graph
+from flask_backend.service import graph_sync
+from flask_backend.service.graph_sync import (
+    SyncResult,
+    build_graph_data,
+    last_sync_seq,
+    sync_graph,
+    touched_since,
+)
 
 
 class TestGraphqliteSmokeTest:
@@ -258,3 +266,223 @@ class TestSyncGraph:
                 "MATCH (m:Movie) WHERE m.title = 'Stale' RETURN m.title AS title"
             )
             assert rows == []
+
+
+def _graph_snapshot(db_path):
+    """Every node as (label, props) and every edge as (source id, target id,
+    type), read straight from GraphQLite's tables - independent of internal
+    rowids, so a rebuilt and an incrementally synced graph compare equal."""
+    conn = Graph(db_path).connection.sqlite_connection
+    props = {}
+    for table in ("bool", "int", "real", "text"):
+        for node_id, key, value in conn.execute(
+            f"SELECT p.node_id, k.key, p.value FROM node_props_{table} p "
+            "JOIN property_keys k ON k.id = p.key_id"
+        ):
+            props.setdefault(node_id, {})[key] = value
+    labels = dict(conn.execute("SELECT node_id, label FROM node_labels"))
+    nodes = {
+        (labels[node_id], tuple(sorted(p.items()))) for node_id, p in props.items()
+    }
+    edges = {
+        (props[source]["id"], props[target]["id"], rel_type)
+        for source, target, rel_type in conn.execute(
+            "SELECT source_id, target_id, type FROM edges"
+        )
+    }
+    return nodes, edges
+
+
+class TestIncrementalSyncGraph:
+    def _movie(self, title, slug, day):
+        movie = Movie(title=title, slug=slug)
+        movie.screenings = [
+            Screening(
+                cinema_id=get_cinema_by_slug("capitolio").id,
+                description="d",
+                draft=False,
+                dates=[ScreeningDate(date=day, time="19:00")],
+            )
+        ]
+        db_session.add(movie)
+        return movie
+
+    def test_converges_to_the_same_graph_as_a_rebuild(
+        self, app, setup_cinemas, tmp_path
+    ):
+        with app.app_context():
+            genre = get_or_create_genre(1, "Drama")
+            kept = self._movie("Ariabescos", "ariabescos", date(2026, 8, 1))
+            kept.genres = [genre]
+            dropped = self._movie("Saiu", "saiu", date(2026, 8, 2))
+            db_session.commit()
+
+            incremental_path = str(tmp_path / "incremental.db")
+            sync_graph(db_path=incremental_path, incremental=True)
+
+            # an edit, a draft toggle, a new date, a removed genre, a new
+            # movie and a deleted one
+            kept.title = "Ariabescos (2026)"
+            kept.genres = []
+            kept.screenings[0].draft = True
+            kept.screenings[0].dates.append(
+                ScreeningDate(date=date(2026, 8, 3), time="21:00")
+            )
+            self._movie("Chegou", "chegou", date(2026, 8, 4))
+            for screening in dropped.screenings:
+                for screening_date in screening.dates:
+                    db_session.delete(screening_date)
+                db_session.delete(screening)
+            db_session.delete(dropped)
+            db_session.commit()
+
+            result = sync_graph(db_path=incremental_path, incremental=True)
+            rebuilt_path = str(tmp_path / "rebuilt.db")
+            sync_graph(db_path=rebuilt_path)
+
+            assert _graph_snapshot(incremental_path) == _graph_snapshot(rebuilt_path)
+            # new: movie + screening + date of "Chegou", and the new date
+            assert result.nodes_created == 4
+            # "Ariabescos" and its screening
+            assert result.nodes_updated == 2
+            # "Saiu", its screening and its date
+            assert result.nodes_deleted == 3
+            # HAS_GENRE, plus "Saiu"'s HAS_SCREENING/AT_CINEMA/HAS_DATE
+            assert result.edges_deleted == 4
+            # "Chegou"'s three edges and the new HAS_DATE
+            assert result.edges_created == 4
+
+    def test_writes_nothing_when_nothing_changed(self, app, setup_cinemas, tmp_path):
+        with app.app_context():
+            self._movie("Ariabescos", "ariabescos", date(2026, 8, 1))
+            db_session.commit()
+            db_path = str(tmp_path / "graph.db")
+            sync_graph(db_path=db_path)
+
+            result = sync_graph(db_path=db_path, incremental=True)
+
+            assert result == SyncResult(nodes_created=0, edges_created=0)
+
+    def test_rebuilds_a_graph_no_sync_has_recorded(self, app, tmp_path):
+        with app.app_context():
+            db_path = str(tmp_path / "graph.db")
+            Graph(db_path).upsert_node(
+                "movie:999999", {"title": "Stale"}, label="Movie"
+            )
+            movie = Movie(title="Filme Real", slug="filme-real")
+            db_session.add(movie)
+            db_session.commit()
+
+            result = sync_graph(db_path=db_path, incremental=True)
+
+            nodes, _edges = _graph_snapshot(db_path)
+            assert [
+                dict(props)["title"] for label, props in nodes if label == "Movie"
+            ] == ["Filme Real"]
+            assert result.nodes_created == len(nodes)
+
+
+class TestSyncLog:
+    def test_tells_what_incremental_syncs_touched_until_a_rebuild(
+        self, app, setup_cinemas, tmp_path
+    ):
+        with app.app_context():
+            genre = get_or_create_genre(1, "Drama")
+            movie = Movie(title="Ariabescos", slug="ariabescos")
+            movie.genres = [genre]
+            movie.screenings = [
+                Screening(
+                    cinema_id=get_cinema_by_slug("capitolio").id,
+                    description="d",
+                    draft=False,
+                    dates=[ScreeningDate(date=date(2026, 8, 1), time="19:00")],
+                )
+            ]
+            untouched = Movie(title="Intocado", slug="intocado")
+            db_session.add_all([movie, untouched])
+            db_session.commit()
+            db_path = str(tmp_path / "graph.db")
+            sync_graph(db_path=db_path)
+            conn = Graph(db_path).connection.sqlite_connection
+            synced = last_sync_seq(conn)
+
+            movie.screenings[0].draft = True
+            movie.genres = []
+            db_session.commit()
+            sync_graph(db_path=db_path, incremental=True)
+            # a sync that writes nothing logs nothing
+            sync_graph(db_path=db_path, incremental=True)
+
+            assert touched_since(conn, synced) == {
+                f"movie:{movie.id}",
+                f"screening:{movie.screenings[0].id}",
+                f"genre:{genre.id}",
+            }
+            assert touched_since(conn, last_sync_seq(conn)) == set()
+
+            sync_graph(db_path=db_path)
+
+            assert touched_since(conn, synced) is None
+
+    def test_an_unlogged_graph_has_no_position(self, tmp_path):
+        graph = Graph(str(tmp_path / "graph.db"))
+
+        assert last_sync_seq(graph.connection.sqlite_connection) is None
+
+
+class TestStreamedSyncGraph:
+    def _movies(self, count, first=0):
+        movies = []
+        for index in range(first, first + count):
+            movie = Movie(title=f"Filme {index}", slug=f"filme-{index}")
+            movie.screenings = [
+                Screening(
+                    cinema_id=get_cinema_by_slug("capitolio").id,
+                    description="d",
+                    draft=False,
+                    dates=[ScreeningDate(date=date(2026, 8, 1 + index), time="19:00")],
+                )
+            ]
+            db_session.add(movie)
+            movies.append(movie)
+        db_session.commit()
+        return movies
+
+    def test_small_chunks_build_the_same_graph(
+        self, app, setup_cinemas, tmp_path, monkeypatch
+    ):
+        with app.app_context():
+            movies = self._movies(5)
+            whole_path = str(tmp_path / "whole.db")
+            sync_graph(db_path=whole_path)
+
+            monkeypatch.setattr(graph_sync, "GRAPH_SYNC_CHUNK_SIZE", 2)
+            chunked_path = str(tmp_path / "chunked.db")
+            sync_graph(db_path=chunked_path)
+            self._movies(1, first=5)
+            movies[0].title = "Filme zero"
+            db_session.commit()
+            sync_graph(db_path=chunked_path, incremental=True)
+            sync_graph(db_path=whole_path)
+
+            assert _graph_snapshot(chunked_path) == _graph_snapshot(whole_path)
+
+    def test_a_failed_rebuild_keeps_the_previous_graph(
+        self, app, setup_cinemas, tmp_path, monkeypatch
+    ):
+        with app.app_context():
+            self._movies(3)
+            db_path = str(tmp_path / "graph.db")
+            sync_graph(db_path=db_path)
+            before = _graph_snapshot(db_path)
+
+            def failing_edges():
+                raise RuntimeError("database went away")
+                yield
+
+            monkeypatch.setattr(graph_sync, "GRAPH_SYNC_CHUNK_SIZE", 2)
+            monkeypatch.setattr(graph_sync, "iter_graph_edges", failing_edges)
+            with pytest.raises(RuntimeError):
+                sync_graph(db_path=db_path)
+
+            assert _graph_snapshot(db_path) == before
@@ -81,6 +81,25 @@ class TestDetectMotifsCommand:
         assert payload[0]["motif_name"] == "director_focus"
         assert "evidence" in payload[0]
 
+    def test_timings_flag_prints_the_time_of_each_motif(
+        self, app, runner, setup_cinemas, tmp_path, monkeypatch
+    ):
+        db_path = str(tmp_path / "graph.db")
+        monkeypatch.setattr("flask_backend.service.graph_sync.GRAPH_DB_PATH", db_path)
+        monkeypatch.setattr(
+            "flask_backend.service.motif_ranking.GRAPH_DB_PATH", db_path
+        )
+        with app.app_context():
+            self._seed_two_movies_by_same_director()
+            sync_graph()
+
+        result = runner.invoke(args=["detect-motifs", "--timings"])
+
+        assert result.exit_code == 0
+        assert "screening_facts: " in result.output
+        assert "director_return: " in result.output
+        assert "Wim Wenders" in result.output
+
     def test_limit_option_caps_the_number_of_results(
         self, app, runner, setup_cinemas, tmp_path, monkeypatch
     ):
@@ -0,0 +1,91 @@
+"""
+Tests flask_backend/service/motif_facts.py.
+"""
+
+from datetime import date, timedelta
+
+from graphqlite import Graph
+
+from flask_backend.db import db_session
+from flask_backend.models import Movie, Screening, ScreeningDate
+from flask_backend.repository.cinemas import get_by_slug as get_cinema_by_slug
+from flask_backend.repository.genres import (
+    get_or_create_by_tmdb_id as get_or_create_genre,
+)
+from flask_backend.service.graph_sync import sync_graph
+from flask_backend.service.motif_facts import NO_DATE, load_screening_facts
+
+
+def _screening(days_from_today, draft=False):
+    return Screening(
+        cinema_id=get_cinema_by_slug("capitolio").id,
+        description="d",
+        draft=draft,
+        dates=[
+            ScreeningDate(date=date.today() + timedelta(days=days), time="19:00")
+            for days in days_from_today
+        ],
+    )
+
+
+class TestLoadScreeningFacts:
+    def test_keeps_each_movies_first_current_and_last_past_date(
+        self, app, setup_cinemas, tmp_path
+    ):
+        with app.app_context():
+            movie = Movie(title="Ariabescos", slug="ariabescos")
+            movie.screenings = [_screening([-30, -3, 0, 5])]
+            db_session.add(movie)
+            db_session.commit()
+            db_path = str(tmp_path / "graph.db")
+            sync_graph(db_path=db_path)
+
+            facts = load_screening_facts(Graph(db_path))
+
+            today = date.today().toordinal()
+            assert facts.titles == ["Ariabescos"]
+            assert sorted(facts.date_ordinal) == [
+                today - 30,
+                today - 3,
+                today,
+                today + 5,
+            ]
+            assert list(facts.date_movie) == [0, 0, 0, 0]
+            assert facts.first_current[0] == today
+            assert facts.last_past[0] == today - 3
+
+    def test_leaves_out_draft_screenings(self, app, setup_cinemas, tmp_path):
+        with app.app_context():
+            movie = Movie(title="Rascunho", slug="rascunho")
+            movie.screenings = [_screening([1], draft=True), _screening([-10])]
+            db_session.add(movie)
+            db_session.commit()
+            db_path = str(tmp_path / "graph.db")
+            sync_graph(db_path=db_path)
+
+            facts = load_screening_facts(Graph(db_path))
+
+            assert not facts.is_current(0)
+            assert facts.first_current[0] == NO_DATE
+            assert len(facts.date_ordinal) == 1
+
+    def test_links_movies_to_their_entities(self, app, setup_cinemas, tmp_path):
+        with app.app_context():
+            drama = get_or_create_genre(1, "Drama")
+            first = Movie(title="Um", slug="um")
+            first.genres = [drama]
+            second = Movie(title="Dois", slug="dois")
+            second.genres = [drama, get_or_create_genre(2, "Comédia")]
+            db_session.add_all([first, second])
+            db_session.commit()
+            db_path = str(tmp_path / "graph.db")
+            sync_graph(db_path=db_path)
+
+            facts = load_screening_facts(Graph(db_path))
+
+            genres = facts.genres
+            by_name = {
+                genres.names[entity]: [facts.titles[movie] for movie in movies]
+                for entity, movies in genres.movies_by_entity().items()
+            }
+            assert by_name == {"Drama": ["Um", "Dois"], "Comédia": ["Dois"]}
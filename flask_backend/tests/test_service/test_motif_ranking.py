@@ -2,6 +2,8 @@
 Tests flask_backend/service/motif_ranking.py.
 """
 
+import copy
+from collections import Counter
 from datetime import date, timedelta
 
 from flask_backend.db import db_session
@@ -11,6 +13,8 @@ from flask_backend.repository.countries import get_or_create_by_iso_code
 from flask_backend.repository.directors import (
     get_or_create_by_tmdb_id as get_or_create_director,
 )
+from flask_backend.scripts.motif_ranking_benchmark import synthetic_observations
+from flask_backend.service import motif_ranking
 from flask_backend.service.graph_sync import sync_graph
 from flask_backend.service.motif_ranking import rank_observations, run_motifs
 from flask_backend.service.motifs import GraphEvidence, Observation
@@ -80,6 +84,87 @@ class TestRankObservations:
 
         assert len(ranked) == 2
 
+    def test_merges_into_the_first_kept_entry_it_overlaps(self):
+        today = date.today().isoformat()
+        far_future = (date.today() + timedelta(days=90)).isoformat()
+        first = _observation("m1", ["a", "b", "c"], today)
+        second = _observation("m2", ["c", "d", "e"], today)
+        # half of its evidence overlaps each of them
+        late = _observation("m3", ["b", "c", "d"], far_future)
+
+        ranked = rank_observations([late, first, second])
+
+        assert [o.motif_name for o in ranked] == ["m1", "m2"]
+        assert ranked[0].metadata["merged_from"] == ["m3"]
+        assert "merged_from" not in ranked[1].metadata
+
+    def test_never_merges_observations_without_evidence_nodes(self):
+        today = date.today().isoformat()
+
+        ranked = rank_observations(
+            [_observation("m1", [], today), _observation("m2", [], today)]
+        )
+
+        assert len(ranked) == 2
+
+    def test_matches_a_pairwise_comparison_of_node_sets(self):
+        observations = synthetic_observations(300, seed=7)
+        expected = _pairwise_ranking(copy.deepcopy(observations))
+
+        ranked = rank_observations(observations)
+
+        assert [(o.headline, o.score, o.metadata) for o in ranked] == [
+            (o.headline, o.score, o.metadata) for o in expected
+        ]
+
+
+def _pairwise_ranking(observations):
+    """The ranking computed the plain way - one score at a time and every
+    observation's node set against every kept one's - for comparison."""
+    counts = Counter(o.motif_name for o in observations)
+    today = date.today()
+    for o in observations:
+        days_until = (
+            date.fromisoformat(o.metadata["next_screening_date"]) - today
+        ).days
+        if days_until <= motif_ranking.TIMELINESS_FULL_SCORE_DAYS:
+            timeliness = 1.0
+        elif days_until >= motif_ranking.TIMELINESS_ZERO_SCORE_DAYS:
+            timeliness = 0.0
+        else:
+            span = (
+                motif_ranking.TIMELINESS_ZERO_SCORE_DAYS
+                - motif_ranking.TIMELINESS_FULL_SCORE_DAYS
+            )
+            timeliness = (
+                1.0 - (days_until - motif_ranking.TIMELINESS_FULL_SCORE_DAYS) / span
+            )
+        o.score = (
+            motif_ranking.RARITY_WEIGHT * (1 / counts[o.motif_name])
+            + motif_ranking.TIMELINESS_WEIGHT * timeliness
+            + motif_ranking.GRAPH_COMPLEXITY_WEIGHT
+            * min(len(o.evidence.nodes) / motif_ranking.GRAPH_COMPLEXITY_NODE_CAP, 1.0)
+        )
+
+    kept = []
+    for o in sorted(observations, key=lambda o: o.score, reverse=True):
+        nodes = set(o.evidence.nodes)
+        match = next(
+            (
+                k
+                for k in kept
+                if len(nodes & set(k.evidence.nodes))
+                / len(nodes | set(k.evidence.nodes))
+                >= motif_ranking.DEDUP_JACCARD_THRESHOLD
+            ),
+            None,
+        )
+        if match is None:
+            kept.append(o)
+        else:
+            match.metadata.setdefault("merged_from", []).append(o.motif_name)
+    return kept
+
 
 class TestRunMotifs:
     def test_returns_ranked_observations_from_a_real_graph(
@@ -127,6 +212,28 @@ class TestRunMotifs:
             assert observations[0].motif_name == "director_focus"
             assert observations[0].score > 0
 
+    def test_reuses_detections_until_the_next_sync(
+        self, app, setup_cinemas, tmp_path, monkeypatch
+    ):
+        with app.app_context():
+            db_path = str(tmp_path / "graph.db")
+            sync_graph(db_path=db_path)
+            detections = []
+
+            def detect_incremental(graph):
+                detections.append(graph)
+                return [], {}
+
+            monkeypatch.setattr(motif_ranking, "detect_incremental", detect_incremental)
+
+            run_motifs(db_path=db_path)
+            run_motifs(db_path=db_path)
+            assert len(detections) == 1
+
+            sync_graph(db_path=db_path)
+            run_motifs(db_path=db_path)
+            assert len(detections) == 2
+
     def test_country_focus_does_not_swallow_an_unrelated_anniversary(
         self, app, setup_cinemas, tmp_path
     ):
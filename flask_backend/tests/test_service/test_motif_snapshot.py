@@ -0,0 +1,194 @@
+"""
+Tests flask_backend/service/motif_snapshot.py.
+"""
+
+from datetime import date, timedelta
+
+from graphqlite import Graph
+
+from flask_backend.db import db_session
+from flask_backend.models import Movie, Screening, ScreeningDate
+from flask_backend.repository.cinemas import get_by_slug as get_cinema_by_slug
+from flask_backend.repository.countries import get_or_create_by_iso_code
+from flask_backend.repository.directors import (
+    get_or_create_by_tmdb_id as get_or_create_director,
+)
+from flask_backend.repository.genres import (
+    get_or_create_by_tmdb_id as get_or_create_genre,
+)
+from flask_backend.service import motif_snapshot, motifs
+from flask_backend.service.graph_sync import sync_graph
+from flask_backend.service.motif_facts import load_screening_facts
+from flask_backend.service.motif_snapshot import detect_incremental
+from flask_backend.service.motifs import detect_all
+
+TODAY = date(2026, 8, 10)
+
+
+def _screening(*days_from_today, draft=False):
+    return Screening(
+        cinema_id=get_cinema_by_slug("capitolio").id,
+        description="d",
+        draft=draft,
+        dates=[
+            ScreeningDate(date=TODAY + timedelta(days=days), time="19:00")
+            for days in days_from_today
+        ],
+    )
+
+
+def _catalog():
+    """Two directors, a shared genre and country, a director return and an
+    anniversary."""
+    wenders = get_or_create_director(1, "Wim Wenders")
+    varda = get_or_create_director(2, "Agnès Varda")
+    drama = get_or_create_genre(1, "Drama")
+    germany = get_or_create_by_iso_code("DE", "Germany")
+    movies = {
+        "paris": Movie(title="Paris, Texas", slug="paris", release_year=1986),
+        "days": Movie(title="Perfect Days", slug="days"),
+        "wings": Movie(title="Asas do Desejo", slug="wings"),
+        "cleo": Movie(title="Cléo de 5 à 7", slug="cleo"),
+        "gleaners": Movie(title="Os Catadores", slug="gleaners"),
+    }
+    for key in ("paris", "days", "wings"):
+        movies[key].directors = [wenders]
+        movies[key].countries = [germany]
+        movies[key].genres = [drama]
+    for key in ("cleo", "gleaners"):
+        movies[key].directors = [varda]
+        movies[key].genres = [drama]
+    movies["paris"].screenings = [_screening(0, 3)]
+    movies["days"].screenings = [_screening(1)]
+    movies["wings"].screenings = [_screening(-300)]
+    movies["cleo"].screenings = [_screening(-200), _screening(2)]
+    movies["gleaners"].screenings = [_screening(0)]
+    db_session.add_all(movies.values())
+    db_session.commit()
+    return movies
+
+
+def _add_date(movie, days_from_today):
+    movie.screenings[0].dates.append(
+        ScreeningDate(date=TODAY + timedelta(days=days_from_today), time="21:00")
+    )
+
+
+def _delete(movie):
+    for screening in movie.screenings:
+        for screening_date in screening.dates:
+            db_session.delete(screening_date)
+        db_session.delete(screening)
+    db_session.delete(movie)
+
+
+def _assert_same_as_a_full_run(graph, today=TODAY):
+    observations, _timings = detect_incremental(graph, today)
+    expected, _timings = detect_all(graph, today)
+    assert observations == expected
+    return observations
+
+
+class TestDetectIncremental:
+    def test_matches_a_full_run_after_every_kind_of_edit(
+        self, app, setup_cinemas, tmp_path
+    ):
+        with app.app_context():
+            movies = _catalog()
+            db_path = str(tmp_path / "graph.db")
+            sync_graph(db_path=db_path)
+            graph = Graph(db_path)
+            observations = _assert_same_as_a_full_run(graph)
+            assert {o.motif_name for o in observations} == {
+                motif.name for motif in motifs.MOTIF_REGISTRY
+            }
+
+            edits = [
+                lambda: setattr(movies["days"].screenings[0], "draft", True),
+                lambda: _add_date(movies["wings"], 4),
+                lambda: setattr(movies["cleo"], "title", "Cléo das 5 às 7"),
+                lambda: setattr(movies["paris"], "directors", []),
+                lambda: setattr(movies["days"].screenings[0], "draft", False),
+                lambda: setattr(
+                    movies["gleaners"].directors[0], "name", "Agnès Varda (1928)"
+                ),
+                lambda: _delete(movies["gleaners"]),
+            ]
+            for edit in edits:
+                edit()
+                db_session.commit()
+                sync_graph(db_path=db_path, incremental=True)
+                _assert_same_as_a_full_run(graph)
+
+    def test_matches_a_full_run_as_the_days_go_by(self, app, setup_cinemas, tmp_path):
+        with app.app_context():
+            _catalog()
+            db_path = str(tmp_path / "graph.db")
+            sync_graph(db_path=db_path)
+            graph = Graph(db_path)
+
+            for days in range(5):
+                _assert_same_as_a_full_run(graph, TODAY + timedelta(days=days))
+
+    def test_reads_the_dates_of_touched_movies_only(
+        self, app, setup_cinemas, tmp_path, monkeypatch
+    ):
+        with app.app_context():
+            movies = _catalog()
+            db_path = str(tmp_path / "graph.db")
+            sync_graph(db_path=db_path)
+            graph = Graph(db_path)
+            detect_incremental(graph, TODAY)
+            _add_date(movies["wings"], 4)
+            db_session.commit()
+            sync_graph(db_path=db_path, incremental=True)
+            reads = []
+
+            def load(graph, today=None, movies=None, known=None):
+                facts = load_screening_facts(graph, today, movies, known)
+                reads.append(facts)
+                return facts
+
+            monkeypatch.setattr(motif_snapshot, "load_screening_facts", load)
+
+            _assert_same_as_a_full_run(graph)
+
+            [facts] = reads
+            # Wenders' and Drama's movies, and the dates of "Asas do Desejo"
+            assert len(facts.movie_ids) == 5
+            assert len(facts.date_ordinal) == 2
+
+    def test_starts_over_when_the_motif_versions_change(
+        self, app, setup_cinemas, tmp_path, monkeypatch
+    ):
+        with app.app_context():
+            _catalog()
+            db_path = str(tmp_path / "graph.db")
+            sync_graph(db_path=db_path)
+            graph = Graph(db_path)
+            detect_incremental(graph, TODAY)
+            reads = []
+            monkeypatch.setattr(
+                motif_snapshot,
+                "load_screening_facts",
+                lambda graph, today=None, movies=None, known=None: (
+                    reads.append(movies)
+                    or load_screening_facts(graph, today, movies, known)
+                ),
+            )
+
+            detect_incremental(graph, TODAY)
+            monkeypatch.setattr(motifs.AnniversaryMotif, "version", "2.0")
+            detect_incremental(graph, TODAY)
+
+            # nothing touched, then a full read
+            assert reads == [set(), None]
+
+    def test_keeps_no_snapshot_of_a_graph_without_a_sync_log(self, tmp_path):
+        graph = Graph(str(tmp_path / "graph.db"))
+        graph.upsert_node("movie:1", {"title": "Solto"}, label="Movie")
+
+        assert detect_incremental(graph, TODAY)[0] == []
+        assert not graph.connection.sqlite_connection.execute(
+            "SELECT name FROM sqlite_master WHERE name = 'motif_snapshot'"
+        ).fetchone()
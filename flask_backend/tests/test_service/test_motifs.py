@@ -16,8 +16,11 @@ from flask_backend.repository.directors import (
 from flask_backend.repository.genres import (
     get_or_create_by_tmdb_id as get_or_create_genre,
 )
+from flask_backend.service import motifs
 from flask_backend.service.graph_sync import sync_graph
+from flask_backend.service.motif_facts import load_screening_facts
 from flask_backend.service.motifs import (
+    FACTS_TIMING,
     MOTIF_REGISTRY,
     AnniversaryMotif,
     CountryFocusMotif,
@@ -25,6 +28,7 @@ from flask_backend.service.motifs import (
     DirectorReturnMotif,
     GenreFocusMotif,
     _dedupe_preserve_order,
+    detect_all,
 )
 
 
@@ -385,3 +389,92 @@ class TestMotifRegistry:
             "anniversary",
         }
         assert len(MOTIF_REGISTRY) == 5
+
+
+class TestDetectAll:
+    def test_evaluates_every_motif_from_one_read_of_the_facts(
+        self, app, setup_cinemas, tmp_path, monkeypatch
+    ):
+        with app.app_context():
+            director = get_or_create_director(1, "Wim Wenders")
+            movie_a = Movie(
+                title="Paris, Texas",
+                slug="paris-texas",
+                release_year=date.today().year - 40,
+            )
+            movie_a.directors = [director]
+            movie_a.screenings = [_screening("capitolio", 1)]
+            movie_b = Movie(title="Perfect Days", slug="perfect-days")
+            movie_b.directors = [director]
+            movie_b.screenings = [_screening("capitolio", 2)]
+            db_session.add_all([movie_a, movie_b])
+            db_session.commit()
+
+            db_path = str(tmp_path / "graph.db")
+            sync_graph(db_path=db_path)
+            graph = Graph(db_path)
+            expected = [
+                observation
+                for motif in MOTIF_REGISTRY
+                for observation in motif.detect(graph)
+            ]
+            reads = []
+            monkeypatch.setattr(
+                motifs,
+                "load_screening_facts",
+                lambda graph, today=None: (
+                    reads.append(graph) or load_screening_facts(graph, today)
+                ),
+            )
+
+            observations, timings = detect_all(graph)
+
+            assert observations == expected
+            assert {o.motif_name for o in observations} == {
+                "director_focus",
+                "anniversary",
+            }
+            assert len(reads) == 1
+            assert set(timings) == {
+                FACTS_TIMING,
+                *(motif.name for motif in MOTIF_REGISTRY),
+            }
+
+    def test_records_a_runnable_cypher_query_as_evidence(
+        self, app, setup_cinemas, tmp_path
+    ):
+        with app.app_context():
+            director = get_or_create_director(1, "Wim Wenders")
+            movie_a = Movie(
+                title="Paris, Texas",
+                slug="paris-texas",
+                release_year=date.today().year - 40,
+            )
+            movie_a.directors = [director]
+            movie_a.screenings = [
+                _screening("capitolio", -200),
+                _screening("capitolio", 1),
+            ]
+            movie_b = Movie(title="Perfect Days", slug="perfect-days")
+            movie_b.directors = [director]
+            movie_b.screenings = [_screening("capitolio", 2)]
+            db_session.add_all([movie_a, movie_b])
+            db_session.commit()
+
+            db_path = str(tmp_path / "graph.db")
+            sync_graph(db_path=db_path)
+            graph = Graph(db_path)
+            observations, _timings = detect_all(graph)
+
+            assert {o.motif_name for o in observations} == {
+                "director_focus",
+                "director_return",
+                "anniversary",
+            }
+            for observation in observations:
+                query = observation.evidence.query
+                assert "{" not in query
+                rows = graph.query(
+                    query, {"today": date.today().isoformat(), "threshold": 2}
+                )
+                assert rows
@@ -1,8 +1,8 @@
 import json
 from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
-import requests
 
 from flask_backend.db import db_session
 from flask_backend.models import Director, Movie
@@ -131,7 +131,7 @@ class TestRunSearchTmdbCandidates:
             with patch.object(
                 movie_inspector.TMDBClient,
                 "search_movies",
-                side_effect=requests.RequestException("timeout"),
+                side_effect=httpx.ReadTimeout("timeout"),
             ):
                 observation, ids = movie_inspector._run_search_tmdb_candidates("Xyz")
 
@@ -166,7 +166,7 @@ class TestRunGetTmdbDetails:
             with patch.object(
                 movie_inspector.TMDBClient,
                 "get_movie_details",
-                side_effect=requests.RequestException("timeout"),
+                side_effect=httpx.ReadTimeout("timeout"),
             ):
                 observation, ids = movie_inspector._run_get_tmdb_details(1)
 
@@ -229,7 +229,7 @@ class TestRunFetchScreeningSource:
             )
             response.raise_for_status = MagicMock()
             with patch(
-                "flask_backend.service.movie_inspector.requests.get",
+                "flask_backend.service.movie_inspector.http_client.get",
                 return_value=response,
             ):
                 observation = movie_inspector._run_fetch_screening_source(screening.id)
@@ -256,8 +256,8 @@ class TestRunFetchScreeningSource:
             db_session.commit()
 
             with patch(
-                "flask_backend.service.movie_inspector.requests.get",
-                side_effect=requests.RequestException("timeout"),
+                "flask_backend.service.movie_inspector.http_client.get",
+                side_effect=httpx.ReadTimeout("timeout"),
             ):
                 observation = movie_inspector._run_fetch_screening_source(screening.id)
 
@@ -12,6 +12,7 @@ from flask_backend.models import (
 )
 from flask_backend.service.movie_metadata_pipeline import (
     apply_tmdb_details,
+    get_manual_review_summary,
     run_pipeline,
 )
 
@@ -393,3 +394,139 @@ class TestRunPipeline:
             assert result.processed == 0
             tmdb_client.search_movie.assert_not_called()
             tmdb_client.get_movie_details.assert_not_called()
+
+
+class TestAttemptStatePreloading:
+    def test_dry_run_skips_attempted_movies_in_two_queries(
+        self, client, app, captured_statements
+    ):
+        with client.application.app_context():
+            movies = [_create_movie(f"Filme {i}", f"filme-{i}") for i in range(4)]
+            db_session.add(
+                MovieMetadataFetchAttempt(
+                    movie_id=movies[0].id,
+                    source="tmdb",
+                    status="not_found",
+                    attempted_at=datetime.now(),
+                )
+            )
+            db_session.commit()
+
+            with captured_statements() as statements:
+                result = run_pipeline(dry_run=True)
+
+        assert result.processed == 3
+        assert result.skipped_all_sources_tried == 1
+        assert len(statements) == 2
+
+    def test_manual_review_summary_reports_the_latest_attempt(self, client, app):
+        with client.application.app_context():
+            first = _create_movie("Primeiro", "primeiro")
+            second = _create_movie("Segundo", "segundo")
+            _create_movie("Nunca Tentado", "nunca-tentado")
+            db_session.add_all(
+                MovieMetadataFetchAttempt(
+                    movie_id=movie_id,
+                    source="tmdb",
+                    status=status,
+                    error_message=error_message,
+                    attempted_at=datetime.now(),
+                )
+                for movie_id, status, error_message in (
+                    (first.id, "error", "timeout"),
+                    (first.id, "not_found", None),
+                    (second.id, "error", "HTTP 500"),
+                )
+            )
+            db_session.commit()
+
+            summary = get_manual_review_summary()
+
+        by_title = {entry["movie_title"]: entry for entry in summary}
+        assert set(by_title) == {"Primeiro", "Segundo"}
+        assert by_title["Primeiro"]["status"] == "not_found"
+        assert by_title["Primeiro"]["error_message"] is None
+        assert by_title["Segundo"]["error_message"] == "HTTP 500"
+
+
+def _details_for(index):
+    return {
+        "genres": [{"id": 28, "name": "Ação"}],
+        "directors": [{"id": 1000 + index, "name": f"Diretora {index}"}],
+        "countries": [{"iso_3166_1": "BR", "name": "Brazil"}],
+        "collection": {"id": 500 + index, "name": f"Coleção {index}"},
+    }
+
+
+def _tmdb_client_by_title():
+    """A TMDB client whose answers depend on the title: "Filme N" is found
+    as TMDB id N with _details_for(N)."""
+    client = Mock()
+    client.search_movie.side_effect = lambda title: {"id": int(title.split()[-1])}
+    client.get_movie_details.side_effect = _details_for
+    return client
+
+
+class TestBatchedEnrichment:
+    def test_applies_every_movie_with_several_workers(self, client, app):
+        with client.application.app_context():
+            movie_ids = [_create_movie(f"Filme {i}", f"filme-{i}").id for i in range(6)]
+
+            with patch(
+                "flask_backend.service.movie_metadata_pipeline.TMDBClient",
+                return_value=_tmdb_client_by_title(),
+            ):
+                result = run_pipeline(workers=4, pipeline_run_id=3)
+
+            assert result.metadata_found == 6
+            for index, movie_id in enumerate(movie_ids):
+                movie = db_session.get(Movie, movie_id)
+                assert movie.tmdb_id == index
+                assert [d.name for d in movie.directors] == [f"Diretora {index}"]
+                assert movie.collection.name == f"Coleção {index}"
+            assert db_session.query(Genre).count() == 1
+            assert db_session.query(Country).count() == 1
+            attempts = db_session.query(MovieMetadataFetchAttempt).all()
+            assert {attempt.pipeline_run_id for attempt in attempts} == {3}
+
+    def test_queries_do_not_grow_with_the_batch(self, client, app, captured_statements):
+        def statements_for(indexes):
+            for i in indexes:
+                _create_movie(f"Filme {i}", f"filme-{i}")
+            with (
+                patch(
+                    "flask_backend.service.movie_metadata_pipeline.TMDBClient",
+                    return_value=_tmdb_client_by_title(),
+                ),
+                captured_statements() as statements,
+            ):
+                result = run_pipeline()
+            assert result.metadata_found == len(indexes)
+            return len(statements)
+
+        with client.application.app_context():
+            small = statements_for(range(2))
+            large = statements_for(range(2, 12))
+
+        assert large <= small
+
+    def test_commits_once_per_batch(self, client, app):
+        with client.application.app_context():
+            for i in range(5):
+                _create_movie(f"Filme {i}", f"filme-{i}")
+
+            with (
+                patch(
+                    "flask_backend.service.movie_metadata_pipeline.TMDBClient",
+                    return_value=_tmdb_client_by_title(),
+                ),
+                patch(
+                    "flask_backend.service.movie_metadata_pipeline.METADATA_BATCH_SIZE",
+                    2,
+                ),
+                patch.object(db_session, "commit", wraps=db_session.commit) as commit,
+            ):
+                result = run_pipeline(workers=2)
+
+            assert result.metadata_found == 5
+            assert commit.call_count == 3
@@ -1,5 +1,8 @@
+from datetime import datetime
 from unittest.mock import patch
 
+from flask import current_app
+
 from flask_backend.db import db_session
 from flask_backend.models import Cinema, Movie, PosterFetchAttempt, Screening
 from flask_backend.service.poster_pipeline import (
@@ -308,3 +311,180 @@ class TestGetManualReviewSummary:
         with client.application.app_context():
             summary = get_manual_review_summary()
         assert summary == []
+
+
+class TestAttemptStatePreloading:
+    def test_dry_run_plans_the_run_in_two_queries(
+        self, client, app, setup_cinemas, captured_statements
+    ):
+        with client.application.app_context():
+            screening_ids = [
+                _create_screening_without_poster(title=f"filme-{index}")
+                for index in range(4)
+            ]
+            db_session.add(
+                PosterFetchAttempt(
+                    screening_id=screening_ids[0],
+                    source="tmdb",
+                    status="not_found",
+                    attempted_at=datetime.now(),
+                )
+            )
+            db_session.commit()
+            db_session.expire_all()
+
+            with (
+                captured_statements() as statements,
+                patch("flask_backend.service.poster_pipeline.logger") as logger,
+            ):
+                result = run_pipeline(app, dry_run=True)
+
+        assert result.processed == 4
+        assert len(statements) == 2
+        planned = [call.args[-1] for call in logger.info.call_args_list]
+        assert sorted(planned) == ["imdb", "tmdb", "tmdb", "tmdb"]
+
+    def test_manual_review_summary_queries_do_not_grow_with_screenings(
+        self, client, app, setup_cinemas, captured_statements
+    ):
+        with client.application.app_context():
+            for index in range(3):
+                screening_id = _create_screening_without_poster(title=f"filme-{index}")
+                db_session.add_all(
+                    PosterFetchAttempt(
+                        screening_id=screening_id,
+                        source=source,
+                        status="not_found",
+                        attempted_at=datetime.now(),
+                    )
+                    for source in ("tmdb", "imdb")
+                )
+            db_session.commit()
+            db_session.expire_all()
+
+            with captured_statements() as statements:
+                summary = get_manual_review_summary()
+
+        assert len(summary) == 3
+        assert len(statements) == 3
+
+
+class TestRunPipelineWorkers:
+    def _patched_sources(self, found_titles):
+        return (
+            patch(
+                "flask_backend.service.poster_pipeline._try_tmdb",
+                side_effect=lambda title: (
+                    f"https://example.com/{title}.jpg"
+                    if title in found_titles
+                    else None
+                ),
+            ),
+            patch(
+                "flask_backend.service.poster_pipeline.download_image_from_url",
+                side_effect=lambda url: (b"fake-bytes", url.rsplit("/", 1)[-1]),
+            ),
+            patch(
+                "flask_backend.service.poster_pipeline.save_image",
+                side_effect=lambda _bytes, _app, filename: (filename, 10, 20),
+            ),
+        )
+
+    def test_records_every_outcome_with_several_workers(
+        self, client, app, setup_cinemas
+    ):
+        with client.application.app_context():
+            screening_ids = {
+                f"filme-{index}": _create_screening_without_poster(
+                    title=f"filme-{index}"
+                )
+                for index in range(6)
+            }
+            tmdb, download, save = self._patched_sources({"filme-1", "filme-4"})
+
+            with tmdb, download, save:
+                result = run_pipeline(app, workers=4, pipeline_run_id=7)
+
+            assert result.processed == 6
+            assert result.posters_found == 2
+            assert result.posters_not_found == 4
+            found = db_session.get(Screening, screening_ids["filme-4"])
+            assert found.image == "filme-4.jpg"
+            assert found.image_height == 20
+            assert db_session.get(Screening, screening_ids["filme-0"]).image is None
+            attempts = db_session.query(PosterFetchAttempt).all()
+            assert len(attempts) == 6
+            assert {attempt.pipeline_run_id for attempt in attempts} == {7}
+
+    def test_commits_attempts_in_batches(self, client, app, setup_cinemas):
+        with client.application.app_context():
+            for index in range(5):
+                _create_screening_without_poster(title=f"filme-{index}")
+            tmdb, download, save = self._patched_sources(set())
+
+            with (
+                tmdb,
+                download,
+                save,
+                patch("flask_backend.service.poster_pipeline.ATTEMPT_BATCH_SIZE", 2),
+                patch.object(db_session, "commit", wraps=db_session.commit) as commit,
+            ):
+                result = run_pipeline(app, workers=2)
+
+            assert result.posters_not_found == 5
+            assert commit.call_count == 3
+            assert db_session.query(PosterFetchAttempt).count() == 5
+
+    def test_records_a_failed_save_and_goes_on(self, client, app, setup_cinemas):
+        with client.application.app_context():
+            _create_screening_without_poster(title="filme-0")
+            _create_screening_without_poster(title="filme-1")
+            tmdb, download, _save = self._patched_sources({"filme-0", "filme-1"})
+
+            with (
+                tmdb,
+                download,
+                patch(
+                    "flask_backend.service.poster_pipeline.save_image",
+                    side_effect=[("filme.jpg", 10, 20), OSError("disco cheio")],
+                ),
+            ):
+                result = run_pipeline(app)
+
+            assert result.posters_found == 1
+            assert result.errors == 1
+            attempts = db_session.query(PosterFetchAttempt).all()
+            assert sorted(attempt.status for attempt in attempts) == [
+                "error",
+                "success",
+            ]
+            assert "disco cheio" in {attempt.error_message for attempt in attempts}
+
+    def test_workers_save_through_the_current_app_proxy(
+        self, client, app, setup_cinemas
+    ):
+        """fetch-posters passes `current_app`, which pool threads can't
+        resolve on their own."""
+        with client.application.app_context():
+            for index in range(3):
+                _create_screening_without_poster(title=f"filme-{index}")
+            tmdb, download, _save = self._patched_sources(
+                {"filme-0", "filme-1", "filme-2"}
+            )
+
+            with (
+                tmdb,
+                download,
+                patch(
+                    "flask_backend.service.poster_pipeline.save_image",
+                    side_effect=lambda _bytes, app, filename: (
+                        f"{app.config['UPLOAD_FOLDER']}/{filename}",
+                        10,
+                        20,
+                    ),
+                ),
+            ):
+                result = run_pipeline(current_app, workers=2)
+
+            assert result.posters_found == 3
+            assert result.errors == 0
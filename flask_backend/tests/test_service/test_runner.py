@@ -31,6 +31,41 @@ class TestRunnerParseScrappedJson:
         runner.parse_scrapped_json([self._cinema_json()])
         assert runner.scrapped_results.cinemas[0].slug == "capitolio"
 
+    def test_fingerprint_ignores_the_order_of_features_and_showtimes(self):
+        cinema_json = self._cinema_json()
+        feature = cinema_json["features"][0]
+        other = {**feature, "title": "Outro Filme", "time": ["2026-08-02T15:00"]}
+        cinema_json["features"] = [
+            {**feature, "time": ["2026-08-01T19:00", "2026-08-03T21:00"]},
+            other,
+        ]
+        reordered = {
+            **cinema_json,
+            "features": [
+                other,
+                {**feature, "time": ["2026-08-03T21:00", "2026-08-01T19:00"]},
+            ],
+        }
+
+        runner = Runner()
+        runner.parse_scrapped_json([cinema_json, reordered])
+        first, second = runner.scrapped_results.cinemas
+
+        assert first.fingerprint() == second.fingerprint()
+
+    def test_fingerprint_changes_with_the_features(self):
+        cinema_json = self._cinema_json()
+        changed = {
+            **cinema_json,
+            "features": [{**cinema_json["features"][0], "time": ["2026-08-01T21:00"]}],
+        }
+
+        runner = Runner()
+        runner.parse_scrapped_json([cinema_json, changed])
+        first, second = runner.scrapped_results.cinemas
+
+        assert first.fingerprint() != second.fingerprint()
+
 
 class TestRunnerImportScrappedResults:
     def test_import_scrapped_results_delegates_to_service(self):
@@ -3,11 +3,12 @@ import os
 from datetime import date, datetime, timedelta
 from unittest.mock import MagicMock, patch
 
+import httpx
 from PIL import Image
 
 from flask_backend.db import db_session
 from flask_backend.import_json import ScrappedCinema, ScrappedFeature, ScrappedResult
-from flask_backend.models import Cinema, Movie, Screening, ScreeningDate
+from flask_backend.models import Movie, Screening, ScreeningDate, UpcomingShowtime
 from flask_backend.repository.cinemas import get_by_slug as get_cinema_by_slug
 from flask_backend.service.screening import (
     build_favorites_feed,
@@ -574,8 +575,6 @@ class TestSaveImage:
         assert result == ("https://imgbb.example/x.webp", 30, 40)
 
     def test_production_env_falls_back_to_local_on_http_error(self):
-        import requests
-
         fake_file = io.BytesIO(b"original-bytes")
         fake_file.filename = "poster.png"
         fake_app = MagicMock()
@@ -590,7 +589,11 @@ class TestSaveImage:
             ),
             patch(
                 "flask_backend.service.screening.upload_image_to_api",
-                side_effect=requests.exceptions.HTTPError,
+                side_effect=httpx.HTTPStatusError(
+                    "500 Internal Server Error",
+                    request=httpx.Request("POST", "https://api.imgbb.com/1/upload"),
+                    response=httpx.Response(500),
+                ),
             ),
             patch(
                 "flask_backend.service.screening.upload_image_to_local_disk",
@@ -684,20 +687,26 @@ class TestDownloadImageFromUrl:
         assert download_image_from_url(None) == (None, None)
 
     def test_not_ok_response_returns_none_none(self):
-        mock_response = MagicMock(ok=False)
-        with patch(
-            "flask_backend.service.screening.requests.Session"
-        ) as mock_session_cls:
-            mock_session_cls.return_value.get.return_value = mock_response
+        mock_response = MagicMock(is_success=False)
+        with patch("flask_backend.service.screening.http_client.get") as mock_get:
+            mock_get.return_value = mock_response
             result = download_image_from_url("https://example.com/poster.jpg")
         assert result == (None, None)
 
+    def test_downloads_through_the_shared_client_with_a_timeout(self):
+        mock_response = MagicMock(is_success=True, content=_make_png_bytes())
+        with patch("flask_backend.service.screening.http_client.get") as mock_get:
+            mock_get.return_value = mock_response
+            download_image_from_url("https://example.com/a.jpg")
+            download_image_from_url("https://example.com/b.jpg")
+
+        assert mock_get.call_count == 2
+        assert all(call.kwargs["timeout"] for call in mock_get.call_args_list)
+
     def test_valid_image_returns_bytes_and_filename(self):
-        mock_response = MagicMock(ok=True, content=_make_png_bytes())
-        with patch(
-            "flask_backend.service.screening.requests.Session"
-        ) as mock_session_cls:
-            mock_session_cls.return_value.get.return_value = mock_response
+        mock_response = MagicMock(is_success=True, content=_make_png_bytes())
+        with patch("flask_backend.service.screening.http_client.get") as mock_get:
+            mock_get.return_value = mock_response
             image_bytes, filename = download_image_from_url(
                 "https://example.com/poster.jpg"
             )
@@ -705,11 +714,9 @@ class TestDownloadImageFromUrl:
         assert filename.endswith(".jpg")
 
     def test_corrupted_content_returns_none_none(self):
-        mock_response = MagicMock(ok=True, content=b"not-an-image")
-        with patch(
-            "flask_backend.service.screening.requests.Session"
-        ) as mock_session_cls:
-            mock_session_cls.return_value.get.return_value = mock_response
+        mock_response = MagicMock(is_success=True, content=b"not-an-image")
+        with patch("flask_backend.service.screening.http_client.get") as mock_get:
+            mock_get.return_value = mock_response
             result = download_image_from_url("https://example.com/poster.jpg")
         assert result == (None, None)
 
@@ -842,6 +849,209 @@ class TestImportScrappedResultsExtraBranches:
             assert len(dates) == 1, "duplicate date/time should not be appended twice"
 
 
+def _create_scrapped_results_with_titles(cinema, slug, titles, times):
+    return ScrappedResult(
+        cinemas=[
+            ScrappedCinema(
+                url="",
+                cinema=cinema,
+                slug=slug,
+                features=[
+                    ScrappedFeature(
+                        title=title,
+                        excerpt="cool film",
+                        poster="",
+                        original_title="",
+                        price="",
+                        director="",
+                        classification="",
+                        general_info="",
+                        read_more="",
+                        time=times,
+                    )
+                    for title in titles
+                ],
+            )
+        ]
+    )
+
+
+class TestImportScrappedResultsBulk:
+    def test_commits_once_per_import(self, app, setup_cinemas):
+        with patch.object(db_session, "commit", wraps=db_session.commit) as commit:
+            import_scrapped_results(
+                _create_scrapped_results_with_titles(
+                    "Capitolio",
+                    "capitolio",
+                    ["Filme Um", "Filme Dois", "Filme Três"],
+                    ["2025-12-25T12:00"],
+                ),
+                app,
+            )
+
+        commit.assert_called_once()
+
+    def test_statement_count_does_not_grow_with_the_number_of_features(
+        self, app, setup_cinemas, captured_statements
+    ):
+        def statements_for(titles):
+            with captured_statements() as statements:
+                import_scrapped_results(
+                    _create_scrapped_results_with_titles(
+                        "CineBancarios", "cinebancarios", titles, ["2025-12-25T12:00"]
+                    ),
+                    app,
+                )
+            return len(statements)
+
+        few = statements_for([f"Filme {n}" for n in range(3)])
+        many = statements_for([f"Outro Filme {n}" for n in range(30)])
+
+        assert many == few
+
+    def test_same_movie_twice_in_one_run_creates_one_movie_and_screening(
+        self, app, setup_cinemas
+    ):
+        summary = import_scrapped_results(
+            _create_scrapped_results_with_titles(
+                "CineBancarios",
+                "cinebancarios",
+                ["Lobo e Cão", "Cinema | Lobo e Cão"],
+                ["2025-12-25T12:00"],
+            ),
+            app,
+        )
+
+        assert summary.movies_created == 1
+        assert summary.screenings_created == 1
+        assert summary.dates_registered == 0
+        with app.app_context():
+            assert db_session.query(Screening).count() == 1
+            assert db_session.query(ScreeningDate).count() == 1
+
+    def test_keeps_the_rows_of_dates_it_already_had(self, app, setup_cinemas):
+        with app.app_context():
+            _create_movie_on_db(db_session)
+            original_ids = {sd.id for sd in db_session.query(ScreeningDate).all()}
+
+        summary = import_scrapped_results(
+            _create_scrapped_results_with_times(
+                "Capitolio", "capitolio", ["2025-12-25T11:00", "2025-12-28T10:00"]
+            ),
+            app,
+        )
+
+        assert summary.dates_registered == 1
+        with app.app_context():
+            ids = {sd.id for sd in db_session.query(ScreeningDate).all()}
+            assert original_ids < ids
+
+
+def _create_scrapped_results_with_posters(posters_by_title):
+    results = _create_scrapped_results_with_titles(
+        "CineBancarios", "cinebancarios", list(posters_by_title), ["2025-12-25T12:00"]
+    )
+    for feature in results.cinemas[0].features:
+        feature.poster = posters_by_title[feature.title]
+    return results
+
+
+class TestImportScrappedResultsPosters:
+    def test_downloads_posters_after_the_import_has_committed(self, app, setup_cinemas):
+        commits_at_download = []
+
+        def download(url):
+            commits_at_download.append(commit.call_count)
+            return io.BytesIO(_make_png_bytes()), "hash.jpg"
+
+        with (
+            patch.object(db_session, "commit", wraps=db_session.commit) as commit,
+            patch(
+                "flask_backend.service.screening.download_image_from_url",
+                side_effect=download,
+            ),
+            patch(
+                "flask_backend.service.screening.save_image",
+                return_value=("poster.webp", 50, 60),
+            ),
+        ):
+            import_scrapped_results(
+                _create_scrapped_results_with_posters(
+                    {"Filme Um": "https://cdn.example.com/um.jpg"}
+                ),
+                app,
+            )
+
+        assert commits_at_download == [1]
+        with app.app_context():
+            screening = db_session.query(Screening).one()
+            assert screening.image == "poster.webp"
+            assert screening.image_width == 50
+
+    def test_a_failing_poster_download_does_not_fail_the_import(
+        self, app, setup_cinemas
+    ):
+        def download(url):
+            if "lento" in url:
+                raise httpx.ReadTimeout("read timed out")
+            return io.BytesIO(_make_png_bytes()), "hash.jpg"
+
+        with (
+            patch(
+                "flask_backend.service.screening.download_image_from_url",
+                side_effect=download,
+            ),
+            patch(
+                "flask_backend.service.screening.save_image",
+                return_value=("poster.webp", 50, 60),
+            ),
+        ):
+            summary = import_scrapped_results(
+                _create_scrapped_results_with_posters(
+                    {
+                        "Filme Um": "https://cdn.example.com/um.jpg",
+                        "Filme Dois": "https://lento.example.com/dois.jpg",
+                    }
+                ),
+                app,
+            )
+
+        assert summary.screenings_created == 2
+        with app.app_context():
+            images = {
+                screening.movie.title: screening.image
+                for screening in db_session.query(Screening).all()
+            }
+            assert images == {"Filme Um": "poster.webp", "Filme Dois": None}
+
+    def test_screenings_sharing_a_poster_url_download_it_once(self, app, setup_cinemas):
+        with (
+            patch(
+                "flask_backend.service.screening.download_image_from_url",
+                return_value=(io.BytesIO(_make_png_bytes()), "hash.jpg"),
+            ) as mock_download,
+            patch(
+                "flask_backend.service.screening.save_image",
+                return_value=("poster.webp", 50, 60),
+            ),
+        ):
+            import_scrapped_results(
+                _create_scrapped_results_with_posters(
+                    {
+                        "Filme Um": "https://cdn.example.com/mesmo.jpg",
+                        "Filme Dois": "https://cdn.example.com/mesmo.jpg",
+                    }
+                ),
+                app,
+            )
+
+        mock_download.assert_called_once()
+        with app.app_context():
+            assert {s.image for s in db_session.query(Screening).all()} == {
+                "poster.webp"
+            }
+
+
 class TestImgFilenameHelpers:
     def test_get_img_filename_from_url_returns_input_extension(self):
         filename = get_img_filename_from_url("https://example.com/poster.jpg")
@@ -952,131 +1162,109 @@ class TestFormatDayLabel:
         )
 
 
-def _movie(title="Filme", release_year=2024):
-    return Movie(title=title, release_year=release_year, directors=[])
-
-
-def _cinema(slug="capitolio"):
-    # short_name and color are computed properties looked up by slug from
-    # CINEMA_SHORT_NAMES/CINEMA_COLORS (flask_backend/constants.py) - the
-    # slug is what actually drives them, `name` here is just the fallback.
-    return Cinema(slug=slug, name=slug, url="https://example.com")
-
-
-def _screening(movie, cinema, dates, draft=False, screening_id=1, image=None):
-    screening = Screening(
-        id=screening_id,
-        movie=movie,
-        movie_id=1,
-        cinema=cinema,
+def _showtime(
+    day,
+    time,
+    screening_id=1,
+    movie_id=1,
+    cinema_slug="capitolio",
+    cinema_short_name="Capitólio",
+    draft=False,
+    image=None,
+):
+    return UpcomingShowtime(
+        screening_id=screening_id,
+        movie_id=movie_id,
+        cinema_id=1,
+        date=day,
+        time=time,
+        movie_title="Filme",
+        release_year=2024,
+        directors="[]",
+        cinema_slug=cinema_slug,
+        cinema_short_name=cinema_short_name,
+        cinema_color="#911eb4",
         description="Uma descrição",
         draft=draft,
         image=image,
-        dates=dates,
     )
-    return screening
+
+
+def _redencao_showtime(day, time, screening_id):
+    return _showtime(
+        day,
+        time,
+        screening_id=screening_id,
+        cinema_slug="sala-redencao",
+        cinema_short_name="Sala Redenção",
+    )
 
 
 class TestBuildReelsFeed:
     def test_orders_cards_by_each_screenings_soonest_date(self):
         today = date.today()
-        movie = _movie()
-        cinema = _cinema()
-        later = _screening(
-            movie,
-            cinema,
-            [ScreeningDate(date=today + timedelta(days=2), time="20:00")],
-            screening_id=1,
-        )
-        sooner = _screening(
-            movie,
-            cinema,
-            [ScreeningDate(date=today, time="18:00")],
-            screening_id=2,
-        )
+        later = _showtime(today + timedelta(days=2), "20:00", screening_id=1)
+        sooner = _showtime(today, "18:00", screening_id=2)
 
         cards = build_reels_feed(
-            [later, sooner], [], today, today + timedelta(days=6), False
+            [later, sooner], today, today + timedelta(days=6), False
         )
 
         assert [card["screening_id"] for card in cards] == [2, 1]
 
     def test_excludes_draft_screenings_when_not_logged_in(self):
         today = date.today()
-        movie = _movie()
-        cinema = _cinema()
-        draft = _screening(
-            movie,
-            cinema,
-            [ScreeningDate(date=today, time="20:00")],
-            draft=True,
-            screening_id=1,
-        )
+        draft = _showtime(today, "20:00", draft=True)
 
-        cards = build_reels_feed([draft], [], today, today + timedelta(days=6), False)
+        cards = build_reels_feed([draft], today, today + timedelta(days=6), False)
 
         assert cards == []
 
     def test_includes_draft_screenings_when_logged_in(self):
         today = date.today()
-        movie = _movie()
-        cinema = _cinema()
-        draft = _screening(
-            movie,
-            cinema,
-            [ScreeningDate(date=today, time="20:00")],
-            draft=True,
-            screening_id=1,
-        )
+        draft = _showtime(today, "20:00", draft=True)
 
-        cards = build_reels_feed([draft], [], today, today + timedelta(days=6), True)
+        cards = build_reels_feed([draft], today, today + timedelta(days=6), True)
 
         assert len(cards) == 1
         assert cards[0]["draft"] is True
 
     def test_attaches_next_dates_for_the_cards_movie(self):
         today = date.today()
-        movie = _movie()
-        cinema = _cinema()
-        screening = _screening(
-            movie, cinema, [ScreeningDate(date=today, time="20:00")], screening_id=1
-        )
-        other_cinema_date = ScreeningDate(date=today + timedelta(days=1), time="19:00")
-        other_cinema_date.screening = _screening(
-            movie, _cinema(slug="sala-redencao"), [], screening_id=2
-        )
+        showtime = _showtime(today, "20:00", screening_id=1)
+        other_cinema = _redencao_showtime(today + timedelta(days=1), "19:00", 2)
 
         cards = build_reels_feed(
-            [screening],
-            [other_cinema_date],
-            today,
-            today + timedelta(days=6),
-            False,
+            [showtime, other_cinema], today, today + timedelta(days=6), False
         )
 
-        assert len(cards[0]["next_dates"]) == 1
-        assert cards[0]["next_dates"][0]["cinema_name"] == "Sala Redenção"
+        card = next(card for card in cards if card["screening_id"] == 1)
+        assert [d["cinema_name"] for d in card["next_dates"]] == [
+            "Capitólio",
+            "Sala Redenção",
+        ]
+
+    def test_groups_a_screenings_showtimes_into_one_card(self):
+        today = date.today()
+        showtimes = [
+            _showtime(today, "18:00", screening_id=1),
+            _showtime(today + timedelta(days=1), "18:00", screening_id=1),
+        ]
+
+        cards = build_reels_feed(showtimes, today, today + timedelta(days=6), False)
+
+        assert len(cards) == 1
+        assert cards[0]["soonest_date"] == today
+        assert len(cards[0]["next_dates"]) == 2
 
     def test_marks_day_label_on_every_card(self):
         today = date.today()
-        movie = _movie()
-        cinema = _cinema()
-        first = _screening(
-            movie, cinema, [ScreeningDate(date=today, time="18:00")], screening_id=1
-        )
-        second_same_day = _screening(
-            movie, cinema, [ScreeningDate(date=today, time="20:00")], screening_id=2
-        )
-        next_day = _screening(
-            movie,
-            cinema,
-            [ScreeningDate(date=today + timedelta(days=1), time="18:00")],
-            screening_id=3,
-        )
+        first = _showtime(today, "18:00", screening_id=1)
+        second_same_day = _showtime(today, "20:00", screening_id=2)
+        next_day = _showtime(today + timedelta(days=1), "18:00", screening_id=3)
 
         cards = build_reels_feed(
             [second_same_day, next_day, first],
-            [],
             today,
             today + timedelta(days=6),
             False,
@@ -1086,19 +1274,11 @@ class TestBuildReelsFeed:
 
     def test_skips_screenings_with_only_past_dates(self):
         today = date.today()
-        movie = _movie()
-        cinema = _cinema()
-        past = _screening(
-            movie,
-            cinema,
-            [ScreeningDate(date=today, time="10:00")],
-            screening_id=1,
-        )
+        past = _showtime(today, "10:00", screening_id=1)
         earliest = datetime(today.year, today.month, today.day, 12, 0)
 
         cards = build_reels_feed(
             [past],
-            [],
             today,
             today + timedelta(days=6),
             False,
@@ -1109,19 +1289,11 @@ class TestBuildReelsFeed:
 
     def test_keeps_screenings_with_future_dates(self):
         today = date.today()
-        movie = _movie()
-        cinema = _cinema()
-        future = _screening(
-            movie,
-            cinema,
-            [ScreeningDate(date=today, time="14:00")],
-            screening_id=1,
-        )
+        future = _showtime(today, "14:00", screening_id=1)
         earliest = datetime(today.year, today.month, today.day, 12, 0)
 
         cards = build_reels_feed(
             [future],
-            [],
             today,
             today + timedelta(days=6),
             False,
@@ -1133,54 +1305,33 @@ class TestBuildReelsFeed:
 
     def test_filters_next_dates_to_future_only(self):
         today = date.today()
-        movie = _movie()
-        capitolio = _cinema()
-        redencao = _cinema(slug="sala-redencao")
-        screening = _screening(
-            movie, capitolio, [ScreeningDate(date=today, time="14:00")], screening_id=1
-        )
-        past_other = ScreeningDate(date=today, time="10:00")
-        past_other.screening = _screening(movie, redencao, [], screening_id=2)
-        future_other = ScreeningDate(date=today, time="16:00")
-        future_other.screening = _screening(movie, redencao, [], screening_id=3)
+        showtime = _showtime(today, "14:00", screening_id=1)
+        past_other = _redencao_showtime(today, "10:00", 2)
+        future_other = _redencao_showtime(today, "16:00", 3)
         earliest = datetime(today.year, today.month, today.day, 12, 0)
 
         cards = build_reels_feed(
-            [screening],
-            [past_other, future_other],
+            [showtime, past_other, future_other],
             today,
             today + timedelta(days=6),
             False,
             earliest_datetime=earliest,
         )
 
-        assert len(cards[0]["next_dates"]) == 1
-        assert cards[0]["next_dates"][0]["time"] == "16:00"
+        card = next(card for card in cards if card["screening_id"] == 1)
+        assert [d["time"] for d in card["next_dates"]] == ["14:00", "16:00"]
 
     def test_uses_soonest_future_date_for_ordering(self):
         today = date.today()
-        movie = _movie()
-        cinema = _cinema()
-        earlier_future = _screening(
-            movie,
-            cinema,
-            [
-                ScreeningDate(date=today, time="10:00"),
-                ScreeningDate(date=today, time="16:00"),
-            ],
-            screening_id=1,
-        )
-        later_future = _screening(
-            movie,
-            cinema,
-            [ScreeningDate(date=today, time="14:00")],
-            screening_id=2,
-        )
+        earlier_future = [
+            _showtime(today, "10:00", screening_id=1),
+            _showtime(today, "16:00", screening_id=1),
+        ]
+        later_future = _showtime(today, "14:00", screening_id=2)
         earliest = datetime(today.year, today.month, today.day, 12, 0)
 
         cards = build_reels_feed(
-            [earlier_future, later_future],
-            [],
+            [*earlier_future, later_future],
             today,
             today + timedelta(days=6),
             False,
@@ -1191,15 +1342,10 @@ class TestBuildReelsFeed:
 
     def test_marks_card_as_wanted_when_its_movie_id_is_in_the_set(self):
         today = date.today()
-        movie = _movie()
-        cinema = _cinema()
-        screening = _screening(
-            movie, cinema, [ScreeningDate(date=today, time="20:00")], screening_id=1
-        )
+        showtime = _showtime(today, "20:00", screening_id=1)
 
         cards = build_reels_feed(
-            [screening],
-            [],
+            [showtime],
             today,
             today + timedelta(days=6),
             False,
@@ -1211,15 +1357,10 @@ class TestBuildReelsFeed:
 
     def test_card_not_wanted_when_its_movie_id_is_not_in_the_set(self):
         today = date.today()
-        movie = _movie()
-        cinema = _cinema()
-        screening = _screening(
-            movie, cinema, [ScreeningDate(date=today, time="20:00")], screening_id=1
-        )
+        showtime = _showtime(today, "20:00", screening_id=1)
 
         cards = build_reels_feed(
-            [screening],
-            [],
+            [showtime],
             today,
             today + timedelta(days=6),
             False,
@@ -1230,15 +1371,9 @@ class TestBuildReelsFeed:
 
     def test_defaults_to_not_wanted_when_no_set_given(self):
         today = date.today()
-        movie = _movie()
-        cinema = _cinema()
-        screening = _screening(
-            movie, cinema, [ScreeningDate(date=today, time="20:00")], screening_id=1
-        )
+        showtime = _showtime(today, "20:00", screening_id=1)
 
-        cards = build_reels_feed(
-            [screening], [], today, today + timedelta(days=6), False
-        )
+        cards = build_reels_feed([showtime], today, today + timedelta(days=6), False)
 
         assert cards[0]["wanted"] is False
 
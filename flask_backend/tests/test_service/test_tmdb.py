@@ -1,8 +1,9 @@
 from unittest.mock import Mock, patch
 
+import httpx
 import pytest
-import requests
 
+from flask_backend.service import tmdb_cache
 from flask_backend.service.tmdb import TMDBClient
 
 
@@ -23,7 +24,7 @@ class TestGetMovieDetails:
                 ]
             },
         }
-        with patch("flask_backend.service.tmdb.requests.get", return_value=response):
+        with patch("flask_backend.service.tmdb.http_client.get", return_value=response):
             details = tmdb_client.get_movie_details(123)
 
         assert details["genres"] == [
@@ -43,7 +44,7 @@ class TestGetMovieDetails:
                 ]
             },
         }
-        with patch("flask_backend.service.tmdb.requests.get", return_value=response):
+        with patch("flask_backend.service.tmdb.http_client.get", return_value=response):
             details = tmdb_client.get_movie_details(123)
 
         assert details["directors"] == [
@@ -57,7 +58,7 @@ class TestGetMovieDetails:
             "genres": [{"id": 28, "name": "Ação"}],
             "credits": {"crew": [{"id": 1, "name": "Someone", "job": "Editor"}]},
         }
-        with patch("flask_backend.service.tmdb.requests.get", return_value=response):
+        with patch("flask_backend.service.tmdb.http_client.get", return_value=response):
             details = tmdb_client.get_movie_details(123)
 
         assert details["directors"] == []
@@ -65,10 +66,10 @@ class TestGetMovieDetails:
     def test_raises_on_request_exception(self, tmdb_client):
         with (
             patch(
-                "flask_backend.service.tmdb.requests.get",
-                side_effect=requests.RequestException("boom"),
+                "flask_backend.service.tmdb.http_client.get",
+                side_effect=httpx.ConnectError("boom"),
             ),
-            pytest.raises(requests.RequestException),
+            pytest.raises(httpx.HTTPError),
         ):
             tmdb_client.get_movie_details(123)
 
@@ -85,7 +86,7 @@ class TestGetMovieDetails:
                 {"iso_3166_1": "UY", "name": "Uruguay"},
             ],
         }
-        with patch("flask_backend.service.tmdb.requests.get", return_value=response):
+        with patch("flask_backend.service.tmdb.http_client.get", return_value=response):
             details = tmdb_client.get_movie_details(123)
 
         assert details["original_title"] == "Cão e Lobo"
@@ -99,7 +100,7 @@ class TestGetMovieDetails:
     def test_release_year_is_none_when_release_date_missing(self, tmdb_client):
         response = Mock()
         response.json.return_value = {"genres": [], "credits": {"crew": []}}
-        with patch("flask_backend.service.tmdb.requests.get", return_value=response):
+        with patch("flask_backend.service.tmdb.http_client.get", return_value=response):
             details = tmdb_client.get_movie_details(123)
 
         assert details["release_year"] is None
@@ -114,7 +115,7 @@ class TestGetMovieDetails:
             "credits": {"crew": []},
             "release_date": "not-a-date",
         }
-        with patch("flask_backend.service.tmdb.requests.get", return_value=response):
+        with patch("flask_backend.service.tmdb.http_client.get", return_value=response):
             details = tmdb_client.get_movie_details(123)
 
         assert details["release_year"] is None
@@ -131,7 +132,7 @@ class TestGetMovieDetails:
                 "backdrop_path": "/backdrop.jpg",
             },
         }
-        with patch("flask_backend.service.tmdb.requests.get", return_value=response):
+        with patch("flask_backend.service.tmdb.http_client.get", return_value=response):
             details = tmdb_client.get_movie_details(123)
 
         assert details["collection"] == {"id": 10, "name": "Bacurau Collection"}
@@ -145,7 +146,7 @@ class TestGetMovieDetails:
             "credits": {"crew": []},
             "belongs_to_collection": None,
         }
-        with patch("flask_backend.service.tmdb.requests.get", return_value=response):
+        with patch("flask_backend.service.tmdb.http_client.get", return_value=response):
             details = tmdb_client.get_movie_details(123)
 
         assert details["collection"] is None
@@ -161,7 +162,7 @@ class TestSearchMovies:
                 {"id": 3, "title": "Três"},
             ]
         }
-        with patch("flask_backend.service.tmdb.requests.get", return_value=response):
+        with patch("flask_backend.service.tmdb.http_client.get", return_value=response):
             results = tmdb_client.search_movies("filme", limit=2)
 
         assert results == [
@@ -176,7 +177,7 @@ class TestSearchMovies:
         results_response.json.return_value = {"results": [{"id": 9, "title": "Movie"}]}
 
         with patch(
-            "flask_backend.service.tmdb.requests.get",
+            "flask_backend.service.tmdb.http_client.get",
             side_effect=[empty_response, results_response],
         ) as mock_get:
             results = tmdb_client.search_movies("filme obscuro")
@@ -189,7 +190,7 @@ class TestSearchMovies:
     def test_returns_empty_list_when_nothing_found(self, tmdb_client):
         response = Mock()
         response.json.return_value = {"results": []}
-        with patch("flask_backend.service.tmdb.requests.get", return_value=response):
+        with patch("flask_backend.service.tmdb.http_client.get", return_value=response):
             results = tmdb_client.search_movies("inexistente")
 
         assert results == []
@@ -197,9 +198,115 @@ class TestSearchMovies:
     def test_raises_on_request_exception(self, tmdb_client):
         with (
             patch(
-                "flask_backend.service.tmdb.requests.get",
-                side_effect=requests.RequestException("boom"),
+                "flask_backend.service.tmdb.http_client.get",
+                side_effect=httpx.ConnectError("boom"),
             ),
-            pytest.raises(requests.RequestException),
+            pytest.raises(httpx.HTTPError),
         ):
             tmdb_client.search_movies("qualquer coisa")
+
+
+def _search_response(results):
+    response = Mock()
+    response.json.return_value = {"results": results}
+    return response
+
+
+class TestCache:
+    def test_repeated_search_is_answered_from_the_cache(self, tmdb_client):
+        with patch(
+            "flask_backend.service.tmdb.http_client.get",
+            return_value=_search_response([{"id": 1, "title": "Um"}]),
+        ) as mock_get:
+            first = tmdb_client.search_movie("Um")
+            second = TMDBClient(api_token="fake-token").search_movies("Um")
+
+        assert first == {"id": 1, "title": "Um"}
+        assert second == [{"id": 1, "title": "Um"}]
+        assert mock_get.call_count == 1
+        assert tmdb_cache.get_stats() == {"hits": 1, "misses": 1}
+
+    def test_details_are_cached_per_language(self, tmdb_client):
+        response = Mock()
+        response.json.return_value = {"genres": [], "credits": {"crew": []}}
+        with patch(
+            "flask_backend.service.tmdb.http_client.get", return_value=response
+        ) as mock_get:
+            tmdb_client.get_movie_details(123)
+            tmdb_client.get_movie_details(123)
+            tmdb_client.get_movie_details(123, language="en-US")
+
+        assert mock_get.call_count == 2
+
+    def test_empty_searches_are_cached_for_the_negative_ttl(
+        self, tmdb_client, fresh_tmdb_cache
+    ):
+        now = [1000.0]
+        fresh_tmdb_cache._clock = lambda: now[0]
+        with patch(
+            "flask_backend.service.tmdb.http_client.get",
+            return_value=_search_response([]),
+        ) as mock_get:
+            assert tmdb_client.search_movie("Inexistente") is None
+            assert tmdb_client.search_movie("Inexistente") is None
+            assert mock_get.call_count == 2  # pt-BR and en-US, once each
+
+            now[0] += fresh_tmdb_cache.negative_ttl_seconds + 1
+            tmdb_client.search_movie("Inexistente")
+
+        assert mock_get.call_count == 4
+
+    def test_found_answers_outlive_the_negative_ttl(
+        self, tmdb_client, fresh_tmdb_cache
+    ):
+        now = [1000.0]
+        fresh_tmdb_cache._clock = lambda: now[0]
+        with patch(
+            "flask_backend.service.tmdb.http_client.get",
+            return_value=_search_response([{"id": 1}]),
+        ) as mock_get:
+            tmdb_client.search_movie("Um")
+            now[0] += fresh_tmdb_cache.negative_ttl_seconds + 1
+            tmdb_client.search_movie("Um")
+            now[0] += fresh_tmdb_cache.ttl_seconds
+            tmdb_client.search_movie("Um")
+
+        assert mock_get.call_count == 2
+
+    def test_bypass_skips_the_lookup_but_refreshes_the_entry(self, tmdb_client):
+        with patch(
+            "flask_backend.service.tmdb.http_client.get",
+            side_effect=[
+                _search_response([{"id": 1}]),
+                _search_response([{"id": 2}]),
+            ],
+        ):
+            tmdb_client.search_movie("Filme")
+            fresh = TMDBClient(api_token="fake-token", use_cache=False).search_movie(
+                "Filme"
+            )
+            cached = tmdb_client.search_movie("Filme")
+
+        assert fresh == {"id": 2}
+        assert cached == {"id": 2}
+
+    def test_errors_are_not_cached(self, tmdb_client):
+        with patch(
+            "flask_backend.service.tmdb.http_client.get",
+            side_effect=[httpx.ConnectError("boom"), _search_response([{"id": 1}])],
+        ):
+            with pytest.raises(httpx.HTTPError):
+                tmdb_client.search_movie("Filme")
+            assert tmdb_client.search_movie("Filme") == {"id": 1}
+
+    def test_disabled_cache_always_fetches(self, tmdb_client, monkeypatch):
+        monkeypatch.setattr(tmdb_cache, "TMDB_CACHE_ENABLED", False)
+        with patch(
+            "flask_backend.service.tmdb.http_client.get",
+            return_value=_search_response([{"id": 1}]),
+        ) as mock_get:
+            tmdb_client.search_movie("Um")
+            tmdb_client.search_movie("Um")
+
+        assert mock_get.call_count == 2
+        assert tmdb_cache.get_stats() == {"hits": 0, "misses": 0}
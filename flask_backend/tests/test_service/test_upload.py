@@ -27,7 +27,7 @@ class TestUploadImageToApi:
             }
         }
         with patch(
-            "flask_backend.service.upload.requests.post", return_value=mock_response
+            "flask_backend.service.upload.http_client.post", return_value=mock_response
         ):
             url, width, height = upload_image_to_api(
                 app=MagicMock(), image=io.BytesIO(b"fake-bytes")
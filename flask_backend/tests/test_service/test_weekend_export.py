@@ -3,7 +3,7 @@ import time
 from datetime import date
 from io import BytesIO
 
-import requests
+import httpx
 from PIL import Image, ImageDraw
 
 from flask_backend.service import weekend_export
@@ -43,6 +43,7 @@ from flask_backend.service.weekend_export import (
     paginate_rows_for_day,
     render_day_image,
 )
+from flask_backend.utils import http_client
 
 
 def _fake_poster_bytes(width=300, height=450, color=(200, 50, 50)):
@@ -301,15 +302,15 @@ class TestLoadPosterBytes:
             assert timeout == POSTER_LOAD_TIMEOUT_SECONDS
             return FakeResponse()
 
-        monkeypatch.setattr(requests, "get", fake_get)
+        monkeypatch.setattr(http_client, "get", fake_get)
         result = _load_poster_bytes("https://i.ibb.co/example.jpg", "/uploads")
         assert result == b"remote-bytes"
 
     def test_remote_url_failure_returns_none(self, monkeypatch):
         def fake_get(url, timeout):
-            raise requests.RequestException("boom")
+            raise httpx.ConnectError("boom")
 
-        monkeypatch.setattr(requests, "get", fake_get)
+        monkeypatch.setattr(http_client, "get", fake_get)
         result = _load_poster_bytes("https://i.ibb.co/example.jpg", "/uploads")
         assert result is None
 
@@ -0,0 +1,187 @@
+import asyncio
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from flask_backend.utils import http_client
+
+
+@pytest.fixture
+def transport():
+    """Routes every host's client through an httpx.MockTransport; set
+    `transport.handler` to answer requests. Starts with no clients and
+    zeroed counters."""
+
+    class _Transport:
+        handler = staticmethod(lambda _request: httpx.Response(200, text="ok"))
+        built = 0
+
+    def build_client():
+        _Transport.built += 1
+        return httpx.Client(
+            transport=httpx.MockTransport(lambda request: _Transport.handler(request))
+        )
+
+    with (
+        patch.dict(http_client._clients, clear=True),
+        patch.object(http_client, "_build_client", side_effect=build_client),
+        patch.object(http_client.time, "sleep") as sleep,
+    ):
+        http_client.reset_host_stats()
+        _Transport.sleep = sleep
+        yield _Transport
+    http_client.reset_host_stats()
+
+
+class TestRequest:
+    def test_reuses_one_client_per_host(self, transport):
+        http_client.get("https://a.example/1")
+        http_client.get("https://a.example/2")
+        http_client.get("https://b.example/1")
+
+        assert transport.built == 2
+        assert set(http_client._clients) == {"a.example", "b.example"}
+
+    def test_returns_error_responses_instead_of_raising(self, transport):
+        transport.handler = lambda _request: httpx.Response(404)
+
+        response = http_client.get("https://a.example/missing")
+
+        assert response.status_code == 404
+        with pytest.raises(httpx.HTTPStatusError):
+            response.raise_for_status()
+
+    def test_retries_idempotent_requests_on_retryable_statuses(self, transport):
+        statuses = iter([503, 429, 200])
+        transport.handler = lambda _request: httpx.Response(next(statuses))
+
+        response = http_client.get("https://a.example/flaky")
+
+        assert response.status_code == 200
+        assert [call.args[0] for call in transport.sleep.call_args_list] == [
+            http_client.HTTP_CLIENT_BACKOFF_SECONDS,
+            http_client.HTTP_CLIENT_BACKOFF_SECONDS * 2,
+        ]
+
+    def test_honours_retry_after(self, transport):
+        statuses = iter([429, 200])
+        transport.handler = lambda _request: httpx.Response(
+            next(statuses), headers={"Retry-After": "3"}
+        )
+
+        http_client.get("https://a.example/limited")
+
+        transport.sleep.assert_called_once_with(3.0)
+
+    def test_returns_the_response_when_retry_after_exceeds_the_cap(self, transport):
+        transport.handler = lambda _request: httpx.Response(
+            429, headers={"Retry-After": "3600"}
+        )
+
+        response = http_client.get("https://a.example/limited")
+
+        assert response.status_code == 429
+        transport.sleep.assert_not_called()
+
+    def test_gives_up_after_the_configured_retries(self, transport):
+        transport.handler = lambda _request: httpx.Response(503)
+
+        response = http_client.get("https://a.example/down")
+
+        assert response.status_code == 503
+        assert transport.sleep.call_count == http_client.HTTP_CLIENT_RETRIES
+
+    def test_does_not_retry_posts(self, transport):
+        transport.handler = lambda _request: httpx.Response(503)
+
+        response = http_client.post("https://a.example/upload", data={"k": "v"})
+
+        assert response.status_code == 503
+        transport.sleep.assert_not_called()
+
+
+class TestHostStats:
+    def test_counts_requests_errors_and_latency_per_host(self, transport):
+        def handler(request):
+            if request.url.path == "/boom":
+                raise httpx.ConnectError("boom", request=request)
+            status = 500 if request.url.path == "/fail" else 200
+            return httpx.Response(status)
+
+        transport.handler = handler
+        http_client.get("https://a.example/ok")
+        http_client.post("https://a.example/fail")
+        with pytest.raises(httpx.ConnectError):
+            http_client.get("https://b.example/boom")
+
+        stats = http_client.get_host_stats()
+
+        assert list(stats) == ["a.example", "b.example"]
+        assert stats["a.example"]["requests"] == 2
+        assert stats["a.example"]["errors"] == 1
+        assert stats["b.example"]["requests"] == 1
+        assert stats["b.example"]["errors"] == 1
+        assert stats["a.example"]["max_ms"] >= stats["a.example"]["avg_ms"] >= 0
+
+    def test_reset_clears_the_counters(self, transport):
+        http_client.get("https://a.example/ok")
+
+        http_client.reset_host_stats()
+
+        assert http_client.get_host_stats() == {}
+
+
+class TestAsyncSession:
+    @pytest.fixture
+    def async_transport(self, transport):
+        def build_async_client():
+            return httpx.AsyncClient(
+                transport=httpx.MockTransport(
+                    lambda request: transport.handler(request)
+                )
+            )
+
+        with (
+            patch.object(
+                http_client, "_build_async_client", side_effect=build_async_client
+            ),
+            patch.object(http_client.asyncio, "sleep") as sleep,
+        ):
+            transport.async_sleep = sleep
+            yield transport
+
+    def _get(self, *urls):
+        async def get_all():
+            async with http_client.AsyncSession() as session:
+                return [await session.get(url) for url in urls]
+
+        return asyncio.run(get_all())
+
+    def test_retries_with_the_same_backoff_as_request(self, async_transport):
+        statuses = iter([503, 200])
+        async_transport.handler = lambda _request: httpx.Response(next(statuses))
+
+        (response,) = self._get("https://a.example/flaky")
+
+        assert response.status_code == 200
+        async_transport.async_sleep.assert_called_once_with(
+            http_client.HTTP_CLIENT_BACKOFF_SECONDS
+        )
+
+    def test_returns_the_response_when_retry_after_exceeds_the_cap(
+        self, async_transport
+    ):
+        async_transport.handler = lambda _request: httpx.Response(
+            429, headers={"Retry-After": "3600"}
+        )
+
+        (response,) = self._get("https://a.example/limited")
+
+        assert response.status_code == 429
+        async_transport.async_sleep.assert_not_called()
+
+    def test_counts_requests_in_the_shared_host_stats(self, async_transport):
+        self._get("https://a.example/1", "https://a.example/2")
+
+        assert http_client.get_host_stats()["a.example"]["requests"] == 2
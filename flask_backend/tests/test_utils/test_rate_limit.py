@@ -0,0 +1,49 @@
+from flask_backend.utils.rate_limit import TokenBucket
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestTokenBucket:
+    def test_allows_a_burst_up_to_capacity(self):
+        clock = _FakeClock()
+        bucket = TokenBucket(rate=1.0, capacity=3, clock=clock, sleep=clock.sleep)
+
+        for _ in range(3):
+            bucket.acquire()
+
+        assert clock.sleeps == []
+
+    def test_waits_for_a_refill_once_empty(self):
+        clock = _FakeClock()
+        bucket = TokenBucket(rate=4.0, capacity=1, clock=clock, sleep=clock.sleep)
+
+        bucket.acquire()
+        bucket.acquire()
+        bucket.acquire()
+
+        assert clock.sleeps == [0.25, 0.25]
+        assert clock.now == 0.5
+
+    def test_refills_with_elapsed_time_up_to_capacity(self):
+        clock = _FakeClock()
+        bucket = TokenBucket(rate=1.0, capacity=2, clock=clock, sleep=clock.sleep)
+        bucket.acquire()
+        bucket.acquire()
+
+        clock.now += 10
+        bucket.acquire()
+        bucket.acquire()
+        bucket.acquire()
+
+        assert clock.sleeps == [1.0]
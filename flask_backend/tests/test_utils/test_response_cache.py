@@ -0,0 +1,230 @@
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import text
+
+from flask_backend.db import db_session
+from flask_backend.env_config import RESPONSE_CACHE_TTL_SECONDS
+from flask_backend.models import Movie, Screening, ScreeningDate
+from flask_backend.repository import pipeline_runs, want_to_watch
+from flask_backend.repository.cinemas import get_by_slug as get_cinema_by_slug
+from flask_backend.utils.response_cache import (
+    CachedPage,
+    ResponseCache,
+    _compute_validators,
+    get_response_cache,
+)
+from flask_backend.utils.visitor import VISITOR_COOKIE_NAME
+
+DESKTOP_UA = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36"
+    )
+}
+
+
+def _create_screening(app, title, slug):
+    with app.app_context():
+        movie = Movie(title=title, slug=slug, created_at=datetime.now())
+        db_session.add(movie)
+        db_session.flush()
+        screening = Screening(
+            movie_id=movie.id,
+            cinema_id=get_cinema_by_slug("capitolio").id,
+            description="desc",
+            draft=False,
+        )
+        db_session.add(screening)
+        db_session.flush()
+        db_session.add(
+            ScreeningDate(screening_id=screening.id, date=date.today(), time="23:59")
+        )
+        db_session.commit()
+
+
+def _queries(statements):
+    # leaves out the PRAGMA query_only that marks public reads read-only
+    return [
+        statement for statement, _ in statements if not statement.startswith("PRAGMA")
+    ]
+
+
+def _cached_entries(app):
+    with app.app_context():
+        return len(get_response_cache()._entries)
+
+
+class TestResponseCache:
+    def test_evicts_least_recently_used_entry(self):
+        cache = ResponseCache(max_entries=2)
+        page = CachedPage(body=b"", mimetype="text/html")
+        cache.set("a", page)
+        cache.set("b", page)
+        cache.get("a")
+        cache.set("c", page)
+
+        assert cache.get("a") is page
+        assert cache.get("b") is None
+        assert cache.get("c") is page
+
+
+class TestComputeValidators:
+    def test_clock_dependent_pages_change_etag_between_windows(self, app):
+        now = datetime(2026, 10, 18, 20, 0, 0)
+        later = now + timedelta(seconds=RESPONSE_CACHE_TTL_SECONDS)
+        with app.test_request_context("/"):
+            first = _compute_validators(True, None, now=now)
+            second = _compute_validators(True, None, now=later)
+            assert first.etag != second.etag
+            assert second.last_modified > first.last_modified
+
+    def test_other_pages_only_change_etag_at_midnight(self, app):
+        now = datetime(2026, 10, 18, 20, 0, 0)
+        with app.test_request_context("/program"):
+            first = _compute_validators(False, None, now=now)
+            later = _compute_validators(False, None, now=now + timedelta(hours=3))
+            tomorrow = _compute_validators(False, None, now=now + timedelta(hours=4))
+            assert first == later
+            assert tomorrow.etag != first.etag
+
+    def test_visitor_marks_change_the_etag(self, app, client, setup_cinemas):
+        with app.app_context():
+            movie = Movie(title="Filme", slug="filme", created_at=datetime.now())
+            db_session.add(movie)
+            db_session.commit()
+            movie_id = movie.id
+        with app.test_request_context("/favoritos"):
+            before = _compute_validators(True, "visitor-1")
+            want_to_watch.toggle(movie_id, "visitor-1")
+            after = _compute_validators(True, "visitor-1")
+            assert before.etag != after.etag
+            assert after.last_modified is None
+
+    def test_finished_pipeline_run_moves_last_modified(self, app):
+        with app.test_request_context("/program"):
+            run = pipeline_runs.start("import-json")
+            before = _compute_validators(False, None)
+            pipeline_runs.finish(run.id, "success")
+            after = _compute_validators(False, None)
+            assert after.etag != before.etag
+            assert after.last_modified >= before.last_modified
+
+
+class TestCachedPage:
+    def test_anonymous_get_sets_etag_and_revalidation_headers(
+        self, client, setup_cinemas
+    ):
+        response = client.get("/program", headers=DESKTOP_UA)
+
+        assert response.status_code == 200
+        assert response.headers["ETag"]
+        assert "no-cache" in response.headers["Cache-Control"]
+        assert "User-Agent" in response.headers["Vary"]
+
+    def test_matching_if_none_match_returns_304(self, client, setup_cinemas):
+        etag = client.get("/program", headers=DESKTOP_UA).headers["ETag"]
+
+        response = client.get("/program", headers={**DESKTOP_UA, "If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.get_data() == b""
+
+    def test_second_request_is_served_from_the_cache(
+        self, app, client, setup_cinemas, captured_statements
+    ):
+        client.get("/weekend", headers=DESKTOP_UA)
+
+        with captured_statements() as statements:
+            response = client.get("/weekend", headers=DESKTOP_UA)
+
+        assert response.status_code == 200
+        # only the generation lookup queries the database
+        assert len(_queries(statements)) == 1
+        assert _cached_entries(app) == 1
+
+    def test_content_write_invalidates_the_page(self, app, client, setup_cinemas):
+        first = client.get("/", headers=DESKTOP_UA)
+        assert "Filme Novo" not in first.get_data(as_text=True)
+
+        _create_screening(app, "Filme Novo", "filme-novo")
+
+        second = client.get(
+            "/", headers={**DESKTOP_UA, "If-None-Match": first.headers["ETag"]}
+        )
+        assert second.status_code == 200
+        assert "Filme Novo" in second.get_data(as_text=True)
+
+    def test_generation_bumped_by_another_process_invalidates_the_page(
+        self, app, client, setup_cinemas
+    ):
+        client.get("/movies", headers=DESKTOP_UA)
+        with app.app_context():
+            # what another worker's commit looks like from here: a bump
+            # that never went through this process's flush listeners
+            db_session.execute(
+                text("UPDATE schedule_generation SET generation = generation + 1")
+            )
+            db_session.commit()
+
+        response = client.get("/movies", headers=DESKTOP_UA)
+
+        assert response.status_code == 200
+        assert _cached_entries(app) == 2
+
+    def test_logged_in_requests_bypass_the_cache(
+        self, app, auth_headers, setup_cinemas
+    ):
+        response = auth_headers.get("/program", headers=DESKTOP_UA)
+
+        assert response.status_code == 200
+        assert "ETag" not in response.headers
+        assert _cached_entries(app) == 0
+
+    def test_visitor_pages_revalidate_but_are_not_stored(
+        self, app, client, setup_cinemas
+    ):
+        client.set_cookie(VISITOR_COOKIE_NAME, "visitor-1")
+
+        first = client.get("/favoritos", headers=DESKTOP_UA)
+        second = client.get(
+            "/favoritos", headers={**DESKTOP_UA, "If-None-Match": first.headers["ETag"]}
+        )
+
+        assert "Last-Modified" not in first.headers
+        assert second.status_code == 304
+        assert _cached_entries(app) == 0
+
+    def test_if_modified_since_returns_304(self, client, setup_cinemas):
+        last_modified = client.get("/program", headers=DESKTOP_UA).headers[
+            "Last-Modified"
+        ]
+
+        response = client.get(
+            "/program", headers={**DESKTOP_UA, "If-Modified-Since": last_modified}
+        )
+
+        assert response.status_code == 304
+
+    def test_304_is_answered_with_a_single_statement(
+        self, client, setup_cinemas, captured_statements
+    ):
+        etag = client.get("/", headers=DESKTOP_UA).headers["ETag"]
+
+        with captured_statements() as statements:
+            response = client.get("/", headers={**DESKTOP_UA, "If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+        assert len(_queries(statements)) == 1
+
+    def test_not_found_is_not_cached(self, app, client, setup_cinemas):
+        response = client.get("/cinemas/nao-existe", headers=DESKTOP_UA)
+
+        assert response.status_code == 404
+        assert _cached_entries(app) == 0
+
+    def test_query_string_is_part_of_the_key(self, app, client, setup_cinemas):
+        client.get("/program", headers=DESKTOP_UA)
+        client.get("/program?cinema=capitolio", headers=DESKTOP_UA)
+
+        assert _cached_entries(app) == 2
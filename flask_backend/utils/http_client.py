@@ -0,0 +1,241 @@
+"""The shared HTTP client every outbound call goes through - cinema
+scrapers, TMDB, IMDB, imgBB uploads and poster downloads - built on httpx.
+
+Each host gets its own httpx.Client and with it its own connection pool
+(up to HTTP_CLIENT_MAX_CONNECTIONS_PER_HOST connections, kept alive
+between calls), created on first use and shared by every thread of the
+process. Connect failures are retried by the transport; idempotent
+requests answered with 429/502/503/504 are retried here with exponential
+backoff, or after the server's Retry-After - unless it asks for longer than
+HTTP_CLIENT_MAX_RETRY_AFTER_SECONDS, in which case the response is
+returned as is. HTTP/2 is negotiated when HTTP_CLIENT_HTTP2 is set and the
+optional `h2` package is installed.
+
+Like requests, a 4xx/5xx response is returned rather than raised - call
+raise_for_status(). Transport failures raise httpx.HTTPError.
+
+Coroutines use an AsyncSession instead (the scrapers, see scrapers/base.py):
+same retries, backoff and counters, over httpx.AsyncClients that live as
+long as the session, since an async client can't outlive its event loop.
+
+Every request is counted per host (see get_host_stats()):
+pipeline_runs.start() resets the counters and pipeline_runs.finish()
+stores them on the run, for the /admin/pipelines run detail page.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+import httpx
+
+from flask_backend.env_config import (
+    HTTP_CLIENT_BACKOFF_SECONDS,
+    HTTP_CLIENT_HTTP2,
+    HTTP_CLIENT_MAX_CONNECTIONS_PER_HOST,
+    HTTP_CLIENT_MAX_RETRY_AFTER_SECONDS,
+    HTTP_CLIENT_RETRIES,
+    HTTP_CLIENT_TIMEOUT_SECONDS,
+)
+
+logger = logging.getLogger(__name__)
+
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+@dataclass
+class HostStats:
+    requests: int = 0
+    errors: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+    def as_dict(self) -> dict:
+        average = self.total_ms / self.requests if self.requests else 0.0
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "avg_ms": round(average, 1),
+            "max_ms": round(self.max_ms, 1),
+        }
+
+
+_clients: Dict[str, httpx.Client] = {}
+_stats: Dict[str, HostStats] = defaultdict(HostStats)
+_lock = threading.Lock()
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _transport_kwargs() -> dict:
+    http2 = HTTP_CLIENT_HTTP2 and _http2_available()
+    if HTTP_CLIENT_HTTP2 and not http2:
+        logger.warning("HTTP_CLIENT_HTTP2 ativo, mas o pacote h2 não está instalado")
+    return {
+        "retries": HTTP_CLIENT_RETRIES,
+        "http2": http2,
+        "limits": httpx.Limits(
+            max_connections=HTTP_CLIENT_MAX_CONNECTIONS_PER_HOST,
+            max_keepalive_connections=HTTP_CLIENT_MAX_CONNECTIONS_PER_HOST,
+        ),
+    }
+
+
+def _build_client() -> httpx.Client:
+    return httpx.Client(
+        transport=httpx.HTTPTransport(**_transport_kwargs()),
+        timeout=HTTP_CLIENT_TIMEOUT_SECONDS,
+        follow_redirects=True,
+    )
+
+
+def _build_async_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        transport=httpx.AsyncHTTPTransport(**_transport_kwargs()),
+        timeout=HTTP_CLIENT_TIMEOUT_SECONDS,
+        follow_redirects=True,
+    )
+
+
+def _client_for(host: str) -> httpx.Client:
+    with _lock:
+        client = _clients.get(host)
+        if client is None:
+            client = _clients[host] = _build_client()
+        return client
+
+
+def _record(host: str, started: float, failed: bool) -> None:
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    with _lock:
+        stats = _stats[host]
+        stats.requests += 1
+        stats.errors += failed
+        stats.total_ms += elapsed_ms
+        stats.max_ms = max(stats.max_ms, elapsed_ms)
+
+
+def _retry_delay(
+    method: str, response: httpx.Response, attempt: int
+) -> Optional[float]:
+    """Seconds to wait before retrying, or None when the response is the
+    answer: not retryable, out of retries, or with a Retry-After longer than
+    a cron pipeline or a scraper run should stall for."""
+    if (
+        method not in IDEMPOTENT_METHODS
+        or response.status_code not in RETRY_STATUSES
+        or attempt >= HTTP_CLIENT_RETRIES
+    ):
+        return None
+    retry_after = response.headers.get("Retry-After", "")
+    if not retry_after.isdigit():
+        return HTTP_CLIENT_BACKOFF_SECONDS * 2**attempt
+    if float(retry_after) > HTTP_CLIENT_MAX_RETRY_AFTER_SECONDS:
+        return None
+    return float(retry_after)
+
+
+def request(method: str, url: str, **kwargs) -> httpx.Response:
+    """Sends a request through the client of `url`'s host. Takes the same
+    keyword arguments as httpx.Client.request (params, headers, data, json,
+    timeout, ...)."""
+    host = httpx.URL(url).host
+    client = _client_for(host)
+    method = method.upper()
+    attempt = 0
+    while True:
+        started = time.perf_counter()
+        try:
+            response = client.request(method, url, **kwargs)
+        except httpx.HTTPError:
+            _record(host, started, failed=True)
+            raise
+        _record(host, started, failed=response.status_code >= 400)
+        delay = _retry_delay(method, response, attempt)
+        if delay is None:
+            return response
+        time.sleep(delay)
+        attempt += 1
+
+
+def get(url: str, **kwargs) -> httpx.Response:
+    return request("GET", url, **kwargs)
+
+
+def post(url: str, **kwargs) -> httpx.Response:
+    return request("POST", url, **kwargs)
+
+
+class AsyncSession:
+    """Async counterpart of request()/get() for coroutines, with one
+    httpx.AsyncClient per host, closed with the session:
+
+        async with http_client.AsyncSession() as session:
+            response = await session.get(url)
+    """
+
+    def __init__(self):
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+
+    def _client_for(self, host: str) -> httpx.AsyncClient:
+        client = self._clients.get(host)
+        if client is None:
+            client = self._clients[host] = _build_async_client()
+        return client
+
+    async def request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        host = httpx.URL(url).host
+        client = self._client_for(host)
+        method = method.upper()
+        attempt = 0
+        while True:
+            started = time.perf_counter()
+            try:
+                response = await client.request(method, url, **kwargs)
+            except httpx.HTTPError:
+                _record(host, started, failed=True)
+                raise
+            _record(host, started, failed=response.status_code >= 400)
+            delay = _retry_delay(method, response, attempt)
+            if delay is None:
+                return response
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def aclose(self) -> None:
+        for client in self._clients.values():
+            await client.aclose()
+        self._clients.clear()
+
+    async def __aenter__(self) -> "AsyncSession":
+        return self
+
+    async def __aexit__(self, *_exc_info) -> None:
+        await self.aclose()
+
+
+def get_host_stats() -> Dict[str, dict]:
+    """Per-host counters since the last reset_host_stats():
+    {host: {"requests", "errors", "avg_ms", "max_ms"}}. Errors are
+    transport failures and 4xx/5xx responses."""
+    with _lock:
+        return {host: stats.as_dict() for host, stats in sorted(_stats.items())}
+
+
+def reset_host_stats() -> None:
+    with _lock:
+        _stats.clear()
@@ -0,0 +1,200 @@
+"""Conditional GET and an in-process cache of rendered public pages, both
+keyed on the shared schedule_generation counter (see
+repository/schedule_generation.py).
+
+Before the view runs, one statement reads the generation and the page's
+Last-Modified (newest content write or finished pipeline run). Those, the
+request path, the mobile/desktop variant and the clock form the page's
+ETag, so If-None-Match / If-Modified-Since are answered with 304 without
+rendering anything or running the view's queries. Every input is shared
+state, so all gunicorn workers hand out the same validators and any of
+them can answer a revalidation.
+
+On a miss the rendered body is kept in a per-worker LRU under that ETag. A
+write committed by any worker or CLI pipeline changes the generation and
+with it every ETag, so no worker serves a stale copy.
+
+Only anonymous requests take part: a logged-in admin sees drafts, and a
+pending flash message is per-session. Requests carrying the want-to-watch
+visitor cookie on views that read it get validators that include the
+visitor's marks, but their pages are never stored.
+"""
+
+import functools
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Callable, Optional
+
+from flask import Response, current_app, g, make_response, request, session
+from werkzeug.http import is_resource_modified
+
+from flask_backend.env_config import (
+    RESPONSE_CACHE_MAX_ENTRIES,
+    RESPONSE_CACHE_TTL_SECONDS,
+)
+from flask_backend.repository import schedule_generation
+from flask_backend.repository.want_to_watch import get_movie_ids_for_visitor
+from flask_backend.utils.mobile import is_mobile_user_agent
+from flask_backend.utils.visitor import get_visitor_id
+
+_EXTENSION_KEY = "response_cache"
+
+
+@dataclass(frozen=True)
+class CachedPage:
+    body: bytes
+    mimetype: str
+
+
+@dataclass(frozen=True)
+class Validators:
+    etag: str
+    # None for per-visitor pages: un-marking a movie doesn't move any
+    # timestamp, so only the ETag can tell those versions apart
+    last_modified: Optional[datetime]
+
+
+class ResponseCache:
+    """Thread-safe LRU of CachedPage entries keyed by ETag. Entries never
+    go stale - a changed page gets a new ETag - so old ones simply age out
+    of the LRU."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, CachedPage]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, etag: str) -> Optional[CachedPage]:
+        with self._lock:
+            page = self._entries.get(etag)
+            if page is not None:
+                self._entries.move_to_end(etag)
+            return page
+
+    def set(self, etag: str, page: CachedPage) -> None:
+        with self._lock:
+            self._entries[etag] = page
+            self._entries.move_to_end(etag)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def get_response_cache(app=None) -> ResponseCache:
+    app = app or current_app
+    cache = app.extensions.get(_EXTENSION_KEY)
+    if cache is None:
+        cache = app.extensions.setdefault(
+            _EXTENSION_KEY, ResponseCache(RESPONSE_CACHE_MAX_ENTRIES)
+        )
+    return cache
+
+
+def _is_cacheable_request() -> bool:
+    if request.method not in ("GET", "HEAD"):
+        return False
+    return g.user is None and "_flashes" not in session
+
+
+def _http_date(moment: datetime) -> datetime:
+    # stored timestamps are naive local time; HTTP dates are UTC
+    return moment.astimezone(timezone.utc).replace(microsecond=0)
+
+
+def _compute_validators(
+    varies_on_clock: bool, visitor_id: Optional[str], now: Optional[datetime] = None
+) -> Validators:
+    """ETag and Last-Modified for the current request, from shared state
+    only. Pages always change at midnight; varies_on_clock pages (the ones
+    hiding showtimes that already started) also change every
+    RESPONSE_CACHE_TTL_SECONDS."""
+    now = now or datetime.now()
+    generation, last_modified = schedule_generation.current()
+    floor = datetime.combine(now.date(), datetime.min.time())
+    parts = [
+        generation,
+        last_modified,
+        now.date(),
+        request.full_path,
+        is_mobile_user_agent(request.headers.get("User-Agent", "")),
+    ]
+    if varies_on_clock:
+        window = int(now.timestamp()) // RESPONSE_CACHE_TTL_SECONDS
+        parts.append(window)
+        floor = max(floor, datetime.fromtimestamp(window * RESPONSE_CACHE_TTL_SECONDS))
+    if visitor_id is not None:
+        parts.append(sorted(get_movie_ids_for_visitor(visitor_id)))
+
+    etag = hashlib.sha1(repr(parts).encode()).hexdigest()
+    if visitor_id is not None:
+        return Validators(etag=etag, last_modified=None)
+    newest = max(last_modified, floor) if last_modified else floor
+    return Validators(etag=etag, last_modified=_http_date(newest))
+
+
+def _with_validators(response: Response, validators: Validators) -> Response:
+    response.set_etag(validators.etag)
+    if validators.last_modified is not None:
+        response.last_modified = validators.last_modified
+    # cacheable, but always revalidated - a 304 is cheap, a stale
+    # schedule isn't
+    response.cache_control.no_cache = True
+    response.vary.update(("User-Agent", "Cookie"))
+    return response
+
+
+def _not_modified(validators: Validators) -> Response:
+    return _with_validators(Response(status=304), validators)
+
+
+def cached_page(varies_on_visitor: bool = False, varies_on_clock: bool = False):
+    """Answers an anonymous GET of the decorated view with 304 when the
+    client's validators still match, and otherwise serves it from the
+    response cache. Pass varies_on_visitor=True for views that read the
+    want-to-watch visitor cookie and varies_on_clock=True for views that
+    hide showtimes which have already started."""
+
+    def decorator(view: Callable) -> Callable:
+        @functools.wraps(view)
+        def wrapped_view(**kwargs):
+            if not _is_cacheable_request():
+                return view(**kwargs)
+
+            visitor_id = get_visitor_id(request) if varies_on_visitor else None
+            validators = _compute_validators(varies_on_clock, visitor_id)
+            if not is_resource_modified(
+                request.environ,
+                etag=validators.etag,
+                last_modified=validators.last_modified,
+            ):
+                return _not_modified(validators)
+
+            cache = get_response_cache()
+            page = None if visitor_id else cache.get(validators.etag)
+            if page is None:
+                response = make_response(view(**kwargs))
+                # redirects, errors, anything setting a cookie or flashing
+                # a message is per-request - hand it back untouched
+                if (
+                    response.status_code != 200
+                    or "Set-Cookie" in response.headers
+                    or "_flashes" in session
+                ):
+                    return response
+                if visitor_id:
+                    return _with_validators(response, validators)
+                page = CachedPage(body=response.get_data(), mimetype=response.mimetype)
+                cache.set(validators.etag, page)
+            return _with_validators(
+                Response(page.body, mimetype=page.mimetype), validators
+            )
+
+        return wrapped_view
+
+    return decorator
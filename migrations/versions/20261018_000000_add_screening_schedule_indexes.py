@@ -0,0 +1,41 @@
+"""Adds composite indexes backing the public schedule queries in
+repository/screenings.py, which now compare screening_dates.date against
+raw date ranges instead of wrapping it in func.date().
+
+Revision ID: 20261018_000000
+Revises: 20260805_000000
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261018_000000"
+down_revision: Union[str, None] = "20260805_000000"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_screening_dates_date_time", "screening_dates", ["date", "time"])
+    op.create_index(
+        "ix_screening_dates_screening_id_date",
+        "screening_dates",
+        ["screening_id", "date"],
+    )
+    op.create_index(
+        "ix_screenings_cinema_id_draft", "screenings", ["cinema_id", "draft"]
+    )
+    op.create_index(
+        "ix_screenings_movie_id_cinema_id", "screenings", ["movie_id", "cinema_id"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_screenings_movie_id_cinema_id", table_name="screenings")
+    op.drop_index("ix_screenings_cinema_id_draft", table_name="screenings")
+    op.drop_index("ix_screening_dates_screening_id_date", table_name="screening_dates")
+    op.drop_index("ix_screening_dates_date_time", table_name="screening_dates")
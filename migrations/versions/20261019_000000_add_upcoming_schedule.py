@@ -0,0 +1,66 @@
+"""Adds the upcoming_schedule read model (see UpcomingShowtime in
+flask_backend/models.py). Created empty - run
+`flask --app flask_backend rebuild-upcoming-schedule` once after upgrading
+to backfill it from the existing screenings.
+
+Revision ID: 20261019_000000
+Revises: 20261018_000000
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_000000"
+down_revision: Union[str, None] = "20261018_000000"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "upcoming_schedule",
+        sa.Column("id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("screening_id", sa.Integer(), nullable=False),
+        sa.Column("movie_id", sa.Integer(), nullable=False),
+        sa.Column("cinema_id", sa.Integer(), nullable=False),
+        sa.Column("date", sa.Date(), nullable=False),
+        sa.Column("time", sa.String(), nullable=True),
+        sa.Column("movie_title", sa.String(), nullable=False),
+        sa.Column("movie_slug", sa.String(), nullable=True),
+        sa.Column("release_year", sa.Integer(), nullable=True),
+        sa.Column("directors", sa.Text(), nullable=False),
+        sa.Column("cinema_slug", sa.String(), nullable=False),
+        sa.Column("cinema_short_name", sa.String(), nullable=False),
+        sa.Column("cinema_color", sa.String(), nullable=False),
+        sa.Column("description", sa.String(), nullable=False),
+        sa.Column("screening_url", sa.String(), nullable=True),
+        sa.Column("image", sa.String(), nullable=True),
+        sa.Column("image_alt", sa.String(), nullable=True),
+        sa.Column("image_width", sa.Integer(), nullable=True),
+        sa.Column("image_height", sa.Integer(), nullable=True),
+        sa.Column("draft", sa.Boolean(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_upcoming_schedule_screening_id", "upcoming_schedule", ["screening_id"]
+    )
+    op.create_index("ix_upcoming_schedule_movie_id", "upcoming_schedule", ["movie_id"])
+    op.create_index(
+        "ix_upcoming_schedule_cinema_id", "upcoming_schedule", ["cinema_id"]
+    )
+    op.create_index(
+        "ix_upcoming_schedule_date_time", "upcoming_schedule", ["date", "time"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_upcoming_schedule_date_time", table_name="upcoming_schedule")
+    op.drop_index("ix_upcoming_schedule_cinema_id", table_name="upcoming_schedule")
+    op.drop_index("ix_upcoming_schedule_movie_id", table_name="upcoming_schedule")
+    op.drop_index("ix_upcoming_schedule_screening_id", table_name="upcoming_schedule")
+    op.drop_table("upcoming_schedule")
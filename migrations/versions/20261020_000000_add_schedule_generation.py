@@ -0,0 +1,34 @@
+"""Adds the single-row schedule_generation counter behind the public page
+response cache (see ScheduleGeneration in flask_backend/models.py).
+
+Revision ID: 20261020_000000
+Revises: 20261019_000000
+Create Date: 2026-10-20 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261020_000000"
+down_revision: Union[str, None] = "20261019_000000"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    schedule_generation = op.create_table(
+        "schedule_generation",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("generation", sa.Integer(), nullable=False),
+        sa.Column("changed_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.bulk_insert(schedule_generation, [{"id": 1, "generation": 0}])
+
+
+def downgrade() -> None:
+    op.drop_table("schedule_generation")
@@ -0,0 +1,26 @@
+"""Indexes pipeline_runs.finished_at so the conditional GET check's
+MAX(finished_at) is a single index seek.
+
+Revision ID: 20261021_000000
+Revises: 20261020_000000
+Create Date: 2026-10-21 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261021_000000"
+down_revision: Union[str, None] = "20261020_000000"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_pipeline_runs_finished_at", "pipeline_runs", ["finished_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_pipeline_runs_finished_at", table_name="pipeline_runs")
@@ -0,0 +1,27 @@
+"""Adds pipeline_runs.http_stats, the per-host outbound HTTP counters of a
+run.
+
+Revision ID: 20261022_000000
+Revises: 20261021_000000
+Create Date: 2026-10-22 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261022_000000"
+down_revision: Union[str, None] = "20261021_000000"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("pipeline_runs", sa.Column("http_stats", sa.Text(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("pipeline_runs", "http_stats")
@@ -0,0 +1,29 @@
+"""Adds pipeline_runs.cinema_fingerprints, the fingerprints of the feature
+lists an import-json run imported, per cinema.
+
+Revision ID: 20261023_000000
+Revises: 20261022_000000
+Create Date: 2026-10-23 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261023_000000"
+down_revision: Union[str, None] = "20261022_000000"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "pipeline_runs", sa.Column("cinema_fingerprints", sa.Text(), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("pipeline_runs", "cinema_fingerprints")
@@ -0,0 +1,213 @@
+import asyncio
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import date
+from functools import partial
+from itertools import islice
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    TypeVar,
+)
+
+import httpx
+
+from flask_backend.env_config import SCRAPER_MAX_CONCURRENCY_PER_HOST
+from flask_backend.utils import http_client
+from scrapers.http_cache import (
+    PageCache,
+    fetch_page_async,
+    fetch_page_conditional,
+    get_page_cache,
+)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+@dataclass
+class _ScrapeRun:
+    """What the coroutines of one run_all() share: the HTTP session and
+    each host's request slots."""
+
+    session: http_client.AsyncSession
+    slots: Dict[str, asyncio.Semaphore] = field(default_factory=dict)
+
+    def slot(self, host: str) -> asyncio.Semaphore:
+        semaphore = self.slots.get(host)
+        if semaphore is None:
+            semaphore = self.slots[host] = asyncio.Semaphore(
+                SCRAPER_MAX_CONCURRENCY_PER_HOST
+            )
+        return semaphore
+
+
+_current_run: ContextVar[_ScrapeRun] = ContextVar("scrape_run")
+
+
+@dataclass
+class _PagesRead:
+    """The pages one scrape_if_changed() read, and whether its features can
+    be trusted to stand for them (see AsyncScraper.mark_incomplete())."""
+
+    urls: List[str] = field(default_factory=list)
+    complete: bool = True
+
+
+_pages_read: ContextVar[_PagesRead] = ContextVar("pages_read")
+
+
+async def _gather(calls: Iterable[Callable[[], Awaitable[Any]]]) -> List[Any]:
+    async with http_client.AsyncSession() as session:
+        token = _current_run.set(_ScrapeRun(session))
+        try:
+            return list(await asyncio.gather(*(call() for call in calls)))
+        finally:
+            _current_run.reset(token)
+
+
+def run_all(*calls: Callable[[], Awaitable[Any]]) -> List[Any]:
+    """Runs the coroutine functions `calls` concurrently on a new event loop,
+    all sharing one http_client.AsyncSession and the per-host request
+    slots, and returns their results in `calls` order. The first failure is
+    raised."""
+    return asyncio.run(_gather(calls))
+
+
+class AsyncScraper:
+    """Base of the scrapers. Pages are fetched by coroutines, through the
+    session of the run_all() they run in, holding one of the
+    SCRAPER_MAX_CONCURRENCY_PER_HOST slots of their host - so every
+    scraper of a run can wait on the network at the same time without
+    hammering any one site.
+
+    Subclasses implement `scrape()`; get_daily_features_json() runs it
+    alone and blocks until it's done. `pages_ahead` is how many pages of
+    a pagination-like loop (fetch_ahead()) are requested at once: more than
+    one means a few requests past the last page.
+
+    In production, scrape_if_changed() skips the whole scrape - parsing and
+    LLM extraction included - when every page the scraper read earlier that
+    day is unchanged (see http_cache.PageCache)."""
+
+    pages_ahead = 1
+
+    async def scrape(self):
+        raise NotImplementedError
+
+    async def scrape_if_changed(self) -> Optional[list]:
+        """scrape(), or None when the pages it read in an earlier
+        scrape_if_changed() of the day all revalidate as unchanged. Always
+        scrapes outside production."""
+        page_cache = get_page_cache()
+        if page_cache is None:
+            return await self.scrape()
+
+        scraper, day = type(self).__name__, date.today().isoformat()
+        urls = page_cache.pages_of(scraper, day)
+        if urls:
+            changed = await self.fetch_all(
+                partial(self._page_changed, page_cache), urls
+            )
+            if not any(changed):
+                return None
+            # the revalidation cached the new pages: until a scrape of them
+            # succeeds, a later run must not take them for unchanged
+            page_cache.set_pages_of(scraper, day, [])
+
+        pages_read = _PagesRead()
+        token = _pages_read.set(pages_read)
+        try:
+            features = await self.scrape()
+        finally:
+            _pages_read.reset(token)
+        page_cache.set_pages_of(
+            scraper, day, pages_read.urls if pages_read.complete else []
+        )
+        return features
+
+    async def _page_changed(self, page_cache: PageCache, url: str) -> bool:
+        cached = page_cache.get(url)
+        headers = cached.request_headers if cached else {}
+        try:
+            _text, changed = await fetch_page_conditional(
+                page_cache, url, headers, lambda h: self.fetch(url, headers=h)
+            )
+        except httpx.HTTPError:
+            # gone or failing: let scrape() deal with it
+            return True
+        return changed
+
+    def mark_incomplete(self):
+        """Tells scrape_if_changed() that the features being scraped don't
+        reflect the pages (an LLM extraction failed, say), so the next run
+        must scrape again even if they are unchanged. Also works from
+        asyncio.to_thread()."""
+        pages_read = _pages_read.get(None)
+        if pages_read is not None:
+            pages_read.complete = False
+
+    def get_daily_features_json(self):
+        return run_all(self.scrape)[0]
+
+    async def fetch(self, url: str, **kwargs) -> httpx.Response:
+        """GET `url` through the run's session (retries and backoff
+        included), within its host's slots."""
+        run = _current_run.get()
+        async with run.slot(httpx.URL(url).host):
+            return await run.session.get(url, **kwargs)
+
+    async def fetch_page(
+        self,
+        cache_path: Optional[str],
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> str:
+        """Page text. Outside production, with http_cache.fetch_page's cache
+        files (none for a None cache_path); in production, revalidated
+        against the page cache and remembered for scrape_if_changed()."""
+        headers = headers or {}
+        page_cache = get_page_cache()
+        if page_cache is None:
+            return await fetch_page_async(
+                cache_path, lambda: self.fetch(url, headers=headers)
+            )
+
+        text, _changed = await fetch_page_conditional(
+            page_cache, url, headers, lambda h: self.fetch(url, headers=h)
+        )
+        pages_read = _pages_read.get(None)
+        if pages_read is not None:
+            pages_read.urls.append(url)
+        return text
+
+    async def fetch_all(
+        self, fetch: Callable[[T], Awaitable[R]], items: Iterable[T]
+    ) -> List[R]:
+        """await fetch(item) for every item, concurrently, in items' order."""
+        return list(await asyncio.gather(*(fetch(item) for item in items)))
+
+    async def fetch_ahead(
+        self, fetch: Callable[[T], Awaitable[R]], items: Iterable[T]
+    ) -> AsyncIterator[R]:
+        """Yields await fetch(item) for each of the (possibly endless) items,
+        in order, `pages_ahead` at a time. When the caller stops iterating,
+        the rest of the batch is dropped - failures included."""
+        items = iter(items)
+        while True:
+            batch = list(islice(items, self.pages_ahead))
+            if not batch:
+                return
+            results = await asyncio.gather(
+                *(fetch(item) for item in batch), return_exceptions=True
+            )
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+                yield result
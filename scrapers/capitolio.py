@@ -1,14 +1,14 @@
 import os
 import re
 from datetime import datetime, timedelta
+from itertools import count
 
-import requests
 from bs4 import BeautifulSoup
 
-from scrapers.http_cache import fetch_page
+from scrapers.base import AsyncScraper, run_all
 
 
-class Capitolio:
+class Capitolio(AsyncScraper):
     def __init__(self):
         self.url = "https://www.capitolio.org.br"
         self.dir = os.path.join("capitolio")
@@ -25,20 +25,25 @@ class Capitolio:
     def _day_file(self, day) -> str:
         return os.path.join(self.dir, f"{day}.html")
 
-    def _day_schedule_html(self, day) -> str:
-        return fetch_page(self._day_file(day), lambda: requests.get(self._day_url(day)))
+    async def _day_schedule_html(self, day) -> str:
+        return await self.fetch_page(self._day_file(day), self._day_url(day))
 
     def get_daily_features_json(self):
         """Deprecated: Use get_weekly_features_json() instead"""
         return self.get_weekly_features_json()
 
     def get_weekly_features_json(self):
-        cur_day = datetime.now()
+        return run_all(self.scrape)[0]
+
+    async def _day_schedule(self, day):
+        return day, await self._day_schedule_html(day.strftime("%Y-%m-%d"))
+
+    async def scrape(self):
+        first_day = datetime.now()
+        days = (first_day + timedelta(days=offset) for offset in count())
         features = []
-        while True:
-            soup = BeautifulSoup(
-                self._day_schedule_html(cur_day.strftime("%Y-%m-%d")), "html.parser"
-            )
+        async for cur_day, schedule_html in self.fetch_ahead(self._day_schedule, days):
+            soup = BeautifulSoup(schedule_html, "html.parser")
             movies_div = soup.find_all("div", class_="movie")
             if cur_day.weekday() != 0 and len(movies_div) == 0:
                 break
@@ -110,6 +115,5 @@ class Capitolio:
                                 "Não informado"
                             ]
                 features.append(feature_film)
-            cur_day = cur_day + timedelta(days=1)
 
         return features
@@ -1,16 +1,16 @@
+import asyncio
 import json
 import os
 from datetime import datetime
 
-import requests
 from bs4 import BeautifulSoup
 
-from scrapers.http_cache import fetch_page
+from scrapers.base import AsyncScraper
 from scrapers.llm_cache import get_features_with_cache
 from scrapers.llms import CineCincoExtractorLLM
 
 
-class CineCinco:
+class CineCinco(AsyncScraper):
     def __init__(self):
         self.url = "https://www.pucrs.br/cultura/projetos/cine-cinco/"
         self.dir = os.path.join("cine-cinco")
@@ -28,26 +28,24 @@ class CineCinco:
         cur_datetime = datetime.now()
         return cur_datetime.strftime("%Y-%m-%d")
 
-    def _get_url_content(self, file, url):
+    async def _get_url_content(self, file, url):
         """Returns contents from file, or GET from url and save to file"""
-        return fetch_page(
+        return await self.fetch_page(
             file,
-            lambda: requests.get(
-                url,
-                headers={
-                    "User-Agent": (
-                        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:109.0) "
-                        "Gecko/20100101 Firefox/116.0"
-                    ),
-                },
-            ),
+            url,
+            headers={
+                "User-Agent": (
+                    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:109.0) "
+                    "Gecko/20100101 Firefox/116.0"
+                ),
+            },
         )
 
-    def _get_content_soup(self):
+    async def _get_content_soup(self):
         """Returns the BeautifulSoup node for the page's `div.content` block,
         which holds the entire "Programação" section."""
         html_filepath = os.path.join(self.todays_dir, "page.html")
-        html = self._get_url_content(html_filepath, self.url)
+        html = await self._get_url_content(html_filepath, self.url)
         soup = BeautifulSoup(html, "html.parser")
         content = soup.select_one("div.content.clearfix") or soup.select_one(
             "div.content"
@@ -88,9 +86,21 @@ class CineCinco:
             for movie in gemini_output["movies"]
         ]
 
-    def get_daily_features_json(self):
-        content_soup = self._get_content_soup()
+    async def scrape(self):
+        content_soup = await self._get_content_soup()
         text = self._get_text_from_soup(content_soup)
-        return get_features_with_cache(
-            self.cache_file, text, lambda: self._extract_features(text)
+        # the Gemini call blocks: keep it off the event loop so the other
+        # scrapers of the run go on meanwhile
+        return await asyncio.to_thread(
+            get_features_with_cache,
+            self.cache_file,
+            text,
+            lambda: self._extract_features_or_mark_incomplete(text),
         )
+
+    def _extract_features_or_mark_incomplete(self, text):
+        features = self._extract_features(text)
+        if features is None:
+            # fallback features: retry the extraction on the next run
+            self.mark_incomplete()
+        return features
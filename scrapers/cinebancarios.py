@@ -1,17 +1,17 @@
+import asyncio
 import json
 import os
 import xml.etree.ElementTree as ET
 from datetime import datetime
 
-import requests
 from bs4 import BeautifulSoup
 
-from scrapers.http_cache import fetch_page
+from scrapers.base import AsyncScraper
 from scrapers.llm_cache import get_features_with_cache
 from scrapers.llms import CineBancariosExtractorLLM
 
 
-class CineBancarios:
+class CineBancarios(AsyncScraper):
     def __init__(self):
         self.url = "http://cinebancarios.blogspot.com/feeds/posts/default?alt=rss"
         self.dir = os.path.join("cinebancarios")
@@ -26,9 +26,9 @@ class CineBancarios:
 
         self.cache_file = os.path.join(self.dir, "cache.json")
 
-    def _get_url_content(self, file, url):
+    async def _get_url_content(self, file, url):
         """Returns contents from file, or GET from url and save to file"""
-        return fetch_page(file, lambda: requests.get(url))
+        return await self.fetch_page(file, url)
 
     def _get_today_ymd(self):
         cur_datetime = datetime.now()
@@ -36,9 +36,9 @@ class CineBancarios:
 
         return cur_date
 
-    def _get_current_blog_post_soup(self):
+    async def _get_current_blog_post_soup(self):
         rss_filepath = os.path.join(self.todays_dir, "feed.xml")
-        blog_rss = self._get_url_content(rss_filepath, self.url)
+        blog_rss = await self._get_url_content(rss_filepath, self.url)
         root = ET.fromstring(blog_rss)
         for child in root[0]:
             if child.tag != "item":
@@ -75,9 +75,21 @@ class CineBancarios:
             for movie in gemini_output["movies"]
         ]
 
-    def get_daily_features_json(self):
-        soup = self._get_current_blog_post_soup()
+    async def scrape(self):
+        soup = await self._get_current_blog_post_soup()
         text = self._get_text_from_soup(soup)
-        return get_features_with_cache(
-            self.cache_file, text, lambda: self._extract_features(text)
+        # the Gemini call blocks: keep it off the event loop so the other
+        # scrapers of the run go on meanwhile
+        return await asyncio.to_thread(
+            get_features_with_cache,
+            self.cache_file,
+            text,
+            lambda: self._extract_features_or_mark_incomplete(text),
         )
+
+    def _extract_features_or_mark_incomplete(self, text):
+        features = self._extract_features(text)
+        if features is None:
+            # fallback features: retry the extraction on the next run
+            self.mark_incomplete()
+        return features
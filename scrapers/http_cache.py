@@ -1,31 +1,234 @@
+"""Caches of the pages the scrapers read.
+
+Outside production, fetch_page() keeps each page in a file of the scraper's
+directory and never requests it again - handy while working on a parser.
+
+In production, PageCache keeps the last copy of every page in a SQLite file
+(SCRAPER_PAGE_CACHE_PATH) along with its ETag, Last-Modified and body hash:
+fetch_page_conditional() sends them back as If-None-Match /
+If-Modified-Since, and a 304 - or a 200 with the same body - means the page
+didn't change. It also remembers which pages each scraper read on a given
+day, which is how AsyncScraper.scrape_if_changed() tells, with a few cheap
+requests, that a cinema has nothing new.
+"""
+
+import hashlib
+import json
 import os
-from typing import Callable
+import sqlite3
+import threading
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
 
-import requests
+import httpx
 
-from flask_backend.env_config import APP_ENVIRONMENT
+from flask_backend.env_config import (
+    APP_ENVIRONMENT,
+    SCRAPER_PAGE_CACHE_ENABLED,
+    SCRAPER_PAGE_CACHE_PATH,
+)
 from flask_backend.utils.enums.environment import EnvironmentEnum
 
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS pages (
+        url TEXT PRIMARY KEY,
+        request_headers TEXT NOT NULL,
+        etag TEXT,
+        last_modified TEXT,
+        sha256 TEXT NOT NULL,
+        body TEXT NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS scraper_pages (
+        scraper TEXT NOT NULL,
+        day TEXT NOT NULL,
+        url TEXT NOT NULL,
+        PRIMARY KEY (scraper, day, url)
+    )
+    """,
+)
+
 
 def _dev_cache_enabled() -> bool:
     return APP_ENVIRONMENT != EnvironmentEnum.PRODUCTION
 
 
-def fetch_page(cache_path: str, fetch: Callable[[], requests.Response]) -> str:
-    """Returns contents from cache_path if present (outside production), otherwise
-    calls fetch() and, outside production, saves the response to cache_path."""
-    if _dev_cache_enabled() and os.path.exists(cache_path):
+def _read_cache(cache_path: Optional[str]) -> Optional[str]:
+    if cache_path is not None and _dev_cache_enabled() and os.path.exists(cache_path):
         with open(cache_path) as f:
             return f.read()
+    return None
 
-    response = fetch()
-    response.raise_for_status()
 
-    if _dev_cache_enabled():
+def _write_cache(cache_path: Optional[str], text: str) -> None:
+    if cache_path is not None and _dev_cache_enabled():
         cache_dir = os.path.dirname(cache_path)
         if cache_dir:
             os.makedirs(cache_dir, exist_ok=True)
         with open(cache_path, "w") as f:
-            f.write(response.text)
+            f.write(text)
 
+
+def fetch_page(cache_path: str, fetch: Callable[[], httpx.Response]) -> str:
+    """Returns contents from cache_path if present (outside production), otherwise
+    calls fetch() and, outside production, saves the response to cache_path."""
+    cached = _read_cache(cache_path)
+    if cached is not None:
+        return cached
+
+    response = fetch()
+    response.raise_for_status()
+    _write_cache(cache_path, response.text)
+    return response.text
+
+
+async def fetch_page_async(
+    cache_path: str, fetch: Callable[[], Awaitable[httpx.Response]]
+) -> str:
+    """fetch_page() for coroutines: same cache files, but awaits fetch(). A
+    None cache_path skips them."""
+    cached = _read_cache(cache_path)
+    if cached is not None:
+        return cached
+
+    response = await fetch()
+    response.raise_for_status()
+    _write_cache(cache_path, response.text)
     return response.text
+
+
+@dataclass
+class CachedPage:
+    request_headers: Dict[str, str]
+    etag: Optional[str]
+    last_modified: Optional[str]
+    sha256: str
+    body: str
+
+
+class PageCache:
+    """Pages stored in the SQLite file at `path`, which is created on first
+    use. Each thread gets its own connection."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            for statement in _SCHEMA:
+                connection.execute(statement)
+            self._local.connection = connection
+        return connection
+
+    def get(self, url: str) -> Optional[CachedPage]:
+        row = (
+            self._connection()
+            .execute(
+                "SELECT request_headers, etag, last_modified, sha256, body"
+                " FROM pages WHERE url = ?",
+                (url,),
+            )
+            .fetchone()
+        )
+        if row is None:
+            return None
+        request_headers, etag, last_modified, sha256, body = row
+        return CachedPage(
+            json.loads(request_headers), etag, last_modified, sha256, body
+        )
+
+    def set(self, url: str, page: CachedPage) -> None:
+        self._connection().execute(
+            "INSERT OR REPLACE INTO pages"
+            " (url, request_headers, etag, last_modified, sha256, body)"
+            " VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                url,
+                json.dumps(page.request_headers),
+                page.etag,
+                page.last_modified,
+                page.sha256,
+                page.body,
+            ),
+        )
+
+    def pages_of(self, scraper: str, day: str) -> List[str]:
+        """URLs `scraper` read on `day` (an ISO date), as of its last
+        set_pages_of()."""
+        rows = self._connection().execute(
+            "SELECT url FROM scraper_pages WHERE scraper = ? AND day = ? ORDER BY url",
+            (scraper, day),
+        )
+        return [url for (url,) in rows]
+
+    def set_pages_of(self, scraper: str, day: str, urls: List[str]) -> None:
+        """Replaces the pages `scraper` read - earlier days included."""
+        connection = self._connection()
+        with connection:
+            connection.execute("BEGIN")
+            connection.execute(
+                "DELETE FROM scraper_pages WHERE scraper = ?", (scraper,)
+            )
+            connection.executemany(
+                "INSERT OR IGNORE INTO scraper_pages (scraper, day, url) VALUES (?, ?, ?)",
+                [(scraper, day, url) for url in urls],
+            )
+
+
+_page_cache: Optional[PageCache] = None
+_page_cache_lock = threading.Lock()
+
+
+def get_page_cache() -> Optional[PageCache]:
+    """The process-wide page cache: None outside production, where the
+    cache files are used instead, or when SCRAPER_PAGE_CACHE_ENABLED is off."""
+    global _page_cache
+    if _dev_cache_enabled() or not SCRAPER_PAGE_CACHE_ENABLED:
+        return None
+    with _page_cache_lock:
+        if _page_cache is None:
+            _page_cache = PageCache(SCRAPER_PAGE_CACHE_PATH)
+        return _page_cache
+
+
+async def fetch_page_conditional(
+    page_cache: PageCache,
+    url: str,
+    headers: Dict[str, str],
+    fetch: Callable[[Dict[str, str]], Awaitable[httpx.Response]],
+) -> Tuple[str, bool]:
+    """Awaits fetch(headers) - `headers` plus the validators of url's cached
+    copy, if any - and returns the page text and whether it changed since
+    that copy. The cache is updated with the new copy."""
+    cached = page_cache.get(url)
+    conditional_headers = dict(headers)
+    if cached is not None:
+        if cached.etag:
+            conditional_headers["If-None-Match"] = cached.etag
+        if cached.last_modified:
+            conditional_headers["If-Modified-Since"] = cached.last_modified
+
+    response = await fetch(conditional_headers)
+    if cached is not None and response.status_code == 304:
+        return cached.body, False
+    response.raise_for_status()
+
+    text = response.text
+    sha256 = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    page_cache.set(
+        url,
+        CachedPage(
+            request_headers=headers,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+            sha256=sha256,
+            body=text,
+        ),
+    )
+    return text, cached is None or cached.sha256 != sha256
@@ -1,9 +1,9 @@
-import requests
 from bs4 import BeautifulSoup
 from country_list import countries_for_language
 from Levenshtein import distance
 
 from flask_backend.import_json import ScrappedFeature
+from scrapers.base import AsyncScraper, run_all
 
 
 def infer_movie_country(general_info):
@@ -20,7 +20,7 @@ def infer_movie_country(general_info):
     return country_names_eng[movie_country_code]
 
 
-class IMDBScrapper:
+class IMDBScrapper(AsyncScraper):
     """Adapted from https://github.com/D3C0RU5/web-scraping-movie"""
 
     def __init__(self):
@@ -66,9 +66,12 @@ class IMDBScrapper:
         return []
 
     def get_image(self, movie: ScrappedFeature):
+        return run_all(lambda: self.find_image(movie))[0]
+
+    async def find_image(self, movie: ScrappedFeature):
         movie_name = movie.title
         director = movie.director
-        search_request = requests.get(
+        search_request = await self.fetch(
             f"https://www.imdb.com/find/?q={movie_name}", headers=self.headers
         )
         search_html = search_request.text
@@ -104,7 +107,7 @@ class IMDBScrapper:
         for imdb_result in sorted_imdb_results:
             movie_link = imdb_result["imdb_movie_url"]
 
-            movie_request = requests.get(movie_link, headers=self.headers)
+            movie_request = await self.fetch(movie_link, headers=self.headers)
             movie_html = movie_request.text
             movie_soup = BeautifulSoup(movie_html, "html.parser")
 
@@ -140,7 +143,7 @@ class IMDBScrapper:
             "a"
         )["href"]
 
-        poster_request = requests.get(
+        poster_request = await self.fetch(
             f"https://www.imdb.com/{image_poster_link}", headers=self.headers
         )
         poster_html = poster_request.text
@@ -2,16 +2,14 @@ import os
 import re
 import unicodedata
 from datetime import date, datetime, time as dt_time
+from itertools import count
 
-import requests
 from bs4 import BeautifulSoup
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
 
-from scrapers.http_cache import fetch_page
+from scrapers.base import AsyncScraper, run_all
 
 
-class CinematecaPauloAmorim:
+class CinematecaPauloAmorim(AsyncScraper):
     def __init__(self):
         self.url = "https://www.cinematecapauloamorim.com.br"
         self.grade_url = "https://www.cinematecapauloamorim.com.br/grade-semanal"
@@ -32,14 +30,10 @@ class CinematecaPauloAmorim:
 
         return cur_date
 
-    def _fetch_page(self, url):
-        session = requests.Session()
-        retry = Retry(connect=3, backoff_factor=0.5)
-        adapter = HTTPAdapter(max_retries=retry)
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
-
-        return session.get(
+    async def _get_page_html(self, file, url):
+        """Returns contents from file, or GET from url and save to file"""
+        return await self.fetch_page(
+            file,
             url,
             headers={
                 "Host": "www.cinematecapauloamorim.com.br",
@@ -52,19 +46,18 @@ class CinematecaPauloAmorim:
             },
         )
 
-    def _get_page_html(self, file, url):
-        """Returns contents from file, or GET from url and save to file"""
-        return fetch_page(file, lambda: self._fetch_page(url))
+    async def _get_programacao_page_html(self, programacao_page):
+        return await self._get_page_html(
+            os.path.join(self.todays_dir, f"programacao{programacao_page}.html"),
+            f"{self.programacao_url}/pag/{programacao_page}",
+        )
 
-    def _get_movies_on_programacao(self):
+    async def _get_movies_on_programacao(self):
         # if a movie is listed under programacao, we
         # assume it is being featured that week
-        programacao_page = 1
-        while True:
-            programacao_html = self._get_page_html(
-                os.path.join(self.todays_dir, f"programacao{programacao_page}.html"),
-                f"{self.programacao_url}/pag/{programacao_page}",
-            )
+        async for programacao_html in self.fetch_ahead(
+            self._get_programacao_page_html, count(1)
+        ):
             programacao_soup = BeautifulSoup(programacao_html, "html.parser")
             ticket_links = programacao_soup.css.select("a.link-default > .ticket")
             if len(ticket_links) == 0:
@@ -109,15 +102,18 @@ class CinematecaPauloAmorim:
                 }
                 movies.append(movie)
             self.movies = self.movies + movies
-            programacao_page += 1
 
-    def _get_movie_excerpt(self):
-        for movie in self.movies:
-            movie_url_id = movie["read_more"].rstrip("/").split("/")[-1]
-            movie_html = self._get_page_html(
-                os.path.join(self.todays_dir, f"{movie_url_id}.html"),
-                movie["read_more"],
-            )
+    async def _get_movie_page_html(self, movie_url):
+        movie_url_id = movie_url.rstrip("/").split("/")[-1]
+        return await self._get_page_html(
+            os.path.join(self.todays_dir, f"{movie_url_id}.html"), movie_url
+        )
+
+    async def _get_movie_excerpt(self):
+        movie_htmls = await self.fetch_all(
+            self._get_movie_page_html, [movie["read_more"] for movie in self.movies]
+        )
+        for movie, movie_html in zip(self.movies, movie_htmls):
             movie_soup = BeautifulSoup(movie_html, "html.parser")
 
             movie["general_info"] = []
@@ -196,8 +192,8 @@ class CinematecaPauloAmorim:
         except (ValueError, KeyError):
             return None
 
-    def _get_weekly_features(self):
-        grade_html = self._get_page_html(
+    async def _get_weekly_features(self):
+        grade_html = await self._get_page_html(
             os.path.join(self.todays_dir, "grade.html"), self.grade_url
         )
         grade_soup = BeautifulSoup(grade_html, "html.parser")
@@ -301,10 +297,13 @@ class CinematecaPauloAmorim:
 
         return sorted_features
 
+    async def scrape(self):
+        await self._get_movies_on_programacao()
+        await self._get_movie_excerpt()
+        return await self._get_weekly_features()
+
     def get_weekly_features_json(self):
-        self._get_movies_on_programacao()
-        self._get_movie_excerpt()
-        return self._get_weekly_features()
+        return run_all(self.scrape)[0]
 
     # Keep the old method for backward compatibility
     def get_daily_features_json(self):
@@ -1,17 +1,17 @@
+import asyncio
 import os
 import re
 from datetime import datetime, timedelta
 
 import icalendar
-import requests
 from bs4 import BeautifulSoup
 from zoneinfo import ZoneInfo
 
-from scrapers.http_cache import fetch_page
+from scrapers.base import AsyncScraper
 from utils import get_formatted_day_str, string_is_day
 
 
-class SalaRedencao:
+class SalaRedencao(AsyncScraper):
     def __init__(self, date: str | None = None):
         if date:
             self.date = date
@@ -40,21 +40,23 @@ class SalaRedencao:
     def _get_lp_file(self):
         return os.path.join(self.scrape_dir, "landing.html")
 
-    def _get_landing_page_html(self) -> str:
-        return self._get_page_html(self._get_lp_file(), self.url)
+    async def _get_landing_page_html(self) -> str:
+        return await self._get_page_html(self._get_lp_file(), self.url)
 
     def _get_news_page_file(self):
         return os.path.join(self.scrape_dir, "news.html")
 
-    def _get_news_page_html(self):
-        return self._get_page_html(self._get_news_page_file(), self.news_url)
+    async def _get_news_page_html(self):
+        return await self._get_page_html(self._get_news_page_file(), self.news_url)
 
-    def _get_page_html(self, file, url):
+    async def _get_page_html(self, file, url):
         """Returns contents from file, or GET from url and save to file"""
-        return fetch_page(file, lambda: requests.get(url))
+        return await self.fetch_page(file, url)
 
-    def _get_events_blog_post_url(self):
-        landing_page_soup = BeautifulSoup(self._get_news_page_html(), "html.parser")
+    async def _get_events_blog_post_url(self):
+        landing_page_soup = BeautifulSoup(
+            await self._get_news_page_html(), "html.parser"
+        )
         full_post_links = landing_page_soup.css.select(".entire-meta-link")
         for full_post_link in full_post_links:
             event_url = full_post_link["href"]
@@ -260,16 +262,19 @@ class SalaRedencao:
             }
         return None
 
-    def _get_events_blog_post_html(self):
+    async def _get_events_blog_post_html(self):
         events_html_dir = os.path.join(self.scrape_dir, "events")
         os.makedirs(events_html_dir, exist_ok=True)
-        features = []
-        for event_url in self.events:
+
+        async def get_event_html(event_url):
             event_url_stripped = event_url.rstrip("/")
             event_slug = f"{event_url_stripped.split('/')[-1]}.html"
             event_file = os.path.join(events_html_dir, event_slug)
-            event_html = self._get_page_html(event_file, event_url)
+            return await self._get_page_html(event_file, event_url)
 
+        event_htmls = await self.fetch_all(get_event_html, self.events)
+        features = []
+        for event_url, event_html in zip(self.events, event_htmls):
             event_soup = BeautifulSoup(event_html, "html.parser")
             blog_features = self._parse_blog_post_by_html(event_soup, event_url)
 
@@ -286,10 +291,11 @@ class SalaRedencao:
             features = features + blog_features
         return features
 
-    def _fetch_google_calendar(self) -> icalendar.Calendar:
+    async def _fetch_google_calendar(self) -> icalendar.Calendar:
         """Fetches and returns the Google Calendar as an icalendar.Calendar instance"""
-        calendar_ics = requests.get(self.google_calendar_ical_url)
-        gcal = icalendar.Calendar.from_ical(calendar_ics.content)
+        # never from the cache files: the calendar is updated all the time
+        calendar_ics = await self.fetch_page(None, self.google_calendar_ical_url)
+        gcal = icalendar.Calendar.from_ical(calendar_ics)
         return gcal
 
     def _clean_gcal_html(self, raw_html):
@@ -375,10 +381,15 @@ class SalaRedencao:
 
         return feats
 
-    def get_daily_features_json(self) -> str:
-        self._get_events_blog_post_url()
-        features = self._get_events_blog_post_html()
-        # try to fetch events from official Google Calendar from Sala Redenção
-        gcal = self._fetch_google_calendar()
+    async def _get_blog_post_features(self):
+        await self._get_events_blog_post_url()
+        return await self._get_events_blog_post_html()
+
+    async def scrape(self):
+        # the blog posts and the official Google Calendar from Sala Redenção
+        # are fetched at the same time
+        features, gcal = await asyncio.gather(
+            self._get_blog_post_features(), self._fetch_google_calendar()
+        )
         gcal_features = self._parse_google_calendar_events(gcal)
         return features + gcal_features
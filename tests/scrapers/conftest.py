@@ -2,15 +2,31 @@ import pytest
 
 from flask_backend.db import db_session, init_db
 from flask_backend.models import GeminiUsageEvent
+from flask_backend.service import gemini_quota
+from scrapers import http_cache
 
 
 @pytest.fixture(autouse=True)
-def _gemini_quota_db():
+def _gemini_quota_db(monkeypatch):
     """tests/scrapers has no Flask app fixture, so this creates the schema
     directly (init_db() is plain Alembic code - it doesn't need a Flask
     app context) and clears gemini_usage_events between tests, mirroring
-    flask_backend/tests/conftest.py's clean_db for this one table."""
+    flask_backend/tests/conftest.py's clean_db for this one table. Each test
+    also gets an empty quota tracker writing inline, like
+    flask_backend/tests/conftest.py's fresh_gemini_quota."""
     init_db()
+    monkeypatch.setattr(
+        gemini_quota, "_tracker", gemini_quota.QuotaTracker(write_behind=False)
+    )
     yield
     db_session.query(GeminiUsageEvent).delete()
     db_session.commit()
+
+
+@pytest.fixture(autouse=True)
+def fresh_page_cache(tmp_path, monkeypatch):
+    """Gives each test an empty production page cache of its own, so tests
+    that pretend to run in production never touch SCRAPER_PAGE_CACHE_PATH."""
+    page_cache = http_cache.PageCache(str(tmp_path / "scraper_pages.sqlite"))
+    monkeypatch.setattr(http_cache, "_page_cache", page_cache)
+    return page_cache
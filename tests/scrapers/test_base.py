@@ -0,0 +1,216 @@
+import asyncio
+import time
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from flask_backend.utils import http_client
+from scrapers import base
+from scrapers.base import AsyncScraper, run_all
+from scrapers.http_cache import PageCache
+
+
+class _Scraper(AsyncScraper):
+    async def scrape(self):
+        return "features"
+
+
+class TestRunAll:
+    def test_runs_the_calls_concurrently_and_keeps_their_order(self):
+        async def sleep_then_return(delay, value):
+            await asyncio.sleep(delay)
+            return value
+
+        started = time.perf_counter()
+        results = run_all(
+            lambda: sleep_then_return(0.1, "slow"),
+            lambda: sleep_then_return(0.1, "fast"),
+        )
+
+        assert results == ["slow", "fast"]
+        assert time.perf_counter() - started < 0.19
+
+    def test_get_daily_features_json_runs_scrape(self):
+        assert _Scraper().get_daily_features_json() == "features"
+
+
+class TestFetch:
+    def test_never_exceeds_the_per_host_slots(self, monkeypatch):
+        monkeypatch.setattr(base, "SCRAPER_MAX_CONCURRENCY_PER_HOST", 2)
+        running = {"now": 0, "max": 0}
+
+        async def get(_session, url, **_kwargs):
+            running["now"] += 1
+            running["max"] = max(running["max"], running["now"])
+            await asyncio.sleep(0.01)
+            running["now"] -= 1
+            return url
+
+        scraper = _Scraper()
+        urls = [f"https://a.example/{index}" for index in range(6)]
+        with patch.object(http_client.AsyncSession, "get", get):
+            results = run_all(lambda: scraper.fetch_all(scraper.fetch, urls))[0]
+
+        assert results == urls
+        assert running["max"] == 2
+
+    def test_fetch_page_reads_and_writes_the_cache_files(self, tmp_path):
+        scraper = _Scraper()
+        cache_path = str(tmp_path / "page.html")
+        with patch.object(
+            _Scraper, "fetch", return_value=MagicMock(text="<html>fetched</html>")
+        ) as fetch:
+            first = run_all(lambda: scraper.fetch_page(cache_path, "https://a.example"))
+            second = run_all(
+                lambda: scraper.fetch_page(cache_path, "https://a.example")
+            )
+
+        assert first == second == ["<html>fetched</html>"]
+        fetch.assert_called_once_with("https://a.example", headers={})
+
+
+class TestFetchAhead:
+    def _pages(self, scraper, fetch, stop_at):
+        async def collect():
+            pages = []
+            async for page in scraper.fetch_ahead(fetch, range(1, 100)):
+                if page == stop_at:
+                    break
+                pages.append(page)
+            return pages
+
+        return run_all(collect)[0]
+
+    def test_requests_pages_ahead_at_a_time(self):
+        fetched = []
+
+        async def fetch(page):
+            fetched.append(page)
+            return page
+
+        scraper = _Scraper()
+        scraper.pages_ahead = 3
+
+        assert self._pages(scraper, fetch, stop_at=4) == [1, 2, 3]
+        assert fetched == [1, 2, 3, 4, 5, 6]
+
+    def test_drops_failures_past_the_last_page(self):
+        async def fetch(page):
+            if page > 3:
+                raise ValueError("no such page")
+            return page
+
+        scraper = _Scraper()
+        scraper.pages_ahead = 4
+
+        assert self._pages(scraper, fetch, stop_at=3) == [1, 2]
+
+    def test_raises_failures_of_pages_the_caller_reaches(self):
+        async def fetch(page):
+            raise ValueError("no such page")
+
+        with pytest.raises(ValueError):
+            self._pages(_Scraper(), fetch, stop_at=3)
+
+
+class _PageScraper(AsyncScraper):
+    url = "https://a.example/programacao"
+
+    def __init__(self):
+        self.scrapes = 0
+        self.incomplete = False
+        self.fail = False
+
+    async def scrape(self):
+        self.scrapes += 1
+        html = await self.fetch_page(None, self.url)
+        if self.fail:
+            raise ValueError("parser broke")
+        if self.incomplete:
+            self.mark_incomplete()
+        return [html]
+
+
+class TestScrapeIfChanged:
+    @pytest.fixture
+    def page_cache(self, tmp_path, monkeypatch):
+        page_cache = PageCache(str(tmp_path / "pages.sqlite"))
+        monkeypatch.setattr(base, "get_page_cache", lambda: page_cache)
+        return page_cache
+
+    def _serve(self, *responses):
+        """Patches fetch to answer `responses` in order."""
+        request = httpx.Request("GET", _PageScraper.url)
+        return patch.object(
+            _PageScraper,
+            "fetch",
+            side_effect=[
+                httpx.Response(status, text=text, headers=headers, request=request)
+                for status, text, headers in responses
+            ],
+        )
+
+    def test_skips_the_scrape_when_the_pages_are_unchanged(self, page_cache):
+        scraper = _PageScraper()
+        with self._serve(
+            (200, "<html>v1</html>", {"ETag": '"v1"'}),
+            (304, "", {}),
+        ):
+            first = run_all(scraper.scrape_if_changed)[0]
+            second = run_all(scraper.scrape_if_changed)[0]
+
+        assert first == ["<html>v1</html>"]
+        assert second is None
+        assert scraper.scrapes == 1
+
+    def test_scrapes_again_when_a_page_changed(self, page_cache):
+        scraper = _PageScraper()
+        with self._serve(
+            (200, "<html>v1</html>", {}),
+            (200, "<html>v2</html>", {}),
+            (200, "<html>v2</html>", {}),
+        ):
+            run_all(scraper.scrape_if_changed)
+            features = run_all(scraper.scrape_if_changed)[0]
+
+        assert features == ["<html>v2</html>"]
+        assert scraper.scrapes == 2
+
+    def test_scrapes_again_after_an_incomplete_scrape(self, page_cache):
+        scraper = _PageScraper()
+        scraper.incomplete = True
+        with self._serve((200, "<html>v1</html>", {}), (200, "<html>v1</html>", {})):
+            run_all(scraper.scrape_if_changed)
+            features = run_all(scraper.scrape_if_changed)[0]
+
+        assert features == ["<html>v1</html>"]
+        assert scraper.scrapes == 2
+
+    def test_scrapes_again_after_a_failed_scrape(self, page_cache):
+        """The failed scrape already cached the new page - the next run
+        must not take it for unchanged."""
+        scraper = _PageScraper()
+        with self._serve(
+            (200, "<html>v1</html>", {}),
+            (200, "<html>v2</html>", {}),
+            (200, "<html>v2</html>", {}),
+            (200, "<html>v2</html>", {}),
+        ):
+            run_all(scraper.scrape_if_changed)
+            scraper.fail = True
+            with pytest.raises(ValueError):
+                run_all(scraper.scrape_if_changed)
+            scraper.fail = False
+            features = run_all(scraper.scrape_if_changed)[0]
+
+        assert features == ["<html>v2</html>"]
+        assert scraper.scrapes == 3
+
+    def test_always_scrapes_outside_production(self):
+        scraper = _PageScraper()
+        with self._serve((200, "<html>v1</html>", {}), (200, "<html>v1</html>", {})):
+            run_all(scraper.scrape_if_changed)
+            run_all(scraper.scrape_if_changed)
+
+        assert scraper.scrapes == 2
@@ -3,6 +3,7 @@ from datetime import datetime
 from unittest.mock import MagicMock, patch
 
 from flask_backend.utils.enums.environment import EnvironmentEnum
+from scrapers.base import run_all
 from scrapers.capitolio import Capitolio
 
 FIXTURE_DIR = os.path.join("tests/files/files_capitolio")
@@ -71,7 +72,7 @@ class TestCapitolio:
 
     def test_day_schedule_html_reads_from_cache_when_present(self):
         capitolio = _make_capitolio()
-        html = capitolio._day_schedule_html("2026-08-05")
+        html = run_all(lambda: capitolio._day_schedule_html("2026-08-05"))[0]
         assert "Oldboy" in html
 
     def test_day_schedule_html_fetches_and_caches_when_missing(self, tmp_path):
@@ -79,10 +80,8 @@ class TestCapitolio:
         capitolio.dir = str(tmp_path)
 
         mock_response = MagicMock(text="<html>fetched</html>")
-        with patch(
-            "scrapers.capitolio.requests.get", return_value=mock_response
-        ) as mock_get:
-            html = capitolio._day_schedule_html("2026-09-01")
+        with patch.object(Capitolio, "fetch", return_value=mock_response) as mock_get:
+            html = run_all(lambda: capitolio._day_schedule_html("2026-09-01"))[0]
 
         mock_get.assert_called_once()
         assert html == "<html>fetched</html>"
@@ -93,12 +92,12 @@ class TestCapitolio:
         capitolio = Capitolio()
         capitolio.dir = str(tmp_path)
 
-        mock_response = MagicMock(text="<html>live</html>")
+        mock_response = MagicMock(text="<html>live</html>", status_code=200, headers={})
         with (
             patch("scrapers.http_cache.APP_ENVIRONMENT", EnvironmentEnum.PRODUCTION),
-            patch("scrapers.capitolio.requests.get", return_value=mock_response),
+            patch.object(Capitolio, "fetch", return_value=mock_response),
         ):
-            html = capitolio._day_schedule_html("2026-09-02")
+            html = run_all(lambda: capitolio._day_schedule_html("2026-09-02"))[0]
 
         assert html == "<html>live</html>"
         assert not (tmp_path / "2026-09-02.html").exists()
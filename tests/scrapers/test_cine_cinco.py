@@ -5,6 +5,7 @@ from unittest.mock import patch
 import pytest
 from bs4 import BeautifulSoup
 
+from scrapers.base import run_all
 from scrapers.cine_cinco import CineCinco
 from scrapers.llm_cache import hash_text
 
@@ -21,7 +22,7 @@ def _make_scraper(tmp_path):
 class TestGetContentSoup:
     def test_returns_div_content(self, tmp_path):
         scraper = _make_scraper(tmp_path)
-        soup = scraper._get_content_soup()
+        soup = run_all(scraper._get_content_soup)[0]
         assert soup.name == "div"
         assert "content" in soup.get("class", [])
 
@@ -35,7 +36,7 @@ class TestGetContentSoup:
         scraper.todays_dir = str(missing_dir)
 
         with pytest.raises(ValueError, match="Could not find div.content"):
-            scraper._get_content_soup()
+            run_all(scraper._get_content_soup)
 
 
 class TestGetTextFromSoup:
@@ -57,7 +58,9 @@ class TestGetTextFromSoup:
 class TestGetDailyFeaturesJson:
     def test_cache_hit_skips_llm_call(self, tmp_path):
         scraper = _make_scraper(tmp_path)
-        content_text = scraper._get_text_from_soup(scraper._get_content_soup())
+        content_text = scraper._get_text_from_soup(
+            run_all(scraper._get_content_soup)[0]
+        )
         content_hash = hash_text(content_text)
         cached_features = [{"title": "Cached Movie", "excerpt": "..."}]
         with open(scraper.cache_file, "w") as f:
@@ -6,6 +6,7 @@ from unittest.mock import patch
 import pytest
 from bs4 import BeautifulSoup
 
+from scrapers.base import run_all
 from scrapers.cinebancarios import CineBancarios
 from scrapers.llm_cache import hash_text
 
@@ -126,7 +127,7 @@ segundas-feiras&lt;/i&gt;&lt;/p&gt;
         cinebancarios.todays_dir = os.path.join(input_xml_dir)
         expected_xml = ET.fromstring(expected_raw_xml)
 
-        assert cinebancarios._get_current_blog_post_soup() == BeautifulSoup(
+        assert run_all(cinebancarios._get_current_blog_post_soup)[0] == BeautifulSoup(
             expected_xml.text, "html.parser"
         )
 
@@ -142,7 +143,7 @@ class TestGetDailyFeaturesJson:
 
     def test_cache_hit_skips_gemini_call(self, tmp_path):
         scraper = self._make_scraper(tmp_path)
-        soup = scraper._get_current_blog_post_soup()
+        soup = run_all(scraper._get_current_blog_post_soup)[0]
         text = scraper._get_text_from_soup(soup)
         content_hash = hash_text(text)
         cached_features = [{"title": "Cached Movie"}]
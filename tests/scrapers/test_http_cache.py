@@ -1,7 +1,18 @@
+import asyncio
 from unittest.mock import MagicMock, patch
 
+import httpx
+
 from flask_backend.utils.enums.environment import EnvironmentEnum
-from scrapers.http_cache import fetch_page
+from scrapers.http_cache import (
+    PageCache,
+    fetch_page,
+    fetch_page_async,
+    fetch_page_conditional,
+    get_page_cache,
+)
+
+URL = "https://a.example/page"
 
 
 class TestFetchPage:
@@ -50,3 +61,109 @@ class TestFetchPage:
         fetch.assert_called_once()
         assert html == "<html>fresh</html>"
         assert cache_path.read_text() == "<html>stale</html>"
+
+
+class TestFetchPageAsync:
+    def test_shares_fetch_pages_cache_files(self, tmp_path):
+        cache_path = tmp_path / "page.html"
+        mock_response = MagicMock(text="<html>fetched</html>")
+
+        async def fetch():
+            return mock_response
+
+        html = asyncio.run(fetch_page_async(str(cache_path), fetch))
+
+        assert html == "<html>fetched</html>"
+        assert fetch_page(str(cache_path), MagicMock()) == "<html>fetched</html>"
+
+
+def _fetch_returning(*responses):
+    """A fetch(headers) that returns `responses` in order and keeps the
+    headers it was given."""
+    sent = []
+    responses = iter(responses)
+
+    async def fetch(headers):
+        sent.append(headers)
+        return next(responses)
+
+    return fetch, sent
+
+
+def _response(status_code, text="", headers=None):
+    return httpx.Response(
+        status_code, text=text, headers=headers, request=httpx.Request("GET", URL)
+    )
+
+
+class TestFetchPageConditional:
+    def _fetch(self, page_cache, fetch, headers=None):
+        return asyncio.run(
+            fetch_page_conditional(page_cache, URL, headers or {}, fetch)
+        )
+
+    def test_sends_the_validators_and_reads_the_body_of_a_304(self, tmp_path):
+        page_cache = PageCache(str(tmp_path / "pages.sqlite"))
+        fetch, sent = _fetch_returning(
+            _response(
+                200,
+                "<html>v1</html>",
+                {"ETag": '"v1"', "Last-Modified": "Wed, 01 Jul 2026 10:00:00 GMT"},
+            ),
+            _response(304),
+        )
+
+        first = self._fetch(page_cache, fetch, {"User-Agent": "x"})
+        second = self._fetch(page_cache, fetch, {"User-Agent": "x"})
+
+        assert first == ("<html>v1</html>", True)
+        assert second == ("<html>v1</html>", False)
+        assert sent == [
+            {"User-Agent": "x"},
+            {
+                "User-Agent": "x",
+                "If-None-Match": '"v1"',
+                "If-Modified-Since": "Wed, 01 Jul 2026 10:00:00 GMT",
+            },
+        ]
+
+    def test_compares_bodies_when_the_site_sends_no_validators(self, tmp_path):
+        page_cache = PageCache(str(tmp_path / "pages.sqlite"))
+        fetch, sent = _fetch_returning(
+            _response(200, "<html>v1</html>"),
+            _response(200, "<html>v1</html>"),
+            _response(200, "<html>v2</html>"),
+        )
+
+        changes = [self._fetch(page_cache, fetch)[1] for _ in range(3)]
+
+        assert changes == [True, False, True]
+        assert sent == [{}, {}, {}]
+        assert page_cache.get(URL).body == "<html>v2</html>"
+
+    def test_errors_are_raised_and_not_cached(self, tmp_path):
+        page_cache = PageCache(str(tmp_path / "pages.sqlite"))
+        fetch, _sent = _fetch_returning(_response(500))
+
+        try:
+            self._fetch(page_cache, fetch)
+        except httpx.HTTPStatusError:
+            pass
+        else:
+            raise AssertionError("expected an HTTPStatusError")
+        assert page_cache.get(URL) is None
+
+
+class TestPageCache:
+    def test_keeps_only_the_latest_day_of_a_scraper(self, tmp_path):
+        page_cache = PageCache(str(tmp_path / "pages.sqlite"))
+        page_cache.set_pages_of("Capitolio", "2026-07-01", ["a", "b"])
+        page_cache.set_pages_of("CineCinco", "2026-07-01", ["c"])
+        page_cache.set_pages_of("Capitolio", "2026-07-02", ["b", "d"])
+
+        assert page_cache.pages_of("Capitolio", "2026-07-01") == []
+        assert page_cache.pages_of("Capitolio", "2026-07-02") == ["b", "d"]
+        assert page_cache.pages_of("CineCinco", "2026-07-01") == ["c"]
+
+    def test_disabled_outside_production(self):
+        assert get_page_cache() is None
@@ -98,40 +98,45 @@ def _fake_get(movie_html):
 
 class TestGetImage:
     def test_no_search_results_returns_none(self):
-        with patch(
-            "scrapers.imdb.requests.get",
+        with patch.object(
+            IMDBScrapper,
+            "fetch",
             return_value=MagicMock(text=NO_RESULTS_HTML),
         ):
             result = IMDBScrapper().get_image(_feature(director="Park Chan-wook"))
         assert result is None
 
     def test_matching_director_returns_poster_url(self):
-        with patch(
-            "scrapers.imdb.requests.get",
+        with patch.object(
+            IMDBScrapper,
+            "fetch",
             side_effect=_fake_get(MOVIE_HTML_SINGLE_DIRECTOR),
         ):
             result = IMDBScrapper().get_image(_feature(director="Park Chan-wook"))
         assert result == "full-poster.jpg"
 
     def test_matching_one_of_multiple_directors_returns_poster_url(self):
-        with patch(
-            "scrapers.imdb.requests.get",
+        with patch.object(
+            IMDBScrapper,
+            "fetch",
             side_effect=_fake_get(MOVIE_HTML_MULTIPLE_DIRECTORS),
         ):
             result = IMDBScrapper().get_image(_feature(director="dude mcguy"))
         assert result == "full-poster.jpg"
 
     def test_non_matching_director_returns_none(self):
-        with patch(
-            "scrapers.imdb.requests.get",
+        with patch.object(
+            IMDBScrapper,
+            "fetch",
             side_effect=_fake_get(MOVIE_HTML_SINGLE_DIRECTOR),
         ):
             result = IMDBScrapper().get_image(_feature(director="Someone Else"))
         assert result is None
 
     def test_no_director_matching_country_returns_poster_url(self):
-        with patch(
-            "scrapers.imdb.requests.get",
+        with patch.object(
+            IMDBScrapper,
+            "fetch",
             side_effect=_fake_get(MOVIE_HTML_COUNTRY_MATCH),
         ):
             result = IMDBScrapper().get_image(
@@ -140,8 +145,9 @@ class TestGetImage:
         assert result == "full-poster.jpg"
 
     def test_no_director_mismatched_country_returns_none(self):
-        with patch(
-            "scrapers.imdb.requests.get",
+        with patch.object(
+            IMDBScrapper,
+            "fetch",
             side_effect=_fake_get(MOVIE_HTML_COUNTRY_MISMATCH),
         ):
             result = IMDBScrapper().get_image(
@@ -150,8 +156,9 @@ class TestGetImage:
         assert result is None
 
     def test_no_director_and_no_inferable_country_returns_none(self):
-        with patch(
-            "scrapers.imdb.requests.get",
+        with patch.object(
+            IMDBScrapper,
+            "fetch",
             side_effect=_fake_get(MOVIE_HTML_COUNTRY_MATCH),
         ):
             result = IMDBScrapper().get_image(
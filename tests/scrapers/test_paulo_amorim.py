@@ -1,14 +1,16 @@
 from datetime import date, datetime
 from unittest.mock import MagicMock, patch
 
+from scrapers.base import run_all
 from scrapers.paulo_amorim import CinematecaPauloAmorim
 
 FIXTURE_DIR = "tests/files/files_paulo-amorim"
 FIXTURE_DAY_DIR = f"{FIXTURE_DIR}/2026-08-05"
 
 
-def _make_scraper():
+def _make_scraper(pages_ahead=1):
     scraper = CinematecaPauloAmorim()
+    scraper.pages_ahead = pages_ahead
     scraper.dir = FIXTURE_DIR
     scraper.todays_dir = FIXTURE_DAY_DIR
     return scraper
@@ -40,6 +42,15 @@ class TestGetWeeklyFeaturesJson:
             == "https://www.cinematecapauloamorim.com.br//uploads/poster.jpg"
         )
 
+    def test_concurrent_fetches_give_the_same_features(self):
+        with patch("scrapers.paulo_amorim.datetime") as mock_dt:
+            mock_dt.now.return_value = datetime(2026, 8, 5)
+            sequential = _make_scraper().get_weekly_features_json()
+            # exactly the two /programacao fixture pages are requested at once
+            concurrent = _make_scraper(pages_ahead=2).get_weekly_features_json()
+
+        assert concurrent == sequential
+
     def test_get_daily_features_json_is_an_alias(self):
         with patch("scrapers.paulo_amorim.datetime") as mock_dt:
             mock_dt.now.return_value = datetime(2026, 8, 5)
@@ -93,9 +104,11 @@ class TestParseDateFromStrongText:
 class TestGetPageHtml:
     def test_reads_from_cache_when_present(self):
         scraper = _make_scraper()
-        html = scraper._get_page_html(
-            f"{FIXTURE_DAY_DIR}/grade.html", "https://example.com/grade"
-        )
+        html = run_all(
+            lambda: scraper._get_page_html(
+                f"{FIXTURE_DAY_DIR}/grade.html", "https://example.com/grade"
+            )
+        )[0]
         assert "5 de agosto" in html
 
     def test_fetches_and_caches_when_missing(self, tmp_path):
@@ -104,12 +117,14 @@ class TestGetPageHtml:
         scraper.todays_dir = str(tmp_path)
 
         mock_response = MagicMock(text="<html>fetched</html>")
-        with patch(
-            "scrapers.paulo_amorim.requests.Session.get", return_value=mock_response
+        with patch.object(
+            CinematecaPauloAmorim, "fetch", return_value=mock_response
         ) as mock_get:
-            html = scraper._get_page_html(
-                str(tmp_path / "new.html"), "https://example.com/new"
-            )
+            html = run_all(
+                lambda: scraper._get_page_html(
+                    str(tmp_path / "new.html"), "https://example.com/new"
+                )
+            )[0]
 
         mock_get.assert_called_once()
         assert html == "<html>fetched</html>"
@@ -5,6 +5,7 @@ from unittest.mock import patch
 
 import icalendar
 
+from scrapers.base import run_all
 from scrapers.sala_redencao import SalaRedencao
 
 GCAL_FIXTURE = os.path.join("tests/files/files_sala-redencao/gcal/basic.ics")
@@ -17,8 +18,8 @@ def _load_gcal_fixture() -> icalendar.Calendar:
 
 class TestSalaRedencao(unittest.TestCase):
     def test_get_events_blog_post_url(self):
-        """`_get_events_blog_post_url` should parse whatever `requests.get`
-        returns into event URLs - no live network call involved here."""
+        """`_get_events_blog_post_url` should parse whatever `fetch` returns
+        into event URLs - no live network call involved here."""
         news_html = """
         <a class="entire-meta-link" href="https://www.ufrgs.br/difusaocultural/sala-redencao-apresenta-programacao-de-cinema-japones/">Link</a>
         <a class="entire-meta-link" href="https://www.ufrgs.br/difusaocultural/programacao-da-sala-redencao-explora-vanguardas-no-cinema/">Link</a>
@@ -26,9 +27,9 @@ class TestSalaRedencao(unittest.TestCase):
         """
         salaRedencao = SalaRedencao(date="2023-09-13")
         salaRedencao.scrape_dir = tempfile.mkdtemp()
-        with patch("scrapers.sala_redencao.requests.get") as mock_get:
-            mock_get.return_value.text = news_html
-            salaRedencao._get_events_blog_post_url()
+        with patch.object(SalaRedencao, "fetch") as mock_fetch:
+            mock_fetch.return_value.text = news_html
+            run_all(salaRedencao._get_events_blog_post_url)
         self.assertIsInstance(salaRedencao.events, list)
         assert len(salaRedencao.events) > 0
         for url in salaRedencao.events:
@@ -44,15 +45,15 @@ class TestSalaRedencao(unittest.TestCase):
         ]
 
     def test__fetch_google_calendar_events_returns_expected_calendar(self):
-        """`_fetch_google_calendar` should parse whatever `requests.get` returns
-        into an `icalendar.Calendar` - no live network call involved here."""
-        with open(GCAL_FIXTURE, "rb") as f:
-            fixture_bytes = f.read()
+        """`_fetch_google_calendar` should parse whatever `fetch` returns into
+        an `icalendar.Calendar` - no live network call involved here."""
+        with open(GCAL_FIXTURE) as f:
+            fixture_text = f.read()
 
         sala_redencao = SalaRedencao()
-        with patch("scrapers.sala_redencao.requests.get") as mock_get:
-            mock_get.return_value.content = fixture_bytes
-            gcal = sala_redencao._fetch_google_calendar()
+        with patch.object(SalaRedencao, "fetch") as mock_fetch:
+            mock_fetch.return_value.text = fixture_text
+            gcal = run_all(sala_redencao._fetch_google_calendar)[0]
 
         assert isinstance(gcal, icalendar.Calendar)
         assert "Redenção" in gcal.calendar_name
@@ -84,7 +85,7 @@ class TestSalaRedencao(unittest.TestCase):
             patch.object(SalaRedencao, "_get_events_blog_post_url", return_value=[]),
             patch.object(SalaRedencao, "_get_events_blog_post_html", return_value=[]),
         ):
-            features_traditional = sala_redencao._get_events_blog_post_html()
+            features_traditional = run_all(sala_redencao._get_events_blog_post_html)[0]
             features_gcal = sala_redencao._parse_google_calendar_events(
                 _load_gcal_fixture()
             )
@@ -126,7 +127,7 @@ class TestSalaRedencao(unittest.TestCase):
                 return_value=[traditional_feature],
             ),
         ):
-            features_traditional = sala_redencao._get_events_blog_post_html()
+            features_traditional = run_all(sala_redencao._get_events_blog_post_html)[0]
             features_gcal = sala_redencao._parse_google_calendar_events(
                 _load_gcal_fixture()
             )
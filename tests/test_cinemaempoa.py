@@ -0,0 +1,89 @@
+import asyncio
+import json
+from unittest.mock import patch
+
+import cinemaempoa
+
+
+def _fake_rooms():
+    def scraper(delay, features):
+        class _Scraper:
+            async def scrape_if_changed(self):
+                await asyncio.sleep(delay)
+                return features
+
+        return _Scraper
+
+    return {
+        "slow": ("https://slow.example", "Slow", scraper(0.05, ["a"])),
+        "fast": ("https://fast.example", "Fast", scraper(0, ["b"])),
+        "same": ("https://same.example", "Same", scraper(0, None)),
+    }
+
+
+class TestRunRooms:
+    def test_parallel_mode_keeps_the_rooms_order(self, capsys):
+        with patch.object(cinemaempoa, "ROOMS", _fake_rooms()):
+            features = cinemaempoa.run_rooms(["fast", "slow"], parallel=True)
+
+        assert [feature["slug"] for feature in features] == ["slow", "fast"]
+        assert features[0] == {
+            "url": "https://slow.example",
+            "cinema": "Slow",
+            "slug": "slow",
+            "features": ["a"],
+        }
+        timings = capsys.readouterr().err.splitlines()
+        assert sorted(line.split(":")[0] for line in timings) == [
+            "fast",
+            "slow",
+            "total",
+        ]
+
+    def test_sequential_mode_matches_parallel_mode(self):
+        with patch.object(cinemaempoa, "ROOMS", _fake_rooms()):
+            sequential = cinemaempoa.run_rooms(["fast", "slow"])
+            parallel = cinemaempoa.run_rooms(["fast", "slow"], parallel=True)
+
+        assert sequential == parallel
+
+    def test_unchanged_rooms_go_out_marked_without_features(self):
+        with patch.object(cinemaempoa, "ROOMS", _fake_rooms()):
+            features = cinemaempoa.run_rooms(["fast", "same"])
+
+        assert features[1] == {
+            "url": "https://same.example",
+            "cinema": "Same",
+            "slug": "same",
+            "features": [],
+            "unchanged": True,
+        }
+
+
+class TestDailySnapshot:
+    def _room(self, slug, features, unchanged=False):
+        room = {"url": "", "cinema": slug, "slug": slug, "features": features}
+        if unchanged:
+            room["unchanged"] = True
+        return room
+
+    def test_unchanged_rooms_keep_their_earlier_entry(self, tmp_path):
+        json_filename = tmp_path / "2026-08-01.json"
+        json_filename.write_text(
+            json.dumps([self._room("slow", ["a"]), self._room("same", ["c"])])
+        )
+
+        snapshot = cinemaempoa.daily_snapshot(
+            [self._room("slow", ["a2"]), self._room("same", [], unchanged=True)],
+            str(json_filename),
+        )
+
+        assert snapshot == [self._room("slow", ["a2"]), self._room("same", ["c"])]
+
+    def test_leaves_the_file_alone_without_an_entry_to_keep(self, tmp_path):
+        snapshot = cinemaempoa.daily_snapshot(
+            [self._room("slow", ["a"]), self._room("same", [], unchanged=True)],
+            str(tmp_path / "2026-08-01.json"),
+        )
+
+        assert snapshot is None